@@ -0,0 +1,95 @@
+"""Benchmark rozmiaru pliku oraz czasu zapisu i wczytania dla formatów kompresji FileManager.
+
+Porównuje zwykły plik tekstowy z każdym formatem z COMPRESSION_FORMATS.
+Tytuły i opisy zadań powtarzają się, jak w typowej liście zadań.
+
+Uruchomienie (z katalogu projektu):
+    python -m benchmarks.bench_compression --tasks 1000000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from src.file_manager import COMPRESSION_FORMATS, FileManager
+from src.task import Task
+from src.todo_status import TaskStatus
+
+TITLES = (
+    "Kupić mleko",
+    "Zadzwonić do klienta",
+    "Przegląd kodu",
+    "Spotkanie zespołu",
+    "Raport tygodniowy",
+)
+DESCRIPTIONS = (
+    "",
+    "Pilne",
+    "Szczegóły w mailu od kierownika",
+    "Do końca tygodnia",
+    "Przygotować prezentację",
+)
+
+
+def make_tasks(count):
+    """Tworzy listę zadań o powtarzających się tytułach, opisach i statusach.
+
+    Args:
+        count (int): Liczba zadań
+
+    Returns:
+        list: Lista obiektów Task
+    """
+    statuses = list(TaskStatus)
+    return [
+        Task(
+            f"{TITLES[i % len(TITLES)]} {i // len(TITLES)}",
+            DESCRIPTIONS[i * 7 % len(DESCRIPTIONS)],
+            statuses[i % len(statuses)],
+            task_id=i + 1,
+        )
+        for i in range(count)
+    ]
+
+
+def best_time(function, repeat):
+    """Zwraca najkrótszy czas wykonania funkcji z repeat prób."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    tasks = make_tasks(args.tasks)
+    for task in tasks:
+        task.to_string()
+    with tempfile.TemporaryDirectory() as directory:
+        print(
+            f"{'format':<10}{'rozmiar [MB]':>14}{'współczynnik':>14}"
+            f"{'zapis [s]':>12}{'odczyt [s]':>12}"
+        )
+        plain_size = None
+        for compression in [None, *COMPRESSION_FORMATS]:
+            path = os.path.join(directory, f"zadania_{compression or 'txt'}")
+            file_manager = FileManager(path, compression=compression)
+            save = best_time(lambda: file_manager.save_tasks(tasks), args.repeat)
+            load = best_time(file_manager.load_tasks, args.repeat)
+            size = os.path.getsize(path)
+            plain_size = plain_size or size
+            print(
+                f"{compression or 'tekst':<10}{size / 1e6:>14.2f}{plain_size / size:>13.1f}x"
+                f"{save:>12.2f}{load:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""Benchmark podstawowych operacji TodoManager, FileManager i Task.
+
+Mierzy wczytanie, zapis, dodanie, usunięcie z początku listy, zmianę statusu,
+filtrowanie po statusie oraz Task.from_string/to_string dla 1k, 100k i 1M
+zadań. Wyniki zapisuje jako JSON, a z podaną linią bazową (--baseline)
+kończy się kodem 1, gdy któraś operacja jest wolniejsza o więcej niż
+--tolerance.
+
+Uruchomienie (z katalogu projektu):
+    python -m benchmarks.bench_core --output wyniki.json
+    python -m benchmarks.bench_core --sizes 1000 100000 --baseline benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from src.file_manager import FileManager
+from src.task import Task
+from src.todo_manager import TodoManager
+from src.todo_status import TaskStatus
+
+DEFAULT_SIZES = (1000, 100000, 1000000)
+DEFAULT_TOLERANCE = 0.25
+
+
+def make_tasks(count):
+    """Tworzy listę przykładowych zadań o różnych statusach.
+
+    Args:
+        count (int): Liczba zadań
+
+    Returns:
+        list: Lista obiektów Task
+    """
+    statuses = (TaskStatus.PENDING, TaskStatus.PENDING, TaskStatus.DONE, TaskStatus.UNFINISHED)
+    return [
+        Task(f"Zadanie {i}", f"Opis zadania {i}", statuses[i % len(statuses)], task_id=i + 1)
+        for i in range(count)
+    ]
+
+
+def mutation_count(size):
+    """Liczba operacji modyfikujących - każda przepisuje cały plik."""
+    return max(3, 100000 // size)
+
+
+def bench_load(path, size):
+    """Wczytanie pliku przez TodoManager (wraz z budową indeksów)."""
+    start = time.perf_counter()
+    TodoManager(path)
+    return 1, time.perf_counter() - start
+
+
+def bench_save(path, size):
+    """Pełny zapis listy zadań, które nie były jeszcze serializowane."""
+    tasks = make_tasks(size)
+    file_manager = FileManager(path)
+    start = time.perf_counter()
+    file_manager.save_tasks(tasks)
+    return 1, time.perf_counter() - start
+
+
+def bench_add(path, size):
+    """Dodanie zadania wraz z zapisem pliku."""
+    manager = TodoManager(path)
+    count = mutation_count(size)
+    start = time.perf_counter()
+    for i in range(count):
+        manager.add_task(f"Nowe zadanie {i}", "Opis")
+    return count, time.perf_counter() - start
+
+
+def bench_delete_front(path, size):
+    """Usunięcie pierwszego zadania listy wraz z zapisem pliku."""
+    manager = TodoManager(path)
+    count = mutation_count(size)
+    start = time.perf_counter()
+    for _ in range(count):
+        manager.delete_task(0)
+    return count, time.perf_counter() - start
+
+
+def bench_status_change(path, size):
+    """Zmiana statusu zadania wraz z zapisem pliku."""
+    manager = TodoManager(path)
+    count = mutation_count(size)
+    start = time.perf_counter()
+    for i in range(count):
+        done = manager.tasks[i].status == TaskStatus.DONE
+        status = TaskStatus.PENDING if done else TaskStatus.DONE
+        manager.change_task_status(i, status)
+    return count, time.perf_counter() - start
+
+
+def bench_filter(path, size):
+    """Pobranie zadań o danym statusie (get_tasks_by_status)."""
+    manager = TodoManager(path)
+    count = max(10, 1000000 // size)
+    start = time.perf_counter()
+    for _ in range(count):
+        manager.get_tasks_by_status(TaskStatus.DONE)
+    return count, time.perf_counter() - start
+
+
+def bench_from_string(path, size):
+    """Parsowanie linii pliku (Task.from_string)."""
+    with open(path) as file:
+        lines = file.readlines()
+    start = time.perf_counter()
+    for line in lines:
+        Task.from_string(line)
+    return len(lines), time.perf_counter() - start
+
+
+def bench_to_string(path, size):
+    """Serializacja zadań, które nie były jeszcze serializowane (Task.to_string)."""
+    tasks = make_tasks(size)
+    start = time.perf_counter()
+    for task in tasks:
+        task.to_string()
+    return len(tasks), time.perf_counter() - start
+
+
+BENCHMARKS = {
+    "load": bench_load,
+    "save": bench_save,
+    "add": bench_add,
+    "delete_front": bench_delete_front,
+    "status_change": bench_status_change,
+    "filter": bench_filter,
+    "from_string": bench_from_string,
+    "to_string": bench_to_string,
+}
+
+
+def run(sizes, names, repeat):
+    """Wykonuje wybrane benchmarki dla każdego rozmiaru listy.
+
+    Każdy pomiar działa na świeżo zapisanym pliku, a z repeat powtórzeń
+    wybierany jest najszybszy, co ogranicza wpływ zakłóceń.
+
+    Args:
+        sizes (list): Liczby zadań
+        names (list): Nazwy benchmarków z BENCHMARKS
+        repeat (int): Liczba powtórzeń każdego pomiaru
+
+    Returns:
+        dict: Wyniki w postaci {"nazwa/rozmiar": {"operations", "seconds", "per_op"}}
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "zadania.txt")
+        for size in sizes:
+            tasks = make_tasks(size)
+            for name in names:
+                best = None
+                for _ in range(repeat):
+                    FileManager(path).save_tasks(tasks)
+                    operations, seconds = BENCHMARKS[name](path, size)
+                    if best is None or seconds < best[1]:
+                        best = (operations, seconds)
+                operations, seconds = best
+                results[f"{name}/{size}"] = {
+                    "operations": operations,
+                    "seconds": seconds,
+                    "per_op": seconds / operations,
+                }
+                per_op_us = seconds / operations * 1e6
+                print(f"{name:<15}{size:>10}{per_op_us:>16,.2f} us/op", flush=True)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Porównuje wyniki z linią bazową.
+
+    Args:
+        results (dict): Wyniki z run()
+        baseline (dict): Wyniki linii bazowej (pole "results" pliku JSON)
+        tolerance (float): Dopuszczalny względny wzrost czasu operacji
+
+    Returns:
+        list: Krotki (pomiar, czas bazowy, czas bieżący) dla regresji
+    """
+    regressions = []
+    for key, result in results.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        ratio = result["per_op"] / reference["per_op"]
+        marker = "REGRESJA" if ratio > 1 + tolerance else ""
+        print(
+            f"{key:<25}{reference['per_op'] * 1e6:>14,.2f}{result['per_op'] * 1e6:>14,.2f} us/op"
+            f"{ratio:>8.2f}x  {marker}"
+        )
+        if marker:
+            regressions.append((key, reference["per_op"], result["per_op"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument(
+        "--benchmarks", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS)
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="plik JSON z wynikami")
+    parser.add_argument("--baseline", help="plik JSON z wynikami linii bazowej")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.benchmarks, args.repeat)
+    if args.output:
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        }
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"Wykryto regresje wydajności: {len(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
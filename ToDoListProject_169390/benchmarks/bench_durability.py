@@ -0,0 +1,83 @@
+"""Porównanie przepustowości zapisu dla poziomów trwałości FileManager.
+
+Uruchomienie (z katalogu projektu):
+    python -m benchmarks.bench_durability --tasks 100000 --changes 2000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from src.file_manager import DURABILITY_LEVELS, FileManager
+from src.task import Task
+
+
+def make_tasks(count):
+    """Tworzy listę przykładowych zadań.
+
+    Args:
+        count (int): Liczba zadań
+
+    Returns:
+        list: Lista obiektów Task
+    """
+    return [Task(f"Zadanie {i}", f"Opis zadania {i}", task_id=i + 1) for i in range(count)]
+
+
+def bench_snapshots(directory, tasks, durability, atomic, repeat):
+    """Mierzy czas pełnych zapisów listy zadań.
+
+    Returns:
+        float: Liczba zapisanych zadań na sekundę
+    """
+    file_manager = FileManager(
+        os.path.join(directory, f"snapshot_{durability}_{atomic}.txt"),
+        atomic=atomic,
+        durability=durability,
+    )
+    start = time.perf_counter()
+    for _ in range(repeat):
+        file_manager.save_tasks(tasks)
+    file_manager.sync()
+    return len(tasks) * repeat / (time.perf_counter() - start)
+
+
+def bench_journal(directory, tasks, durability, changes):
+    """Mierzy czas dopisywania pojedynczych zmian do dziennika.
+
+    Returns:
+        float: Liczba zapisanych zmian na sekundę
+    """
+    file_manager = FileManager(
+        os.path.join(directory, f"journal_{durability}.txt"),
+        journal=True,
+        compact_threshold=changes + 1,
+        durability=durability,
+    )
+    file_manager.save_tasks(tasks)
+    start = time.perf_counter()
+    for i in range(changes):
+        file_manager.apply_changes(tasks, [("update", tasks[i % len(tasks)])])
+    file_manager.sync()
+    return changes / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=100000)
+    parser.add_argument("--changes", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    tasks = make_tasks(args.tasks)
+    print(f"{'tryb':<10}{'migawka [zad/s]':>18}{'atomowo [zad/s]':>18}{'dziennik [zm/s]':>18}")
+    with tempfile.TemporaryDirectory() as directory:
+        for durability in DURABILITY_LEVELS:
+            snapshot = bench_snapshots(directory, tasks, durability, False, args.repeat)
+            atomic = bench_snapshots(directory, tasks, durability, True, args.repeat)
+            journal = bench_journal(directory, tasks, durability, args.changes)
+            print(f"{durability:<10}{snapshot:>18,.0f}{atomic:>18,.0f}{journal:>18,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Benchmark wczytywania dużego pliku przez FileManager.load_tasks w zależności od liczby procesów.
+
+Oprócz czasu wczytania podaje czas procesora procesu głównego, który
+ogranicza przyspieszenie - obiekty Task powstają zawsze w procesie głównym.
+
+Uruchomienie (z katalogu projektu):
+    python -m benchmarks.bench_parallel_load --tasks 1000000 --workers 1 2 4 8 16 32
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from src.file_manager import FileManager
+from src.task import Task
+from src.todo_status import TaskStatus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1000000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    statuses = list(TaskStatus)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "zadania.txt")
+        FileManager(path).save_tasks(
+            Task(f"Zadanie {i}", f"Opis zadania {i}", statuses[i % len(statuses)], task_id=i + 1)
+            for i in range(args.tasks)
+        )
+        print(f"{'procesy':<10}{'czas [s]':>12}{'CPU główny [s]':>18}{'przyspieszenie':>18}")
+        reference = None
+        for workers in args.workers:
+            file_manager = FileManager(path, workers=workers)
+            best = None
+            for _ in range(args.repeat):
+                cpu_start = time.process_time()
+                start = time.perf_counter()
+                tasks = file_manager.load_tasks()
+                result = (time.perf_counter() - start, time.process_time() - cpu_start)
+                del tasks
+                if best is None or result[0] < best[0]:
+                    best = result
+            reference = reference or best[0]
+            print(f"{workers:<10}{best[0]:>12.2f}{best[1]:>18.2f}{reference / best[0]:>17.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Test obciążeniowy TodoManager - przepustowość operacji w zależności od liczby wątków.
+
+Uruchomienie (z katalogu projektu):
+    python -m benchmarks.bench_threads --tasks 10000 --operations 20000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+from src.file_manager import FileManager
+from src.task import Task
+from src.todo_manager import TodoManager
+from src.todo_status import TaskStatus
+
+WORKLOADS = {
+    "odczyt": 0.0,
+    "mieszane 90/10": 0.1,
+    "zapis": 1.0,
+}
+
+
+def run_workload(manager, threads, operations, write_ratio):
+    """Wykonuje operacje na menedżerze z podanej liczby wątków.
+
+    Args:
+        manager (TodoManager): Testowany menedżer
+        threads (int): Liczba wątków
+        operations (int): Łączna liczba operacji
+        write_ratio (float): Udział operacji modyfikujących
+
+    Returns:
+        float: Liczba operacji na sekundę
+    """
+    statuses = list(TaskStatus)
+    task_count = len(manager.tasks)
+    start_barrier = threading.Barrier(threads + 1)
+
+    def work(seed):
+        generator = random.Random(seed)
+        start_barrier.wait()
+        for _ in range(operations // threads):
+            task_id = generator.randint(1, task_count)
+            if generator.random() < write_ratio:
+                manager.edit_task_by_id(task_id, description=f"Opis {generator.random()}")
+            elif generator.random() < 0.5:
+                manager.get_task(task_id)
+            else:
+                manager.count_tasks_by_status(generator.choice(statuses))
+
+    workers = [threading.Thread(target=work, args=(n,)) for n in range(threads)]
+    for worker in workers:
+        worker.start()
+    start_barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return operations // threads * threads / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--operations", type=int, default=20000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "zadania.txt")
+        file_manager = FileManager(path, journal=True, compact_threshold=10 ** 9)
+        file_manager.save_tasks(Task(f"Zadanie {i}", task_id=i + 1) for i in range(args.tasks))
+        manager = TodoManager(file_manager=file_manager)
+
+        print(f"{'obciążenie':<16}" + "".join(f"{f'{n} wątk. [op/s]':>18}" for n in args.threads))
+        for name, write_ratio in WORKLOADS.items():
+            results = [
+                run_workload(manager, n, args.operations, write_ratio) for n in args.threads
+            ]
+            print(f"{name:<16}" + "".join(f"{result:>18,.0f}" for result in results))
+        manager.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import asyncio
+from src.file_manager import FileManager
+
+
+class AsyncFileManager:
+    """
+    Asynchroniczna nakładka na FileManager dla aplikacji opartych na asyncio.
+    Operacje na plikach wykonywane są w puli wątków (asyncio.to_thread), więc
+    nie blokują pętli zdarzeń.
+
+    Zapisy zgłaszane przez wiele współbieżnych korutyn są łączone: gdy trwa
+    zapis, kolejne zmiany są zbierane i zapisywane razem w następnym zapisie,
+    a każda korutyna czeka tylko na zapis zawierający jej zmiany.
+
+    Args:
+        file_manager (FileManager, optional): Obiekt wykonujący operacje na
+            plikach. Domyślnie FileManager z domyślną ścieżką
+    """
+
+    def __init__(self, file_manager=None):
+        self.file_manager = file_manager if file_manager is not None else FileManager()
+        self._tasks = None
+        self._pending = []
+        self._snapshot = False
+        self._next_write = None
+        self._writer = None
+
+    async def load_tasks(self):
+        """Wczytuje zadania z pliku po zakończeniu trwających zapisów.
+
+        Returns:
+            list: Lista obiektów Task wczytanych z pliku
+        """
+        await self._wait_for_writes()
+        return await asyncio.to_thread(self.file_manager.load_tasks)
+
+    async def save_tasks(self, tasks):
+        """Zapisuje całą listę zadań, łącząc zapis z innymi oczekującymi.
+
+        Args:
+            tasks (list): Lista obiektów Task do zapisania
+
+        Returns:
+            bool: True jeśli zapis się powiódł, False w przypadku błędu
+        """
+        return await self._submit(tasks, [], True)
+
+    async def apply_changes(self, tasks, changes):
+        """Utrwala zmiany, łącząc je ze zmianami innych korutyn.
+
+        Args:
+            tasks (list): Aktualna lista zadań (po wprowadzeniu zmian)
+            changes (list): Zmiany jako krotki (operacja, zadanie)
+
+        Returns:
+            bool: True jeśli zapis się powiódł, False w przypadku błędu
+        """
+        return await self._submit(tasks, changes, False)
+
+    async def flush(self):
+        """Czeka na zakończenie zapisów i wymusza odłożony fsync."""
+        await self._wait_for_writes()
+        await asyncio.to_thread(self.file_manager.sync)
+
+    async def close(self):
+        """Czeka na zakończenie zapisów i zamyka pliki."""
+        await self.flush()
+        await asyncio.to_thread(self.file_manager.close)
+
+    async def _submit(self, tasks, changes, snapshot):
+        """Dołącza zmiany do najbliższego zapisu i czeka na jego wynik.
+
+        Args:
+            tasks (list): Aktualna lista zadań
+            changes (list): Zmiany do zapisania
+            snapshot (bool): Czy zapisać całą listę zamiast zmian
+
+        Returns:
+            bool: Wynik zapisu zawierającego zmiany
+        """
+        self._tasks = tasks
+        self._pending.extend(changes)
+        self._snapshot = self._snapshot or snapshot
+        if self._next_write is None:
+            self._next_write = asyncio.get_running_loop().create_future()
+        write = self._next_write
+        if self._writer is None:
+            self._writer = asyncio.ensure_future(self._write_loop())
+        return await asyncio.shield(write)
+
+    async def _write_loop(self):
+        """Zapisuje kolejne partie zmian, dopóki są zgłoszone zapisy.
+
+        Kopia listy i linie tekstu zmienionych zadań są przygotowywane
+        w wątku pętli zdarzeń, w którym korutyny modyfikują zadania, a zapis
+        na dysk odbywa się w puli wątków.
+        """
+        try:
+            while self._next_write is not None:
+                write, self._next_write = self._next_write, None
+                changes, self._pending = self._pending, []
+                snapshot, self._snapshot = self._snapshot, False
+                tasks = list(self._tasks)
+                for _, task in changes:
+                    task.mark_dirty()
+                    task.to_string()
+                try:
+                    if snapshot:
+                        result = await asyncio.to_thread(self.file_manager.save_tasks, tasks)
+                    else:
+                        result = await asyncio.to_thread(
+                            self.file_manager.apply_changes, tasks, changes
+                        )
+                except asyncio.CancelledError:
+                    write.cancel()
+                    raise
+                except Exception as e:
+                    print(f"Błąd podczas zapisu zadań: {e}")
+                    result = False
+                write.set_result(result)
+        finally:
+            self._writer = None
+
+    async def _wait_for_writes(self):
+        """Czeka, aż wszystkie zgłoszone zapisy zostaną wykonane."""
+        while self._writer is not None:
+            await asyncio.shield(self._writer)
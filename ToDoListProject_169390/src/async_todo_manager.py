@@ -0,0 +1,212 @@
+import asyncio
+from src.async_file_manager import AsyncFileManager
+from src.file_manager import FileManager
+from src.todo_manager import TodoManager
+
+
+class AsyncTodoManager:
+    """
+    Asynchroniczny odpowiednik TodoManager dla aplikacji opartych na asyncio.
+    Operacje modyfikujące zmieniają stan w pamięci od razu, w wątku pętli
+    zdarzeń, a następnie czekają na zapis zmian przez AsyncFileManager.
+    Zmiany wielu współbieżnych korutyn są zapisywane wspólnie, więc tysiące
+    równoczesnych operacji nie powodują tysięcy zapisów pliku.
+    Metody odczytu nie wykonują operacji na plikach i są synchroniczne.
+
+    Obiekt tworzy się metodą open():
+
+        manager = await AsyncTodoManager.open("zadania.txt")
+        task = await manager.add_task("Zadanie")
+
+    Args:
+        todo_manager (TodoManager): Menedżer przechowujący zadania w pamięci,
+            utworzony z _ChangeCollector jako obiektem zapisu
+        file_manager (AsyncFileManager): Obiekt zapisujący zmiany
+    """
+
+    def __init__(self, todo_manager, file_manager):
+        self._manager = todo_manager
+        self._changes = todo_manager.file_manager
+        self.file_manager = file_manager
+
+    @classmethod
+    async def open(cls, file_path="todo_tasks.txt", file_manager=None, lazy=False):
+        """Tworzy menedżer, wczytując zadania z pliku w puli wątków.
+
+        Args:
+            file_path (str): Ścieżka do pliku z zadaniami
+            file_manager (FileManager lub AsyncFileManager, optional): Gotowy
+                obiekt do zapisu i odczytu zadań. Gdy podany, file_path jest ignorowany
+            lazy (bool, optional): Tryb leniwy, jak w TodoManager
+
+        Returns:
+            AsyncTodoManager: Nowy menedżer zadań
+        """
+        if file_manager is None:
+            file_manager = FileManager(file_path)
+        if not isinstance(file_manager, AsyncFileManager):
+            file_manager = AsyncFileManager(file_manager)
+        collector = _ChangeCollector(file_manager.file_manager)
+        todo_manager = await asyncio.to_thread(TodoManager, file_manager=collector, lazy=lazy)
+        manager = cls(todo_manager, file_manager)
+        await manager._persist()
+        return manager
+
+    async def add_task(self, title, description=""):
+        """Dodaje nowe zadanie do listy i czeka na jego zapis.
+
+        Args:
+            title (str): Tytuł nowego zadania
+            description (str, optional): Opis zadania. Domyślnie pusty string
+
+        Returns:
+            Task: Utworzony obiekt zadania z nadanym identyfikatorem
+
+        Raises:
+            ValueError: Gdy tytuł zadania jest pusty
+        """
+        task = self._manager.add_task(title, description)
+        await self._persist()
+        return task
+
+    async def delete_task(self, task_index):
+        """Usuwa zadanie z listy (zob. TodoManager.delete_task)."""
+        result = self._manager.delete_task(task_index)
+        await self._persist()
+        return result
+
+    async def delete_task_by_id(self, task_id):
+        """Usuwa zadanie o podanym identyfikatorze (zob. TodoManager.delete_task_by_id)."""
+        result = self._manager.delete_task_by_id(task_id)
+        await self._persist()
+        return result
+
+    async def edit_task(self, task_index, title=None, description=None):
+        """Edytuje istniejące zadanie (zob. TodoManager.edit_task)."""
+        result = self._manager.edit_task(task_index, title, description)
+        await self._persist()
+        return result
+
+    async def edit_task_by_id(self, task_id, title=None, description=None):
+        """Edytuje zadanie o podanym identyfikatorze (zob. TodoManager.edit_task_by_id)."""
+        result = self._manager.edit_task_by_id(task_id, title, description)
+        await self._persist()
+        return result
+
+    async def change_task_status(self, task_index, new_status):
+        """Zmienia status zadania (zob. TodoManager.change_task_status)."""
+        result = self._manager.change_task_status(task_index, new_status)
+        await self._persist()
+        return result
+
+    async def change_task_status_by_id(self, task_id, new_status):
+        """Zmienia status zadania o podanym identyfikatorze.
+
+        Zob. TodoManager.change_task_status_by_id.
+        """
+        result = self._manager.change_task_status_by_id(task_id, new_status)
+        await self._persist()
+        return result
+
+    async def undo(self):
+        """Cofa ostatnią operację modyfikującą (zob. TodoManager.undo)."""
+        result = self._manager.undo()
+        await self._persist()
+        return result
+
+    async def redo(self):
+        """Ponawia ostatnią cofniętą operację (zob. TodoManager.redo)."""
+        result = self._manager.redo()
+        await self._persist()
+        return result
+
+    def subscribe(self, callback=None, kinds=None, interval=0.05, max_pending=10000):
+        """Rejestruje subskrybenta zdarzeń zmian (zob. TodoManager.subscribe).
+
+        Funkcja callback jest wywoływana w wątku subskrypcji - do korutyn
+        zdarzenia można przekazać np. przez loop.call_soon_threadsafe.
+        """
+        return self._manager.subscribe(callback, kinds, interval, max_pending)
+
+    def get_task(self, task_id):
+        """Zwraca zadanie o podanym identyfikatorze (zob. TodoManager.get_task)."""
+        return self._manager.get_task(task_id)
+
+    def get_tasks(self):
+        """Zwraca kopię listy wszystkich zadań (zob. TodoManager.get_tasks)."""
+        return self._manager.get_tasks()
+
+    def get_tasks_by_status(self, status):
+        """Zwraca zadania o określonym statusie (zob. TodoManager.get_tasks_by_status)."""
+        return self._manager.get_tasks_by_status(status)
+
+    def count_tasks_by_status(self, status):
+        """Zwraca liczbę zadań o określonym statusie (zob. TodoManager.count_tasks_by_status)."""
+        return self._manager.count_tasks_by_status(status)
+
+    async def flush(self):
+        """Czeka na zapis wszystkich zmian i wymusza odłożony fsync."""
+        await self._persist()
+        await self.file_manager.flush()
+
+    async def close(self):
+        """Zapisuje odłożone zmiany i zamyka pliki."""
+        await self._persist()
+        await self.file_manager.close()
+
+    async def _persist(self):
+        """Przekazuje zmiany zebrane od TodoManager do zapisu i czeka na niego.
+
+        Returns:
+            bool: True jeśli zapis się powiódł lub nie było zmian
+        """
+        changes, snapshot = self._changes.take()
+        if snapshot:
+            return await self.file_manager.save_tasks(self._manager.tasks)
+        if changes:
+            return await self.file_manager.apply_changes(self._manager.tasks, changes)
+        return True
+
+
+class _ChangeCollector:
+    """
+    Obiekt zapisu dla TodoManager wewnątrz AsyncTodoManager.
+    Wczytuje zadania przez właściwy FileManager, ale zamiast zapisywać
+    zmiany - zbiera je, aby AsyncTodoManager zapisał je asynchronicznie.
+    """
+
+    def __init__(self, file_manager):
+        self.file_manager = file_manager
+        self._changes = []
+        self._snapshot = False
+
+    def load_tasks(self):
+        return self.file_manager.load_tasks()
+
+    def load_tasks_lazy(self):
+        return self.file_manager.load_tasks_lazy()
+
+    def save_tasks(self, tasks):
+        self._changes = []
+        self._snapshot = True
+        return True
+
+    def apply_changes(self, tasks, changes):
+        self._changes.extend(changes)
+        return True
+
+    def sync(self):
+        pass
+
+    def close(self):
+        pass
+
+    def take(self):
+        """Zwraca zebrane zmiany i czyści je.
+
+        Returns:
+            tuple: (lista zmian, czy trzeba zapisać całą listę)
+        """
+        changes, self._changes = self._changes, []
+        snapshot, self._snapshot = self._snapshot, False
+        return changes, snapshot
@@ -0,0 +1,401 @@
+import mmap
+import os
+import struct
+import sys
+import weakref
+from array import array
+from src.file_manager import FileManager
+from src.lazy_task_list import LazyTaskList
+from src.metrics import timed
+from src.task import Task
+from src.todo_status import TaskStatus
+
+MAGIC = b"TODOBIN1"
+STATUS_CODES = (TaskStatus.PENDING, TaskStatus.DONE, TaskStatus.UNFINISHED)
+
+_HEADER = struct.Struct("<8sQ")
+_OFFSET = struct.Struct("<Q")
+_LENGTH = struct.Struct("<I")
+
+
+class BinaryFileManager(FileManager):
+    """
+    Klasa zapisująca zadania w binarnym formacie kolumnowym.
+
+    Układ pliku (little-endian):
+        nagłówek: MAGIC, liczba zadań N
+        status: N bajtów (indeks w STATUS_CODES)
+        task_id: N x uint64 (0 oznacza brak identyfikatora)
+        tytuły: N x uint64 przesunięcie + N x uint32 długość
+        opisy: N x uint64 przesunięcie + N x uint32 długość
+        sterta: teksty tytułów i opisów w UTF-8
+
+    Plik jest otwierany przez mmap, a load_tasks zwraca LazyTaskList, więc
+    wczytanie trwa niemal stały czas, a obiekty Task powstają dopiero przy
+    dostępie. Format tekstowy pozostaje dostępny przez import_text/export_text.
+
+    Aktualizacje zadań (bez dziennika i zapisu atomowego) są nanoszone
+    w miejscu: zmieniany jest bajt statusu, a nowy tytuł lub opis nadpisuje
+    poprzedni albo, gdy jest dłuższy, jest dopisywany na końcu sterty.
+    Koszt zapisu zależy więc od liczby zmian, a nie od liczby zadań (poza
+    plikiem współdzielonym, gdzie każdy zapis jest pełną migawką). Pełny
+    zapis (kompaktujący stertę) następuje przy dodaniu lub usunięciu zadania
+    oraz gdy nieużywana część sterty przekroczy połowę pliku.
+
+    Istniejący dziennik jest nakładany przy każdym wczytaniu i czyszczony
+    przy zapisie migawki, także poza trybem dziennika (jak w FileManager).
+
+    Kompresja (parametr compression) nie jest obsługiwana, bo skompresowanego
+    pliku nie da się zmapować do pamięci.
+
+    Raises:
+        ValueError: Gdy podano parametr compression
+    """
+
+    def __init__(self, file_path="database_todo.bin", **options):
+        if options.get("compression") is not None:
+            raise ValueError("Format binarny nie obsługuje kompresji")
+        super().__init__(file_path, **options)
+        self._records = None
+        self._heap_garbage = 0
+
+    @timed("file.save_tasks")
+    def save_tasks(self, tasks):
+        """Zapisuje listę zadań w formacie binarnym.
+
+        Args:
+            tasks (list): Lista obiektów Task do zapisania
+
+        Returns:
+            bool: True jeśli zapis się powiódł, False w przypadku błędu
+        """
+        target = self._snapshot_target(self.atomic)
+        try:
+            data = _encode_tasks(tasks)
+            with self.lock():
+                self.close()
+                self._records = None
+                with open(target, "wb") as file:
+                    file.write(data)
+                    self._sync(file)
+                self._commit_snapshot(target)
+            self._heap_garbage = 0
+            self.metrics.increment("file.bytes_written", len(data))
+            return True
+        except Exception as e:
+            print(f"Błąd podczas zapisywania zadań: {e}")
+            self._discard_snapshot(target)
+            return False
+
+    @timed("file.load_tasks")
+    def load_tasks(self):
+        """Otwiera plik binarny i zwraca leniwą listę zadań.
+
+        Returns:
+            list: LazyTaskList z zadaniami z pliku, lub pusta lista
+                  w przypadku błędu lub braku pliku
+        """
+        if not os.path.exists(self.file_path):
+            open(self.file_path, "wb").close()
+            return []
+
+        try:
+            self.close()
+            self._records = None
+            with self._read_lock():
+                self._record_read()
+                if os.path.getsize(self.file_path) == 0:
+                    tasks = []
+                else:
+                    self._file = open(self.file_path, "rb")
+                    self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                    columns = _BinaryColumns(self._mmap)
+                    tasks = LazyTaskList(range(columns.count), columns.task)
+                    self._lazy_tasks = weakref.ref(tasks)
+                self._replay_journal(tasks)
+            return tasks
+        except Exception as e:
+            print(f"Błąd podczas odczytu zadań: {e}")
+            self.close()
+            return []
+
+    def apply_changes(self, tasks, changes):
+        """Utrwala zmiany, nanosząc aktualizacje zadań w miejscu.
+
+        Gdy wszystkie zmiany są aktualizacjami zadań zapisanych w pliku,
+        poprawiane są tylko rekordy tych zadań. W pozostałych przypadkach
+        (dodanie, usunięcie, tryb dziennika, zapisu atomowego, plik
+        współdzielony lub niepusty dziennik, którego rekordy nałożyłyby się
+        na poprawione rekordy) działa jak FileManager.apply_changes.
+
+        Args:
+            tasks (list): Aktualna lista zadań (po wprowadzeniu zmian)
+            changes (list): Zmiany jako krotki (operacja, zadanie)
+
+        Returns:
+            bool: True jeśli zapis się powiódł, False w przypadku błędu
+        """
+        updates_only = all(operation == "update" for operation, _ in changes)
+        if (
+            self.journal
+            or self.atomic
+            or self.shared
+            or not updates_only
+            or _has_records(self.journal_path)
+        ):
+            return super().apply_changes(tasks, changes)
+        try:
+            if self._patch_records([task for _, task in changes]):
+                return True
+        except Exception as e:
+            print(f"Błąd podczas aktualizacji zadań w miejscu: {e}")
+        return self.save_tasks(tasks)
+
+    @timed("file.patch_records")
+    def _patch_records(self, tasks):
+        """Nanosi stan podanych zadań na ich rekordy w pliku.
+
+        Args:
+            tasks (list): Zmienione zadania
+
+        Returns:
+            bool: True jeśli rekordy zostały poprawione, False gdy potrzebny
+                  jest pełny zapis (brak zadania w pliku, zbyt duża sterta)
+        """
+        records = self._record_positions()
+        indexes = [records.get(task.task_id) for task in tasks]
+        if None in indexes:
+            return False
+
+        with open(self.file_path, "r+b") as file:
+            columns = _BinaryColumns(file.read(_HEADER.size))
+            end = file.seek(0, os.SEEK_END)
+            if self._heap_garbage * 2 > end:
+                return False
+            for task, index in zip(tasks, indexes):
+                file.seek(columns.status_start + index)
+                file.write(bytes((STATUS_CODES.index(task.status),)))
+                for offset_start, length_start, value in (
+                    (columns.title_offset_start, columns.title_length_start, task.title),
+                    (columns.desc_offset_start, columns.desc_length_start, task.description),
+                ):
+                    end = self._patch_text(
+                        file, columns, offset_start, length_start, index, value, end
+                    )
+            self._sync(file)
+        return True
+
+    def _patch_text(self, file, columns, offset_start, length_start, index, value, end):
+        """Zastępuje tekst rekordu, gdy różni się od zapisanego.
+
+        Krótszy lub równy tekst nadpisuje poprzedni, dłuższy jest dopisywany
+        na końcu pliku, a przesunięcie rekordu jest poprawiane.
+
+        Args:
+            file (file): Plik otwarty w trybie "r+b"
+            columns (_BinaryColumns): Układ kolumn pliku
+            offset_start (int): Początek kolumny przesunięć
+            length_start (int): Początek kolumny długości
+            index (int): Numer rekordu
+            value (str): Nowy tekst
+            end (int): Bieżący rozmiar pliku
+
+        Returns:
+            int: Rozmiar pliku po zmianie
+        """
+        file.seek(offset_start + index * _OFFSET.size)
+        (offset,) = _OFFSET.unpack(file.read(_OFFSET.size))
+        file.seek(length_start + index * _LENGTH.size)
+        (length,) = _LENGTH.unpack(file.read(_LENGTH.size))
+        file.seek(columns.heap_start + offset)
+        encoded = str(value).encode("utf-8")
+        if file.read(length) == encoded:
+            return end
+
+        if len(encoded) <= length:
+            file.seek(columns.heap_start + offset)
+            file.write(encoded)
+            self._heap_garbage += length - len(encoded)
+        else:
+            file.seek(end)
+            file.write(encoded)
+            file.seek(offset_start + index * _OFFSET.size)
+            file.write(_OFFSET.pack(end - columns.heap_start))
+            self._heap_garbage += length
+            end += len(encoded)
+        file.seek(length_start + index * _LENGTH.size)
+        file.write(_LENGTH.pack(len(encoded)))
+        return end
+
+    def _record_positions(self):
+        """Zwraca słownik identyfikator zadania -> numer rekordu w pliku.
+
+        Słownik jest budowany z kolumny identyfikatorów przy pierwszym użyciu
+        i unieważniany przy pełnym zapisie lub wczytaniu pliku.
+
+        Returns:
+            dict: Numery rekordów zadań posiadających identyfikator
+        """
+        if self._records is None:
+            self._records = {}
+            if os.path.exists(self.file_path) and os.path.getsize(self.file_path):
+                with open(self.file_path, "rb") as file:
+                    columns = _BinaryColumns(file.read(_HEADER.size))
+                    file.seek(columns.id_start)
+                    ids = array("Q", file.read(columns.count * _OFFSET.size))
+                if sys.byteorder != "little":
+                    ids.byteswap()
+                self._records = {task_id: index for index, task_id in enumerate(ids) if task_id}
+        return self._records
+
+    def _iter_snapshot(self, report=None):
+        """Zwraca zadania z pliku binarnego bez zapamiętywania ich w pamięci.
+
+        Args:
+            report (LoadReport, optional): Raport błędów - rekordy binarne nie
+                zawierają linii do pominięcia, więc pozostaje pusty
+
+        Yields:
+            Task: Kolejne zadania z pliku
+        """
+        if os.path.getsize(self.file_path) == 0:
+            return
+        with open(self.file_path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                columns = _BinaryColumns(buffer)
+                for index in range(columns.count):
+                    yield columns.task(index)
+
+    def load_tasks_lazy(self):
+        """Wczytuje zadania leniwie - format binarny zawsze jest wczytywany leniwie.
+
+        Returns:
+            list: LazyTaskList z zadaniami z pliku
+        """
+        return self.load_tasks()
+
+    def import_text(self, text_path):
+        """Importuje zadania z pliku w formacie tekstowym.
+
+        Args:
+            text_path (str): Ścieżka do pliku tekstowego "title|description|status"
+
+        Returns:
+            bool: True jeśli zapis się powiódł, False w przypadku błędu
+        """
+        return self.save_tasks(FileManager(text_path).load_tasks())
+
+    def export_text(self, text_path):
+        """Eksportuje zadania do pliku w formacie tekstowym.
+
+        Args:
+            text_path (str): Ścieżka do docelowego pliku tekstowego
+
+        Returns:
+            bool: True jeśli zapis się powiódł, False w przypadku błędu
+        """
+        return FileManager(text_path).save_tasks(self.load_tasks())
+
+
+def _has_records(path):
+    """Sprawdza, czy plik (np. dziennik) istnieje i nie jest pusty.
+
+    Args:
+        path (str): Ścieżka do pliku
+
+    Returns:
+        bool: True jeśli plik ma zawartość
+    """
+    return os.path.exists(path) and os.path.getsize(path) > 0
+
+
+class _BinaryColumns:
+    """Widok kolumn zmapowanego pliku binarnego."""
+
+    def __init__(self, buffer):
+        magic, count = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("Nieprawidłowy format pliku binarnego")
+        self.buffer = buffer
+        self.count = count
+        self.status_start = _HEADER.size
+        self.id_start = self.status_start + count
+        self.title_offset_start = self.id_start + count * _OFFSET.size
+        self.title_length_start = self.title_offset_start + count * _OFFSET.size
+        self.desc_offset_start = self.title_length_start + count * _LENGTH.size
+        self.desc_length_start = self.desc_offset_start + count * _OFFSET.size
+        self.heap_start = self.desc_length_start + count * _LENGTH.size
+
+    def task(self, index):
+        """Tworzy obiekt Task z rekordu o podanym numerze.
+
+        Args:
+            index (int): Numer rekordu
+
+        Returns:
+            Task: Zadanie odczytane z kolumn
+        """
+        status = STATUS_CODES[self.buffer[self.status_start + index]]
+        (task_id,) = _OFFSET.unpack_from(self.buffer, self.id_start + index * _OFFSET.size)
+        title = self._text(self.title_offset_start, self.title_length_start, index)
+        description = self._text(self.desc_offset_start, self.desc_length_start, index)
+        return Task(title, description, status, task_id or None)
+
+    def _text(self, offset_start, length_start, index):
+        """Odczytuje tekst ze sterty.
+
+        Args:
+            offset_start (int): Początek kolumny przesunięć
+            length_start (int): Początek kolumny długości
+            index (int): Numer rekordu
+
+        Returns:
+            str: Zdekodowany tekst
+        """
+        (offset,) = _OFFSET.unpack_from(self.buffer, offset_start + index * _OFFSET.size)
+        (length,) = _LENGTH.unpack_from(self.buffer, length_start + index * _LENGTH.size)
+        start = self.heap_start + offset
+        return self.buffer[start:start + length].decode("utf-8")
+
+
+def _encode_tasks(tasks):
+    """Koduje listę zadań do formatu binarnego.
+
+    Args:
+        tasks (list): Lista obiektów Task
+
+    Returns:
+        bytes: Zawartość pliku binarnego
+
+    Raises:
+        ValueError: Gdy zadanie ma nieprawidłowy status
+    """
+    statuses = bytearray()
+    ids = []
+    offsets = {"title": [], "description": []}
+    lengths = {"title": [], "description": []}
+    heap = []
+    heap_size = 0
+
+    for task in tasks:
+        statuses.append(STATUS_CODES.index(task.status))
+        ids.append(_OFFSET.pack(task.task_id or 0))
+        for field, value in (("title", task.title), ("description", task.description)):
+            encoded = str(value).encode("utf-8")
+            offsets[field].append(_OFFSET.pack(heap_size))
+            lengths[field].append(_LENGTH.pack(len(encoded)))
+            heap.append(encoded)
+            heap_size += len(encoded)
+
+    return b"".join(
+        [
+            _HEADER.pack(MAGIC, len(statuses)),
+            bytes(statuses),
+            *ids,
+            *offsets["title"],
+            *lengths["title"],
+            *offsets["description"],
+            *lengths["description"],
+            *heap,
+        ]
+    )
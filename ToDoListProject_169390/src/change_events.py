@@ -0,0 +1,330 @@
+import threading
+
+ADDED = "added"
+EDITED = "edited"
+STATUS_CHANGED = "status_changed"
+DELETED = "deleted"
+RESET = "reset"
+
+
+class TaskEvent:
+    """
+    Zdarzenie zmiany listy zadań przekazywane subskrybentom.
+
+    Rodzaje zdarzeń i ich wartości:
+        ADDED - old jest None, new zawiera "title", "description" i "status"
+        EDITED - old i new zawierają "title" i "description"
+        STATUS_CHANGED - old i new zawierają "status"
+        DELETED - old zawiera "title", "description" i "status", new jest None
+        RESET - lista zadań zmieniła się w całości (np. po przywróceniu
+            wersji lub przepełnieniu kolejki subskrybenta) i należy ją
+            wczytać ponownie; task_id, old i new są None
+
+    Attributes:
+        kind (str): Rodzaj zdarzenia
+        task_id (int): Identyfikator zadania
+        old (dict): Wartości pól przed zmianą
+        new (dict): Wartości pól po zmianie
+    """
+
+    __slots__ = ("kind", "task_id", "old", "new")
+
+    def __init__(self, kind, task_id=None, old=None, new=None):
+        self.kind = kind
+        self.task_id = task_id
+        self.old = old
+        self.new = new
+
+    def __eq__(self, other):
+        if not isinstance(other, TaskEvent):
+            return NotImplemented
+        return (self.kind, self.task_id, self.old, self.new) == (
+            other.kind, other.task_id, other.old, other.new
+        )
+
+    def __repr__(self):
+        return (
+            f"TaskEvent({self.kind!r}, task_id={self.task_id}, "
+            f"old={self.old!r}, new={self.new!r})"
+        )
+
+
+class Subscription:
+    """
+    Subskrypcja zdarzeń zmian listy zadań.
+
+    Zdarzenia trafiają do kolejki subskrypcji bez czekania na subskrybenta,
+    więc powolny subskrybent nie spowalnia operacji modyfikujących. Zdarzenia
+    dotyczące tego samego zadania są w kolejce łączone (np. kilka edycji daje
+    jedną edycję z pierwszą starą i ostatnią nową wartością, a zadanie dodane
+    i usunięte przed odbiorem znika z kolejki), więc jej rozmiar zależy od
+    liczby zmienionych zadań, a nie od liczby operacji. Gdy przekroczy
+    max_pending, kolejka jest zastępowana jednym zdarzeniem RESET.
+
+    Zdarzenia odbiera się metodą poll() albo przez funkcję callback, którą
+    wątek subskrypcji wywołuje z listą zdarzeń zebranych w ciągu interval
+    sekund. Subskrypcję kończy close().
+
+    Args:
+        notifier (ChangeNotifier): Źródło zdarzeń
+        callback (function, optional): Funkcja wywoływana z listą zdarzeń
+        kinds (iterable, optional): Rodzaje przekazywanych zdarzeń. Domyślnie
+            wszystkie; RESET jest przekazywany zawsze
+        interval (float, optional): Czas (w sekundach), przez jaki wątek
+            subskrypcji zbiera zdarzenia przed wywołaniem callback
+        max_pending (int, optional): Maksymalna liczba zadań ze zdarzeniami
+            oczekującymi na odbiór
+
+    Attributes:
+        overflows (int): Liczba przepełnień kolejki zastąpionych zdarzeniem RESET
+    """
+
+    def __init__(self, notifier, callback=None, kinds=None, interval=0.05, max_pending=10000):
+        self.callback = callback
+        self.kinds = frozenset(kinds) if kinds is not None else None
+        self.interval = interval
+        self.max_pending = max_pending
+        self.overflows = 0
+        self._notifier = notifier
+        self._condition = threading.Condition()
+        self._pending = {}
+        self._reset = False
+        self._closed = False
+        self._thread = None
+        if callback is not None:
+            self._thread = threading.Thread(target=self._run, name="todo-events", daemon=True)
+            self._thread.start()
+
+    @property
+    def pending_count(self):
+        """Liczba zadań ze zdarzeniami oczekującymi na odbiór."""
+        with self._condition:
+            return len(self._pending)
+
+    def push(self, events):
+        """Dodaje zdarzenia do kolejki subskrypcji, łącząc je z oczekującymi.
+
+        Args:
+            events (list): Obiekty TaskEvent w kolejności zmian
+        """
+        with self._condition:
+            if self._closed or self._reset:
+                return
+            for event in events:
+                if event.kind == RESET:
+                    self._pending.clear()
+                    self._reset = True
+                    break
+                _coalesce(self._pending, event)
+            if len(self._pending) > self.max_pending:
+                self._pending.clear()
+                self._reset = True
+                self.overflows += 1
+            self._condition.notify_all()
+
+    def poll(self, timeout=0):
+        """Zwraca zdarzenia oczekujące w kolejce i opróżnia ją.
+
+        Args:
+            timeout (float, optional): Maksymalny czas oczekiwania (w sekundach)
+                na zdarzenia, gdy kolejka jest pusta. None - bez ograniczenia
+
+        Returns:
+            list: Obiekty TaskEvent w kolejności pierwszej zmiany zadań
+        """
+        with self._condition:
+            if timeout != 0:
+                self._condition.wait_for(lambda: self._has_events() or self._closed, timeout)
+            return self._take()
+
+    def close(self):
+        """Kończy subskrypcję.
+
+        Wątek subskrypcji przekazuje jeszcze zdarzenia oczekujące w kolejce.
+        """
+        self._notifier.unsubscribe(self)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _has_events(self):
+        """Czy w kolejce są zdarzenia."""
+        return bool(self._pending) or self._reset
+
+    def _take(self):
+        """Pobiera zdarzenia z kolejki (pod blokadą subskrypcji).
+
+        Returns:
+            list: Obiekty TaskEvent
+        """
+        if self._reset:
+            events = [TaskEvent(RESET)]
+        else:
+            events = [event for group in self._pending.values() for event in group]
+            if self.kinds is not None:
+                events = [event for event in events if event.kind in self.kinds]
+        self._pending = {}
+        self._reset = False
+        return events
+
+    def _run(self):
+        """Pętla wątku subskrypcji - przekazuje zdarzenia partiami do callback."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._has_events() or self._closed)
+                if not self._has_events():
+                    return
+                if self.interval and not self._closed:
+                    self._condition.wait_for(lambda: self._closed, self.interval)
+                events = self._take()
+            if not events:
+                continue
+            try:
+                self.callback(events)
+            except Exception as e:
+                print(f"Błąd subskrybenta zdarzeń: {e}")
+
+
+class ChangeNotifier:
+    """
+    Lista subskrypcji zdarzeń zmian menedżera zadań.
+
+    Publikacja jedynie dopisuje zdarzenia do kolejek subskrypcji. Lista
+    subskrypcji jest wymieniana w całości przy zmianie, więc publikacja
+    nie zajmuje blokady, a bez subskrybentów menedżer nie tworzy zdarzeń
+    (atrybut active).
+
+    Attributes:
+        active (bool): Czy są subskrybenci
+    """
+
+    def __init__(self):
+        self.active = False
+        self._subscriptions = ()
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback=None, kinds=None, interval=0.05, max_pending=10000):
+        """Tworzy nową subskrypcję (zob. Subscription).
+
+        Returns:
+            Subscription: Nowa subskrypcja
+        """
+        subscription = Subscription(self, callback, kinds, interval, max_pending)
+        with self._lock:
+            self._subscriptions += (subscription,)
+            self.active = True
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """Usuwa subskrypcję z listy.
+
+        Args:
+            subscription (Subscription): Usuwana subskrypcja
+        """
+        with self._lock:
+            self._subscriptions = tuple(
+                item for item in self._subscriptions if item is not subscription
+            )
+            self.active = bool(self._subscriptions)
+
+    def publish(self, events):
+        """Przekazuje zdarzenia wszystkim subskrypcjom.
+
+        Args:
+            events (list): Obiekty TaskEvent w kolejności zmian
+        """
+        for subscription in self._subscriptions:
+            subscription.push(events)
+
+
+def _coalesce(pending, event):
+    """Łączy zdarzenie ze zdarzeniami tego samego zadania oczekującymi w kolejce.
+
+    Zdarzenia są współdzielone przez subskrypcje, więc połączenie tworzy
+    nowe obiekty zamiast zmieniać istniejące.
+
+    Args:
+        pending (dict): Listy oczekujących zdarzeń według identyfikatora zadania
+        event (TaskEvent): Nowe zdarzenie
+    """
+    task_id = event.task_id
+    events = pending.get(task_id)
+    if events is None:
+        pending[task_id] = [event]
+        return
+
+    first = events[0]
+    if event.kind == DELETED:
+        if first.kind == ADDED:
+            del pending[task_id]
+            return
+        old = dict(event.old)
+        for earlier in reversed(events):
+            old.update(earlier.old)
+        pending[task_id] = [TaskEvent(DELETED, task_id, old, None)]
+    elif first.kind == ADDED:
+        pending[task_id] = [TaskEvent(ADDED, task_id, None, {**first.new, **event.new})]
+    elif first.kind == DELETED:
+        merged = _changes(task_id, first.old, event.new)
+        if merged:
+            pending[task_id] = merged
+        else:
+            del pending[task_id]
+    else:
+        merged = [earlier for earlier in events if earlier.kind != event.kind]
+        previous = next((earlier for earlier in events if earlier.kind == event.kind), None)
+        if previous is None:
+            merged.append(event)
+        elif previous.old != event.new:
+            combined = TaskEvent(event.kind, task_id, previous.old, event.new)
+            merged.insert(events.index(previous), combined)
+        if merged:
+            pending[task_id] = merged
+        else:
+            del pending[task_id]
+
+
+def _changes(task_id, old, new):
+    """Zwraca zdarzenia opisujące różnicę między dwoma stanami zadania.
+
+    Args:
+        task_id (int): Identyfikator zadania
+        old (dict): Pola zadania przed zmianą
+        new (dict): Pola zadania po zmianie
+
+    Returns:
+        list: Zdarzenia EDITED i STATUS_CHANGED (puste, gdy stany są równe)
+    """
+    events = []
+    if (old["title"], old["description"]) != (new["title"], new["description"]):
+        events.append(TaskEvent(
+            EDITED,
+            task_id,
+            {"title": old["title"], "description": old["description"]},
+            {"title": new["title"], "description": new["description"]},
+        ))
+    if old["status"] != new["status"]:
+        events.append(TaskEvent(
+            STATUS_CHANGED, task_id, {"status": old["status"]}, {"status": new["status"]}
+        ))
+    return events
+
+
+def task_fields(task):
+    """Zwraca pola zadania zapisywane w zdarzeniach ADDED i DELETED.
+
+    Args:
+        task (Task): Zadanie
+
+    Returns:
+        dict: "title", "description" i "status" zadania
+    """
+    return {"title": task.title, "description": task.description, "status": task.status}
@@ -1,57 +1,1063 @@
-import os
-from src.task import Task
-
-
-class FileManager:
-    """
-    Klasa odpowiedzialna za operacje I/O na plikach z zadaniami.
-    Zapewnia zapisywanie i odczytywanie listy zadań.
-    """
-
-    def __init__(self, file_path="database_todo.txt"):
-        self.file_path = file_path
-
-    def save_tasks(self, tasks):
-        """Zapisuje listę zadań do pliku.
-
-        Args:
-            tasks (list): Lista obiektów Task do zapisania
-
-        Returns:
-            bool: True jeśli zapis się powiódł, False w przypadku błędu
-        """
-        try:
-            with open(self.file_path, "w") as file:
-                for task in tasks:
-                    file.write(task.to_string() + "\n")
-            return True
-        except Exception as e:
-            print(f"Błąd podczas zapisywania zadań: {e}")
-            return False
-
-    def load_tasks(self):
-        """Wczytuje zadania z pliku.
-
-        Returns:
-            list: Lista obiektów Task wczytanych z pliku,
-                  lub pusta lista w przypadku błędu lub braku pliku
-        """
-        tasks = []
-
-        if not os.path.exists(self.file_path):
-            open(self.file_path, "w").close()
-            return tasks
-
-        try:
-            with open(self.file_path, "r") as file:
-                for line in file:
-                    if line.strip():
-                        try:
-                            task = Task.from_string(line)
-                            tasks.append(task)
-                        except ValueError as e:
-                            print(f"Pominięto nieprawidłowe zadanie: {e}")
-            return tasks
-        except Exception as e:
-            print(f"Błąd podczas odczytu zadań: {e}")
-            return []
+import bz2
+import gc
+import gzip
+import io
+import locale
+import lzma
+import mmap
+import os
+import re
+import struct
+import weakref
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager, nullcontext
+from itertools import repeat
+from src.lazy_task_list import LazyTaskList
+from src.load_report import LoadReport
+from src.metrics import NULL_METRICS, timed
+from src.storage_backend import StorageBackend
+from src.task import INVALID_FORMAT, Task
+from src.todo_status import TaskStatus
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    from compression import zstd
+except ImportError:
+    zstd = None
+
+JOURNAL_SUFFIX = ".journal"
+TEMP_SUFFIX = ".tmp"
+LOCK_SUFFIX = ".lock"
+
+DURABILITY_NONE = "none"
+DURABILITY_BATCH = "batch"
+DURABILITY_ALWAYS = "always"
+DURABILITY_LEVELS = (DURABILITY_NONE, DURABILITY_BATCH, DURABILITY_ALWAYS)
+
+_WRITE_CHUNK = 4096
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+PARALLEL_CHUNKS_PER_WORKER = 4
+_VERSION = struct.Struct("<QQ")
+
+_STATUS_PATTERN = b"|".join(re.escape(status.value.encode("ascii")) for status in TaskStatus)
+_VALID_LINE = re.compile(
+    rb"^[^|\n]*\|[^|\n]*\|(?:" + _STATUS_PATTERN + rb")(?:\|[0-9]+)?[ \t\r\f\v]*$",
+    re.MULTILINE,
+)
+# Format kompresji: (funkcja otwierająca strumień, argumenty zapisu, sygnatura pliku)
+COMPRESSION_FORMATS = {
+    "gzip": (gzip.open, {"compresslevel": 6}, b"\x1f\x8b"),
+    "bz2": (bz2.open, {}, re.compile(rb"BZh[1-9]1AY&SY")),
+    "xz": (lzma.open, {"preset": 1}, b"\xfd7zXZ\x00"),
+}
+if zstd is not None:
+    COMPRESSION_FORMATS["zstd"] = (zstd.open, {}, b"\x28\xb5\x2f\xfd")
+_MAGIC_LENGTH = 10
+
+_BLANK_LINE = re.compile(rb"^[ \t\r\f\v]*\n", re.MULTILINE)
+_ANY_LINE = re.compile(rb"^.*$", re.MULTILINE)
+
+
+class FileManager(StorageBackend):
+    """
+    Klasa odpowiedzialna za operacje I/O na plikach z zadaniami.
+    Zapewnia zapisywanie i odczytywanie listy zadań. Jest domyślnym
+    magazynem zadań (StorageBackend) używanym przez TodoManager.
+
+    W trybie dziennika (journal=True) pojedyncze zmiany są dopisywane
+    do pliku "<file_path>.journal" zamiast przepisywania całej listy,
+    a dziennik jest okresowo kompaktowany do nowej migawki. Istniejący
+    dziennik jest nakładany przy każdym wczytaniu i czyszczony przy każdym
+    zapisie migawki także poza trybem dziennika, aby jego rekordy nie
+    zostały nałożone na nowszą migawkę.
+
+    Zapis atomowy (atomic=True) tworzy plik tymczasowy i podmienia nim plik
+    docelowy, więc przerwany zapis nie niszczy poprzedniej zawartości.
+    Poziom trwałości (durability) określa, jak często wywoływany jest fsync:
+        "none" - nigdy, dane trafiają na dysk, gdy zdecyduje system
+        "batch" - raz na sync_interval zapisów oraz przy wywołaniu sync()
+        "always" - po każdym zapisie, przy zapisie atomowym także katalogu
+
+    Plik współdzielony przez wiele procesów (shared=True) jest chroniony
+    blokadą doradczą (flock) na pliku "<file_path>.lock", który przechowuje
+    też licznik wersji danych i licznik migawek. Każdy zapis zwiększa wersję,
+    więc sprawdzenie zmian wprowadzonych przez inne procesy to odczyt 16
+    bajtów. Gdy od ostatniego odczytu zmienił się tylko dziennik, wczytywane
+    są jedynie nowe rekordy (read_external_changes), a po zapisie nowej
+    migawki potrzebne jest ponowne wczytanie pliku. Migawka pliku
+    współdzielonego jest zawsze zapisywana przez plik tymczasowy, więc nie
+    zmienia plików zmapowanych przez inne procesy. Na systemach bez fcntl
+    blokady nie są zakładane, a wykrywanie zmian działa bez zmian.
+
+    Obiekt pomiarów (metrics) otrzymuje czasy operacji "file.save_tasks",
+    "file.apply_changes", "file.load_tasks" i "file.load_tasks_lazy",
+    liczniki "file.bytes_written", "file.tasks_loaded" i
+    "file.skipped_records" oraz zdarzenia "file.skipped_record" dla
+    pominiętych nieprawidłowych linii i rekordów dziennika.
+
+    W trybie zbierania błędów (collect_errors=True) nieprawidłowe linie nie
+    są wypisywane, tylko zliczane w raporcie load_report (LoadReport), który
+    przechowuje pierwsze max_error_samples linii z numerami. Linie są wtedy
+    parsowane przez Task.parse, bez wyjątku dla każdej błędnej linii, więc
+    uszkodzony plik wczytuje się tak szybko jak poprawny.
+
+    Przy workers większym niż 1 load_tasks parsuje pliki większe niż
+    PARALLEL_MIN_BYTES w puli procesów: plik jest dzielony na fragmenty na
+    granicach linii, a wyniki są łączone w kolejności linii. Pominięte linie
+    są zgłaszane tak samo jak przy wczytywaniu sekwencyjnym. Obiekty Task
+    i tak powstają w procesie głównym, więc przyspieszenie jest ograniczone
+    kosztem ich tworzenia i przesłania danych między procesami.
+
+    Z kompresją (compression="gzip", "bz2", "xz", a od Pythona 3.14 także
+    "zstd") migawka jest zapisywana i czytana strumieniowo przez moduł
+    kompresji z biblioteki standardowej, bez rozpakowanej kopii pliku
+    w pamięci. Format pliku jest rozpoznawany przy odczycie po jego
+    sygnaturze, niezależnie od parametru compression, który dotyczy tylko
+    zapisu. Dziennik pozostaje zwykłym plikiem tekstowym, a skompresowanych
+    plików nie da się zmapować do pamięci ani podzielić na fragmenty, więc
+    load_tasks_lazy wczytuje je od razu, a load_tasks - sekwencyjnie.
+    """
+
+    def __init__(
+        self,
+        file_path="database_todo.txt",
+        journal=False,
+        compact_threshold=1000,
+        atomic=False,
+        durability=DURABILITY_NONE,
+        sync_interval=100,
+        shared=False,
+        metrics=None,
+        collect_errors=False,
+        max_error_samples=10,
+        workers=1,
+        compression=None,
+    ):
+        if durability not in DURABILITY_LEVELS:
+            raise ValueError(f"Nieznany poziom trwałości: {durability}")
+        if compression is not None and compression not in COMPRESSION_FORMATS:
+            raise ValueError(f"Nieznany format kompresji: {compression}")
+        self.file_path = file_path
+        self.journal = journal
+        self.journal_path = file_path + JOURNAL_SUFFIX
+        self.compact_threshold = compact_threshold
+        self.atomic = atomic
+        self.durability = durability
+        self.sync_interval = sync_interval
+        self._journal_records = 0
+        self._unsynced_writes = 0
+        self._file = None
+        self._mmap = None
+        self._lazy_tasks = None
+        self.shared = shared
+        self.lock_path = file_path + LOCK_SUFFIX
+        self._lock_fd = None
+        self._lock_depth = 0
+        self._version = 0
+        self._generation = 0
+        self._journal_offset = 0
+        self.metrics = metrics if metrics is not None else NULL_METRICS
+        self.collect_errors = collect_errors
+        self.max_error_samples = max_error_samples
+        self.load_report = None
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self.compression = compression
+        if shared:
+            self._lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            weakref.finalize(self, os.close, self._lock_fd)
+
+    @timed("file.save_tasks")
+    def save_tasks(self, tasks):
+        """Zapisuje listę zadań do pliku.
+
+        Przyjmuje dowolny iterowalny obiekt, więc zadania mogą być zapisywane
+        strumieniowo (np. wprost z iter_tasks()). W trybie atomowym, a także
+        dla zadań spoza listy (które mogą być właśnie odczytywane z pliku
+        docelowego), zapis trafia do pliku tymczasowego podmienianego po
+        zakończeniu zapisu. W trybie dziennika zapis pełnej listy jest
+        migawką, więc dziennik jest po nim czyszczony. Zadania zapamiętują
+        swoją linię tekstu, więc serializowane są tylko zadania zmienione od
+        poprzedniego zapisu, a linie są zapisywane porcjami (z kompresją -
+        przez strumień kompresji, a wielkość zapisu jest liczona po kompresji).
+
+        Args:
+            tasks (iterable): Lista lub inny iterowalny zbiór obiektów Task
+
+        Returns:
+            bool: True jeśli zapis się powiódł, False w przypadku błędu
+        """
+        target = self._snapshot_target(self.atomic or not isinstance(tasks, Sequence))
+        try:
+            with self.lock():
+                self.close()
+                with open(target, "wb" if self.compression else "w") as file:
+                    with self._text_writer(file) as stream:
+                        chunk = []
+                        for task in tasks:
+                            chunk.append(task.to_string())
+                            if len(chunk) == _WRITE_CHUNK:
+                                stream.write("\n".join(chunk) + "\n")
+                                chunk = []
+                        if chunk:
+                            stream.write("\n".join(chunk) + "\n")
+                    self._sync(file)
+                    written = file.tell()
+                self._commit_snapshot(target)
+            self.metrics.increment("file.bytes_written", written)
+            return True
+        except Exception as e:
+            print(f"Błąd podczas zapisywania zadań: {e}")
+            self._discard_snapshot(target)
+            return False
+
+    @timed("file.apply_changes")
+    def apply_changes(self, tasks, changes):
+        """Utrwala zmiany wprowadzone w liście zadań.
+
+        Bez dziennika zapisuje całą listę. W trybie dziennika dopisuje po
+        jednym rekordzie na zmianę, a po przekroczeniu progu compact_threshold
+        kompaktuje dziennik zapisując nową migawkę.
+
+        Args:
+            tasks (list): Aktualna lista zadań (po wprowadzeniu zmian)
+            changes (list): Zmiany jako krotki (operacja, zadanie),
+                gdzie operacja to "add", "update" lub "delete"
+
+        Returns:
+            bool: True jeśli zapis się powiódł, False w przypadku błędu
+        """
+        if not self.journal:
+            return self.save_tasks(tasks)
+
+        if self._journal_records + len(changes) > self.compact_threshold:
+            return self.save_tasks(tasks)
+
+        try:
+            with self.lock():
+                with open(self.journal_path, "a") as file:
+                    start = file.tell()
+                    file.write("".join(_journal_record(*change) for change in changes))
+                    self._sync(file)
+                    written = file.tell() - start
+                self._journal_records += len(changes)
+                self._record_write(snapshot=False)
+            self.metrics.increment("file.bytes_written", written)
+            return True
+        except Exception as e:
+            print(f"Błąd podczas zapisu dziennika: {e}")
+            return False
+
+    def sync(self):
+        """Wymusza zapis na dysk zmian, dla których odłożono fsync (tryb "batch")."""
+        if not self._unsynced_writes:
+            return
+        for path in (self.file_path, self.journal_path):
+            if os.path.exists(path):
+                with open(path, "ab") as file:
+                    os.fsync(file.fileno())
+        self._unsynced_writes = 0
+
+    def _sync(self, file):
+        """Wywołuje fsync dla zapisanego pliku zgodnie z poziomem trwałości.
+
+        Args:
+            file (file): Otwarty plik, do którego zakończono zapis
+        """
+        if self.durability == DURABILITY_NONE:
+            return
+        self._unsynced_writes += 1
+        if self.durability == DURABILITY_ALWAYS or self._unsynced_writes >= self.sync_interval:
+            file.flush()
+            os.fsync(file.fileno())
+            self._unsynced_writes = 0
+
+    def _text_writer(self, file):
+        """Zwraca strumień tekstowy zapisu migawki do otwartego pliku.
+
+        Strumień kompresji nie zamyka pliku, więc po jego zamknięciu (zapisie
+        końcówki formatu) plik można jeszcze zsynchronizować z dyskiem.
+
+        Args:
+            file (file): Plik docelowy, binarny gdy zapis jest kompresowany
+
+        Returns:
+            Menedżer kontekstu strumienia tekstowego
+        """
+        if self.compression is None:
+            return nullcontext(file)
+        opener, options, _ = COMPRESSION_FORMATS[self.compression]
+        return opener(file, "wt", encoding=locale.getpreferredencoding(False), **options)
+
+    def _open_snapshot(self):
+        """Otwiera plik migawki do odczytu tekstu, rozpakowując go strumieniowo.
+
+        Returns:
+            file: Strumień tekstowy pliku migawki
+        """
+        compression = _detect_compression(self.file_path)
+        if compression is None:
+            return open(self.file_path, "r")
+        opener = COMPRESSION_FORMATS[compression][0]
+        return opener(self.file_path, "rt", encoding=locale.getpreferredencoding(False))
+
+    def _snapshot_target(self, atomic):
+        """Zwraca ścieżkę, do której należy zapisać migawkę.
+
+        Plik współdzielony jest zawsze zapisywany przez plik tymczasowy: inne
+        procesy mogą mieć zmapowany poprzedni plik (load_tasks_lazy), a jego
+        obcięcie w miejscu kończy ich odczyt błędem SIGBUS. Po podmianie
+        zachowują one poprzedni i-węzeł do czasu ponownego wczytania.
+
+        Args:
+            atomic (bool): Czy zapis ma trafić do pliku tymczasowego
+
+        Returns:
+            str: Ścieżka pliku tymczasowego lub pliku docelowego
+        """
+        if atomic or self.shared:
+            return self.file_path + TEMP_SUFFIX
+        return self.file_path
+
+    def _commit_snapshot(self, target):
+        """Kończy zapis migawki - podmienia plik tymczasowy i czyści dziennik.
+
+        Args:
+            target (str): Ścieżka, do której zapisano migawkę
+        """
+        if target != self.file_path:
+            os.replace(target, self.file_path)
+            if self.durability == DURABILITY_ALWAYS:
+                _sync_directory(self.file_path)
+        if self.journal or os.path.exists(self.journal_path):
+            open(self.journal_path, "w").close()
+            self._journal_records = 0
+        self._record_write(snapshot=True)
+
+    def _discard_snapshot(self, target):
+        """Usuwa plik tymczasowy po nieudanym zapisie migawki.
+
+        Args:
+            target (str): Ścieżka, do której zapisywano migawkę
+        """
+        if target != self.file_path and os.path.exists(target):
+            os.remove(target)
+
+    @timed("file.load_tasks")
+    def load_tasks(self):
+        """Wczytuje zadania z pliku.
+
+        Na wczytaną migawkę nakładane są rekordy dziennika, jeśli istnieje.
+
+        Na czas tworzenia listy wstrzymywany jest automatyczny odśmiecacz
+        pamięci, który przy milionach nowych obiektów Task zajmuje około
+        połowy czasu wczytywania. Duże pliki są parsowane równolegle, gdy
+        workers jest większe niż 1 (zob. _load_parallel).
+
+        Returns:
+            list: Lista obiektów Task wczytanych z pliku,
+                  lub pusta lista w przypadku błędu lub braku pliku
+        """
+        if not os.path.exists(self.file_path):
+            open(self.file_path, "w").close()
+            return []
+
+        try:
+            with self._read_lock():
+                self._record_read()
+                tasks = None
+                if (
+                    self.workers > 1
+                    and os.path.getsize(self.file_path) >= PARALLEL_MIN_BYTES
+                    and _detect_compression(self.file_path) is None
+                ):
+                    tasks = self._load_parallel()
+                if tasks is None:
+                    with _gc_paused():
+                        tasks = list(self.iter_tasks())
+            self.metrics.increment("file.tasks_loaded", len(tasks))
+            return tasks
+        except Exception as e:
+            print(f"Błąd podczas odczytu zadań: {e}")
+            return []
+
+    def iter_tasks(self):
+        """Zwraca zadania z pliku jedno po drugim (generator).
+
+        Plik jest czytany strumieniowo, więc zużycie pamięci nie zależy od
+        liczby zadań. Nieprawidłowe linie są pomijane z komunikatem, tak jak
+        w load_tasks, a w trybie zbierania błędów - zliczane w load_report.
+        Rekordy dziennika (jeśli istnieje) są nakładane na zadania w trakcie
+        odczytu - w pamięci trzymany jest tylko dziennik. Błędy odczytu pliku
+        są przekazywane do wywołującego.
+
+        Yields:
+            Task: Kolejne zadania z pliku
+        """
+        if not os.path.exists(self.file_path):
+            open(self.file_path, "w").close()
+            return
+
+        report = None
+        if self.collect_errors:
+            report = self.load_report = LoadReport(self.max_error_samples)
+        overlay = self._read_journal()
+        tasks = self._iter_snapshot(report)
+        tasks = overlay.apply_to(tasks) if overlay is not None else tasks
+        if report is None:
+            yield from tasks
+            return
+
+        loaded = 0
+        try:
+            for task in tasks:
+                loaded += 1
+                yield task
+        finally:
+            report.loaded = loaded
+            self._report_errors(report)
+
+    def _iter_snapshot(self, report=None):
+        """Zwraca zadania zapisane w pliku migawki, bez nakładania dziennika.
+
+        Args:
+            report (LoadReport, optional): Raport, do którego trafiają
+                nieprawidłowe linie zamiast komunikatów
+
+        Yields:
+            Task: Kolejne prawidłowe zadania z pliku
+        """
+        parse = Task.parse
+        with self._open_snapshot() as file:
+            for line_number, line in enumerate(file, 1):
+                task, error = parse(line)
+                if task is not None:
+                    yield task
+                elif not line.strip():
+                    continue
+                elif report is not None:
+                    report.add(line_number, error, line)
+                else:
+                    print(f"Pominięto nieprawidłowe zadanie: {error} (linia {line_number})")
+                    self._skipped(self.file_path, line_number, error)
+
+    def _load_parallel(self):
+        """Wczytuje zadania, parsując fragmenty pliku w puli procesów.
+
+        Fragmenty kończą się na granicach linii, a proces główny tworzy
+        obiekty Task z wyników kolejnych fragmentów, gdy pozostałe są jeszcze
+        parsowane. Nieprawidłowe linie są zgłaszane po wczytaniu,
+        w kolejności i z numerami jak w iter_tasks.
+
+        Returns:
+            list: Lista obiektów Task, lub None gdy puli procesów nie można
+                użyć i zadania należy wczytać sekwencyjnie
+        """
+        bounds = _chunk_bounds(self.file_path, self.workers * PARALLEL_CHUNKS_PER_WORKER)
+        report = LoadReport(self.max_error_samples if self.collect_errors else None)
+        overlay = self._read_journal()
+        tasks = []
+        line_offset = 0
+        try:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(bounds))) as executor:
+                chunks = executor.map(
+                    _parse_chunk,
+                    repeat(self.file_path),
+                    bounds,
+                    repeat(locale.getpreferredencoding(False)),
+                    repeat(report.max_samples),
+                )
+                with _gc_paused():
+                    for line_count, columns, lines, chunk_report in chunks:
+                        chunk = list(map(Task, *columns))
+                        for task, line in zip(chunk, lines):
+                            task._line = line
+                        tasks += chunk
+                        report.merge(chunk_report, line_offset)
+                        line_offset += line_count
+                    if overlay is not None:
+                        tasks = list(overlay.apply_to(tasks))
+        except (OSError, BrokenProcessPool) as e:
+            print(f"Nie można wczytać zadań równolegle, wczytywanie sekwencyjne: {e}")
+            return None
+
+        if self.collect_errors:
+            report.loaded = len(tasks)
+            self.load_report = report
+            self._report_errors(report)
+        else:
+            for line_number, error, _ in report.samples:
+                print(f"Pominięto nieprawidłowe zadanie: {error} (linia {line_number})")
+                self._skipped(self.file_path, line_number, error)
+        return tasks
+
+    @timed("file.load_tasks_lazy")
+    def load_tasks_lazy(self):
+        """Wczytuje zadania leniwie, zapamiętując jedynie położenie linii w pliku.
+
+        Plik jest mapowany do pamięci, a jedno przejście wyrażenia regularnego
+        wyznacza początki prawidłowych linii. Obiekt Task powstaje dopiero
+        przy pierwszym dostępie do danego zadania. Nieprawidłowe linie są
+        pomijane z komunikatem dla każdej linii, tak jak w load_tasks (w trybie
+        zbierania błędów - zliczane w load_report, gdzie powody są znane tylko
+        dla przykładowych linii). Obsługiwane są zakończenia linii "\\n" oraz "\\r\\n".
+        Plik skompresowany jest wczytywany od razu (load_tasks).
+
+        Returns:
+            list: LazyTaskList z zadaniami z pliku, lub pusta lista
+                  w przypadku błędu lub braku pliku
+        """
+        if not os.path.exists(self.file_path):
+            open(self.file_path, "w").close()
+            return []
+        if _detect_compression(self.file_path) is not None:
+            return self.load_tasks()
+
+        try:
+            self.close()
+            report = None
+            if self.collect_errors:
+                report = self.load_report = LoadReport(self.max_error_samples)
+            with self._read_lock():
+                self._record_read()
+                if os.path.getsize(self.file_path) == 0:
+                    tasks = []
+                else:
+                    self._file = open(self.file_path, "rb")
+                    self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                    offsets = [match.start() for match in _VALID_LINE.finditer(self._mmap)]
+                    skipped = _count_non_blank_lines(self._mmap) - len(offsets)
+                    if skipped and report is not None:
+                        self._sample_invalid_lines(report, offsets)
+                        report.skipped = skipped
+                    elif skipped:
+                        invalid = LoadReport(None)
+                        self._sample_invalid_lines(invalid, offsets)
+                        for line_number, error, _ in invalid.samples:
+                            print(
+                                f"Pominięto nieprawidłowe zadanie: {error} (linia {line_number})"
+                            )
+                            self._skipped(self.file_path, line_number, error)
+                    tasks = LazyTaskList(offsets, _LineReader(self._mmap).task)
+                    self._lazy_tasks = weakref.ref(tasks)
+                self._replay_journal(tasks)
+            if report is not None:
+                report.loaded = len(tasks)
+                self._report_errors(report)
+            return tasks
+        except Exception as e:
+            print(f"Błąd podczas odczytu zadań: {e}")
+            self.close()
+            return []
+
+    def _sample_invalid_lines(self, report, offsets):
+        """Dodaje do raportu pierwsze nieprawidłowe linie zmapowanego pliku.
+
+        Linie są porównywane z uporządkowaną listą początków prawidłowych
+        linii, a przeglądanie kończy się po zebraniu max_samples przykładów
+        (dla max_samples równego None - na końcu pliku).
+
+        Args:
+            report (LoadReport): Raport błędów wczytywania
+            offsets (list): Początki prawidłowych linii w pliku
+        """
+        encoding = locale.getpreferredencoding(False)
+        valid = iter(offsets)
+        next_valid = next(valid, None)
+        for line_number, match in enumerate(_ANY_LINE.finditer(self._mmap), 1):
+            if report.max_samples is not None and len(report.samples) >= report.max_samples:
+                return
+            if match.start() == next_valid:
+                next_valid = next(valid, None)
+                continue
+            line = match.group().decode(encoding, errors="replace")
+            if line.strip():
+                _, reason = Task.parse(line)
+                report.add(line_number, reason or INVALID_FORMAT, line)
+
+    def _report_errors(self, report):
+        """Przekazuje podsumowanie raportu błędów do obiektu pomiarów.
+
+        Args:
+            report (LoadReport): Raport zakończonego wczytywania
+        """
+        if not report.skipped:
+            return
+        self.metrics.increment("file.skipped_records", report.skipped)
+        for line_number, reason, _ in report.samples:
+            self.metrics.event(
+                "file.skipped_record", path=self.file_path, line=line_number, error=reason
+            )
+
+    @contextmanager
+    def lock(self):
+        """Zajmuje blokadę wyłączną pliku współdzielonego między procesami.
+
+        Blokada jest wielowejściowa w obrębie obiektu. Dla pliku, który nie
+        jest współdzielony, nie robi nic.
+
+        Yields:
+            FileManager: Ten sam obiekt
+        """
+        if self._lock_fd is None or self._lock_depth:
+            self._lock_depth += 1
+            try:
+                yield self
+            finally:
+                self._lock_depth -= 1
+            return
+
+        if fcntl is not None:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        self._lock_depth = 1
+        try:
+            yield self
+        finally:
+            self._lock_depth = 0
+            if fcntl is not None:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def has_external_changes(self):
+        """Sprawdza, czy inny proces zapisał zmiany od ostatniego odczytu lub zapisu.
+
+        Returns:
+            bool: True jeśli plik współdzielony zmienił się, False w przeciwnym razie
+        """
+        return self.shared and self._read_version()[0] != self._version
+
+    def read_external_changes(self):
+        """Wczytuje zmiany zapisane przez inne procesy od ostatniego odczytu.
+
+        Returns:
+            list: Zmiany jako krotki (operacja, zadanie lub identyfikator przy
+                  usunięciu) odczytane z dziennika, pusta lista gdy zmian nie
+                  było, lub None gdy inny proces zapisał nową migawkę i plik
+                  trzeba wczytać ponownie
+        """
+        if not self.shared:
+            return []
+        with self._read_lock():
+            version, generation = self._read_version()
+            if version == self._version:
+                return []
+            if generation != self._generation or not self.journal:
+                return None
+            size = os.path.getsize(self.journal_path) if os.path.exists(self.journal_path) else 0
+            if size < self._journal_offset:
+                return None
+            with open(self.journal_path, "rb") as file:
+                file.seek(self._journal_offset)
+                data = file.read(size - self._journal_offset)
+
+            changes = []
+            text = data.decode(locale.getpreferredencoding(False), errors="replace")
+            for line in text.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    changes.append(_parse_journal_record(line))
+                    self._journal_records += 1
+                except ValueError as e:
+                    print(f"Pominięto nieprawidłowy rekord dziennika: {e}")
+                    self._skipped(self.journal_path, None, e)
+            self._version = version
+            self._journal_offset = size
+            return changes
+
+    @contextmanager
+    def _read_lock(self):
+        """Zajmuje blokadę współdzieloną na czas odczytu pliku współdzielonego.
+
+        Gdy obiekt trzyma już blokadę wyłączną, nie jest ona zmieniana.
+        """
+        if self._lock_fd is None or self._lock_depth or fcntl is None:
+            yield
+            return
+        fcntl.flock(self._lock_fd, fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _read_version(self):
+        """Odczytuje wersję danych i numer migawki z pliku blokady.
+
+        Returns:
+            tuple: (wersja, numer migawki), (0, 0) dla nowego pliku
+        """
+        if hasattr(os, "pread"):
+            data = os.pread(self._lock_fd, _VERSION.size, 0)
+        else:
+            os.lseek(self._lock_fd, 0, os.SEEK_SET)
+            data = os.read(self._lock_fd, _VERSION.size)
+        if len(data) < _VERSION.size:
+            return 0, 0
+        return _VERSION.unpack(data)
+
+    def _record_read(self):
+        """Zapamiętuje wersję pliku współdzielonego przed jego wczytaniem."""
+        if not self.shared:
+            return
+        self._version, self._generation = self._read_version()
+        exists = self.journal and os.path.exists(self.journal_path)
+        self._journal_offset = os.path.getsize(self.journal_path) if exists else 0
+
+    def _record_write(self, snapshot):
+        """Zwiększa wersję pliku współdzielonego po zapisie (pod blokadą).
+
+        Gdy przed zapisem obiekt nie znał najnowszej wersji, zapamiętana
+        wersja nie jest zmieniana, aby zmiany innych procesów nie zostały
+        pominięte przy kolejnym odczycie.
+
+        Args:
+            snapshot (bool): Czy zapisano nową migawkę (a nie rekordy dziennika)
+        """
+        if not self.shared:
+            return
+        version, generation = self._read_version()
+        current = version == self._version and generation == self._generation
+        version += 1
+        if snapshot:
+            generation += 1
+        data = _VERSION.pack(version, generation)
+        if hasattr(os, "pwrite"):
+            os.pwrite(self._lock_fd, data, 0)
+        else:
+            os.lseek(self._lock_fd, 0, os.SEEK_SET)
+            os.write(self._lock_fd, data)
+        if current or snapshot:
+            self._version, self._generation = version, generation
+            exists = self.journal and os.path.exists(self.journal_path)
+            self._journal_offset = os.path.getsize(self.journal_path) if exists else 0
+
+    def close(self):
+        """Zamyka plik zmapowany przez leniwe wczytywanie.
+
+        Zadania z ostatnio zwróconej leniwej listy, które nie zostały jeszcze
+        wczytane, są wcześniej tworzone, aby lista pozostała kompletna.
+        """
+        lazy_tasks = self._lazy_tasks() if self._lazy_tasks is not None else None
+        if lazy_tasks is not None:
+            lazy_tasks.materialize()
+        self._lazy_tasks = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _replay_journal(self, tasks):
+        """Nakłada rekordy dziennika na listę zadań wczytaną z migawki.
+
+        Args:
+            tasks (list): Lista zadań z migawki, modyfikowana w miejscu
+        """
+        overlay = self._read_journal()
+        if overlay is not None:
+            tasks[:] = list(overlay.apply_to(tasks))
+
+    def _read_journal(self):
+        """Wczytuje dziennik do pamięci jako nakładkę na migawkę.
+
+        Returns:
+            _JournalOverlay: Stan dziennika lub None, gdy dziennik jest pusty
+        """
+        self._journal_records = 0
+        if not os.path.exists(self.journal_path) or os.path.getsize(self.journal_path) == 0:
+            return None
+
+        overlay = _JournalOverlay()
+        with open(self.journal_path, "r") as file:
+            for line_number, line in enumerate(file, 1):
+                if not line.strip():
+                    continue
+                try:
+                    overlay.apply(line)
+                    self._journal_records += 1
+                except ValueError as e:
+                    print(f"Pominięto nieprawidłowy rekord dziennika: {e}")
+                    self._skipped(self.journal_path, line_number, e)
+        return overlay
+
+    def _skipped(self, path, line_number, error):
+        """Zgłasza pominięty nieprawidłowy rekord do obiektu pomiarów.
+
+        Args:
+            path (str): Plik, w którym wystąpił rekord
+            line_number (int): Numer linii, lub None gdy nieznany
+            error (Exception): Powód pominięcia rekordu
+        """
+        self.metrics.increment("file.skipped_records")
+        self.metrics.event("file.skipped_record", path=path, line=line_number, error=str(error))
+
+
+def _sync_directory(path):
+    """Wywołuje fsync katalogu, aby utrwalić podmianę pliku (tylko POSIX).
+
+    Args:
+        path (str): Ścieżka pliku w synchronizowanym katalogu
+    """
+    if os.name != "posix":
+        return
+    descriptor = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+@contextmanager
+def _gc_paused():
+    """Wstrzymuje automatyczny odśmiecacz pamięci na czas tworzenia wielu obiektów."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _detect_compression(path):
+    """Rozpoznaje format kompresji pliku po jego sygnaturze.
+
+    Args:
+        path (str): Ścieżka pliku
+
+    Returns:
+        str: Nazwa formatu z COMPRESSION_FORMATS, lub None dla zwykłego pliku
+            tekstowego (także pustego lub nieistniejącego)
+    """
+    try:
+        with open(path, "rb") as file:
+            header = file.read(_MAGIC_LENGTH)
+    except OSError:
+        return None
+    for name, (_, _, magic) in COMPRESSION_FORMATS.items():
+        if header.startswith(magic) if isinstance(magic, bytes) else magic.match(header):
+            return name
+    return None
+
+
+def _chunk_bounds(path, count):
+    """Dzieli plik na fragmenty o zbliżonym rozmiarze, kończące się na końcu linii.
+
+    Args:
+        path (str): Ścieżka pliku
+        count (int): Docelowa liczba fragmentów
+
+    Returns:
+        list: Krotki (początek, koniec) fragmentów w bajtach, bez pustych fragmentów
+    """
+    size = os.path.getsize(path)
+    starts = [0]
+    with open(path, "rb") as file:
+        for index in range(1, count):
+            position = size * index // count
+            if position <= starts[-1]:
+                continue
+            file.seek(position - 1)
+            file.readline()
+            position = file.tell()
+            if position >= size:
+                break
+            if position > starts[-1]:
+                starts.append(position)
+    return list(zip(starts, starts[1:] + [size]))
+
+
+def _parse_chunk(path, bounds, encoding, max_samples):
+    """Parsuje fragment pliku z zadaniami (wykonywane w procesie puli).
+
+    Zwraca pola zadań zamiast obiektów Task, bo ich przesłanie między
+    procesami jest kilkukrotnie tańsze.
+
+    Args:
+        path (str): Ścieżka pliku
+        bounds (tuple): Początek i koniec fragmentu w bajtach
+        encoding (str): Kodowanie pliku
+        max_samples (int): Limit przykładowych linii raportu, None - bez limitu
+
+    Returns:
+        tuple: (liczba linii fragmentu, krotka list argumentów Task - tytuły,
+            opisy, statusy i identyfikatory, lista zapamiętanych linii tekstu,
+            LoadReport z numerami linii liczonymi od początku fragmentu)
+    """
+    start, end = bounds
+    with open(path, "rb") as file:
+        file.seek(start)
+        data = file.read(end - start)
+
+    titles, descriptions, statuses, task_ids, lines = [], [], [], [], []
+    report = LoadReport(max_samples)
+    parse = Task.parse
+    line_number = 0
+    for line_number, line in enumerate(io.TextIOWrapper(io.BytesIO(data), encoding=encoding), 1):
+        task, error = parse(line)
+        if task is not None:
+            titles.append(task.title)
+            descriptions.append(task.description)
+            statuses.append(task.status)
+            task_ids.append(task.task_id)
+            lines.append(task._line)
+        elif line.strip():
+            report.add(line_number, error, line)
+    return line_number, (titles, descriptions, statuses, task_ids), lines, report
+
+
+def _count_non_blank_lines(buffer):
+    """Zlicza niepuste linie bez tworzenia obiektu dla każdej linii.
+
+    Args:
+        buffer (mmap.mmap): Zawartość pliku
+
+    Returns:
+        int: Liczba niepustych linii
+    """
+    chunk = 1 << 20
+    lines = sum(buffer[i:i + chunk].count(b"\n") for i in range(0, len(buffer), chunk))
+    lines -= len(_BLANK_LINE.findall(buffer))
+    if buffer[buffer.rfind(b"\n") + 1:].strip():
+        lines += 1
+    return lines
+
+
+class _LineReader:
+    """Tworzy zadania z linii zmapowanego pliku tekstowego."""
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.encoding = locale.getpreferredencoding(False)
+
+    def task(self, offset):
+        """Tworzy obiekt Task z linii zaczynającej się pod podanym przesunięciem.
+
+        Args:
+            offset (int): Przesunięcie początku linii w pliku
+
+        Returns:
+            Task: Zadanie odczytane z linii
+        """
+        end = self.buffer.find(b"\n", offset)
+        if end == -1:
+            end = len(self.buffer)
+        line = self.buffer[offset:end].decode(self.encoding, errors="replace")
+        return Task.from_string(line)
+
+
+def _task_id(task):
+    """Klucz sortowania zadań według identyfikatora."""
+    return task.task_id
+
+
+def _journal_record(operation, task):
+    """Koduje pojedynczą zmianę jako linię dziennika.
+
+    Args:
+        operation (str): "add", "update" lub "delete"
+        task (Task): Zadanie, którego dotyczy zmiana (stan po zmianie)
+
+    Returns:
+        str: Rekord dziennika zakończony znakiem nowej linii
+    """
+    if operation == "add":
+        return f"A|{task.to_string()}\n"
+    if operation == "update":
+        return f"U|{task.to_string()}\n"
+    if operation == "delete":
+        return f"D|{task.task_id}\n"
+    raise ValueError(f"Nieznana operacja: {operation}")
+
+
+def _parse_journal_record(line):
+    """Dekoduje linię dziennika.
+
+    Args:
+        line (str): Linia dziennika
+
+    Returns:
+        tuple: (operacja, zadanie) dla "add" i "update" lub
+               ("delete", identyfikator zadania)
+
+    Raises:
+        ValueError: Gdy rekord ma nieprawidłowy format
+    """
+    operation, _, payload = line.strip().partition("|")
+    if operation in ("A", "U"):
+        task = Task.from_string(payload)
+        if task.task_id is None:
+            raise ValueError("Rekord dziennika bez identyfikatora zadania")
+        return ("add" if operation == "A" else "update"), task
+    if operation == "D":
+        return "delete", int(payload)
+    raise ValueError(f"Nieznany rekord dziennika: {operation}")
+
+
+class _JournalOverlay:
+    """
+    Stan dziennika nakładany na zadania z migawki.
+    Rekordy adresują zadania po identyfikatorze, więc zadania z migawki
+    zachowują swoją kolejność, a nowe zadania trafiają na koniec w kolejności
+    dodania. Zadanie dodane z identyfikatorem mniejszym niż któreś z zadań
+    migawki (np. przywrócone przez TodoManager.undo) trafia przed pierwsze
+    zadanie migawki o większym identyfikatorze.
+    """
+
+    def __init__(self):
+        self.replaced = {}
+        self.removed = set()
+        self.appended = {}
+
+    def apply(self, line):
+        """Uwzględnia pojedynczy rekord dziennika.
+
+        Args:
+            line (str): Linia dziennika
+
+        Raises:
+            ValueError: Gdy rekord ma nieprawidłowy format
+        """
+        operation, payload = _parse_journal_record(line)
+        if operation == "delete":
+            if self.appended.pop(payload, None) is None:
+                self.removed.add(payload)
+                self.replaced.pop(payload, None)
+            return
+        task_id = payload.task_id
+        if operation == "add" or task_id in self.appended or task_id in self.removed:
+            self.appended[task_id] = payload
+        else:
+            self.replaced[task_id] = payload
+
+    def apply_to(self, tasks):
+        """Nakłada dziennik na zadania z migawki.
+
+        Args:
+            tasks (iterable): Zadania z migawki
+
+        Yields:
+            Task: Zadania po uwzględnieniu dziennika
+        """
+        pending = sorted(self.appended.values(), key=_task_id)
+        index = 0
+        next_id = pending[0].task_id if pending else None
+        for task in tasks:
+            task_id = task.task_id
+            if task_id in self.removed:
+                continue
+            while next_id is not None and task_id is not None and next_id < task_id:
+                yield pending[index]
+                index += 1
+                next_id = pending[index].task_id if index < len(pending) else None
+            yield self.replaced.get(task_id, task)
+        if not index:
+            yield from self.appended.values()
+            return
+        merged = {task.task_id for task in pending[:index]}
+        yield from (task for task in self.appended.values() if task.task_id not in merged)
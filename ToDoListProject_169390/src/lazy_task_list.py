@@ -0,0 +1,116 @@
+from collections.abc import MutableSequence
+
+
+class LazyTaskList(MutableSequence):
+    """
+    Lista zadań tworzonych leniwie przy pierwszym dostępie.
+    Przechowuje klucze rekordów (liczby całkowite) zamiast gotowych obiektów
+    Task, a obiekt zadania jest budowany funkcją loader dopiero wtedy, gdy
+    ktoś odwoła się do danego elementu. Zachowuje się jak zwykła lista,
+    więc może zastąpić listę zadań w TodoManager.
+    """
+
+    def __init__(self, keys, loader):
+        self._items = keys
+        self._loader = loader
+        self._cache = {}
+
+    def _resolve(self, item):
+        """Zamienia klucz rekordu na obiekt Task, wczytując go przy pierwszym dostępie.
+
+        Args:
+            item (int lub Task): Klucz rekordu lub już utworzone zadanie
+
+        Returns:
+            Task: Zadanie odpowiadające elementowi listy
+        """
+        if not isinstance(item, int):
+            return item
+        task = self._cache.get(item)
+        if task is None:
+            task = self._loader(item)
+            self._cache[item] = task
+        return task
+
+    def _mutable_items(self):
+        """Zwraca listę kluczy, zamieniając na nią początkowy zakres przy pierwszej zmianie.
+
+        Returns:
+            list: Modyfikowalna lista elementów
+        """
+        if not isinstance(self._items, list):
+            self._items = list(self._items)
+        return self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+        return self._resolve(self._items[index])
+
+    def __setitem__(self, index, value):
+        self._mutable_items()[index] = value
+
+    def __delitem__(self, index):
+        del self._mutable_items()[index]
+
+    def insert(self, index, value):
+        self._mutable_items().insert(index, value)
+
+    def clear(self):
+        self._items = []
+
+    def index(self, value, start=0, stop=None):
+        """Zwraca indeks zadania bez tworzenia niewczytanych zadań.
+
+        Zadania porównywane są po tożsamości obiektu, więc rekordy, które nie
+        zostały jeszcze wczytane, nie mogą być szukanym zadaniem.
+        """
+        stop = len(self._items) if stop is None else stop
+        for i in range(*slice(start, stop).indices(len(self._items))):
+            item = self._items[i]
+            if item is value or (isinstance(item, int) and self._cache.get(item) is value):
+                return i
+        raise ValueError("Zadanie nie znajduje się na liście")
+
+    def copy(self):
+        """Zwraca płytką kopię listy bez wczytywania zadań.
+
+        Kopia współdzieli zadania już wczytane i źródło danych z oryginałem.
+
+        Returns:
+            LazyTaskList: Kopia listy
+        """
+        items = self._items if isinstance(self._items, range) else list(self._items)
+        duplicate = LazyTaskList(items, self._loader)
+        duplicate._cache = self._cache
+        return duplicate
+
+    def __iter__(self):
+        for item in self._items:
+            yield self._resolve(item)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, LazyTaskList)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"LazyTaskList({len(self)} zadań, wczytano {self.loaded_count})"
+
+    @property
+    def loaded_count(self):
+        """Liczba rekordów, dla których utworzono już obiekty Task."""
+        return len(self._cache)
+
+    def materialize(self):
+        """Tworzy wszystkie jeszcze niewczytane zadania.
+
+        Po wywołaniu lista nie potrzebuje już źródła danych (np. zmapowanego
+        pliku), więc można je bezpiecznie zamknąć.
+        """
+        for item in self._items:
+            self._resolve(item)
+        self._loader = None
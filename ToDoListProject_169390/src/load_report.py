@@ -0,0 +1,90 @@
+class LoadReport:
+    """
+    Raport błędów wczytywania pliku z zadaniami.
+    Zlicza pominięte linie według powodu i przechowuje tylko pierwsze
+    max_samples przykładów, więc jego rozmiar nie zależy od liczby błędów.
+
+    Args:
+        max_samples (int, optional): Liczba zapamiętywanych przykładowych linii,
+            None - bez ograniczenia
+
+    Attributes:
+        loaded (int): Liczba wczytanych zadań
+        skipped (int): Liczba pominiętych nieprawidłowych linii
+        reasons (dict): Liczba pominiętych linii dla każdego powodu
+        samples (list): Pierwsze pominięte linie jako krotki
+            (numer linii, powód, treść linii)
+    """
+
+    def __init__(self, max_samples=10):
+        self.max_samples = max_samples
+        self.loaded = 0
+        self.skipped = 0
+        self.reasons = {}
+        self.samples = []
+
+    def add(self, line_number, reason, line):
+        """Rejestruje pominiętą linię.
+
+        Args:
+            line_number (int): Numer linii w pliku (od 1)
+            reason (str): Powód pominięcia
+            line (str): Treść linii
+        """
+        self.skipped += 1
+        self.reasons[reason] = self.reasons.get(reason, 0) + 1
+        if self.max_samples is None or len(self.samples) < self.max_samples:
+            self.samples.append((line_number, reason, line.rstrip("\r\n")))
+
+    def merge(self, other, line_offset=0):
+        """Dołącza raport z fragmentu pliku wczytanego osobno (np. w innym procesie).
+
+        Args:
+            other (LoadReport): Raport fragmentu z numerami linii liczonymi od
+                początku fragmentu
+            line_offset (int, optional): Liczba linii pliku przed fragmentem
+        """
+        self.loaded += other.loaded
+        self.skipped += other.skipped
+        for reason, count in other.reasons.items():
+            self.reasons[reason] = self.reasons.get(reason, 0) + count
+        for line_number, reason, line in other.samples:
+            if self.max_samples is not None and len(self.samples) >= self.max_samples:
+                break
+            self.samples.append((line_number + line_offset, reason, line))
+
+    @property
+    def ok(self):
+        """Czy plik został wczytany bez pominiętych linii."""
+        return not self.skipped
+
+    def summary(self):
+        """Zwraca jednolinijkowe podsumowanie raportu.
+
+        Returns:
+            str: Liczba wczytanych i pominiętych zadań wraz z powodami
+        """
+        text = f"Wczytano zadania: {self.loaded}, pominięto nieprawidłowe: {self.skipped}"
+        if self.reasons:
+            reasons = ", ".join(f"{reason}: {count}" for reason, count in self.reasons.items())
+            text += f" ({reasons})"
+        return text
+
+    def to_dict(self):
+        """Zwraca raport jako słownik gotowy do zapisu w JSON.
+
+        Returns:
+            dict: Liczniki, powody i przykładowe linie
+        """
+        return {
+            "loaded": self.loaded,
+            "skipped": self.skipped,
+            "reasons": dict(self.reasons),
+            "samples": [
+                {"line": line_number, "reason": reason, "text": line}
+                for line_number, reason, line in self.samples
+            ],
+        }
+
+    def __repr__(self):
+        return f"LoadReport(loaded={self.loaded}, skipped={self.skipped})"
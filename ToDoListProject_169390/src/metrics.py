@@ -0,0 +1,282 @@
+import functools
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+
+HISTOGRAM_BOUNDS = tuple(1e-6 * 2**i for i in range(28))
+
+
+class Metrics:
+    """
+    Interfejs pomiarów wydajności używany przez TodoManager i FileManager.
+    Ta klasa niczego nie zapisuje. Jej instancja NULL_METRICS jest domyślnym
+    obiektem pomiarów, a mierzone metody rozpoznają ją jednym porównaniem,
+    więc wyłączone pomiary niemal nic nie kosztują. Aby eksportować
+    pomiary (np. do Prometheusa lub StatsD), należy nadpisać observe,
+    increment i event w klasie pochodnej albo użyć MetricsRecorder.
+
+    Nazwy pomiarów mają postać "obiekt.operacja", np. "file.save_tasks",
+    "todo.add_task", "file.bytes_written".
+    """
+
+    def timer(self, name):
+        """Zwraca menedżer kontekstu mierzący czas wykonania bloku.
+
+        Args:
+            name (str): Nazwa mierzonej operacji
+
+        Returns:
+            Menedżer kontekstu przekazujący zmierzony czas do observe
+        """
+        return _NULL_TIMER
+
+    def observe(self, name, seconds):
+        """Rejestruje czas wykonania operacji.
+
+        Args:
+            name (str): Nazwa operacji
+            seconds (float): Czas wykonania w sekundach
+        """
+
+    def increment(self, name, value=1):
+        """Zwiększa licznik.
+
+        Args:
+            name (str): Nazwa licznika
+            value (int, optional): Wartość, o którą zwiększany jest licznik
+        """
+
+    def event(self, name, **fields):
+        """Rejestruje zdarzenie z danymi (np. pominięty nieprawidłowy rekord).
+
+        Args:
+            name (str): Nazwa zdarzenia
+            **fields: Dane zdarzenia
+        """
+
+
+NULL_METRICS = Metrics()
+
+
+class MetricsRecorder(Metrics):
+    """
+    Pomiary zbierane w pamięci: liczniki, histogramy czasów operacji
+    i ostatnie zdarzenia. Może być używany z wielu wątków. Metoda snapshot
+    zwraca wszystkie pomiary jako słownik gotowy do zapisu w JSON.
+
+    Args:
+        max_events (int, optional): Liczba przechowywanych ostatnich zdarzeń
+    """
+
+    def __init__(self, max_events=1000):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+        self._events = deque(maxlen=max_events)
+
+    def timer(self, name):
+        return _Timer(self, name)
+
+    def observe(self, name, seconds):
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.record(seconds)
+
+    def increment(self, name, value=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def event(self, name, **fields):
+        with self._lock:
+            self._events.append(dict(fields, name=name, time=time.time()))
+
+    def counter(self, name):
+        """Zwraca wartość licznika.
+
+        Args:
+            name (str): Nazwa licznika
+
+        Returns:
+            int: Wartość licznika (0, gdy nie był zwiększany)
+        """
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def histogram(self, name):
+        """Zwraca histogram czasów operacji.
+
+        Args:
+            name (str): Nazwa operacji
+
+        Returns:
+            Histogram: Histogram operacji, lub None gdy nie była mierzona
+        """
+        with self._lock:
+            return self._histograms.get(name)
+
+    def events(self, name=None):
+        """Zwraca zarejestrowane zdarzenia, od najstarszego.
+
+        Args:
+            name (str, optional): Nazwa zdarzeń do zwrócenia. Domyślnie wszystkie
+
+        Returns:
+            list: Zdarzenia jako słowniki z polami name, time i danymi zdarzenia
+        """
+        with self._lock:
+            return [event for event in self._events if name is None or event["name"] == name]
+
+    def snapshot(self):
+        """Zwraca wszystkie pomiary.
+
+        Returns:
+            dict: Słownik z kluczami "counters", "histograms" i "events"
+        """
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "histograms": {
+                    name: histogram.to_dict() for name, histogram in self._histograms.items()
+                },
+                "events": list(self._events),
+            }
+
+    def reset(self):
+        """Usuwa wszystkie pomiary."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._events.clear()
+
+
+class Histogram:
+    """
+    Histogram czasów operacji o przedziałach rosnących wykładniczo
+    (od 1 us, każdy kolejny dwa razy szerszy). Zapis pomiaru kosztuje
+    O(log liczby przedziałów), a percentyle są szacowane z dokładnością
+    do granicy przedziału.
+    """
+
+    def __init__(self):
+        self.counts = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    def record(self, value):
+        """Dodaje pomiar do histogramu.
+
+        Args:
+            value (float): Czas w sekundach
+        """
+        self.counts[bisect_left(HISTOGRAM_BOUNDS, value)] += 1
+        self.count += 1
+        self.total += value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def percentile(self, fraction):
+        """Szacuje percentyl czasu operacji.
+
+        Args:
+            fraction (float): Percentyl jako ułamek, np. 0.99
+
+        Returns:
+            float: Górna granica przedziału zawierającego percentyl (nie więcej
+                niż największy pomiar), lub None gdy histogram jest pusty
+        """
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                bound = HISTOGRAM_BOUNDS[index] if index < len(HISTOGRAM_BOUNDS) else self.maximum
+                return min(bound, self.maximum)
+        return self.maximum
+
+    def to_dict(self):
+        """Zwraca podsumowanie histogramu.
+
+        Returns:
+            dict: Liczba i suma pomiarów, minimum, maksimum, percentyle
+                p50/p90/p99 oraz niepuste przedziały (górna granica: liczba)
+        """
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.minimum,
+            "max": self.maximum,
+            "p50": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "p99": self.percentile(0.99),
+            "buckets": {
+                (str(HISTOGRAM_BOUNDS[index]) if index < len(HISTOGRAM_BOUNDS) else "inf"): count
+                for index, count in enumerate(self.counts)
+                if count
+            },
+        }
+
+
+def timed(name):
+    """Dekorator metody mierzący jej czas obiektem pomiarów self.metrics.
+
+    Args:
+        name (str): Nazwa mierzonej operacji
+
+    Returns:
+        function: Dekorator
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            metrics = self.metrics
+            if metrics is NULL_METRICS:
+                return method(self, *args, **kwargs)
+            with metrics.timer(name):
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class _Timer:
+    """Menedżer kontekstu mierzący czas bloku dla MetricsRecorder."""
+
+    __slots__ = ("_metrics", "_name", "_start")
+
+    def __init__(self, metrics, name):
+        self._metrics = metrics
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._metrics.observe(self._name, time.perf_counter() - self._start)
+        return False
+
+
+class _NullTimer:
+    """Menedżer kontekstu, który niczego nie mierzy."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
@@ -0,0 +1,96 @@
+import base64
+import binascii
+import json
+
+SORT_KEYS = ("task_id", "title", "status")
+
+
+class TaskPage:
+    """
+    Jedna strona listy zadań zwracana przez TodoManager.list_tasks.
+
+    Args:
+        tasks (list): Zadania na stronie
+        next_cursor (str): Kursor następnej strony, lub None gdy to ostatnia strona
+        total (int): Liczba wszystkich zadań spełniających kryteria
+    """
+
+    def __init__(self, tasks, next_cursor, total):
+        self.tasks = tasks
+        self.next_cursor = next_cursor
+        self.total = total
+
+    def __iter__(self):
+        return iter(self.tasks)
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def __repr__(self):
+        return (
+            f"TaskPage(tasks={len(self.tasks)}, total={self.total}, "
+            f"next_cursor={self.next_cursor!r})"
+        )
+
+
+def sort_key(sort_by):
+    """Zwraca funkcję klucza porządku zadań dla podanego pola.
+
+    Klucz kończy się identyfikatorem zadania, więc porządek jest
+    jednoznaczny także dla zadań o równych wartościach pola.
+
+    Args:
+        sort_by (str): Pole sortowania, jedno z SORT_KEYS
+
+    Returns:
+        function: Funkcja zwracająca krotkę klucza dla zadania
+
+    Raises:
+        ValueError: Gdy pole sortowania jest nieznane
+    """
+    if sort_by == "task_id":
+        return lambda task: (task.task_id,)
+    if sort_by == "title":
+        return lambda task: (task.title.lower(), task.task_id)
+    if sort_by == "status":
+        return lambda task: (task.status.value, task.task_id)
+    raise ValueError(f"Nieznane pole sortowania: {sort_by}")
+
+
+def encode_cursor(query, key):
+    """Koduje kursor wskazujący miejsce po ostatnim zadaniu strony.
+
+    Args:
+        query (list): Parametry zapytania (sortowanie, kierunek, status),
+            z którymi kursor może być użyty
+        key (tuple): Klucz porządku ostatniego zadania strony
+
+    Returns:
+        str: Nieprzezroczysty kursor
+    """
+    data = json.dumps([query, list(key)], ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor, query):
+    """Odczytuje klucz zapisany w kursorze.
+
+    Args:
+        cursor (str): Kursor zwrócony przez encode_cursor
+        query (list): Parametry bieżącego zapytania
+
+    Returns:
+        tuple: Klucz porządku ostatniego zadania poprzedniej strony
+
+    Raises:
+        ValueError: Gdy kursor jest nieprawidłowy lub pochodzi z innego zapytania
+    """
+    try:
+        cursor_query, key = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError, TypeError, AttributeError):
+        raise ValueError("Nieprawidłowy kursor")
+    if not isinstance(key, list):
+        raise ValueError("Nieprawidłowy kursor")
+    if cursor_query != query:
+        raise ValueError("Kursor pochodzi z innego zapytania")
+    return tuple(key)
@@ -0,0 +1,124 @@
+import threading
+
+
+class ReadWriteLock:
+    """
+    Blokada czytelników i pisarzy.
+    Wielu czytelników może trzymać blokadę jednocześnie, a pisarz ma wyłączny
+    dostęp. Oczekujący pisarz ma pierwszeństwo przed nowymi czytelnikami, więc
+    ciągły odczyt nie zagłodzi zapisu. Blokada jest wielowejściowa: wątek
+    trzymający blokadę zapisu może ponownie ją zająć lub zająć blokadę
+    odczytu, a czytelnik może ponownie zająć blokadę odczytu. Zamiana blokady
+    odczytu na blokadę zapisu nie jest możliwa.
+
+    Atrybuty reader i writer są menedżerami kontekstu:
+
+        with lock.reader:
+            ...
+        with lock.writer:
+            ...
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = {}
+        self._writer = None
+        self._writer_depth = 0
+        self._waiting_writers = 0
+        self.reader = _LockGuard(self.acquire_read, self.release_read)
+        self.writer = _LockGuard(self.acquire_write, self.release_write)
+
+    def acquire_read(self):
+        """Zajmuje blokadę odczytu, czekając na zakończenie zapisu."""
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer != me and me not in self._readers:
+                self._condition.wait_for(self._can_read)
+            self._readers[me] = self._readers.get(me, 0) + 1
+
+    def release_read(self):
+        """Zwalnia blokadę odczytu.
+
+        Raises:
+            RuntimeError: Gdy wątek nie trzyma blokady odczytu
+        """
+        me = threading.get_ident()
+        with self._condition:
+            count = self._readers.get(me)
+            if not count:
+                raise RuntimeError("Wątek nie trzyma blokady odczytu")
+            if count > 1:
+                self._readers[me] = count - 1
+            else:
+                del self._readers[me]
+                if not self._readers:
+                    self._condition.notify_all()
+
+    def acquire_write(self):
+        """Zajmuje blokadę zapisu, czekając na zakończenie odczytów i zapisów.
+
+        Raises:
+            RuntimeError: Gdy wątek trzyma blokadę odczytu bez blokady zapisu
+        """
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._writer_depth += 1
+                return
+            if me in self._readers:
+                raise RuntimeError("Nie można zamienić blokady odczytu na blokadę zapisu")
+            self._waiting_writers += 1
+            try:
+                self._condition.wait_for(self._can_write)
+            finally:
+                self._waiting_writers -= 1
+            self._writer = me
+            self._writer_depth = 1
+
+    def release_write(self):
+        """Zwalnia blokadę zapisu.
+
+        Raises:
+            RuntimeError: Gdy wątek nie trzyma blokady zapisu
+        """
+        with self._condition:
+            if self._writer != threading.get_ident():
+                raise RuntimeError("Wątek nie trzyma blokady zapisu")
+            self._writer_depth -= 1
+            if not self._writer_depth:
+                self._writer = None
+                self._condition.notify_all()
+
+    def held(self):
+        """Czy bieżący wątek trzyma blokadę (odczytu lub zapisu).
+
+        Returns:
+            bool: True jeśli wątek trzyma którąś ze stron blokady
+        """
+        me = threading.get_ident()
+        with self._condition:
+            return self._writer == me or me in self._readers
+
+    def _can_read(self):
+        """Czy nowy czytelnik może zająć blokadę."""
+        return self._writer is None and not self._waiting_writers
+
+    def _can_write(self):
+        """Czy pisarz może zająć blokadę."""
+        return self._writer is None and not self._readers
+
+
+class _LockGuard:
+    """Menedżer kontekstu zajmujący i zwalniający jedną stronę blokady."""
+
+    def __init__(self, acquire, release):
+        self._acquire = acquire
+        self._release = release
+
+    def __enter__(self):
+        self._acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._release()
+        return False
@@ -0,0 +1,177 @@
+import heapq
+import re
+import unicodedata
+from bisect import bisect_left, insort
+
+_POLISH_LETTERS = str.maketrans("ąćęłńóśźż", "acelnoszz")
+_TOKEN = re.compile(r"\w+")
+
+
+def normalize_text(text):
+    """Sprowadza tekst do postaci używanej w wyszukiwaniu.
+
+    Zamienia litery na małe i usuwa znaki diakrytyczne, więc "Żółć"
+    i "zolc" dają ten sam wynik. Polskie litery (także "ł", którego nie
+    rozkłada normalizacja Unicode) są zamieniane bezpośrednio.
+
+    Args:
+        text (str): Tekst do znormalizowania
+
+    Returns:
+        str: Tekst bez wielkich liter i znaków diakrytycznych
+    """
+    text = str(text).lower().translate(_POLISH_LETTERS)
+    if text.isascii():
+        return text
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text):
+    """Dzieli tekst na znormalizowane słowa.
+
+    Args:
+        text (str): Tekst do podziału
+
+    Returns:
+        list: Lista słów (tokenów)
+    """
+    return _TOKEN.findall(normalize_text(text))
+
+
+class SearchIndex:
+    """
+    Indeks odwrócony słów z tytułów i opisów zadań.
+    Dla każdego słowa przechowuje zbiór zadań, w których występuje, a posortowany
+    słownik słów pozwala wyszukiwać po prefiksie wyszukiwaniem binarnym.
+    Wyszukiwanie nie rozróżnia wielkości liter ani znaków diakrytycznych.
+    Indeks nie śledzi zmian zadań - po zmianie tytułu lub opisu należy
+    wywołać update ze starym tekstem.
+    """
+
+    def __init__(self, tasks=()):
+        self._postings = {}
+        self._vocabulary = []
+        self.rebuild(tasks)
+
+    def add(self, task):
+        """Dodaje zadanie do indeksu.
+
+        Args:
+            task (Task): Zadanie do dodania
+        """
+        for token in self._task_tokens(task.title, task.description):
+            postings = self._postings.get(token)
+            if postings is None:
+                self._postings[token] = {task}
+                insort(self._vocabulary, token)
+            else:
+                postings.add(task)
+
+    def remove(self, task, title=None, description=None):
+        """Usuwa zadanie z indeksu.
+
+        Args:
+            task (Task): Zadanie do usunięcia
+            title (str, optional): Tytuł, pod którym zadanie zostało
+                zaindeksowane. Domyślnie bieżący tytuł zadania
+            description (str, optional): Opis, pod którym zadanie zostało
+                zaindeksowane. Domyślnie bieżący opis zadania
+        """
+        title = task.title if title is None else title
+        description = task.description if description is None else description
+        for token in self._task_tokens(title, description):
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.discard(task)
+            if not postings:
+                del self._postings[token]
+                del self._vocabulary[bisect_left(self._vocabulary, token)]
+
+    def update(self, task, old_title, old_description):
+        """Aktualizuje indeks po zmianie tytułu lub opisu zadania.
+
+        Args:
+            task (Task): Zmienione zadanie
+            old_title (str): Tytuł przed zmianą
+            old_description (str): Opis przed zmianą
+        """
+        if task.title == old_title and task.description == old_description:
+            return
+        self.remove(task, old_title, old_description)
+        self.add(task)
+
+    def search(self, query, statuses=None, prefix=False, limit=None):
+        """Wyszukuje zadania zawierające wszystkie słowa zapytania.
+
+        Args:
+            query (str): Słowa do wyszukania
+            statuses (iterable, optional): Dopuszczalne statusy zadań (TaskStatus)
+            prefix (bool, optional): Czy słowa zapytania są prefiksami słów
+                zadania (np. "zak" znajduje "zakupy")
+            limit (int, optional): Maksymalna liczba zwracanych zadań.
+                Przy ogólnych zapytaniach oszczędza sortowanie wszystkich wyników
+
+        Returns:
+            list: Znalezione zadania uporządkowane według identyfikatora
+        """
+        tokens = set(tokenize(query))
+        if not tokens:
+            return []
+
+        matches = sorted((self._matches(token, prefix) for token in tokens), key=len)
+        found = matches[0]
+        if len(matches) > 1:
+            found = found.intersection(*matches[1:])
+        if statuses is not None:
+            statuses = set(statuses)
+            found = [task for task in found if task.status in statuses]
+        if limit is not None:
+            return heapq.nsmallest(limit, found, key=_search_order)
+        return sorted(found, key=_search_order)
+
+    def rebuild(self, tasks):
+        """Buduje indeks od nowa na podstawie podanych zadań.
+
+        Args:
+            tasks (iterable): Zadania do zaindeksowania
+        """
+        self._postings = {}
+        for task in tasks:
+            for token in self._task_tokens(task.title, task.description):
+                postings = self._postings.get(token)
+                if postings is None:
+                    self._postings[token] = {task}
+                else:
+                    postings.add(task)
+        self._vocabulary = sorted(self._postings)
+
+    def _matches(self, token, prefix):
+        """Zwraca zbiór zadań pasujących do jednego słowa zapytania.
+
+        Args:
+            token (str): Znormalizowane słowo zapytania
+            prefix (bool): Czy słowo jest prefiksem
+
+        Returns:
+            set: Zadania zawierające słowo (lub słowo o podanym prefiksie)
+        """
+        if not prefix:
+            return self._postings.get(token, set())
+        matches = set()
+        position = bisect_left(self._vocabulary, token)
+        while position < len(self._vocabulary) and self._vocabulary[position].startswith(token):
+            matches.update(self._postings[self._vocabulary[position]])
+            position += 1
+        return matches
+
+    @staticmethod
+    def _task_tokens(title, description):
+        """Zwraca zbiór słów tytułu i opisu zadania."""
+        return set(tokenize(f"{title}\n{description}"))
+
+
+def _search_order(task):
+    """Klucz porządku wyników - identyfikator zadania."""
+    return task.task_id if task.task_id is not None else 0
@@ -0,0 +1,233 @@
+import sqlite3
+import threading
+from src.file_manager import DURABILITY_ALWAYS, DURABILITY_BATCH, DURABILITY_NONE
+from src.file_manager import DURABILITY_LEVELS
+from src.storage_backend import StorageBackend
+from src.task import Task
+from src.todo_status import TaskStatus
+
+_SYNCHRONOUS = {
+    DURABILITY_NONE: "OFF",
+    DURABILITY_BATCH: "NORMAL",
+    DURABILITY_ALWAYS: "FULL",
+}
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS tasks (
+        id INTEGER PRIMARY KEY,
+        title TEXT NOT NULL,
+        description TEXT NOT NULL DEFAULT '',
+        status TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, id)",
+)
+
+_SELECT = "SELECT id, title, description, status FROM tasks"
+_INSERT = "INSERT OR REPLACE INTO tasks (id, title, description, status) VALUES (?, ?, ?, ?)"
+_UPDATE = "UPDATE tasks SET title = ?, description = ?, status = ? WHERE id = ?"
+_DELETE = "DELETE FROM tasks WHERE id = ?"
+
+
+class SqliteFileManager(StorageBackend):
+    """
+    Magazyn zadań w bazie SQLite.
+    Każde zadanie to jeden wiersz tabeli tasks, więc dodanie, edycja
+    i usunięcie zadania zmienia tylko jego wiersz, a zmiany z apply_changes
+    są zapisywane w jednej transakcji. Indeks na kolumnie status obsługuje
+    zapytania load_tasks_by_status i count_tasks_by_status, które nie
+    wczytują pozostałych zadań.
+
+    Baza działa w trybie WAL: zapis dopisuje strony do pliku "-wal",
+    a czytelnicy w innych procesach nie są przez niego blokowani. Poziom
+    trwałości odpowiada ustawieniu PRAGMA synchronous:
+        "none" - OFF, bez fsync
+        "batch" - NORMAL, fsync przy punkcie kontrolnym WAL oraz w sync();
+            ostatnie transakcje mogą zostać utracone przy awarii zasilania,
+            ale baza pozostaje spójna
+        "always" - FULL, fsync przy każdej transakcji
+
+    Połączenie jest otwierane przy pierwszym użyciu i może być używane
+    z różnych wątków (np. przez zapis w tle), ale nie jednocześnie.
+
+    Args:
+        file_path (str): Ścieżka do pliku bazy (":memory:" - baza w pamięci)
+        durability (str, optional): Poziom trwałości. Domyślnie "batch"
+
+    Raises:
+        ValueError: Gdy podano nieznany poziom trwałości
+    """
+
+    def __init__(self, file_path="database_todo.db", durability=DURABILITY_BATCH):
+        if durability not in DURABILITY_LEVELS:
+            raise ValueError(f"Nieznany poziom trwałości: {durability}")
+        self.file_path = file_path
+        self.durability = durability
+        self._connection = None
+        self._mutex = threading.Lock()
+
+    def load_tasks(self):
+        """Wczytuje wszystkie zadania z bazy.
+
+        Returns:
+            list: Lista obiektów Task w kolejności identyfikatorów,
+                  lub pusta lista w przypadku błędu
+        """
+        return self._select(f"{_SELECT} ORDER BY id")
+
+    def load_tasks_by_status(self, status):
+        """Wczytuje z bazy tylko zadania o podanym statusie, korzystając z indeksu.
+
+        Args:
+            status (TaskStatus): Status zadań do wczytania
+
+        Returns:
+            list: Lista obiektów Task w kolejności identyfikatorów,
+                  lub pusta lista w przypadku błędu
+        """
+        return self._select(f"{_SELECT} WHERE status = ? ORDER BY id", (status.value,))
+
+    def count_tasks_by_status(self, status):
+        """Zlicza zadania o podanym statusie, korzystając z indeksu.
+
+        Args:
+            status (TaskStatus): Status zadań do zliczenia
+
+        Returns:
+            int: Liczba zadań o podanym statusie, lub 0 w przypadku błędu
+        """
+        try:
+            with self._mutex:
+                query = "SELECT COUNT(*) FROM tasks WHERE status = ?"
+                return self._connect().execute(query, (status.value,)).fetchone()[0]
+        except sqlite3.Error as e:
+            print(f"Błąd podczas odczytu zadań: {e}")
+            return 0
+
+    def save_tasks(self, tasks):
+        """Zastępuje zawartość bazy podaną listą zadań w jednej transakcji.
+
+        Zadania bez identyfikatora otrzymują kolejne wolne identyfikatory.
+
+        Args:
+            tasks (iterable): Lista lub inny iterowalny zbiór obiektów Task
+
+        Returns:
+            bool: True jeśli zapis się powiódł, False w przypadku błędu
+        """
+        tasks = list(tasks)
+        next_id = max((task.task_id for task in tasks if task.task_id is not None), default=0) + 1
+        for task in tasks:
+            if task.task_id is None:
+                task.task_id = next_id
+                next_id += 1
+        try:
+            with self._mutex:
+                connection = self._connect()
+                with connection:
+                    connection.execute("DELETE FROM tasks")
+                    connection.executemany(_INSERT, map(_row, tasks))
+            return True
+        except sqlite3.Error as e:
+            print(f"Błąd podczas zapisywania zadań: {e}")
+            return False
+
+    def apply_changes(self, tasks, changes):
+        """Utrwala zmiany, modyfikując tylko wiersze zmienionych zadań.
+
+        Wszystkie zmiany są zapisywane w jednej transakcji - przy błędzie
+        baza pozostaje w stanie sprzed wywołania.
+
+        Args:
+            tasks (list): Aktualna lista zadań (nieużywana - zapisywane są
+                tylko zmiany)
+            changes (list): Zmiany jako krotki (operacja, zadanie),
+                gdzie operacja to "add", "update" lub "delete"
+
+        Returns:
+            bool: True jeśli zapis się powiódł, False w przypadku błędu
+        """
+        try:
+            with self._mutex:
+                connection = self._connect()
+                with connection:
+                    for operation, task in changes:
+                        if operation == "delete":
+                            connection.execute(_DELETE, (task.task_id,))
+                        elif operation == "update":
+                            connection.execute(
+                                _UPDATE,
+                                (task.title, task.description, task.status.value, task.task_id),
+                            )
+                        else:
+                            cursor = connection.execute(_INSERT, _row(task))
+                            if task.task_id is None:
+                                task.task_id = cursor.lastrowid
+            return True
+        except sqlite3.Error as e:
+            print(f"Błąd podczas zapisywania zadań: {e}")
+            return False
+
+    def sync(self):
+        """Przenosi zmiany z pliku WAL do bazy punktem kontrolnym (z fsync)."""
+        with self._mutex:
+            if self._connection is not None and self.durability != DURABILITY_NONE:
+                self._connection.execute("PRAGMA wal_checkpoint(FULL)")
+
+    def close(self):
+        """Zamyka połączenie z bazą. Kolejna operacja otworzy je ponownie."""
+        with self._mutex:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self):
+        """Zwraca połączenie z bazą, otwierając je i tworząc schemat przy pierwszym użyciu.
+
+        Returns:
+            sqlite3.Connection: Otwarte połączenie
+        """
+        if self._connection is None:
+            connection = sqlite3.connect(self.file_path, check_same_thread=False)
+            try:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute(f"PRAGMA synchronous={_SYNCHRONOUS[self.durability]}")
+                with connection:
+                    for statement in _SCHEMA:
+                        connection.execute(statement)
+            except sqlite3.Error:
+                connection.close()
+                raise
+            self._connection = connection
+        return self._connection
+
+    def _select(self, query, parameters=()):
+        """Wykonuje zapytanie o zadania i tworzy z wierszy obiekty Task.
+
+        Wiersze z nieznanym statusem są pomijane z komunikatem.
+
+        Args:
+            query (str): Zapytanie zwracające kolumny id, title, description, status
+            parameters (tuple, optional): Parametry zapytania
+
+        Returns:
+            list: Lista obiektów Task, lub pusta lista w przypadku błędu
+        """
+        try:
+            with self._mutex:
+                rows = self._connect().execute(query, parameters).fetchall()
+        except sqlite3.Error as e:
+            print(f"Błąd podczas odczytu zadań: {e}")
+            return []
+
+        tasks = []
+        for task_id, title, description, status in rows:
+            try:
+                tasks.append(Task(title, description, TaskStatus(status), task_id))
+            except ValueError:
+                print(f"Pominięto nieprawidłowe zadanie: {task_id}")
+        return tasks
+
+
+def _row(task):
+    """Zwraca wiersz tabeli tasks dla zadania."""
+    return task.task_id, task.title, task.description, task.status.value
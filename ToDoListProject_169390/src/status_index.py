@@ -0,0 +1,106 @@
+from src.todo_status import TaskStatus
+
+
+class StatusIndex:
+    """
+    Indeks zadań według statusu.
+    Przechowuje dla każdego statusu osobny zbiór zadań, dzięki czemu
+    filtrowanie kosztuje O(k) względem liczby wyników, a zliczanie O(1).
+
+    Z kluczem porządku (key) zadania w obrębie statusu są zwracane w jego
+    kolejności - TodoManager podaje identyfikator, więc kolejność jest taka
+    jak w liście zadań. Zbiór jest sortowany przy odczycie tylko wtedy, gdy
+    trafiło do niego zadanie z kluczem mniejszym od wcześniej dodanych (np.
+    po powrocie zadania do poprzedniego statusu). Bez klucza zadania są
+    uporządkowane według kolejności, w jakiej otrzymały dany status.
+
+    Args:
+        tasks (iterable, optional): Zadania, z których budowany jest indeks
+        key (function, optional): Klucz porządku zadań w obrębie statusu
+    """
+
+    def __init__(self, tasks=(), key=None):
+        self._buckets = {status: {} for status in TaskStatus}
+        self._key = key
+        self._last_keys = {}
+        self._unsorted = set()
+        self.rebuild(tasks)
+
+    def add(self, task):
+        """Dodaje zadanie do indeksu.
+
+        Args:
+            task (Task): Zadanie do dodania
+        """
+        bucket = self._buckets.get(task.status)
+        if bucket is None:
+            return
+        bucket[id(task)] = task
+        if self._key is not None:
+            key = self._key(task)
+            last = self._last_keys.get(task.status)
+            if last is not None and key < last:
+                self._unsorted.add(task.status)
+            else:
+                self._last_keys[task.status] = key
+
+    def remove(self, task):
+        """Usuwa zadanie z indeksu.
+
+        Args:
+            task (Task): Zadanie do usunięcia
+        """
+        bucket = self._buckets.get(task.status)
+        if bucket is not None:
+            bucket.pop(id(task), None)
+
+    def move(self, task, old_status):
+        """Przenosi zadanie po zmianie statusu.
+
+        Args:
+            task (Task): Zadanie z już ustawionym nowym statusem
+            old_status (TaskStatus): Poprzedni status zadania
+        """
+        bucket = self._buckets.get(old_status)
+        if bucket is not None:
+            bucket.pop(id(task), None)
+        self.add(task)
+
+    def get(self, status):
+        """Zwraca zadania o podanym statusie.
+
+        Args:
+            status (TaskStatus): Status zadań do wyszukania
+
+        Returns:
+            list: Lista zadań o podanym statusie
+        """
+        if status in self._unsorted:
+            tasks = sorted(self._buckets[status].values(), key=self._key)
+            self._buckets[status] = {id(task): task for task in tasks}
+            self._unsorted.discard(status)
+        return list(self._buckets.get(status, {}).values())
+
+    def count(self, status):
+        """Zwraca liczbę zadań o podanym statusie.
+
+        Args:
+            status (TaskStatus): Status zadań do zliczenia
+
+        Returns:
+            int: Liczba zadań o podanym statusie
+        """
+        return len(self._buckets.get(status, {}))
+
+    def rebuild(self, tasks):
+        """Buduje indeks od nowa na podstawie listy zadań.
+
+        Args:
+            tasks (list): Lista wszystkich zadań
+        """
+        for bucket in self._buckets.values():
+            bucket.clear()
+        self._last_keys.clear()
+        self._unsorted.clear()
+        for task in tasks:
+            self.add(task)
@@ -0,0 +1,98 @@
+from contextlib import nullcontext
+from src.metrics import NULL_METRICS
+
+
+class StorageBackend:
+    """
+    Interfejs magazynu zadań używanego przez TodoManager.
+    Klasa pochodna musi zaimplementować load_tasks i save_tasks. Pozostałe
+    metody mają domyślne implementacje: apply_changes zapisuje całą listę,
+    load_tasks_lazy wczytuje zadania od razu, a sync i close nic nie robią.
+
+    Magazyn współdzielony przez wiele procesów ustawia atrybut shared na True
+    i implementuje lock, has_external_changes oraz read_external_changes
+    (zob. FileManager).
+
+    Atrybut metrics (obiekt Metrics) przyjmuje pomiary czasów operacji,
+    liczniki i zdarzenia magazynu. Domyślnie pomiary są wyłączone.
+    """
+
+    shared = False
+    metrics = NULL_METRICS
+
+    def load_tasks(self):
+        """Wczytuje wszystkie zadania z magazynu.
+
+        Returns:
+            list: Lista obiektów Task w kolejności identyfikatorów
+
+        Raises:
+            NotImplementedError: Gdy klasa pochodna nie implementuje metody
+        """
+        raise NotImplementedError
+
+    def save_tasks(self, tasks):
+        """Zapisuje całą listę zadań, zastępując zawartość magazynu.
+
+        Args:
+            tasks (iterable): Obiekty Task do zapisania
+
+        Returns:
+            bool: True jeśli zapis się powiódł, False w przypadku błędu
+
+        Raises:
+            NotImplementedError: Gdy klasa pochodna nie implementuje metody
+        """
+        raise NotImplementedError
+
+    def apply_changes(self, tasks, changes):
+        """Utrwala zmiany wprowadzone w liście zadań.
+
+        Args:
+            tasks (list): Aktualna lista zadań (po wprowadzeniu zmian)
+            changes (list): Zmiany jako krotki (operacja, zadanie),
+                gdzie operacja to "add", "update" lub "delete"
+
+        Returns:
+            bool: True jeśli zapis się powiódł, False w przypadku błędu
+        """
+        return self.save_tasks(tasks)
+
+    def load_tasks_lazy(self):
+        """Wczytuje zadania w trybie leniwym (domyślnie - od razu wszystkie).
+
+        Returns:
+            list: Lista obiektów Task
+        """
+        return self.load_tasks()
+
+    def sync(self):
+        """Wymusza zapis na dysk zmian, dla których odłożono synchronizację."""
+
+    def close(self):
+        """Zwalnia zasoby magazynu (pliki, połączenia)."""
+
+    def lock(self):
+        """Zajmuje blokadę magazynu współdzielonego między procesami.
+
+        Returns:
+            Menedżer kontekstu blokady. Domyślnie nie blokuje niczego
+        """
+        return nullcontext()
+
+    def has_external_changes(self):
+        """Czy inny proces zmienił dane od ostatniego odczytu lub zapisu.
+
+        Returns:
+            bool: Domyślnie False
+        """
+        return False
+
+    def read_external_changes(self):
+        """Zwraca zmiany zapisane przez inne procesy.
+
+        Returns:
+            list: Krotki (operacja, zadanie lub identyfikator), lub None,
+                gdy należy wczytać wszystkie zadania ponownie
+        """
+        return None
@@ -1,74 +1,177 @@
-from src.todo_status import TaskStatus, get_default_status
-
-
-class Task:
-    """
-    Klasa reprezentująca pojedyncze zadanie w aplikacji Todo.
-    Przechowuje informacje o tytule, opisie i statusie zadania.
-    Umożliwia aktualizację właściwości zadania oraz konwersję między
-    obiektami zadań a reprezentacją tekstową.
-    """
-
-    def __init__(self, title, description="", status=None):
-        self.title = title
-        self.description = description
-        self.status = status if status else get_default_status()
-
-    def change_status(self, new_status):
-        """Zmienia status zadania.
-
-        Args:
-            new_status (TaskStatus): Nowy status do ustawienia
-
-        Returns:
-            bool: True jeśli status został zmieniony, False w przeciwnym razie
-        """
-        if isinstance(new_status, TaskStatus):
-            self.status = new_status
-            return True
-        return False
-
-    def update_details(self, title=None, description=None):
-        """Aktualizuje szczegóły zadania.
-
-        Args:
-            title (str, optional): Nowy tytuł zadania
-            description (str, optional): Nowy opis zadania
-        """
-        if title:
-            self.title = title
-        if description is not None:
-            self.description = description
-
-    def to_string(self):
-        """Konwertuje zadanie do formatu string dla zapisu do pliku.
-
-        Returns:
-            str: Reprezentacja tekstowa zadania w formacie "title|description|status"
-        """
-        return f"{self.title}|{self.description}|{self.status.value}"
-
-    @classmethod
-    def from_string(cls, task_string):
-        """Tworzy obiekt zadania z tekstu wczytanego z pliku.
-
-        Args:
-            task_string (str): Tekstowa reprezentacja zadania
-
-        Returns:
-            Task: Nowy obiekt zadania
-
-        Raises:
-            ValueError: Gdy format tekstu jest nieprawidłowy lub nie można utworzyć zadania
-        """
-        try:
-            parts = task_string.strip().split("|")
-            if len(parts) != 3:
-                raise ValueError("Nieprawidłowy format zadania")
-
-            title, description, status_value = parts
-            status = TaskStatus(status_value)
-
-            return cls(title, description, status)
-        except Exception as e:
-            raise ValueError(f"Nie można utworzyć zadania: {e}")
+from operator import attrgetter
+from src.todo_status import TaskStatus, get_default_status
+
+INVALID_FORMAT = "Nieprawidłowy format zadania"
+INVALID_STATUS = "Nieprawidłowy status zadania"
+INVALID_TASK_ID = "Nieprawidłowy identyfikator zadania"
+
+_STATUS_BY_VALUE = {status.value: status for status in TaskStatus}
+
+
+def _serialized_field(name):
+    """Tworzy właściwość pola zadania zapisywanego w linii tekstu.
+
+    Odczyt korzysta z attrgetter (bez wywołania funkcji Pythona), a zapis
+    unieważnia zapamiętaną linię tekstu zadania.
+
+    Args:
+        name (str): Nazwa atrybutu w __slots__ przechowującego wartość
+
+    Returns:
+        property: Właściwość z odczytem i zapisem pola
+    """
+    def setter(task, value):
+        setattr(task, name, value)
+        task._line = None
+
+    return property(attrgetter(name), setter)
+
+
+class Task:
+    """
+    Klasa reprezentująca pojedyncze zadanie w aplikacji Todo.
+    Przechowuje informacje o tytule, opisie i statusie zadania.
+    Umożliwia aktualizację właściwości zadania oraz konwersję między
+    obiektami zadań a reprezentacją tekstową.
+    Zadania zarządzane przez TodoManager mają trwały, unikalny identyfikator.
+    Atrybuty są przechowywane w __slots__ zamiast w słowniku instancji,
+    co przy milionach zadań znacząco zmniejsza zużycie pamięci.
+    Zadanie zapamiętuje swoją reprezentację tekstową, więc zapis niezmienionych
+    zadań nie wymaga ponownej serializacji. Przypisanie atrybutu title,
+    description, status lub task_id (także bezpośrednie) unieważnia
+    zapamiętaną linię.
+    """
+
+    __slots__ = ("_title", "_description", "_status", "_task_id", "_status_listener", "_line")
+
+    title = _serialized_field("_title")
+    description = _serialized_field("_description")
+    status = _serialized_field("_status")
+    task_id = _serialized_field("_task_id")
+
+    def __init__(self, title, description="", status=None, task_id=None):
+        self._title = title
+        self._description = description
+        self._status = status if status else get_default_status()
+        self._task_id = task_id
+        self._status_listener = None
+        self._line = None
+
+    @property
+    def dirty(self):
+        """Czy zadanie zmieniło się od ostatniej serializacji (to_string)."""
+        return self._line is None
+
+    def mark_dirty(self):
+        """Oznacza zadanie jako zmienione, unieważniając zapamiętaną linię tekstu."""
+        self._line = None
+
+    def change_status(self, new_status):
+        """Zmienia status zadania.
+
+        Jeśli zadanie należy do menedżera, jego indeks statusów jest
+        powiadamiany o zmianie.
+
+        Args:
+            new_status (TaskStatus): Nowy status do ustawienia
+
+        Returns:
+            bool: True jeśli status został zmieniony, False w przeciwnym razie
+        """
+        if isinstance(new_status, TaskStatus):
+            old_status = self._status
+            self.status = new_status
+            if self._status_listener is not None:
+                self._status_listener(self, old_status)
+            return True
+        return False
+
+    def update_details(self, title=None, description=None):
+        """Aktualizuje szczegóły zadania.
+
+        Args:
+            title (str, optional): Nowy tytuł zadania
+            description (str, optional): Nowy opis zadania
+        """
+        if title:
+            self.title = title
+        if description is not None:
+            self.description = description
+
+    def to_string(self):
+        """Konwertuje zadanie do formatu string dla zapisu do pliku.
+
+        Wynik jest zapamiętywany do czasu zmiany zadania.
+
+        Returns:
+            str: Reprezentacja tekstowa zadania w formacie "title|description|status",
+                 uzupełniona o "|task_id" gdy zadanie ma identyfikator
+        """
+        line = self._line
+        if line is None:
+            if self._task_id is None:
+                line = f"{self._title}|{self._description}|{self._status.value}"
+            else:
+                line = f"{self._title}|{self._description}|{self._status.value}|{self._task_id}"
+            self._line = line
+        return line
+
+    @classmethod
+    def from_string(cls, task_string):
+        """Tworzy obiekt zadania z tekstu wczytanego z pliku.
+
+        Args:
+            task_string (str): Tekstowa reprezentacja zadania w formacie
+                "title|description|status" lub "title|description|status|task_id"
+
+        Gdy tekst ma postać kanoniczną, zadanie zapamiętuje go jako swoją
+        reprezentację, więc ponowny zapis nie wymaga serializacji. Tekst jest
+        sprawdzany przez parse, więc obie metody akceptują te same linie.
+
+        Returns:
+            Task: Nowy obiekt zadania
+
+        Raises:
+            ValueError: Gdy format tekstu jest nieprawidłowy lub nie można utworzyć zadania
+        """
+        if not isinstance(task_string, str):
+            raise ValueError(f"Nie można utworzyć zadania: {INVALID_FORMAT}")
+        task, reason = cls.parse(task_string)
+        if task is None:
+            raise ValueError(f"Nie można utworzyć zadania: {reason}")
+        return task
+
+    @classmethod
+    def parse(cls, task_string):
+        """Tworzy obiekt zadania z tekstu bez zgłaszania wyjątku dla błędnego formatu.
+
+        Odpowiednik from_string dla wczytywania plików: nieprawidłowa linia
+        kosztuje tyle co prawidłowa, bo powód błędu jest zwracany zamiast
+        tworzenia i obsługi wyjątku.
+
+        Args:
+            task_string (str): Tekstowa reprezentacja zadania (zob. from_string)
+
+        Returns:
+            tuple: (Task, None) dla prawidłowego tekstu, albo (None, powód),
+                gdzie powód to INVALID_FORMAT, INVALID_STATUS lub INVALID_TASK_ID
+        """
+        line = task_string.strip()
+        parts = line.split("|")
+        if len(parts) not in (3, 4):
+            return None, INVALID_FORMAT
+        status = _STATUS_BY_VALUE.get(parts[2])
+        if status is None:
+            return None, INVALID_STATUS
+
+        task_id = None
+        if len(parts) == 4:
+            if not (parts[3].isascii() and parts[3].isdigit()):
+                return None, INVALID_TASK_ID
+            task_id = int(parts[3])
+            if str(task_id) != parts[3]:
+                line = None
+
+        task = cls(parts[0], parts[1], status, task_id)
+        task._line = line
+        return task, None
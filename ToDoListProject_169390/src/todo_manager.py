@@ -1,148 +1,1269 @@
-from src.task import Task
-from src.file_manager import FileManager
-from src.todo_status import TaskStatus, is_valid_status
-
-
-class TodoManager:
-    """
-    Klasa zarządzająca listą zadań w aplikacji Todo.
-    Odpowiada za dodawanie, usuwanie, edycję i zmianę statusu zadań.
-    Zapewnia również trwałość danych poprzez zapisywanie zmian do pliku.
-    """
-
-    def __init__(self, file_path="todo_tasks.txt"):
-        self.file_manager = FileManager(file_path)
-        self.tasks = self.file_manager.load_tasks()
-
-    def add_task(self, title, description=""):
-        """Dodaje nowe zadanie do listy.
-
-        Args:
-            title (str): Tytuł nowego zadania
-            description (str, optional): Opis zadania. Domyślnie pusty string
-
-        Returns:
-            Task: Utworzony obiekt zadania
-
-        Raises:
-            ValueError: Gdy tytuł zadania jest pusty
-        """
-        if not title:
-            raise ValueError("Tytuł zadania nie może być pusty")
-
-        new_task = Task(title, description)
-        self.tasks.append(new_task)
-        self._save_changes()
-        return new_task
-
-    def delete_task(self, task_index):
-        """Usuwa zadanie z listy.
-
-        Args:
-            task_index (int): Indeks zadania do usunięcia
-
-        Returns:
-            bool: True jeśli zadanie zostało usunięte, False w przypadku błędu
-        """
-        try:
-            if 0 <= task_index < len(self.tasks):
-                del self.tasks[task_index]
-                self._save_changes()
-                return True
-            return False
-        except Exception as e:
-            print(f"Błąd podczas usuwania zadania: {e}")
-            return False
-
-    def edit_task(self, task_index, title=None, description=None):
-        """Edytuje istniejące zadanie.
-
-        Args:
-            task_index (int): Indeks zadania do edycji
-            title (str, optional): Nowy tytuł zadania
-            description (str, optional): Nowy opis zadania
-
-        Returns:
-            bool: True jeśli zadanie zostało zaktualizowane, False w przypadku błędu
-        """
-        try:
-            if 0 <= task_index < len(self.tasks):
-                self.tasks[task_index].update_details(title, description)
-                self._save_changes()
-                return True
-            return False
-        except Exception as e:
-            print(f"Błąd podczas edycji zadania: {e}")
-            return False
-
-    def change_task_status(self, task_index, new_status):
-        """Zmienia status zadania.
-
-        Args:
-            task_index (int): Indeks zadania, którego status ma być zmieniony
-            new_status (TaskStatus lub str): Nowy status zadania
-
-        Returns:
-            bool: True jeśli status został zmieniony, False w przypadku błędu
-
-        Raises:
-            ValueError: Gdy zadanie ma już podany status
-            IndexError: Gdy indeks zadania jest nieprawidłowy
-        """
-        try:
-            if 0 <= task_index < len(self.tasks):
-
-                if isinstance(new_status, str) and is_valid_status(new_status):
-                    new_status = TaskStatus(new_status.lower())
-
-                current_task = self.tasks[task_index]
-                if current_task.status == new_status:
-                    raise ValueError(f"Zadanie ma już status {new_status.value}")
-
-                if isinstance(new_status, TaskStatus):
-                    current_task.change_status(new_status)
-                    self._save_changes()
-                    return True
-                return False
-            else:
-                raise IndexError("Nieprawidłowy indeks zadania")
-        except (ValueError, IndexError) as e:
-            print(f"Błąd podczas zmiany statusu zadania: {e}")
-            return False
-        except Exception as e:
-            print(f"Nieoczekiwany błąd: {e}")
-            return False
-
-    def get_tasks(self):
-        """Zwraca listę wszystkich zadań.
-
-        Returns:
-            list: Lista wszystkich zadań
-        """
-        return self.tasks
-
-    def _save_changes(self):
-        """Zapisuje zmiany w liście zadań do pliku.
-
-        Aktualizuje plik z zadaniami po każdej operacji modyfikującej listę zadań.
-        """
-        self.file_manager.save_tasks(self.tasks)
-
-
-def get_tasks_by_status(todo_manager, status):
-    """Zwraca zadania o określonym statusie.
-
-    Args:
-        todo_manager (TodoManager): Instancja menedżera zadań
-        status (TaskStatus lub str): Status zadań do wyszukania
-
-    Returns:
-        list: Lista zadań o podanym statusie
-    """
-    if not isinstance(status, TaskStatus):
-        try:
-            status = TaskStatus(status.lower())
-        except ValueError:
-            return []
-
-    return [task for task in todo_manager.get_tasks() if task.status == status]
+import heapq
+import weakref
+from bisect import bisect_left, bisect_right
+from collections import deque
+from contextlib import contextmanager
+from src.change_events import ADDED, DELETED, EDITED, RESET, STATUS_CHANGED
+from src.change_events import ChangeNotifier, TaskEvent, task_fields
+from src.task import Task
+from src.file_manager import FileManager
+from src.metrics import NULL_METRICS, timed
+from src.pagination import TaskPage, decode_cursor, encode_cursor, sort_key
+from src.rwlock import ReadWriteLock
+from src.search_index import SearchIndex
+from src.status_index import StatusIndex
+from src.todo_status import TaskStatus, is_valid_status
+from src.version_store import diff_states
+from src.write_behind import WriteBehindWriter
+
+
+class TodoManager:
+    """
+    Klasa zarządzająca listą zadań w aplikacji Todo.
+    Odpowiada za dodawanie, usuwanie, edycję i zmianę statusu zadań.
+    Zapewnia również trwałość danych poprzez zapisywanie zmian do magazynu
+    zadań (StorageBackend) - domyślnie pliku tekstowego obsługiwanego przez
+    FileManager.
+    Zadania można adresować indeksem w liście lub trwałym identyfikatorem
+    (task_id), który nie zmienia się po usunięciu innych zadań. Lista zadań
+    jest zawsze uporządkowana rosnąco według identyfikatorów: zadania
+    z pliku o innej kolejności (lub z nadanymi nowymi identyfikatorami) są
+    porządkowane przy budowie indeksów, a z tego porządku korzystają
+    wyszukiwanie binarne pozycji zadania, stronicowanie kursorem i undo().
+
+    Menedżer może być używany jednocześnie z wielu wątków. Odczyty
+    (get_task, get_tasks, get_tasks_by_status, count_tasks_by_status) zajmują
+    blokadę odczytu i nie blokują się nawzajem, a operacje modyfikujące
+    wraz z zapisem zmian do pliku wykonywane są pod blokadą zapisu,
+    jedna po drugiej.
+
+    Plik obsługiwany przez FileManager(shared=True) może być używany przez
+    wiele procesów. Operacje modyfikujące zajmują wtedy blokadę
+    międzyprocesową i przed zmianą nanoszą zmiany zapisane przez inne
+    procesy - z dziennika tylko nowe rekordy, a po zapisie nowej migawki
+    cały plik. Odczyty sprawdzają licznik wersji pliku i również nanoszą
+    zmiany, gdy plik się zmienił.
+
+    Args:
+        file_path (str): Ścieżka do pliku z zadaniami
+        file_manager (StorageBackend, optional): Magazyn zadań, np. FileManager
+            w trybie dziennika lub SqliteFileManager. Gdy podany, file_path
+            jest ignorowany
+        lazy (bool, optional): Tryb leniwy - przy tworzeniu menedżera zapamiętywane
+            są tylko położenia zadań w pliku, obiekty Task powstają przy pierwszym
+            dostępie, a indeksy (identyfikatory, statusy) przy pierwszym użyciu
+        write_behind (bool, optional): Tryb zapisu w tle - operacje wracają po
+            zmianie stanu w pamięci, a zmiany zapisuje wątek roboczy. Przed
+            zakończeniem pracy należy wywołać close() lub flush()
+        flush_interval (float, optional): Maksymalny czas (w sekundach) od
+            zmiany do jej zapisu w trybie zapisu w tle
+        flush_threshold (int, optional): Liczba odłożonych zmian wymuszająca
+            zapis w trybie zapisu w tle
+        metrics (Metrics, optional): Obiekt pomiarów otrzymujący czasy wczytania
+            ("todo.load"), operacji modyfikujących (np. "todo.add_task") i zapisu
+            zmian ("todo.save_changes") oraz licznik zapisanych zmian
+            ("todo.changes"). Magazyn bez własnego obiektu pomiarów otrzymuje
+            ten sam. Domyślnie pomiary magazynu lub wyłączone
+        version_store (VersionStore, optional): Historia wersji listy zadań
+            używana przez create_version, list_versions, diff_versions
+            i restore_version. Domyślnie wersjonowanie jest wyłączone
+        undo_depth (int, optional): Liczba ostatnich operacji, które można
+            cofnąć metodą undo(). 0 wyłącza historię operacji
+
+    Raises:
+        ValueError: Gdy tryb zapisu w tle użyto z plikiem współdzielonym
+    """
+
+    def __init__(
+        self,
+        file_path="todo_tasks.txt",
+        file_manager=None,
+        lazy=False,
+        write_behind=False,
+        flush_interval=1.0,
+        flush_threshold=1000,
+        metrics=None,
+        version_store=None,
+        undo_depth=100,
+    ):
+        if file_manager is None:
+            file_manager = FileManager(file_path)
+        if metrics is None:
+            metrics = getattr(file_manager, "metrics", NULL_METRICS)
+        elif getattr(file_manager, "metrics", NULL_METRICS) is NULL_METRICS:
+            file_manager.metrics = metrics
+        self.metrics = metrics
+        self._shared = getattr(file_manager, "shared", False)
+        if write_behind and self._shared:
+            raise ValueError("Tryb zapisu w tle nie obsługuje pliku współdzielonego")
+        self.file_manager = file_manager
+        self.version_store = version_store
+        self._lazy = lazy
+        self._tasks_by_id = {}
+        self._next_id = 1
+        self._status_index = StatusIndex(key=_task_id_key)
+        self._search_index = None
+        self._indexed = False
+        self._batch_depth = 0
+        self._pending_changes = []
+        self._undo_log = deque(maxlen=undo_depth)
+        self._redo_log = deque(maxlen=undo_depth)
+        self._batch_history = []
+        self._replaying = False
+        self._notifier = ChangeNotifier()
+        self._pending_events = []
+        self._lock = ReadWriteLock()
+        self._writer = None
+        with self.metrics.timer("todo.load"):
+            if lazy:
+                self.tasks = self.file_manager.load_tasks_lazy()
+            else:
+                self.tasks = self.file_manager.load_tasks()
+                self._ensure_indexes()
+        if write_behind:
+            self._writer = WriteBehindWriter(
+                self.file_manager, self._lock.reader, flush_interval, flush_threshold
+            )
+            self._close_writer = weakref.finalize(self, self._writer.close)
+
+    @timed("todo.add_task")
+    def add_task(self, title, description=""):
+        """Dodaje nowe zadanie do listy.
+
+        Args:
+            title (str): Tytuł nowego zadania
+            description (str, optional): Opis zadania. Domyślnie pusty string
+
+        Returns:
+            Task: Utworzony obiekt zadania z nadanym identyfikatorem
+
+        Raises:
+            ValueError: Gdy tytuł zadania jest pusty
+        """
+        if not title:
+            raise ValueError("Tytuł zadania nie może być pusty")
+
+        with self._write_access():
+            self._ensure_indexes()
+            new_task = Task(title, description)
+            self.tasks.append(new_task)
+            self._attach(new_task)
+            self._record(("add", new_task))
+            self._emit(ADDED, new_task.task_id, None, task_fields(new_task))
+            self._save_changes(("add", new_task))
+        return new_task
+
+    def get_task(self, task_id):
+        """Zwraca zadanie o podanym identyfikatorze w czasie O(1).
+
+        Args:
+            task_id (int): Identyfikator zadania
+
+        Returns:
+            Task: Znalezione zadanie lub None, gdy zadanie nie istnieje
+        """
+        self._refresh()
+        self._ensure_indexes()
+        with self._lock.reader:
+            return self._tasks_by_id.get(task_id)
+
+    @timed("todo.delete_task")
+    def delete_task(self, task_index):
+        """Usuwa zadanie z listy.
+
+        Args:
+            task_index (int): Indeks zadania do usunięcia
+
+        Returns:
+            bool: True jeśli zadanie zostało usunięte, False w przypadku błędu
+        """
+        try:
+            with self._write_access():
+                self._ensure_indexes()
+                if 0 <= task_index < len(self.tasks):
+                    self._delete(task_index)
+                    return True
+                return False
+        except Exception as e:
+            print(f"Błąd podczas usuwania zadania: {e}")
+            return False
+
+    @timed("todo.delete_task_by_id")
+    def delete_task_by_id(self, task_id):
+        """Usuwa zadanie o podanym identyfikatorze.
+
+        Identyfikatory pozostałych zadań nie zmieniają się po usunięciu.
+
+        Args:
+            task_id (int): Identyfikator zadania do usunięcia
+
+        Returns:
+            bool: True jeśli zadanie zostało usunięte, False w przypadku błędu
+        """
+        try:
+            with self._write_access():
+                self._ensure_indexes()
+                task = self._tasks_by_id.get(task_id)
+                if task is not None:
+                    self._delete(self._position(task))
+                    return True
+                return False
+        except Exception as e:
+            print(f"Błąd podczas usuwania zadania: {e}")
+            return False
+
+    @timed("todo.edit_task")
+    def edit_task(self, task_index, title=None, description=None):
+        """Edytuje istniejące zadanie.
+
+        Args:
+            task_index (int): Indeks zadania do edycji
+            title (str, optional): Nowy tytuł zadania
+            description (str, optional): Nowy opis zadania
+
+        Returns:
+            bool: True jeśli zadanie zostało zaktualizowane, False w przypadku błędu
+        """
+        try:
+            with self._write_access():
+                self._ensure_indexes()
+                if 0 <= task_index < len(self.tasks):
+                    self._edit(self.tasks[task_index], title, description)
+                    return True
+                return False
+        except Exception as e:
+            print(f"Błąd podczas edycji zadania: {e}")
+            return False
+
+    @timed("todo.edit_task_by_id")
+    def edit_task_by_id(self, task_id, title=None, description=None):
+        """Edytuje zadanie o podanym identyfikatorze.
+
+        Args:
+            task_id (int): Identyfikator zadania do edycji
+            title (str, optional): Nowy tytuł zadania
+            description (str, optional): Nowy opis zadania
+
+        Returns:
+            bool: True jeśli zadanie zostało zaktualizowane, False w przypadku błędu
+        """
+        try:
+            with self._write_access():
+                self._ensure_indexes()
+                task = self._tasks_by_id.get(task_id)
+                if task is not None:
+                    self._edit(task, title, description)
+                    return True
+                return False
+        except Exception as e:
+            print(f"Błąd podczas edycji zadania: {e}")
+            return False
+
+    @timed("todo.change_task_status")
+    def change_task_status(self, task_index, new_status):
+        """Zmienia status zadania.
+
+        Args:
+            task_index (int): Indeks zadania, którego status ma być zmieniony
+            new_status (TaskStatus lub str): Nowy status zadania
+
+        Returns:
+            bool: True jeśli status został zmieniony, False w przypadku błędu
+
+        Raises:
+            ValueError: Gdy zadanie ma już podany status
+            IndexError: Gdy indeks zadania jest nieprawidłowy
+        """
+        try:
+            with self._write_access():
+                self._ensure_indexes()
+                if 0 <= task_index < len(self.tasks):
+                    return self._change_status(self.tasks[task_index], new_status)
+                else:
+                    raise IndexError("Nieprawidłowy indeks zadania")
+        except (ValueError, IndexError) as e:
+            print(f"Błąd podczas zmiany statusu zadania: {e}")
+            return False
+        except Exception as e:
+            print(f"Nieoczekiwany błąd: {e}")
+            return False
+
+    @timed("todo.change_task_status_by_id")
+    def change_task_status_by_id(self, task_id, new_status):
+        """Zmienia status zadania o podanym identyfikatorze.
+
+        Args:
+            task_id (int): Identyfikator zadania
+            new_status (TaskStatus lub str): Nowy status zadania
+
+        Returns:
+            bool: True jeśli status został zmieniony, False w przypadku błędu
+        """
+        try:
+            with self._write_access():
+                self._ensure_indexes()
+                task = self._tasks_by_id.get(task_id)
+                if task is None:
+                    raise LookupError(f"Nie znaleziono zadania o identyfikatorze {task_id}")
+                return self._change_status(task, new_status)
+        except (ValueError, LookupError) as e:
+            print(f"Błąd podczas zmiany statusu zadania: {e}")
+            return False
+        except Exception as e:
+            print(f"Nieoczekiwany błąd: {e}")
+            return False
+
+    def get_tasks(self):
+        """Zwraca listę wszystkich zadań.
+
+        Zwracana jest kopia listy, więc można ją przeglądać bez blokady,
+        także gdy inne wątki modyfikują zadania. Zmiana zwróconej listy (np.
+        dopisanie lub usunięcie elementu) nie zmienia listy menedżera - do
+        tego służą add_task, delete_task i pozostałe operacje modyfikujące,
+        które aktualizują też indeksy i zapisują zmiany.
+
+        Returns:
+            list: Lista wszystkich zadań
+        """
+        self._refresh()
+        with self._lock.reader:
+            return self.tasks.copy()
+
+    def get_tasks_by_status(self, status):
+        """Zwraca zadania o określonym statusie korzystając z indeksu statusów.
+
+        Args:
+            status (TaskStatus lub str): Status zadań do wyszukania
+
+        Returns:
+            list: Lista zadań o podanym statusie, w kolejności listy zadań
+        """
+        status = _normalize_status(status)
+        if status is None:
+            return []
+        self._refresh()
+        self._ensure_indexes()
+        with self._lock.reader:
+            return self._status_index.get(status)
+
+    def list_tasks(
+        self, limit=50, offset=0, cursor=None, status=None, sort_by="task_id", reverse=False
+    ):
+        """Zwraca jedną stronę listy zadań.
+
+        Strony można pobierać przesunięciem (offset) albo kursorem zwróconym
+        z poprzednią stroną. Kursor wskazuje miejsce po ostatnim zadaniu
+        strony, więc dodanie lub usunięcie zadań nie przesuwa kolejnych stron.
+        Przy sortowaniu według identyfikatora (domyślnie) koszt strony zależy
+        od jej rozmiaru, a nie od liczby zadań: lista zadań jest uporządkowana
+        według identyfikatorów (także gdy plik ma inną kolejność, zob.
+        _index_tasks), a filtr statusu korzysta z indeksu statusów.
+        Sortowanie według innego pola wybiera stronę kopcem w czasie
+        O(n log(offset + limit)).
+
+        Args:
+            limit (int, optional): Maksymalna liczba zadań na stronie
+            offset (int, optional): Liczba zadań pomijanych (po kursorze, jeśli podany)
+            cursor (str, optional): Kursor next_cursor poprzedniej strony
+            status (TaskStatus lub str, optional): Status, do którego zawężana jest lista
+            sort_by (str, optional): Pole sortowania: "task_id", "title" lub "status"
+            reverse (bool, optional): Czy sortować malejąco
+
+        Returns:
+            TaskPage: Zadania strony, kursor następnej strony i liczba wszystkich
+                zadań spełniających kryteria
+
+        Raises:
+            ValueError: Gdy limit lub offset są nieprawidłowe, pole sortowania
+                jest nieznane, albo kursor jest nieprawidłowy lub pochodzi
+                z innego zapytania
+        """
+        if limit < 1:
+            raise ValueError("Limit musi być dodatni")
+        if offset < 0:
+            raise ValueError("Offset nie może być ujemny")
+        order = sort_key(sort_by)
+        if status is not None:
+            status = _normalize_status(status)
+            if status is None:
+                return TaskPage([], None, 0)
+        query = [sort_by, reverse, status.value if status is not None else None]
+        after = decode_cursor(cursor, query) if cursor is not None else None
+
+        self._refresh()
+        self._ensure_indexes()
+        with self._lock.reader:
+            if sort_by == "task_id":
+                tasks, more = self._page_by_id(after, offset, limit, status, reverse)
+            else:
+                tasks, more = self._page_sorted(order, after, offset, limit, status, reverse)
+            total = len(self.tasks) if status is None else self._status_index.count(status)
+        next_cursor = encode_cursor(query, order(tasks[-1])) if more else None
+        return TaskPage(tasks, next_cursor, total)
+
+    def count_tasks_by_status(self, status):
+        """Zwraca liczbę zadań o określonym statusie w czasie O(1).
+
+        Args:
+            status (TaskStatus lub str): Status zadań do zliczenia
+
+        Returns:
+            int: Liczba zadań o podanym statusie
+        """
+        status = _normalize_status(status)
+        if status is None:
+            return 0
+        self._refresh()
+        self._ensure_indexes()
+        with self._lock.reader:
+            return self._status_index.count(status)
+
+    def search(self, query, status=None, prefix=False, limit=None):
+        """Wyszukuje zadania po słowach z tytułu i opisu.
+
+        Korzysta z indeksu odwróconego budowanego przy pierwszym wyszukiwaniu
+        i aktualizowanego przy dodawaniu, edycji i usuwaniu zadań. Wielkość
+        liter i polskie znaki diakrytyczne nie mają znaczenia ("zolc"
+        znajduje "Żółć").
+
+        Args:
+            query (str): Słowa, które muszą wystąpić w zadaniu
+            status (TaskStatus, str lub iterable, optional): Status lub kolekcja
+                statusów, do których zawężane są wyniki
+            prefix (bool, optional): Czy słowa zapytania są prefiksami słów
+                zadania (np. "zak" znajduje "zakupy")
+            limit (int, optional): Maksymalna liczba zwracanych zadań
+
+        Returns:
+            list: Znalezione zadania uporządkowane według identyfikatora
+        """
+        statuses = None
+        if status is not None:
+            if isinstance(status, (TaskStatus, str)):
+                status = (status,)
+            statuses = {value for value in map(_normalize_status, status) if value is not None}
+        self._refresh()
+        self._ensure_indexes()
+        if self._search_index is None:
+            with self._lock.writer:
+                if self._search_index is None:
+                    self._search_index = SearchIndex(self.tasks)
+        with self._lock.reader:
+            return self._search_index.search(query, statuses, prefix, limit)
+
+    def _page_by_id(self, after, offset, limit, status, reverse):
+        """Wybiera stronę zadań w kolejności identyfikatorów.
+
+        Bez filtra strona jest wycinkiem listy zadań. Z filtrem statusu
+        wybierana jest tańsza z dwóch dróg: przeglądanie listy od kursora
+        z pominięciem zadań o innym statusie (koszt odwrotnie proporcjonalny
+        do udziału statusu) albo wycinek zadań z indeksu statusów, który
+        zwraca je w kolejności identyfikatorów (koszt proporcjonalny do ich liczby).
+
+        Args:
+            after (tuple): Klucz ostatniego zadania poprzedniej strony lub None
+            offset (int): Liczba pomijanych zadań
+            limit (int): Maksymalna liczba zadań na stronie
+            status (TaskStatus): Status zadań lub None
+            reverse (bool): Czy kolejność jest malejąca
+
+        Returns:
+            tuple: (zadania strony, czy są kolejne zadania)
+        """
+        source = self.tasks
+        if status is not None:
+            count = self._status_index.count(status)
+            if count <= (offset + limit + 1) * len(self.tasks) // max(count, 1):
+                source = self._status_index.get(status)
+                status = None
+
+        if after is None:
+            start = len(source) - 1 if reverse else 0
+        elif reverse:
+            start = bisect_left(source, after[0], key=_task_id_key) - 1
+        else:
+            start = bisect_right(source, after[0], key=_task_id_key)
+
+        if status is None:
+            if not reverse:
+                start += offset
+                return source[start:start + limit], start + limit < len(source)
+            start -= offset
+            stop = max(start - limit, -1)
+            return [source[i] for i in range(start, stop, -1)], stop >= 0
+
+        step = -1 if reverse else 1
+        page = []
+        while 0 <= start < len(source):
+            task = source[start]
+            start += step
+            if task.status != status:
+                continue
+            if offset:
+                offset -= 1
+            elif len(page) == limit:
+                return page, True
+            else:
+                page.append(task)
+        return page, False
+
+    def _page_sorted(self, order, after, offset, limit, status, reverse):
+        """Wybiera stronę zadań posortowanych według innego pola niż identyfikator.
+
+        Args:
+            order (function): Klucz porządku zadań (zob. pagination.sort_key)
+            after (tuple): Klucz ostatniego zadania poprzedniej strony lub None
+            offset (int): Liczba pomijanych zadań
+            limit (int): Maksymalna liczba zadań na stronie
+            status (TaskStatus): Status zadań lub None
+            reverse (bool): Czy kolejność jest malejąca
+
+        Returns:
+            tuple: (zadania strony, czy są kolejne zadania)
+        """
+        candidates = self._status_index.get(status) if status is not None else self.tasks
+        if after is not None:
+            if reverse:
+                candidates = (task for task in candidates if order(task) < after)
+            else:
+                candidates = (task for task in candidates if order(task) > after)
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        page = select(offset + limit + 1, candidates, key=order)[offset:]
+        return page[:limit], len(page) > limit
+
+    def undo(self):
+        """Cofa ostatnią operację modyfikującą lub całą transakcję batch().
+
+        Historia przechowuje dla każdej operacji tylko zmienione pola (a dla
+        usuniętego zadania - samo zadanie), więc cofnięcie kosztuje tyle co
+        pojedyncza operacja, a zmiana jest zapisywana w magazynie tak samo
+        jak zwykła operacja modyfikująca (np. jednym rekordem dziennika).
+
+        Returns:
+            bool: True jeśli operacja została cofnięta, False gdy nie ma czego cofać
+
+        Raises:
+            RuntimeError: Gdy metoda jest wywołana wewnątrz batch()
+        """
+        return self._replay_history(self._undo_log, self._redo_log, undo=True)
+
+    def redo(self):
+        """Ponawia ostatnią cofniętą operację.
+
+        Nowa operacja modyfikująca usuwa możliwość ponowienia cofniętych operacji.
+
+        Returns:
+            bool: True jeśli operacja została ponowiona, False gdy nie ma czego ponawiać
+
+        Raises:
+            RuntimeError: Gdy metoda jest wywołana wewnątrz batch()
+        """
+        return self._replay_history(self._redo_log, self._undo_log, undo=False)
+
+    def _replay_history(self, source, target, undo):
+        """Wykonuje ostatni wpis historii operacji i przenosi go do drugiej historii.
+
+        Args:
+            source (deque): Historia, z której pobierany jest wpis
+            target (deque): Historia, do której trafia wykonany wpis
+            undo (bool): True - cofnięcie wpisu, False - jego ponowienie
+
+        Returns:
+            bool: True jeśli wpis został wykonany, False gdy historia jest pusta
+        """
+        with self._write_access():
+            if self._batch_depth:
+                raise RuntimeError("Nie można cofać ani ponawiać operacji wewnątrz batch()")
+            if not source:
+                return False
+            self._ensure_indexes()
+            entry = source.pop()
+            self._replaying = True
+            self._batch_depth = 1
+            try:
+                self._apply_entry(entry, undo)
+            finally:
+                self._replaying = False
+                self._batch_depth = 0
+                self._flush_changes()
+            target.append(entry)
+            return True
+
+    def _apply_entry(self, entry, undo):
+        """Cofa lub ponawia jeden wpis historii operacji.
+
+        Zadania są wyszukiwane po identyfikatorze, więc wpisy pozostają
+        poprawne także po nałożeniu zmian innych procesów. Zadania usunięte
+        w międzyczasie są pomijane.
+
+        Args:
+            entry (tuple): Wpis ("add", zadanie), ("delete", zadanie),
+                ("edit", id, stary tytuł, stary opis, nowy tytuł, nowy opis),
+                ("status", id, stary status, nowy status) lub ("batch", wpisy)
+            undo (bool): True - cofnięcie wpisu, False - jego ponowienie
+        """
+        kind = entry[0]
+        if kind == "batch":
+            for item in reversed(entry[1]) if undo else entry[1]:
+                self._apply_entry(item, undo)
+        elif kind in ("add", "delete"):
+            task = entry[1]
+            if (kind == "delete") == undo:
+                if task.task_id not in self._tasks_by_id:
+                    position = bisect_left(self.tasks, task.task_id, key=_task_id_key)
+                    self.tasks.insert(position, task)
+                    self._attach(task)
+                    self._emit(ADDED, task.task_id, None, task_fields(task))
+                    self._save_changes(("add", task))
+            else:
+                current = self._tasks_by_id.get(task.task_id)
+                if current is not None:
+                    self._delete(self._position(current))
+        else:
+            task = self._tasks_by_id.get(entry[1])
+            if task is None:
+                return
+            if kind == "edit":
+                title, description = (entry[2], entry[3]) if undo else (entry[4], entry[5])
+                self._edit(task, title, description)
+            else:
+                status = entry[2] if undo else entry[3]
+                if task.status != status:
+                    self._change_status(task, status)
+
+    def _record(self, entry):
+        """Dopisuje operację do historii cofania.
+
+        Wewnątrz batch() operacje są zbierane we wpis całej transakcji,
+        a podczas undo() i redo() nie są zapisywane.
+
+        Args:
+            entry (tuple): Wpis historii (zob. _apply_entry)
+        """
+        if self._replaying:
+            return
+        if self._batch_depth:
+            self._batch_history.append(entry)
+            return
+        self._undo_log.append(entry)
+        self._redo_log.clear()
+
+    def create_version(self, label=""):
+        """Zapisuje bieżący stan listy zadań jako nową wersję.
+
+        Wersja przechowuje tylko zadania zmienione od poprzedniej wersji,
+        więc warto ją tworzyć np. przed każdą zbiorczą edycją.
+
+        Args:
+            label (str, optional): Opis wersji
+
+        Returns:
+            VersionInfo: Utworzona wersja
+
+        Raises:
+            ValueError: Gdy menedżer nie ma historii wersji
+        """
+        store = self._versions()
+        with self._write_access():
+            self._ensure_indexes()
+            return store.commit(self.tasks, label)
+
+    def list_versions(self):
+        """Zwraca zapisane wersje listy zadań, od najstarszej.
+
+        Returns:
+            list: Obiekty VersionInfo
+
+        Raises:
+            ValueError: Gdy menedżer nie ma historii wersji
+        """
+        return self._versions().versions()
+
+    def diff_versions(self, old, new=None):
+        """Porównuje dwie wersje listy zadań.
+
+        Args:
+            old (int): Numer starszej wersji
+            new (int, optional): Numer nowszej wersji. Domyślnie bieżący
+                stan listy zadań
+
+        Returns:
+            VersionDiff: Zadania dodane, usunięte i zmienione między wersjami
+
+        Raises:
+            ValueError: Gdy menedżer nie ma historii wersji
+            LookupError: Gdy wersja o podanym numerze nie istnieje
+        """
+        store = self._versions()
+        old_state = store.state(old)
+        if new is not None:
+            return diff_states(old_state, store.state(new))
+        self._refresh()
+        self._ensure_indexes()
+        with self._lock.reader:
+            current = {task.task_id: task.to_string() for task in self.tasks}
+        return diff_states(old_state, current)
+
+    def restore_version(self, number):
+        """Przywraca listę zadań do stanu z podanej wersji.
+
+        Bieżący stan jest najpierw zapisywany jako nowa wersja, więc
+        przywrócenie można cofnąć. Zadania są zastępowane nowymi obiektami
+        z zachowaniem identyfikatorów, a lista zapisywana w całości. Historia
+        operacji dla undo() i redo() jest czyszczona.
+
+        Args:
+            number (int): Numer przywracanej wersji
+
+        Returns:
+            VersionInfo: Wersja utworzona przed przywróceniem
+
+        Raises:
+            ValueError: Gdy menedżer nie ma historii wersji
+            LookupError: Gdy wersja o podanym numerze nie istnieje
+            RuntimeError: Gdy metoda jest wywołana wewnątrz batch()
+        """
+        store = self._versions()
+        with self._write_access():
+            if self._batch_depth:
+                raise RuntimeError("Nie można przywrócić wersji wewnątrz batch()")
+            self._ensure_indexes()
+            restored = store.tasks(number)
+            backup = store.commit(self.tasks, f"Przed przywróceniem wersji {number}")
+            for task in self.tasks:
+                task._status_listener = None
+            self.tasks = restored
+            self._index_tasks()
+            self._undo_log.clear()
+            self._redo_log.clear()
+            if self._writer is not None:
+                self._writer.submit(self.tasks, [], snapshot=True)
+            else:
+                self.file_manager.save_tasks(self.tasks)
+            self._emit(RESET)
+            self._publish_events()
+            return backup
+
+    def subscribe(self, callback=None, kinds=None, interval=0.05, max_pending=10000):
+        """Rejestruje subskrybenta zdarzeń zmian listy zadań.
+
+        Po każdej operacji modyfikującej (a dla batch() - po całej transakcji)
+        subskrybenci otrzymują zdarzenia TaskEvent z identyfikatorem zadania
+        oraz starymi i nowymi wartościami zmienionych pól, także dla undo(),
+        redo() i zmian innych procesów. Zamiast porównywać całą listę zadań,
+        klient może więc nanosić tylko zmiany. Zdarzenia trafiają do kolejki
+        subskrypcji bez czekania na subskrybenta i są w niej łączone
+        (zob. change_events.Subscription).
+
+        Args:
+            callback (function, optional): Funkcja wywoływana w wątku
+                subskrypcji z listą zdarzeń. Bez niej zdarzenia pobiera się
+                metodą poll() subskrypcji
+            kinds (iterable, optional): Rodzaje przekazywanych zdarzeń, np.
+                (ADDED, DELETED). Domyślnie wszystkie
+            interval (float, optional): Czas (w sekundach), przez jaki zdarzenia
+                są zbierane przed wywołaniem callback
+            max_pending (int, optional): Liczba zmienionych zadań w kolejce,
+                po przekroczeniu której kolejka jest zastępowana zdarzeniem RESET
+
+        Returns:
+            Subscription: Subskrypcja; close() kończy ją
+        """
+        return self._notifier.subscribe(callback, kinds, interval, max_pending)
+
+    def _versions(self):
+        """Zwraca historię wersji menedżera.
+
+        Returns:
+            VersionStore: Historia wersji
+
+        Raises:
+            ValueError: Gdy menedżer nie ma historii wersji
+        """
+        if self.version_store is None:
+            raise ValueError("Wersjonowanie zadań nie jest włączone")
+        return self.version_store
+
+    def refresh(self):
+        """Nanosi zmiany zapisane w pliku współdzielonym przez inne procesy.
+
+        Returns:
+            bool: True jeśli stan menedżera został zaktualizowany
+        """
+        if not self._shared:
+            return False
+        with self._lock.writer:
+            return self._apply_external_changes()
+
+    def _refresh(self):
+        """Tani test wersji pliku współdzielonego przed odczytem."""
+        if self._shared and self.file_manager.has_external_changes():
+            self.refresh()
+
+    @contextmanager
+    def _write_access(self):
+        """Zajmuje blokadę zapisu przed operacją modyfikującą.
+
+        Dla pliku współdzielonego zajmuje też blokadę międzyprocesową
+        i nanosi zmiany innych procesów, zanim operacja zmieni stan.
+        """
+        with self._lock.writer:
+            if not self._shared:
+                yield
+                return
+            with self.file_manager.lock():
+                self._apply_external_changes()
+                yield
+
+    def _apply_external_changes(self):
+        """Nanosi zmiany innych procesów (pod blokadą zapisu).
+
+        Returns:
+            bool: True jeśli plik zmienił się od ostatniego odczytu
+        """
+        if not self.file_manager.has_external_changes():
+            return False
+        self._ensure_indexes()
+        changes = self.file_manager.read_external_changes()
+        if changes is None:
+            self._reload()
+        else:
+            for operation, payload in changes:
+                self._apply_external(operation, payload)
+        self._publish_events()
+        return True
+
+    def _apply_external(self, operation, payload):
+        """Nanosi pojedynczą zmianę z dziennika zapisaną przez inny proces.
+
+        Args:
+            operation (str): "add", "update" lub "delete"
+            payload (Task lub int): Zadanie po zmianie lub identyfikator
+                usuniętego zadania
+        """
+        if operation == "delete":
+            task = self._tasks_by_id.get(payload)
+            if task is not None:
+                position = self._position(task)
+                self._detach(task)
+                del self.tasks[position]
+                self._emit(DELETED, task.task_id, task_fields(task), None)
+            return
+
+        task = self._tasks_by_id.get(payload.task_id)
+        if task is None:
+            self.tasks.insert(bisect_left(self.tasks, payload.task_id, key=_task_id_key), payload)
+            self._attach(payload)
+            self._next_id = max(self._next_id, payload.task_id + 1)
+            self._emit(ADDED, payload.task_id, None, task_fields(payload))
+            return
+        old_title, old_description = task.title, task.description
+        task.title = payload.title
+        task.description = payload.description
+        if self._search_index is not None:
+            self._search_index.update(task, old_title, old_description)
+        if (old_title, old_description) != (task.title, task.description):
+            self._emit(
+                EDITED,
+                task.task_id,
+                {"title": old_title, "description": old_description},
+                {"title": task.title, "description": task.description},
+            )
+        if task.status != payload.status:
+            old_status = task.status
+            task.change_status(payload.status)
+            self._emit(
+                STATUS_CHANGED, task.task_id, {"status": old_status}, {"status": task.status}
+            )
+
+    def _reload(self):
+        """Wczytuje ponownie cały plik po zapisie nowej migawki przez inny proces."""
+        for task in self.tasks:
+            task._status_listener = None
+        if self._lazy:
+            self.tasks = self.file_manager.load_tasks_lazy()
+        else:
+            self.tasks = self.file_manager.load_tasks()
+        self._indexed = False
+        self._ensure_indexes()
+        self._undo_log.clear()
+        self._redo_log.clear()
+        self._emit(RESET)
+
+    def _delete(self, task_index):
+        """Usuwa zadanie spod podanego indeksu i zapisuje zmianę.
+
+        Args:
+            task_index (int): Prawidłowy indeks zadania
+        """
+        task = self.tasks[task_index]
+        self._detach(task)
+        del self.tasks[task_index]
+        self._record(("delete", task))
+        self._emit(DELETED, task.task_id, task_fields(task), None)
+        self._save_changes(("delete", task))
+
+    def _edit(self, task, title, description):
+        """Aktualizuje szczegóły zadania i zapisuje zmianę.
+
+        Wpis historii cofania i zdarzenie EDITED są tworzone tylko wtedy, gdy
+        tytuł lub opis rzeczywiście się zmienił.
+
+        Args:
+            task (Task): Edytowane zadanie
+            title (str): Nowy tytuł zadania lub None
+            description (str): Nowy opis zadania lub None
+        """
+        old_title, old_description = task.title, task.description
+        task.update_details(title, description)
+        if (task.title, task.description) != (old_title, old_description):
+            if self._search_index is not None:
+                self._search_index.update(task, old_title, old_description)
+            self._record(
+                ("edit", task.task_id, old_title, old_description, task.title, task.description)
+            )
+            self._emit(
+                EDITED,
+                task.task_id,
+                {"title": old_title, "description": old_description},
+                {"title": task.title, "description": task.description},
+            )
+        self._save_changes(("update", task))
+
+    def _change_status(self, task, new_status):
+        """Zmienia status zadania i zapisuje zmianę.
+
+        Args:
+            task (Task): Zadanie, którego status ma być zmieniony
+            new_status (TaskStatus lub str): Nowy status zadania
+
+        Returns:
+            bool: True jeśli status został zmieniony, False gdy status jest nieprawidłowy
+
+        Raises:
+            ValueError: Gdy zadanie ma już podany status
+        """
+        if isinstance(new_status, str) and is_valid_status(new_status):
+            new_status = TaskStatus(new_status.lower())
+
+        if task.status == new_status:
+            raise ValueError(f"Zadanie ma już status {new_status.value}")
+
+        if isinstance(new_status, TaskStatus):
+            old_status = task.status
+            task.change_status(new_status)
+            self._record(("status", task.task_id, old_status, new_status))
+            self._emit(
+                STATUS_CHANGED, task.task_id, {"status": old_status}, {"status": new_status}
+            )
+            self._save_changes(("update", task))
+            return True
+        return False
+
+    def _position(self, task):
+        """Zwraca indeks zadania w liście.
+
+        Lista jest uporządkowana według identyfikatorów (zob. _index_tasks),
+        więc pozycja jest wyszukiwana binarnie, a przeszukanie liniowe jest
+        tylko zabezpieczeniem.
+
+        Args:
+            task (Task): Zadanie należące do menedżera
+
+        Returns:
+            int: Indeks zadania w liście
+        """
+        position = bisect_left(self.tasks, task.task_id, key=_task_id_key)
+        if position < len(self.tasks) and self.tasks[position] is task:
+            return position
+        return self.tasks.index(task)
+
+    def _attach(self, task):
+        """Dodaje zadanie do indeksów i rejestruje powiadamianie o zmianie statusu.
+
+        Zadanie bez identyfikatora lub z identyfikatorem już zajętym
+        otrzymuje nowy, unikalny identyfikator.
+
+        Args:
+            task (Task): Zadanie należące do menedżera
+
+        Returns:
+            bool: True jeśli zadaniu nadano nowy identyfikator
+        """
+        assigned = task.task_id is None or task.task_id in self._tasks_by_id
+        if assigned:
+            task.task_id = self._next_id
+            self._next_id += 1
+        self._tasks_by_id[task.task_id] = task
+        task._status_listener = self._status_index.move
+        self._status_index.add(task)
+        if self._search_index is not None:
+            self._search_index.add(task)
+        return assigned
+
+    def _detach(self, task):
+        """Usuwa zadanie z indeksów.
+
+        Args:
+            task (Task): Zadanie usuwane z menedżera
+        """
+        task._status_listener = None
+        self._tasks_by_id.pop(task.task_id, None)
+        self._status_index.remove(task)
+        if self._search_index is not None:
+            self._search_index.remove(task)
+
+    def _ensure_indexes(self):
+        """Buduje indeksy przy pierwszym użyciu.
+
+        Zadania, którym nadano nowe identyfikatory (np. wczytane z pliku
+        w starym formacie), są od razu zapisywane, aby identyfikatory były trwałe.
+        """
+        if self._indexed:
+            return
+        with self._lock.writer:
+            if self._indexed:
+                return
+            self._indexed = True
+            if self._index_tasks():
+                if self._writer is not None:
+                    self._writer.submit(self.tasks, [], snapshot=True)
+                else:
+                    self.file_manager.save_tasks(self.tasks)
+
+    def _index_tasks(self):
+        """Buduje indeksy od nowa na podstawie bieżącej listy zadań.
+
+        Zadania bez identyfikatora lub z powtórzonym identyfikatorem
+        otrzymują nowe, większe od pozostałych. Gdy identyfikatory nie
+        rosną wraz z kolejnością listy, lista jest sortowana według nich
+        (stabilnie), a zmieniona kolejność zapisywana jak nowe identyfikatory.
+
+        Returns:
+            bool: True jeśli któreś zadanie otrzymało nowy identyfikator
+                  (np. zadania wczytane z pliku w starym formacie) lub lista
+                  została uporządkowana
+        """
+        self._tasks_by_id.clear()
+        self._status_index.rebuild(())
+        self._search_index = None
+        ids = [task.task_id for task in self.tasks if task.task_id is not None]
+        self._next_id = max(self._next_id, max(ids, default=0) + 1)
+
+        assigned = False
+        ordered = True
+        previous = 0
+        for task in self.tasks:
+            assigned = self._attach(task) or assigned
+            ordered = ordered and task.task_id > previous
+            previous = task.task_id
+        if not ordered:
+            self.tasks = sorted(self.tasks, key=_task_id_key)
+        return assigned or not ordered
+
+    @contextmanager
+    def batch(self):
+        """Grupuje operacje modyfikujące w jedną transakcję.
+
+        Zmiany wprowadzone wewnątrz bloku są zapisywane jednym zapisem po jego
+        zakończeniu i cofane jednym wywołaniem undo(). Gdy w bloku wystąpi
+        wyjątek, operacje bloku są cofane (w odwrotnej kolejności, na podstawie
+        ich wpisów historii), a wyjątek jest przekazywany dalej. Koszt bloku
+        zależy więc od liczby jego operacji, a nie od liczby zadań. Blok
+        zajmuje blokadę zapisu przez cały czas trwania, więc transakcja innego
+        wątku czeka na jego zakończenie, a zagnieżdżone bloki tego samego
+        wątku należą do transakcji zewnętrznej. W trybie zapisu w tle wątek
+        roboczy czeka na zakończenie transakcji.
+
+        Yields:
+            TodoManager: Ten sam menedżer zadań
+        """
+        with self._write_access():
+            if self._batch_depth:
+                self._batch_depth += 1
+                try:
+                    yield self
+                finally:
+                    self._batch_depth -= 1
+                return
+
+            self._batch_depth = 1
+            self._batch_history = []
+            try:
+                yield self
+            except BaseException:
+                self._rollback()
+                raise
+            finally:
+                self._batch_depth = 0
+            if self._batch_history:
+                self._record(("batch", tuple(self._batch_history)))
+                self._batch_history = []
+            self._flush_changes()
+
+    def flush(self):
+        """Zapisuje na dysk wszystkie dotąd wprowadzone zmiany.
+
+        W trybie zapisu w tle czeka, aż wątek roboczy zapisze odłożone zmiany.
+        Wymusza też fsync odłożony przez poziom trwałości "batch".
+
+        Returns:
+            bool: True jeśli zapis się powiódł, False w przypadku błędu
+
+        Raises:
+            RuntimeError: Gdy w trybie zapisu w tle metoda jest wywołana
+                wewnątrz batch() lub pod blokadą menedżera
+        """
+        self._check_writer_not_blocked()
+        result = self._writer.flush() if self._writer is not None else True
+        with self._lock.writer:
+            self.file_manager.sync()
+        return result
+
+    def close(self):
+        """Kończy pracę menedżera - zapisuje odłożone zmiany i zamyka pliki.
+
+        Po zamknięciu menedżer nadal działa, ale zmiany są zapisywane od razu.
+
+        Returns:
+            bool: True jeśli zapis się powiódł, False w przypadku błędu
+
+        Raises:
+            RuntimeError: Gdy w trybie zapisu w tle metoda jest wywołana
+                wewnątrz batch() lub pod blokadą menedżera
+        """
+        self._check_writer_not_blocked()
+        result = True
+        if self._writer is not None:
+            result = self._close_writer()
+        with self._lock.writer:
+            self._writer = None
+            self.file_manager.sync()
+            self.file_manager.close()
+        return result
+
+    def _check_writer_not_blocked(self):
+        """Sprawdza, czy oczekiwanie na wątek zapisu w tle nie zablokuje się.
+
+        Wątek roboczy kopiuje listę zadań pod blokadą odczytu menedżera, więc
+        wątek, który trzyma blokadę (np. wewnątrz batch()), czekałby na niego
+        bez końca.
+
+        Raises:
+            RuntimeError: Gdy bieżący wątek trzyma blokadę menedżera
+                w trybie zapisu w tle
+        """
+        if self._writer is not None and self._lock.held():
+            raise RuntimeError(
+                "Nie można czekać na zapis w tle wewnątrz batch() ani pod blokadą menedżera"
+            )
+
+    def _rollback(self):
+        """Cofa operacje transakcji batch() przerwanej wyjątkiem.
+
+        Wpisy historii transakcji są cofane w odwrotnej kolejności, jak
+        w undo(). Odłożone zmiany i zdarzenia są odrzucane, bo transakcja nie
+        była jeszcze zapisana.
+        """
+        history, self._batch_history = self._batch_history, []
+        self._replaying = True
+        try:
+            self._apply_entry(("batch", tuple(history)), undo=True)
+        finally:
+            self._replaying = False
+            self._pending_changes = []
+            self._pending_events = []
+
+    def _save_changes(self, *changes):
+        """Zapisuje zmiany w liście zadań do pliku.
+
+        Aktualizuje plik z zadaniami po każdej operacji modyfikującej listę zadań.
+        Wewnątrz batch() zmiany są odkładane do zapisu na koniec transakcji,
+        a w trybie zapisu w tle przekazywane do wątku roboczego.
+
+        Args:
+            *changes (tuple): Zmiany jako krotki (operacja, zadanie),
+                przekazywane do FileManager.apply_changes
+        """
+        self._pending_changes.extend(changes)
+        if not self._batch_depth:
+            self._flush_changes()
+
+    def _flush_changes(self):
+        """Przekazuje odłożone zmiany do FileManager jednym zapisem, a zdarzenia subskrybentom."""
+        if self._pending_changes:
+            changes, self._pending_changes = self._pending_changes, []
+            if self.metrics is not NULL_METRICS:
+                self.metrics.increment("todo.changes", len(changes))
+                with self.metrics.timer("todo.save_changes"):
+                    self._write_changes(changes)
+            else:
+                self._write_changes(changes)
+        self._publish_events()
+
+    def _emit(self, kind, task_id=None, old=None, new=None):
+        """Odkłada zdarzenie zmiany do przekazania subskrybentom.
+
+        Bez subskrybentów zdarzenie nie jest tworzone. Odłożone zdarzenia są
+        przekazywane po zapisie zmian, a przy wycofaniu batch() odrzucane.
+
+        Args:
+            kind (str): Rodzaj zdarzenia (zob. change_events.TaskEvent)
+            task_id (int, optional): Identyfikator zadania
+            old (dict, optional): Wartości pól przed zmianą
+            new (dict, optional): Wartości pól po zmianie
+        """
+        if self._notifier.active:
+            self._pending_events.append(TaskEvent(kind, task_id, old, new))
+
+    def _publish_events(self):
+        """Przekazuje odłożone zdarzenia subskrybentom."""
+        if self._pending_events:
+            events, self._pending_events = self._pending_events, []
+            self._notifier.publish(events)
+
+    def _write_changes(self, changes):
+        """Zapisuje zmiany przez FileManager lub przekazuje je do wątku zapisu w tle.
+
+        Args:
+            changes (list): Zmiany jako krotki (operacja, zadanie)
+        """
+        if self._writer is not None:
+            self._writer.submit(self.tasks, changes)
+        else:
+            self.file_manager.apply_changes(self.tasks, changes)
+
+
+def get_tasks_by_status(todo_manager, status):
+    """Zwraca zadania o określonym statusie.
+
+    Args:
+        todo_manager (TodoManager): Instancja menedżera zadań
+        status (TaskStatus lub str): Status zadań do wyszukania
+
+    Returns:
+        list: Lista zadań o podanym statusie
+    """
+    return todo_manager.get_tasks_by_status(status)
+
+
+def _task_id_key(task):
+    """Zwraca identyfikator zadania - klucz wyszukiwania binarnego."""
+    return task.task_id
+
+
+def _normalize_status(status):
+    """Zamienia status podany jako tekst na TaskStatus.
+
+    Args:
+        status (TaskStatus lub str): Status do znormalizowania
+
+    Returns:
+        TaskStatus: Status, lub None gdy tekst nie jest prawidłowym statusem
+    """
+    if isinstance(status, TaskStatus):
+        return status
+    try:
+        return TaskStatus(status.lower())
+    except ValueError:
+        return None
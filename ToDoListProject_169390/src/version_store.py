@@ -0,0 +1,305 @@
+import os
+import threading
+import time
+from src.file_manager import _gc_paused
+from src.task import Task
+
+VERSIONS_SUFFIX = ".versions"
+
+
+class VersionInfo:
+    """
+    Opis jednej zapisanej wersji listy zadań.
+
+    Attributes:
+        number (int): Numer wersji (kolejne wersje mają kolejne numery od 1)
+        created (float): Czas utworzenia wersji (sekundy od epoki, jak time.time())
+        label (str): Opis wersji podany przy jej tworzeniu
+        changed (int): Liczba zadań dodanych lub zmienionych od poprzedniej wersji
+        deleted (int): Liczba zadań usuniętych od poprzedniej wersji
+    """
+
+    def __init__(self, number, created, label="", changed=0, deleted=0):
+        self.number = number
+        self.created = created
+        self.label = label
+        self.changed = changed
+        self.deleted = deleted
+
+    def __repr__(self):
+        return (
+            f"VersionInfo(number={self.number}, label={self.label!r}, "
+            f"changed={self.changed}, deleted={self.deleted})"
+        )
+
+
+class VersionDiff:
+    """
+    Różnica między dwiema wersjami listy zadań.
+
+    Attributes:
+        added (list): Zadania obecne tylko w nowszej wersji
+        deleted (list): Zadania obecne tylko w starszej wersji
+        changed (list): Krotki (zadanie w starszej wersji, zadanie w nowszej
+            wersji) dla zadań, które się zmieniły
+    """
+
+    def __init__(self, added, deleted, changed):
+        self.added = added
+        self.deleted = deleted
+        self.changed = changed
+
+    def __len__(self):
+        return len(self.added) + len(self.deleted) + len(self.changed)
+
+    def __repr__(self):
+        return (
+            f"VersionDiff(added={len(self.added)}, deleted={len(self.deleted)}, "
+            f"changed={len(self.changed)})"
+        )
+
+
+class VersionStore:
+    """
+    Historia wersji listy zadań zapisywana przyrostowo.
+    Każda wersja zapisuje w pliku tylko zadania dodane lub zmienione od
+    poprzedniej wersji oraz identyfikatory usuniętych, więc setki wersji
+    zajmują tyle miejsca, ile wprowadzonych między nimi zmian. Stan dowolnej
+    wersji powstaje przez odtworzenie zmian od początku historii.
+
+    Plik jest tylko dopisywany: wersja to linia "V|numer|czas|opis", po której
+    następują rekordy "U|linia zadania" i "D|identyfikator". Przed każdą
+    operacją wczytywane są wersje dopisane przez inne procesy, a dopisanie
+    wersji nie jest chronione blokadą międzyprocesową - przy pliku
+    współdzielonym zapewnia ją TodoManager.
+
+    Args:
+        file_path (str): Ścieżka pliku historii wersji, np.
+            "<plik zadań>" + VERSIONS_SUFFIX
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._lock = threading.Lock()
+        self._versions = []
+        self._head = {}
+        self._offset = 0
+
+    def commit(self, tasks, label=""):
+        """Zapisuje bieżący stan listy zadań jako nową wersję.
+
+        Zadania zapamiętują swoją linię tekstu, więc porównanie z poprzednią
+        wersją nie wymaga ponownej serializacji niezmienionych zadań.
+        Niedokończona linia po przerwanym zapisie jest zamykana, aby nowa
+        wersja nie została z nią sklejona.
+
+        Args:
+            tasks (iterable): Zadania z nadanymi identyfikatorami
+            label (str, optional): Opis wersji
+
+        Returns:
+            VersionInfo: Utworzona wersja
+        """
+        with self._lock:
+            self._catch_up()
+            current = {task.task_id: task.to_string() for task in tasks}
+            changed = [
+                line for task_id, line in current.items() if self._head.get(task_id) != line
+            ]
+            deleted = [task_id for task_id in self._head if task_id not in current]
+            number = self._versions[-1].number + 1 if self._versions else 1
+            label = " ".join(str(label).split())
+            version = VersionInfo(number, time.time(), label, len(changed), len(deleted))
+
+            records = [f"V|{version.number}|{version.created!r}|{version.label}\n"]
+            records.extend(f"U|{line}\n" for line in changed)
+            records.extend(f"D|{task_id}\n" for task_id in deleted)
+            data = "".join(records).encode("utf-8")
+            with open(self.file_path, "ab") as file:
+                if file.tell() > self._offset:
+                    data = b"\n" + data
+                file.write(data)
+                file.flush()
+                os.fsync(file.fileno())
+                self._offset = file.tell()
+
+            self._versions.append(version)
+            self._head = current
+            return version
+
+    def versions(self):
+        """Zwraca zapisane wersje, od najstarszej.
+
+        Returns:
+            list: Obiekty VersionInfo
+        """
+        with self._lock:
+            self._catch_up()
+            return list(self._versions)
+
+    def state(self, number):
+        """Odtwarza stan listy zadań w podanej wersji.
+
+        Args:
+            number (int): Numer wersji
+
+        Returns:
+            dict: Linie tekstu zadań według identyfikatora
+
+        Raises:
+            LookupError: Gdy wersja o podanym numerze nie istnieje
+        """
+        with self._lock:
+            self._catch_up()
+            if not any(version.number == number for version in self._versions):
+                raise LookupError(f"Nie znaleziono wersji {number}")
+            if number == self._versions[-1].number:
+                return dict(self._head)
+            state = {}
+            lines, _ = _read_lines(self.file_path, 0)
+            for line in lines:
+                try:
+                    if line.startswith("V|") and _parse_header(line).number > number:
+                        break
+                    _apply_record(state, line)
+                except ValueError:
+                    continue
+            return state
+
+    def tasks(self, number):
+        """Zwraca zadania zapisane w podanej wersji.
+
+        Args:
+            number (int): Numer wersji
+
+        Returns:
+            list: Nowe obiekty Task w kolejności identyfikatorów
+
+        Raises:
+            LookupError: Gdy wersja o podanym numerze nie istnieje
+        """
+        state = self.state(number)
+        with _gc_paused():
+            return [_task(state[task_id]) for task_id in sorted(state)]
+
+    def _catch_up(self):
+        """Wczytuje wersje dopisane do pliku od ostatniego odczytu."""
+        size = os.path.getsize(self.file_path) if os.path.exists(self.file_path) else 0
+        if size == self._offset:
+            return
+        if size < self._offset:
+            self._versions, self._head, self._offset = [], {}, 0
+
+        lines, self._offset = _read_lines(self.file_path, self._offset)
+        for line in lines:
+            try:
+                if line.startswith("V|"):
+                    self._versions.append(_parse_header(line))
+                elif self._versions:
+                    operation = _apply_record(self._head, line)
+                    if operation == "U":
+                        self._versions[-1].changed += 1
+                    else:
+                        self._versions[-1].deleted += 1
+                else:
+                    raise ValueError("Rekord przed pierwszą wersją")
+            except ValueError as e:
+                print(f"Pominięto nieprawidłowy rekord historii wersji: {e}")
+
+
+def diff_states(old, new):
+    """Porównuje dwa stany listy zadań.
+
+    Args:
+        old (dict): Linie tekstu zadań według identyfikatora w starszej wersji
+        new (dict): Linie tekstu zadań według identyfikatora w nowszej wersji
+
+    Returns:
+        VersionDiff: Zadania dodane, usunięte i zmienione, w kolejności identyfikatorów
+    """
+    added = [_task(new[task_id]) for task_id in sorted(new.keys() - old.keys())]
+    deleted = [_task(old[task_id]) for task_id in sorted(old.keys() - new.keys())]
+    changed = [
+        (_task(old[task_id]), _task(new[task_id]))
+        for task_id in sorted(old.keys() & new.keys())
+        if old[task_id] != new[task_id]
+    ]
+    return VersionDiff(added, deleted, changed)
+
+
+def _task(line):
+    """Tworzy zadanie z linii historii (zawsze poprawnej, bo zapisanej przez to_string).
+
+    Args:
+        line (str): Linia tekstu zadania
+
+    Returns:
+        Task: Nowy obiekt zadania
+    """
+    return Task.parse(line)[0]
+
+
+def _read_lines(path, offset):
+    """Odczytuje kompletne linie pliku od podanego miejsca.
+
+    Niedokończona ostatnia linia (dopisywana właśnie przez inny proces)
+    jest pomijana.
+
+    Args:
+        path (str): Ścieżka pliku
+        offset (int): Położenie w bajtach, od którego czytany jest plik
+
+    Returns:
+        tuple: (lista linii bez znaku końca linii, położenie za ostatnią
+            kompletną linią)
+    """
+    with open(path, "rb") as file:
+        file.seek(offset)
+        data = file.read()
+    end = data.rfind(b"\n") + 1
+    return data[:end].decode("utf-8").split("\n")[:-1], offset + end
+
+
+def _parse_header(line):
+    """Odczytuje nagłówek wersji "V|numer|czas|opis".
+
+    Args:
+        line (str): Linia nagłówka
+
+    Returns:
+        VersionInfo: Wersja bez policzonych zmian
+
+    Raises:
+        ValueError: Gdy nagłówek ma nieprawidłowy format
+    """
+    parts = line.split("|", 3)
+    if len(parts) != 4:
+        raise ValueError("Nieprawidłowy nagłówek wersji")
+    return VersionInfo(int(parts[1]), float(parts[2]), parts[3])
+
+
+def _apply_record(state, line):
+    """Nanosi rekord zmiany na stan listy zadań.
+
+    Args:
+        state (dict): Linie tekstu zadań według identyfikatora
+        line (str): Rekord "U|linia zadania" lub "D|identyfikator"; nagłówki
+            wersji są pomijane
+
+    Returns:
+        str: Rodzaj rekordu ("V", "U" lub "D")
+
+    Raises:
+        ValueError: Gdy rekord ma nieprawidłowy format
+    """
+    operation, _, payload = line.partition("|")
+    if operation == "U":
+        _, separator, task_id = payload.rpartition("|")
+        if not separator:
+            raise ValueError("Rekord historii wersji bez identyfikatora zadania")
+        state[int(task_id)] = payload
+    elif operation == "D":
+        state.pop(int(payload), None)
+    elif operation != "V":
+        raise ValueError(f"Nieznany rekord historii wersji: {operation}")
+    return operation
@@ -0,0 +1,175 @@
+import threading
+
+
+class WriteBehindWriter:
+    """
+    Wątek zapisujący zmiany w tle (write-behind).
+    Operacje modyfikujące TodoManager przekazują zmiany metodą submit i od
+    razu wracają, a wątek roboczy łączy odłożone zmiany i zapisuje je przez
+    FileManager.apply_changes co interval sekund lub gdy liczba odłożonych
+    zmian osiągnie threshold.
+
+    Kopia listy zadań i linie tekstu zmienionych zadań są przygotowywane pod
+    blokadą menedżera, a zapis na dysk odbywa się już bez niej. Zadanie
+    zmienione w trakcie zapisu trafia do kolejnej partii, więc plik zawsze
+    dogania stan w pamięci, a po flush() odpowiada mu dokładnie.
+
+    Nieudany zapis nie gubi zmian: partia wraca na początek kolejki i jest
+    zapisywana ponownie po interval sekundach lub przy kolejnym flush() (wraz z
+    nowszymi zmianami), a flush() zwraca False, gdy zapis wykonany po jego
+    wywołaniu się nie powiódł. Zmiany, których nie udało się zapisać także przy
+    zamknięciu, pozostają w pending_count, a close() zwraca False.
+
+    Args:
+        file_manager (FileManager): Obiekt zapisujący zadania
+        lock: Blokada odczytu menedżera zadań (menedżer kontekstu) - pod nią
+            wykonywana jest kopia listy do zapisu
+        interval (float, optional): Maksymalny czas (w sekundach) między
+            zmianą a jej zapisem
+        threshold (int, optional): Liczba odłożonych zmian wymuszająca zapis
+    """
+
+    def __init__(self, file_manager, lock, interval=1.0, threshold=1000):
+        self.file_manager = file_manager
+        self.interval = interval
+        self.threshold = threshold
+        self._lock = lock
+        self._condition = threading.Condition()
+        self._tasks = None
+        self._pending = []
+        self._snapshot = False
+        self._writing = False
+        self._flush_requests = 0
+        self._closed = False
+        self._last_result = True
+        self._writes = 0
+        self._flush_calls = 0
+        self._thread = threading.Thread(target=self._run, name="todo-write-behind", daemon=True)
+        self._thread.start()
+
+    def submit(self, tasks, changes, snapshot=False):
+        """Odkłada zmiany do zapisu w tle.
+
+        Args:
+            tasks (list): Lista zadań menedżera (po wprowadzeniu zmian)
+            changes (list): Zmiany jako krotki (operacja, zadanie)
+            snapshot (bool, optional): Czy zamiast zmian zapisać całą listę
+                (FileManager.save_tasks)
+
+        Raises:
+            RuntimeError: Gdy wątek zapisujący został zamknięty
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Wątek zapisujący został zamknięty")
+            self._tasks = tasks
+            self._pending.extend(changes)
+            self._snapshot = self._snapshot or snapshot
+            if snapshot or len(self._pending) >= self.threshold:
+                self._condition.notify_all()
+
+    @property
+    def pending_count(self):
+        """Liczba zmian oczekujących na zapis."""
+        with self._condition:
+            return len(self._pending)
+
+    def flush(self):
+        """Czeka, aż wszystkie przekazane zmiany zostaną zapisane.
+
+        Returns:
+            bool: True jeśli zmiany zostały zapisane, False gdy zapis się nie
+                powiódł (zmiany pozostają w kolejce do ponownego zapisu)
+        """
+        with self._condition:
+            if self._closed and not self._thread.is_alive():
+                return self._last_result
+            writes = self._writes
+            self._flush_calls += 1
+            self._flush_requests += 1
+            self._condition.notify_all()
+            self._condition.wait_for(
+                lambda: (not self._has_work() and not self._writing)
+                or (self._writes > writes and not self._last_result)
+            )
+            self._flush_requests -= 1
+            return self._last_result and not self._has_work()
+
+    def close(self):
+        """Zapisuje odłożone zmiany i kończy wątek roboczy.
+
+        Returns:
+            bool: True jeśli ostatni zapis się powiódł, False w przypadku błędu
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        return self._last_result
+
+    def _run(self):
+        """Pętla wątku roboczego - zapisuje zmiany partiami."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(self._should_write, timeout=self.interval)
+                if not self._has_work():
+                    if self._closed:
+                        return
+                    continue
+                self._writing = True
+            if not self._write():
+                with self._condition:
+                    if self._closed:
+                        return
+                    calls = self._flush_calls
+                    self._condition.wait_for(
+                        lambda: self._closed or self._flush_calls > calls, timeout=self.interval
+                    )
+
+    def _has_work(self):
+        """Czy są zmiany oczekujące na zapis."""
+        return bool(self._pending) or self._snapshot
+
+    def _should_write(self):
+        """Czy wątek roboczy powinien zapisać zmiany bez czekania na interval."""
+        if self._closed:
+            return True
+        return self._has_work() and (
+            self._snapshot or self._flush_requests > 0 or len(self._pending) >= self.threshold
+        )
+
+    def _write(self):
+        """Zapisuje odłożone zmiany na kopii listy zadań.
+
+        Po nieudanym zapisie zmiany wracają na początek kolejki.
+
+        Returns:
+            bool: True jeśli zapis się powiódł
+        """
+        changes, snapshot = [], False
+        try:
+            with self._lock:
+                with self._condition:
+                    changes, self._pending = self._pending, []
+                    snapshot, self._snapshot = self._snapshot, False
+                    tasks = list(self._tasks)
+                for _, task in changes:
+                    task.mark_dirty()
+                    task.to_string()
+            if snapshot:
+                result = self.file_manager.save_tasks(tasks)
+            else:
+                result = self.file_manager.apply_changes(tasks, changes)
+        except Exception as e:
+            print(f"Błąd podczas zapisu w tle: {e}")
+            result = False
+        with self._condition:
+            if not result:
+                self._pending[:0] = changes
+                self._snapshot = self._snapshot or snapshot
+            self._last_result = result
+            self._writing = False
+            self._writes += 1
+            self._condition.notify_all()
+        return result
@@ -0,0 +1,112 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+import unittest.mock
+from src.async_file_manager import AsyncFileManager
+from src.file_manager import FileManager
+from src.task import Task
+
+
+class TestAsyncFileManager(unittest.IsolatedAsyncioTestCase):
+    """Klasa testowa dla klasy AsyncFileManager."""
+
+    def setUp(self):
+        """Przygotowanie danych przed każdym testem."""
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False).name
+        self.file_manager = AsyncFileManager(FileManager(self.temp_file))
+        self.tasks = [Task("Zadanie 1", task_id=1), Task("Zadanie 2", task_id=2)]
+
+    def tearDown(self):
+        """Sprzątanie po testach."""
+        if os.path.exists(self.temp_file):
+            os.remove(self.temp_file)
+
+    async def test_save_and_load_tasks(self):
+        """Test asynchronicznego zapisu i odczytu zadań."""
+        self.assertTrue(await self.file_manager.save_tasks(self.tasks))
+
+        loaded_tasks = await self.file_manager.load_tasks()
+
+        self.assertEqual([task.to_string() for task in loaded_tasks],
+                         [task.to_string() for task in self.tasks])
+
+    async def test_io_runs_outside_event_loop_thread(self):
+        """Test, czy zapis nie jest wykonywany w wątku pętli zdarzeń."""
+        threads = []
+        original = self.file_manager.file_manager.save_tasks
+
+        def save_tasks(tasks):
+            threads.append(threading.get_ident())
+            return original(tasks)
+
+        with unittest.mock.patch.object(self.file_manager.file_manager, "save_tasks", save_tasks):
+            await self.file_manager.save_tasks(self.tasks)
+
+        self.assertNotEqual(threads, [threading.get_ident()])
+
+    async def test_concurrent_changes_are_coalesced(self):
+        """Test łączenia zmian zgłoszonych przez wiele korutyn."""
+        with unittest.mock.patch.object(self.file_manager.file_manager, "apply_changes",
+                                        return_value=True) as mock_apply:
+            results = await asyncio.gather(*(
+                self.file_manager.apply_changes(self.tasks, [("update", self.tasks[i % 2])])
+                for i in range(1000)
+            ))
+
+        self.assertTrue(all(results))
+        self.assertLessEqual(mock_apply.call_count, 2)
+        self.assertEqual(sum(len(call.args[1]) for call in mock_apply.call_args_list), 1000)
+
+    async def test_changes_during_write_go_to_next_write(self):
+        """Test zmian zgłoszonych w trakcie trwającego zapisu."""
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def apply_changes(tasks, changes):
+            calls.append(len(changes))
+            started.set()
+            release.wait(5)
+            return True
+
+        update_first = [("update", self.tasks[0])]
+        update_second = [("update", self.tasks[1])]
+        with unittest.mock.patch.object(self.file_manager.file_manager, "apply_changes",
+                                        apply_changes):
+            first = asyncio.ensure_future(
+                self.file_manager.apply_changes(self.tasks, update_first)
+            )
+            await asyncio.to_thread(started.wait, 5)
+            others = [
+                asyncio.ensure_future(self.file_manager.apply_changes(self.tasks, update_second))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(first, *others)
+
+        self.assertEqual(calls, [1, 3])
+
+    async def test_failed_write_returns_false(self):
+        """Test obsługi błędu zapisu."""
+        with unittest.mock.patch.object(self.file_manager.file_manager, "apply_changes",
+                                        side_effect=OSError("Disk full")):
+            with unittest.mock.patch("builtins.print") as mock_print:
+                result = await self.file_manager.apply_changes(
+                    self.tasks, [("update", self.tasks[0])]
+                )
+
+        self.assertFalse(result)
+        mock_print.assert_called_with("Błąd podczas zapisu zadań: Disk full")
+
+    async def test_load_waits_for_pending_writes(self):
+        """Test, czy odczyt widzi wcześniej zgłoszone zapisy."""
+        save = asyncio.ensure_future(self.file_manager.save_tasks(self.tasks))
+        await asyncio.sleep(0)
+
+        loaded_tasks = await self.file_manager.load_tasks()
+
+        self.assertTrue(save.done())
+        self.assertEqual(len(loaded_tasks), 2)
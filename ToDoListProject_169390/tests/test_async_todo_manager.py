@@ -0,0 +1,104 @@
+import asyncio
+import os
+import tempfile
+import unittest
+import unittest.mock
+from src.async_todo_manager import AsyncTodoManager
+from src.file_manager import FileManager
+from src.todo_manager import TodoManager
+from src.todo_status import TaskStatus
+
+
+class TestAsyncTodoManager(unittest.IsolatedAsyncioTestCase):
+    """Klasa testowa dla klasy AsyncTodoManager."""
+
+    async def asyncSetUp(self):
+        """Przygotowanie danych przed każdym testem."""
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False).name
+        self.manager = await AsyncTodoManager.open(self.temp_file)
+
+    def tearDown(self):
+        """Sprzątanie po testach."""
+        if os.path.exists(self.temp_file):
+            os.remove(self.temp_file)
+
+    async def test_mutations_are_persisted(self):
+        """Test zapisu zmian wprowadzonych asynchronicznie."""
+        task = await self.manager.add_task("Zadanie 1", "Opis 1")
+        await self.manager.add_task("Zadanie 2")
+        self.assertTrue(await self.manager.change_task_status_by_id(task.task_id, TaskStatus.DONE))
+        self.assertTrue(await self.manager.edit_task(1, description="Opis 2"))
+        self.assertTrue(await self.manager.delete_task(0))
+        self.assertFalse(await self.manager.delete_task_by_id(task.task_id))
+
+        reloaded = TodoManager(self.temp_file)
+        self.assertEqual([t.to_string() for t in reloaded.get_tasks()],
+                         [t.to_string() for t in self.manager.get_tasks()])
+        self.assertEqual(reloaded.get_tasks()[0].description, "Opis 2")
+
+    async def test_undo_redo_are_persisted(self):
+        """Test zapisu cofniętych i ponowionych operacji."""
+        await self.manager.add_task("Zadanie 1")
+        await self.manager.add_task("Zadanie 2")
+        await self.manager.delete_task(0)
+
+        self.assertTrue(await self.manager.undo())
+        self.assertEqual([t.task_id for t in TodoManager(self.temp_file).get_tasks()], [1, 2])
+        self.assertTrue(await self.manager.redo())
+        self.assertEqual([t.task_id for t in TodoManager(self.temp_file).get_tasks()], [2])
+
+    async def test_subscribe_delivers_to_event_loop(self):
+        """Test przekazania zdarzeń zmian do korutyny przez call_soon_threadsafe."""
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        subscription = self.manager.subscribe(
+            lambda events: loop.call_soon_threadsafe(queue.put_nowait, events), interval=0
+        )
+        task = await self.manager.add_task("Zadanie")
+
+        events = await asyncio.wait_for(queue.get(), 5)
+        self.assertEqual(
+            [(event.kind, event.task_id) for event in events], [("added", task.task_id)]
+        )
+        subscription.close()
+
+    async def test_reads(self):
+        """Test synchronicznych metod odczytu."""
+        task = await self.manager.add_task("Zadanie 1")
+        await self.manager.change_task_status(0, "done")
+
+        self.assertIs(self.manager.get_task(task.task_id), task)
+        self.assertEqual(self.manager.get_tasks_by_status(TaskStatus.DONE), [task])
+        self.assertEqual(self.manager.count_tasks_by_status("done"), 1)
+
+    async def test_concurrent_coroutines_share_writes(self):
+        """Test, czy tysiące współbieżnych operacji nie powodują tysięcy zapisów."""
+        file_manager = self.manager.file_manager.file_manager
+        with unittest.mock.patch.object(file_manager, "apply_changes",
+                                        wraps=file_manager.apply_changes) as mock_apply:
+            tasks = await asyncio.gather(
+                *(self.manager.add_task(f"Zadanie {i}") for i in range(2000))
+            )
+
+        self.assertLessEqual(mock_apply.call_count, 2)
+        self.assertEqual(len({task.task_id for task in tasks}), 2000)
+        reloaded = TodoManager(self.temp_file)
+        self.assertEqual(len(reloaded.get_tasks()), 2000)
+
+    async def test_legacy_tasks_receive_ids(self):
+        """Test nadania i zapisu identyfikatorów zadaniom w starym formacie."""
+        with open(self.temp_file, "w") as file:
+            file.write("Zadanie 1|Opis 1|pending\n")
+
+        manager = await AsyncTodoManager.open(file_manager=FileManager(self.temp_file))
+
+        self.assertEqual(manager.get_tasks()[0].task_id, 1)
+        with open(self.temp_file) as file:
+            self.assertEqual(file.read(), "Zadanie 1|Opis 1|pending|1\n")
+        await manager.close()
+
+    async def test_add_empty_title(self):
+        """Test dodania zadania z pustym tytułem."""
+        with self.assertRaises(ValueError):
+            await self.manager.add_task("")
+        await self.manager.flush()
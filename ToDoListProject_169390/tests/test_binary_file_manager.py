@@ -0,0 +1,190 @@
+import os
+import tempfile
+import unittest
+import unittest.mock
+from src.binary_file_manager import BinaryFileManager
+from src.file_manager import FileManager
+from src.lazy_task_list import LazyTaskList
+from src.metrics import MetricsRecorder
+from src.task import Task
+from src.todo_manager import TodoManager
+from src.todo_status import TaskStatus
+
+
+class TestBinaryFileManager(unittest.TestCase):
+    """Klasa testowa dla klasy BinaryFileManager."""
+
+    def setUp(self):
+        """Przygotowanie danych przed każdym testem."""
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False).name
+        self.file_manager = BinaryFileManager(self.temp_file)
+        self.tasks = [
+            Task("Zadanie 1", "Opis 1", task_id=1),
+            Task("Żółć", "Zażółć gęślą jaźń", TaskStatus.DONE, task_id=2),
+            Task("Zadanie 3", "", TaskStatus.UNFINISHED),
+        ]
+
+    def tearDown(self):
+        """Sprzątanie po testach."""
+        self.file_manager.close()
+        for path in (self.temp_file, self.temp_file + ".txt", self.temp_file + ".journal"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_save_and_load_tasks(self):
+        """Test zapisania i wczytania zadań w formacie binarnym."""
+        self.assertTrue(self.file_manager.save_tasks(self.tasks))
+
+        loaded_tasks = self.file_manager.load_tasks()
+
+        self.assertEqual(len(loaded_tasks), 3)
+        for loaded, task in zip(loaded_tasks, self.tasks):
+            self.assertEqual(loaded.to_string(), task.to_string())
+
+    def test_load_is_lazy(self):
+        """Test leniwego tworzenia zadań przy dostępie."""
+        self.file_manager.save_tasks(self.tasks)
+
+        loaded_tasks = self.file_manager.load_tasks()
+
+        self.assertIsInstance(loaded_tasks, LazyTaskList)
+        self.assertEqual(loaded_tasks.loaded_count, 0)
+        self.assertEqual(loaded_tasks[1].title, "Żółć")
+        self.assertEqual(loaded_tasks.loaded_count, 1)
+
+    def test_load_nonexistent_and_empty_file(self):
+        """Test wczytania z nieistniejącego i pustego pliku."""
+        os.remove(self.temp_file)
+        self.assertEqual(self.file_manager.load_tasks(), [])
+        self.assertTrue(os.path.exists(self.temp_file))
+        self.assertEqual(self.file_manager.load_tasks(), [])
+
+    def test_load_invalid_file(self):
+        """Test wczytania pliku w innym formacie."""
+        with open(self.temp_file, "w") as file:
+            file.write("Zadanie 1|Opis 1|pending\n")
+
+        self.assertEqual(self.file_manager.load_tasks(), [])
+
+    def test_compression_is_rejected(self):
+        """Test odrzucenia parametru compression, którego format binarny nie obsługuje."""
+        with self.assertRaises(ValueError):
+            BinaryFileManager(self.temp_file, compression="gzip")
+        BinaryFileManager(self.temp_file, compression=None).close()
+
+    def test_save_invalid_status(self):
+        """Test zapisu zadania z nieprawidłowym statusem."""
+        result = self.file_manager.save_tasks([Task("Tytuł", "Opis", "invalid_status")])
+        self.assertFalse(result)
+
+    def test_save_over_mapped_file_keeps_lazy_tasks(self):
+        """Test nadpisania pliku, z którego pochodzi leniwa lista zadań."""
+        self.file_manager.save_tasks(self.tasks)
+        loaded_tasks = self.file_manager.load_tasks()
+
+        self.file_manager.save_tasks(loaded_tasks[:1])
+
+        self.assertEqual([task.title for task in loaded_tasks][1], "Żółć")
+        self.assertEqual(len(self.file_manager.load_tasks()), 1)
+
+    def test_import_and_export_text(self):
+        """Test importu i eksportu formatu tekstowego."""
+        text_path = self.temp_file + ".txt"
+        FileManager(text_path).save_tasks(self.tasks)
+
+        self.assertTrue(self.file_manager.import_text(text_path))
+        os.remove(text_path)
+        self.assertTrue(self.file_manager.export_text(text_path))
+
+        loaded_tasks = FileManager(text_path).load_tasks()
+        self.assertEqual([task.to_string() for task in loaded_tasks],
+                         [task.to_string() for task in self.tasks])
+
+    def test_todo_manager_with_binary_backend(self):
+        """Test współpracy TodoManager z formatem binarnym."""
+        manager = TodoManager(file_manager=self.file_manager)
+        manager.add_task("Zadanie 1", "Opis 1")
+        manager.add_task("Zadanie 2", "Opis 2")
+        manager.change_task_status(1, TaskStatus.DONE)
+
+        reloaded = TodoManager(file_manager=BinaryFileManager(self.temp_file))
+
+        self.assertEqual([task.title for task in reloaded.get_tasks()], ["Zadanie 1", "Zadanie 2"])
+        self.assertEqual(reloaded.get_tasks()[1].status, TaskStatus.DONE)
+        reloaded.file_manager.close()
+
+    def test_update_is_patched_in_place(self):
+        """Test aktualizacji zadań w miejscu, bez przepisywania pliku."""
+        self.file_manager.save_tasks(self.tasks[:2])
+        size = os.path.getsize(self.temp_file)
+        task = self.tasks[0]
+
+        task.change_status(TaskStatus.DONE)
+        task.update_details(description="Opis")
+        with unittest.mock.patch.object(self.file_manager, "save_tasks") as mock_save:
+            self.assertTrue(self.file_manager.apply_changes(self.tasks[:2], [("update", task)]))
+            mock_save.assert_not_called()
+        self.assertEqual(os.path.getsize(self.temp_file), size)
+
+        task.update_details(title="Znacznie dłuższy tytuł zadania")
+        self.assertTrue(self.file_manager.apply_changes(self.tasks[:2], [("update", task)]))
+        self.assertGreater(os.path.getsize(self.temp_file), size)
+
+        loaded_tasks = BinaryFileManager(self.temp_file).load_tasks()
+        self.assertEqual([loaded.to_string() for loaded in loaded_tasks],
+                         [task.to_string() for task in self.tasks[:2]])
+
+    def test_journal_is_used_without_journal_mode(self):
+        """Test nakładania i czyszczenia dziennika bez trybu dziennika."""
+        journal_manager = BinaryFileManager(self.temp_file, journal=True)
+        tasks = self.tasks[:2]
+        journal_manager.save_tasks(tasks)
+        journal_manager.apply_changes(tasks[1:], [("delete", tasks[0])])
+        journal_manager.close()
+
+        loaded_tasks = list(self.file_manager.load_tasks())
+        self.assertEqual([task.task_id for task in loaded_tasks], [2])
+
+        task = loaded_tasks[0]
+        task.update_details(title="Zmienione")
+        self.assertTrue(self.file_manager.apply_changes(loaded_tasks, [("update", task)]))
+        self.assertEqual(os.path.getsize(journal_manager.journal_path), 0)
+
+        reloaded = BinaryFileManager(self.temp_file, journal=True)
+        self.assertEqual([(task.title, task.task_id) for task in reloaded.load_tasks()],
+                         [("Zmienione", 2)])
+        reloaded.close()
+
+    def test_update_of_unknown_task_saves_all(self):
+        """Test pełnego zapisu, gdy zmienionego zadania nie ma w pliku."""
+        self.file_manager.save_tasks(self.tasks[:2])
+        task = Task("Nowe", task_id=9)
+
+        save_tasks = unittest.mock.patch.object(self.file_manager, "save_tasks", return_value=True)
+        with save_tasks as mock_save:
+            self.assertTrue(self.file_manager.apply_changes([task], [("update", task)]))
+            mock_save.assert_called_once_with([task])
+
+    def test_iter_tasks(self):
+        """Test strumieniowego odczytu zadań z pliku binarnego."""
+        self.file_manager.save_tasks(self.tasks)
+
+        titles = [task.title for task in self.file_manager.iter_tasks()]
+
+        self.assertEqual(titles, [task.title for task in self.tasks])
+        self.assertEqual(list(BinaryFileManager(self.temp_file + ".txt").iter_tasks()), [])
+
+    def test_metrics(self):
+        """Test pomiarów zapisu, odczytu i poprawek w miejscu."""
+        metrics = MetricsRecorder()
+        file_manager = BinaryFileManager(self.temp_file, metrics=metrics)
+        file_manager.save_tasks(self.tasks)
+        tasks = file_manager.load_tasks()
+        tasks[0].change_status(TaskStatus.DONE)
+        file_manager.apply_changes(tasks, [("update", tasks[0])])
+        file_manager.close()
+
+        self.assertEqual(metrics.counter("file.bytes_written"), os.path.getsize(self.temp_file))
+        self.assertEqual(metrics.histogram("file.save_tasks").count, 1)
+        self.assertEqual(metrics.histogram("file.load_tasks").count, 1)
+        self.assertEqual(metrics.histogram("file.patch_records").count, 1)
@@ -0,0 +1,156 @@
+import threading
+import time
+import unittest
+import unittest.mock
+from src.change_events import ADDED, DELETED, EDITED, RESET, STATUS_CHANGED
+from src.change_events import ChangeNotifier, TaskEvent
+from src.todo_status import TaskStatus
+
+
+def _edited(task_id, old_title, new_title):
+    """Tworzy zdarzenie edycji tytułu zadania bez opisu."""
+    return TaskEvent(
+        EDITED,
+        task_id,
+        {"title": old_title, "description": ""},
+        {"title": new_title, "description": ""},
+    )
+
+
+def _fields(title, status=TaskStatus.PENDING):
+    """Tworzy pola zadania bez opisu."""
+    return {"title": title, "description": "", "status": status}
+
+
+def _status_changed(task_id, old_status, new_status):
+    """Tworzy zdarzenie zmiany statusu zadania."""
+    return TaskEvent(STATUS_CHANGED, task_id, {"status": old_status}, {"status": new_status})
+
+
+class TestChangeEvents(unittest.TestCase):
+    """Klasa testowa dla modułu change_events."""
+
+    def setUp(self):
+        """Przygotowanie danych przed każdym testem."""
+        self.notifier = ChangeNotifier()
+
+    def test_notifier_without_subscribers_is_inactive(self):
+        """Test atrybutu active przy dodawaniu i usuwaniu subskrypcji."""
+        self.assertFalse(self.notifier.active)
+        subscription = self.notifier.subscribe()
+        self.assertTrue(self.notifier.active)
+        subscription.close()
+        self.assertFalse(self.notifier.active)
+
+        subscription.push([TaskEvent(ADDED, 1, None, _fields("A"))])
+        self.assertEqual(subscription.poll(), [])
+
+    def test_edits_are_coalesced(self):
+        """Test łączenia kolejnych edycji i zmian statusu tego samego zadania."""
+        subscription = self.notifier.subscribe()
+        self.notifier.publish([_edited(1, "A", "B"), _edited(2, "X", "Y")])
+        self.notifier.publish([
+            _edited(1, "B", "C"),
+            _status_changed(1, TaskStatus.PENDING, TaskStatus.DONE),
+            _edited(2, "Y", "X"),
+        ])
+
+        self.assertEqual(subscription.pending_count, 1)
+        self.assertEqual(subscription.poll(), [
+            _edited(1, "A", "C"),
+            _status_changed(1, TaskStatus.PENDING, TaskStatus.DONE),
+        ])
+        self.assertEqual(subscription.poll(), [])
+
+    def test_add_and_delete_are_coalesced(self):
+        """Test łączenia dodania i usunięcia z innymi zdarzeniami zadania."""
+        subscription = self.notifier.subscribe()
+        self.notifier.publish([
+            TaskEvent(ADDED, 1, None, _fields("A")),
+            _edited(1, "A", "B"),
+            TaskEvent(ADDED, 2, None, _fields("C")),
+            TaskEvent(DELETED, 2, _fields("C"), None),
+            _edited(3, "D", "E"),
+            TaskEvent(DELETED, 3, _fields("E"), None),
+            TaskEvent(DELETED, 4, _fields("F"), None),
+            TaskEvent(ADDED, 4, None, _fields("F", TaskStatus.DONE)),
+        ])
+
+        self.assertEqual(subscription.poll(), [
+            TaskEvent(ADDED, 1, None, _fields("B")),
+            TaskEvent(DELETED, 3, _fields("D"), None),
+            _status_changed(4, TaskStatus.PENDING, TaskStatus.DONE),
+        ])
+
+    def test_kinds_filter(self):
+        """Test przekazywania tylko wybranych rodzajów zdarzeń."""
+        subscription = self.notifier.subscribe(kinds=[DELETED])
+        self.notifier.publish([_edited(1, "A", "B"), TaskEvent(DELETED, 2, _fields("C"), None)])
+
+        self.assertEqual(subscription.poll(), [TaskEvent(DELETED, 2, _fields("C"), None)])
+
+    def test_overflow_and_reset(self):
+        """Test zastąpienia przepełnionej kolejki zdarzeniem RESET."""
+        subscription = self.notifier.subscribe(max_pending=2)
+        self.notifier.publish([_edited(task_id, "A", "B") for task_id in range(3)])
+        self.notifier.publish([_edited(5, "A", "B")])
+
+        self.assertEqual(subscription.overflows, 1)
+        self.assertEqual(subscription.poll(), [TaskEvent(RESET)])
+
+        self.notifier.publish([_edited(1, "A", "B"), TaskEvent(RESET), _edited(2, "A", "B")])
+        self.assertEqual(subscription.poll(), [TaskEvent(RESET)])
+
+    def test_poll_waits_for_events(self):
+        """Test oczekiwania poll() na zdarzenia z innego wątku."""
+        subscription = self.notifier.subscribe()
+        timer = threading.Timer(0.05, self.notifier.publish, [[_edited(1, "A", "B")]])
+        timer.start()
+
+        self.assertEqual(subscription.poll(timeout=5), [_edited(1, "A", "B")])
+        timer.join()
+        self.assertEqual(subscription.poll(timeout=0.01), [])
+
+    def test_callback_receives_batches(self):
+        """Test przekazywania zdarzeń partiami do funkcji callback."""
+        batches = []
+        subscription = self.notifier.subscribe(batches.append, interval=60)
+        for i in range(10):
+            self.notifier.publish([_edited(1, f"T{i}", f"T{i + 1}")])
+        subscription.close()
+
+        self.assertEqual(batches, [[_edited(1, "T0", "T10")]])
+
+    def test_slow_callback_does_not_block_publish(self):
+        """Test publikacji zdarzeń bez czekania na powolnego subskrybenta."""
+        release = threading.Event()
+        received = []
+
+        def callback(events):
+            release.wait(5)
+            received.extend(events)
+
+        subscription = self.notifier.subscribe(callback, interval=0)
+        self.notifier.publish([_edited(1, "A", "B")])
+        time.sleep(0.05)
+
+        start = time.perf_counter()
+        for task_id in range(2, 1000):
+            self.notifier.publish([_edited(task_id, "A", "B")])
+        self.assertLess(time.perf_counter() - start, 2)
+
+        release.set()
+        subscription.close()
+        self.assertEqual(len(received), 999)
+
+    def test_callback_errors_are_reported(self):
+        """Test obsługi wyjątku zgłoszonego przez subskrybenta."""
+        def callback(events):
+            raise RuntimeError("błąd")
+
+        with unittest.mock.patch("builtins.print") as mock_print:
+            subscription = self.notifier.subscribe(callback, interval=0)
+            self.notifier.publish([_edited(1, "A", "B")])
+            subscription.close()
+
+        mock_print.assert_called_once_with("Błąd subskrybenta zdarzeń: błąd")
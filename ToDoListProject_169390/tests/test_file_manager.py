@@ -1,394 +1,1050 @@
-import os
-import tempfile
-from unittest import mock
-import unittest
-import builtins
-from src.file_manager import FileManager
-from src.task import Task
-from src.todo_status import TaskStatus
-
-
-class TestFileManager(unittest.TestCase):
-    """Klasa testowa dla klasy FileManager."""
-
-    def setUp(self):
-        """Przygotowanie danych przed każdym testem."""
-
-        self.temp_file = tempfile.NamedTemporaryFile(delete=False).name
-        self.file_manager = FileManager(self.temp_file)
-
-        self.task1 = Task("Zadanie 1", "Opis 1")
-        self.task2 = Task("Zadanie 2", "Opis 2", TaskStatus.DONE)
-        self.tasks = [self.task1, self.task2]
-
-    def tearDown(self):
-        """Sprzątanie po testach."""
-
-        if os.path.exists(self.temp_file):
-            os.remove(self.temp_file)
-
-    def test_save_tasks_empty_list(self):
-        """Test zapisania pustej listy zadań."""
-        result = self.file_manager.save_tasks([])
-        self.assertTrue(result)
-        self.assertTrue(os.path.exists(self.temp_file))
-        with open(self.temp_file, "r") as file:
-            content = file.read()
-        self.assertEqual(content, "")
-
-    def test_save_tasks_single_task(self):
-        """Test zapisania jednego zadania."""
-        self.file_manager.save_tasks([self.task1])
-        with open(self.temp_file, "r") as file:
-            content = file.read().strip()
-        expected = self.task1.to_string()
-        self.assertEqual(content, expected)
-
-    def test_save_tasks_multiple_tasks(self):
-        """Test zapisania wielu zadań."""
-        self.file_manager.save_tasks(self.tasks)
-        with open(self.temp_file, "r") as file:
-            lines = file.readlines()
-
-        self.assertEqual(len(lines), 2)
-        self.assertEqual(lines[0].strip(), self.task1.to_string())
-        self.assertEqual(lines[1].strip(), self.task2.to_string())
-
-    def test_save_tasks_with_error(self):
-        """Test zapisania zadań z błędem (nieprawidłowa ścieżka)."""
-        invalid_file_manager = FileManager("/nonexistent/directory/file.txt")
-        result = invalid_file_manager.save_tasks(self.tasks)
-        self.assertFalse(result)
-
-    def test_load_tasks_nonexistent_file(self):
-        """Test wczytania zadań z nieistniejącego pliku."""
-
-        nonexistent_file = os.path.join(tempfile.gettempdir(), "nonexistent_file.txt")
-        if os.path.exists(nonexistent_file):
-            os.remove(nonexistent_file)
-
-        file_manager = FileManager(nonexistent_file)
-        tasks = file_manager.load_tasks()
-
-        self.assertTrue(os.path.exists(nonexistent_file))
-        self.assertEqual(len(tasks), 0)
-
-        os.remove(nonexistent_file)
-
-    def test_load_tasks_with_valid_data(self):
-        """Test wczytania zadań z prawidłowymi danymi."""
-
-        self.file_manager.save_tasks(self.tasks)
-
-        loaded_tasks = self.file_manager.load_tasks()
-
-        self.assertEqual(len(loaded_tasks), 2)
-        self.assertEqual(loaded_tasks[0].title, self.task1.title)
-        self.assertEqual(loaded_tasks[0].description, self.task1.description)
-        self.assertEqual(loaded_tasks[0].status, self.task1.status)
-        self.assertEqual(loaded_tasks[1].title, self.task2.title)
-        self.assertEqual(loaded_tasks[1].description, self.task2.description)
-        self.assertEqual(loaded_tasks[1].status, self.task2.status)
-
-    def test_load_tasks_with_invalid_data(self):
-        """Test wczytania zadań z nieprawidłowymi danymi."""
-
-        with open(self.temp_file, "w") as file:
-            file.write("Zadanie 1|Opis 1|pending\n")
-            file.write("Nieprawidłowe_dane\n")
-            file.write("Zadanie 3|Opis 3|invalid_status\n")
-            file.write("Zadanie 4|Opis 4|done\n")
-
-        loaded_tasks = self.file_manager.load_tasks()
-
-        self.assertEqual(len(loaded_tasks), 2)
-        self.assertEqual(loaded_tasks[0].title, "Zadanie 1")
-        self.assertEqual(loaded_tasks[1].title, "Zadanie 4")
-
-    def test_load_tasks_with_empty_lines(self):
-        """Test wczytania zadań z pustymi liniami w pliku."""
-
-        with open(self.temp_file, "w", encoding="utf-8") as file:
-            file.write("Zadanie 1|Opis 1|pending\n")
-            file.write("\n")
-            file.write("Zadanie 2|Opis 2|done\n")
-            file.write("\n")
-
-        loaded_tasks = self.file_manager.load_tasks()
-
-        self.assertEqual(len(loaded_tasks), 2)
-
-    def test_load_tasks_permission_error(self):
-        """Test wczytania zadań z pliku bez uprawnień do odczytu."""
-
-        if os.name != "posix":
-            self.skipTest("Test dostępu działa tylko na systemach POSIX")
-
-        self.file_manager.save_tasks(self.tasks)
-
-        try:
-            os.chmod(self.temp_file, 0o000)
-
-            loaded_tasks = self.file_manager.load_tasks()
-
-            self.assertEqual(len(loaded_tasks), 0)
-        finally:
-
-            os.chmod(self.temp_file, 0o666)
-
-    def test_save_and_load_tasks_with_special_characters(self):
-        """Test zapisania i wczytania zadań ze znakami specjalnymi (z wyjątkiem znaku '|')."""
-
-        task_with_special_chars = Task("Zadanie ze znakami !@#$%", "Opis z enterami")
-        self.file_manager.save_tasks([task_with_special_chars])
-
-        loaded_tasks = self.file_manager.load_tasks()
-        self.assertEqual(len(loaded_tasks), 1)
-        self.assertEqual(loaded_tasks[0].title, "Zadanie ze znakami !@#$%")
-        self.assertEqual(loaded_tasks[0].description, "Opis z enterami")
-
-    def test_load_tasks_with_unicode_characters(self):
-        """Test wczytania zadań z pliku zawierającego proste znaki."""
-        task_with_simple_chars = Task("Zadanie specjalne", "Opis specjalny")
-        self.file_manager.save_tasks([task_with_simple_chars])
-
-        loaded_tasks = self.file_manager.load_tasks()
-        self.assertEqual(len(loaded_tasks), 1)
-        self.assertEqual(loaded_tasks[0].title, "Zadanie specjalne")
-        self.assertEqual(loaded_tasks[0].description, "Opis specjalny")
-
-    def test_load_tasks_with_multiple_invalid_lines(self):
-        """Test wczytania zadań z pliku zawierającego wiele nieprawidłowych linii."""
-        with open(self.temp_file, "w") as file:
-            file.write("Prawidłowe|Zadanie 1|pending\n")
-            file.write("Nieprawidłowa linia\n")
-            file.write("Bardzo|nieprawidłowa|linia|z|wieloma|elementami\n")
-            file.write("Prawidłowe|Zadanie 2|done\n")
-            file.write("Zadanie|bez|właściwego|statusu\n")
-
-        loaded_tasks = self.file_manager.load_tasks()
-        self.assertEqual(len(loaded_tasks), 2)
-        self.assertEqual(loaded_tasks[0].title, "Prawidłowe")
-        self.assertEqual(loaded_tasks[1].title, "Prawidłowe")
-
-    def test_save_tasks_overwrites_previous_content(self):
-        """Test, czy zapisanie zadań nadpisuje poprzednią zawartość pliku."""
-
-        self.file_manager.save_tasks(self.tasks)
-
-        single_task = [Task("Nowe zadanie", "Nowy opis")]
-        result = self.file_manager.save_tasks(single_task)
-
-        self.assertTrue(result)
-
-        loaded_tasks = self.file_manager.load_tasks()
-        self.assertEqual(len(loaded_tasks), 1)
-        self.assertEqual(loaded_tasks[0].title, "Nowe zadanie")
-
-    def test_save_tasks_with_very_long_strings(self):
-        """Test zapisania zadań z bardzo długimi ciągami znaków."""
-        long_title = "A" * 1000
-        long_description = "B" * 5000
-        task_with_long_strings = Task(long_title, long_description)
-
-        result = self.file_manager.save_tasks([task_with_long_strings])
-        self.assertTrue(result)
-
-        loaded_tasks = self.file_manager.load_tasks()
-        self.assertEqual(len(loaded_tasks), 1)
-        self.assertEqual(len(loaded_tasks[0].title), 1000)
-        self.assertEqual(len(loaded_tasks[0].description), 5000)
-
-    def test_load_tasks_from_file_with_strange_line_endings(self):
-        """Test wczytania zadań z pliku z różnymi zakończeniami linii."""
-
-        with open(self.temp_file, "wb") as file:
-            file.write(b"Zadanie 1|Opis 1|pending\r\n")
-            file.write(b"Zadanie 2|Opis 2|done\n")
-            file.write(b"Zadanie 3|Opis 3|unfinished\r")
-
-        loaded_tasks = self.file_manager.load_tasks()
-        self.assertEqual(len(loaded_tasks), 3)
-        self.assertEqual(loaded_tasks[0].title, "Zadanie 1")
-        self.assertEqual(loaded_tasks[1].title, "Zadanie 2")
-        self.assertEqual(loaded_tasks[2].title, "Zadanie 3")
-
-    def test_load_tasks_with_corrupted_file(self):
-        """Test wczytania zadań z uszkodzonego pliku."""
-
-        with open(self.temp_file, "wb") as file:
-            file.write(b"\x80\x81\x82Nieprawidlowe\xf0\xf1\xf2dane\x00")
-
-        loaded_tasks = self.file_manager.load_tasks()
-        self.assertEqual(len(loaded_tasks), 0)
-
-    def test_save_tasks_with_different_statuses(self):
-        """Test zapisania zadań o różnych statusach."""
-        tasks = [
-            Task("Zadanie 1", "Opis 1", TaskStatus.PENDING),
-            Task("Zadanie 2", "Opis 2", TaskStatus.DONE),
-            Task("Zadanie 3", "Opis 3", TaskStatus.UNFINISHED),
-        ]
-
-        result = self.file_manager.save_tasks(tasks)
-        self.assertTrue(result)
-
-        loaded_tasks = self.file_manager.load_tasks()
-        self.assertEqual(len(loaded_tasks), 3)
-        self.assertEqual(loaded_tasks[0].status, TaskStatus.PENDING)
-        self.assertEqual(loaded_tasks[1].status, TaskStatus.DONE)
-        self.assertEqual(loaded_tasks[2].status, TaskStatus.UNFINISHED)
-
-    def test_save_and_load_multiple_times(self):
-        """Test wielokrotnego zapisywania i wczytywania danych."""
-
-        self.file_manager.save_tasks([self.task1])
-        loaded_tasks = self.file_manager.load_tasks()
-        self.assertEqual(len(loaded_tasks), 1)
-        self.assertEqual(loaded_tasks[0].title, self.task1.title)
-
-        self.file_manager.save_tasks([self.task2])
-        loaded_tasks = self.file_manager.load_tasks()
-        self.assertEqual(len(loaded_tasks), 1)
-        self.assertEqual(loaded_tasks[0].title, self.task2.title)
-
-        self.file_manager.save_tasks(self.tasks)
-        loaded_tasks = self.file_manager.load_tasks()
-        self.assertEqual(len(loaded_tasks), 2)
-
-    def test_load_tasks_with_unexpected_exception(self):
-        """Test obsługi nieoczekiwanego wyjątku podczas wczytywania zadań."""
-        original_open = open
-
-        def mocked_open(*args, **kwargs):
-            if args[0] == self.temp_file and "r" in args[1]:
-                raise Exception("Symulowany nieoczekiwany błąd")
-            return original_open(*args, **kwargs)
-
-        try:
-
-            builtins.open = mocked_open
-
-            loaded_tasks = self.file_manager.load_tasks()
-            self.assertEqual(len(loaded_tasks), 0)
-        finally:
-
-            builtins.open = original_open
-
-    def test_save_tasks_with_unexpected_exception(self):
-        """Test obsługi nieoczekiwanego wyjątku podczas zapisywania zadań."""
-        original_open = open
-
-        def mocked_open(*args, **kwargs):
-            if args[0] == self.temp_file and "w" in args[1]:
-                raise Exception("Symulowany nieoczekiwany błąd")
-            return original_open(*args, **kwargs)
-
-        try:
-
-            builtins.open = mocked_open
-
-            result = self.file_manager.save_tasks(self.tasks)
-            self.assertFalse(result)
-        finally:
-
-            builtins.open = original_open
-
-    def test_save_tasks_to_readonly_location(self):
-        """Test zapisu do lokalizacji tylko do odczytu."""
-
-        with mock.patch("builtins.open") as mock_open:
-            mock_open.side_effect = PermissionError("Brak uprawnień do zapisu")
-            result = self.file_manager.save_tasks(self.tasks)
-
-        self.assertFalse(result)
-        mock_open.assert_called_once()
-
-    def test_save_tasks_during_disk_full(self):
-        """Test zapisu zadań gdy dysk jest pełny."""
-        with unittest.mock.patch("builtins.open") as mock_open:
-
-            mock_file = mock_open.return_value.__enter__.return_value
-            mock_file.write.side_effect = OSError("Disk full")
-
-            result = self.file_manager.save_tasks(self.tasks)
-
-        self.assertFalse(result)
-        self.assertTrue(mock_file.write.called)
-
-    def test_load_tasks_with_file_read_error(self):
-        """Test wczytania zadań gdy wystąpi błąd podczas czytania pliku."""
-
-        self.file_manager.save_tasks(self.tasks)
-
-        with unittest.mock.patch("builtins.open") as mock_open:
-
-            def selective_mock(*args, **kwargs):
-                if "r" in args[1]:
-                    mock_file = unittest.mock.MagicMock()
-                    mock_file.__enter__.return_value.readlines.side_effect = IOError(
-                        "Błąd odczytu"
-                    )
-                    return mock_file
-
-                return open(*args, **kwargs)
-
-            mock_open.side_effect = selective_mock
-
-            loaded_tasks = self.file_manager.load_tasks()
-
-        self.assertIsInstance(loaded_tasks, list)
-        self.assertEqual(len(loaded_tasks), 0)
-
-    def test_task_file_creation_with_permissions(self):
-        """Test tworzenia pliku zadań z określonymi uprawnieniami."""
-
-        if os.path.exists(self.temp_file):
-            os.remove(self.temp_file)
-
-        with unittest.mock.patch("builtins.open") as mock_open:
-            mock_open.return_value.__enter__.return_value = unittest.mock.MagicMock()
-            self.file_manager.load_tasks()
-
-        mock_open.assert_any_call(self.temp_file, "w")
-
-    def test_file_manager_with_default_path(self):
-        """Test inicjalizacji FileManager z domyślną ścieżką pliku."""
-        default_manager = FileManager()
-
-        self.assertEqual(default_manager.file_path, "database_todo.txt")
-        self.assertIsNot(default_manager.file_path, self.temp_file)
-        self.assertIsInstance(default_manager.file_path, str)
-
-    def test_parametrized_test(self):
-        """Test zapisywania i wczytywania zadań z różnymi statusami."""
-        test_cases = [
-            ("pending", TaskStatus.PENDING),
-            ("done", TaskStatus.DONE),
-            ("unfinished", TaskStatus.UNFINISHED),
-        ]
-
-        for status_name, status_enum in test_cases:
-            with self.subTest(status=status_name):
-
-                temp_file = tempfile.NamedTemporaryFile(delete=False).name
-                try:
-
-                    file_manager = FileManager(temp_file)
-
-                    task = Task("Zadanie testowe", "Opis zadania", status_enum)
-
-                    result = file_manager.save_tasks([task])
-                    self.assertTrue(result)
-
-                    loaded_tasks = file_manager.load_tasks()
-
-                    self.assertEqual(len(loaded_tasks), 1)
-                    self.assertEqual(loaded_tasks[0].title, "Zadanie testowe")
-                    self.assertEqual(loaded_tasks[0].description, "Opis zadania")
-                    self.assertEqual(loaded_tasks[0].status, status_enum)
-                    self.assertEqual(loaded_tasks[0].status.value, status_name)
-                finally:
-
-                    if os.path.exists(temp_file):
-                        os.remove(temp_file)
+import locale
+import os
+import tempfile
+import threading
+from unittest import mock
+import unittest
+import builtins
+import gzip
+from src import file_manager as file_manager_module
+from src.file_manager import COMPRESSION_FORMATS, FileManager, _chunk_bounds, _detect_compression
+from src.metrics import MetricsRecorder
+from src.task import Task
+from src.todo_status import TaskStatus
+
+
+class TestFileManager(unittest.TestCase):
+    """Klasa testowa dla klasy FileManager."""
+
+    def setUp(self):
+        """Przygotowanie danych przed każdym testem."""
+
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False).name
+        self.file_manager = FileManager(self.temp_file)
+
+        self.task1 = Task("Zadanie 1", "Opis 1")
+        self.task2 = Task("Zadanie 2", "Opis 2", TaskStatus.DONE)
+        self.tasks = [self.task1, self.task2]
+
+    def tearDown(self):
+        """Sprzątanie po testach."""
+
+        for path in (self.temp_file, self.temp_file + ".journal", self.temp_file + ".lock"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_save_tasks_empty_list(self):
+        """Test zapisania pustej listy zadań."""
+        result = self.file_manager.save_tasks([])
+        self.assertTrue(result)
+        self.assertTrue(os.path.exists(self.temp_file))
+        with open(self.temp_file, "r") as file:
+            content = file.read()
+        self.assertEqual(content, "")
+
+    def test_save_tasks_single_task(self):
+        """Test zapisania jednego zadania."""
+        self.file_manager.save_tasks([self.task1])
+        with open(self.temp_file, "r") as file:
+            content = file.read().strip()
+        expected = self.task1.to_string()
+        self.assertEqual(content, expected)
+
+    def test_save_tasks_multiple_tasks(self):
+        """Test zapisania wielu zadań."""
+        self.file_manager.save_tasks(self.tasks)
+        with open(self.temp_file, "r") as file:
+            lines = file.readlines()
+
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[0].strip(), self.task1.to_string())
+        self.assertEqual(lines[1].strip(), self.task2.to_string())
+
+    def test_save_tasks_with_error(self):
+        """Test zapisania zadań z błędem (nieprawidłowa ścieżka)."""
+        invalid_file_manager = FileManager("/nonexistent/directory/file.txt")
+        result = invalid_file_manager.save_tasks(self.tasks)
+        self.assertFalse(result)
+
+    def test_load_tasks_nonexistent_file(self):
+        """Test wczytania zadań z nieistniejącego pliku."""
+
+        nonexistent_file = os.path.join(tempfile.gettempdir(), "nonexistent_file.txt")
+        if os.path.exists(nonexistent_file):
+            os.remove(nonexistent_file)
+
+        file_manager = FileManager(nonexistent_file)
+        tasks = file_manager.load_tasks()
+
+        self.assertTrue(os.path.exists(nonexistent_file))
+        self.assertEqual(len(tasks), 0)
+
+        os.remove(nonexistent_file)
+
+    def test_load_tasks_with_valid_data(self):
+        """Test wczytania zadań z prawidłowymi danymi."""
+
+        self.file_manager.save_tasks(self.tasks)
+
+        loaded_tasks = self.file_manager.load_tasks()
+
+        self.assertEqual(len(loaded_tasks), 2)
+        self.assertEqual(loaded_tasks[0].title, self.task1.title)
+        self.assertEqual(loaded_tasks[0].description, self.task1.description)
+        self.assertEqual(loaded_tasks[0].status, self.task1.status)
+        self.assertEqual(loaded_tasks[1].title, self.task2.title)
+        self.assertEqual(loaded_tasks[1].description, self.task2.description)
+        self.assertEqual(loaded_tasks[1].status, self.task2.status)
+
+    def test_load_tasks_with_invalid_data(self):
+        """Test wczytania zadań z nieprawidłowymi danymi."""
+
+        with open(self.temp_file, "w") as file:
+            file.write("Zadanie 1|Opis 1|pending\n")
+            file.write("Nieprawidłowe_dane\n")
+            file.write("Zadanie 3|Opis 3|invalid_status\n")
+            file.write("Zadanie 4|Opis 4|done\n")
+
+        loaded_tasks = self.file_manager.load_tasks()
+
+        self.assertEqual(len(loaded_tasks), 2)
+        self.assertEqual(loaded_tasks[0].title, "Zadanie 1")
+        self.assertEqual(loaded_tasks[1].title, "Zadanie 4")
+
+    def test_load_tasks_with_empty_lines(self):
+        """Test wczytania zadań z pustymi liniami w pliku."""
+
+        with open(self.temp_file, "w", encoding="utf-8") as file:
+            file.write("Zadanie 1|Opis 1|pending\n")
+            file.write("\n")
+            file.write("Zadanie 2|Opis 2|done\n")
+            file.write("\n")
+
+        loaded_tasks = self.file_manager.load_tasks()
+
+        self.assertEqual(len(loaded_tasks), 2)
+
+    def test_load_tasks_permission_error(self):
+        """Test wczytania zadań z pliku bez uprawnień do odczytu."""
+
+        if os.name != "posix":
+            self.skipTest("Test dostępu działa tylko na systemach POSIX")
+
+        self.file_manager.save_tasks(self.tasks)
+
+        try:
+            os.chmod(self.temp_file, 0o000)
+
+            loaded_tasks = self.file_manager.load_tasks()
+
+            self.assertEqual(len(loaded_tasks), 0)
+        finally:
+
+            os.chmod(self.temp_file, 0o666)
+
+    def test_save_and_load_tasks_with_special_characters(self):
+        """Test zapisania i wczytania zadań ze znakami specjalnymi (z wyjątkiem znaku '|')."""
+
+        task_with_special_chars = Task("Zadanie ze znakami !@#$%", "Opis z enterami")
+        self.file_manager.save_tasks([task_with_special_chars])
+
+        loaded_tasks = self.file_manager.load_tasks()
+        self.assertEqual(len(loaded_tasks), 1)
+        self.assertEqual(loaded_tasks[0].title, "Zadanie ze znakami !@#$%")
+        self.assertEqual(loaded_tasks[0].description, "Opis z enterami")
+
+    def test_load_tasks_with_unicode_characters(self):
+        """Test wczytania zadań z pliku zawierającego proste znaki."""
+        task_with_simple_chars = Task("Zadanie specjalne", "Opis specjalny")
+        self.file_manager.save_tasks([task_with_simple_chars])
+
+        loaded_tasks = self.file_manager.load_tasks()
+        self.assertEqual(len(loaded_tasks), 1)
+        self.assertEqual(loaded_tasks[0].title, "Zadanie specjalne")
+        self.assertEqual(loaded_tasks[0].description, "Opis specjalny")
+
+    def test_load_tasks_with_multiple_invalid_lines(self):
+        """Test wczytania zadań z pliku zawierającego wiele nieprawidłowych linii."""
+        with open(self.temp_file, "w") as file:
+            file.write("Prawidłowe|Zadanie 1|pending\n")
+            file.write("Nieprawidłowa linia\n")
+            file.write("Bardzo|nieprawidłowa|linia|z|wieloma|elementami\n")
+            file.write("Prawidłowe|Zadanie 2|done\n")
+            file.write("Zadanie|bez|właściwego|statusu\n")
+
+        loaded_tasks = self.file_manager.load_tasks()
+        self.assertEqual(len(loaded_tasks), 2)
+        self.assertEqual(loaded_tasks[0].title, "Prawidłowe")
+        self.assertEqual(loaded_tasks[1].title, "Prawidłowe")
+
+    def test_save_tasks_overwrites_previous_content(self):
+        """Test, czy zapisanie zadań nadpisuje poprzednią zawartość pliku."""
+
+        self.file_manager.save_tasks(self.tasks)
+
+        single_task = [Task("Nowe zadanie", "Nowy opis")]
+        result = self.file_manager.save_tasks(single_task)
+
+        self.assertTrue(result)
+
+        loaded_tasks = self.file_manager.load_tasks()
+        self.assertEqual(len(loaded_tasks), 1)
+        self.assertEqual(loaded_tasks[0].title, "Nowe zadanie")
+
+    def test_save_tasks_with_very_long_strings(self):
+        """Test zapisania zadań z bardzo długimi ciągami znaków."""
+        long_title = "A" * 1000
+        long_description = "B" * 5000
+        task_with_long_strings = Task(long_title, long_description)
+
+        result = self.file_manager.save_tasks([task_with_long_strings])
+        self.assertTrue(result)
+
+        loaded_tasks = self.file_manager.load_tasks()
+        self.assertEqual(len(loaded_tasks), 1)
+        self.assertEqual(len(loaded_tasks[0].title), 1000)
+        self.assertEqual(len(loaded_tasks[0].description), 5000)
+
+    def test_load_tasks_from_file_with_strange_line_endings(self):
+        """Test wczytania zadań z pliku z różnymi zakończeniami linii."""
+
+        with open(self.temp_file, "wb") as file:
+            file.write(b"Zadanie 1|Opis 1|pending\r\n")
+            file.write(b"Zadanie 2|Opis 2|done\n")
+            file.write(b"Zadanie 3|Opis 3|unfinished\r")
+
+        loaded_tasks = self.file_manager.load_tasks()
+        self.assertEqual(len(loaded_tasks), 3)
+        self.assertEqual(loaded_tasks[0].title, "Zadanie 1")
+        self.assertEqual(loaded_tasks[1].title, "Zadanie 2")
+        self.assertEqual(loaded_tasks[2].title, "Zadanie 3")
+
+    def test_load_tasks_with_corrupted_file(self):
+        """Test wczytania zadań z uszkodzonego pliku."""
+
+        with open(self.temp_file, "wb") as file:
+            file.write(b"\x80\x81\x82Nieprawidlowe\xf0\xf1\xf2dane\x00")
+
+        loaded_tasks = self.file_manager.load_tasks()
+        self.assertEqual(len(loaded_tasks), 0)
+
+    def test_save_tasks_with_different_statuses(self):
+        """Test zapisania zadań o różnych statusach."""
+        tasks = [
+            Task("Zadanie 1", "Opis 1", TaskStatus.PENDING),
+            Task("Zadanie 2", "Opis 2", TaskStatus.DONE),
+            Task("Zadanie 3", "Opis 3", TaskStatus.UNFINISHED),
+        ]
+
+        result = self.file_manager.save_tasks(tasks)
+        self.assertTrue(result)
+
+        loaded_tasks = self.file_manager.load_tasks()
+        self.assertEqual(len(loaded_tasks), 3)
+        self.assertEqual(loaded_tasks[0].status, TaskStatus.PENDING)
+        self.assertEqual(loaded_tasks[1].status, TaskStatus.DONE)
+        self.assertEqual(loaded_tasks[2].status, TaskStatus.UNFINISHED)
+
+    def test_save_and_load_multiple_times(self):
+        """Test wielokrotnego zapisywania i wczytywania danych."""
+
+        self.file_manager.save_tasks([self.task1])
+        loaded_tasks = self.file_manager.load_tasks()
+        self.assertEqual(len(loaded_tasks), 1)
+        self.assertEqual(loaded_tasks[0].title, self.task1.title)
+
+        self.file_manager.save_tasks([self.task2])
+        loaded_tasks = self.file_manager.load_tasks()
+        self.assertEqual(len(loaded_tasks), 1)
+        self.assertEqual(loaded_tasks[0].title, self.task2.title)
+
+        self.file_manager.save_tasks(self.tasks)
+        loaded_tasks = self.file_manager.load_tasks()
+        self.assertEqual(len(loaded_tasks), 2)
+
+    def test_load_tasks_with_unexpected_exception(self):
+        """Test obsługi nieoczekiwanego wyjątku podczas wczytywania zadań."""
+        original_open = open
+
+        def mocked_open(*args, **kwargs):
+            if args[0] == self.temp_file and "r" in args[1]:
+                raise Exception("Symulowany nieoczekiwany błąd")
+            return original_open(*args, **kwargs)
+
+        try:
+
+            builtins.open = mocked_open
+
+            loaded_tasks = self.file_manager.load_tasks()
+            self.assertEqual(len(loaded_tasks), 0)
+        finally:
+
+            builtins.open = original_open
+
+    def test_save_tasks_with_unexpected_exception(self):
+        """Test obsługi nieoczekiwanego wyjątku podczas zapisywania zadań."""
+        original_open = open
+
+        def mocked_open(*args, **kwargs):
+            if args[0] == self.temp_file and "w" in args[1]:
+                raise Exception("Symulowany nieoczekiwany błąd")
+            return original_open(*args, **kwargs)
+
+        try:
+
+            builtins.open = mocked_open
+
+            result = self.file_manager.save_tasks(self.tasks)
+            self.assertFalse(result)
+        finally:
+
+            builtins.open = original_open
+
+    def test_save_tasks_to_readonly_location(self):
+        """Test zapisu do lokalizacji tylko do odczytu."""
+
+        with mock.patch("builtins.open") as mock_open:
+            mock_open.side_effect = PermissionError("Brak uprawnień do zapisu")
+            result = self.file_manager.save_tasks(self.tasks)
+
+        self.assertFalse(result)
+        mock_open.assert_called_once()
+
+    def test_save_tasks_during_disk_full(self):
+        """Test zapisu zadań gdy dysk jest pełny."""
+        with unittest.mock.patch("builtins.open") as mock_open:
+
+            mock_file = mock_open.return_value.__enter__.return_value
+            mock_file.write.side_effect = OSError("Disk full")
+
+            result = self.file_manager.save_tasks(self.tasks)
+
+        self.assertFalse(result)
+        self.assertTrue(mock_file.write.called)
+
+    def test_load_tasks_with_file_read_error(self):
+        """Test wczytania zadań gdy wystąpi błąd podczas czytania pliku."""
+
+        self.file_manager.save_tasks(self.tasks)
+
+        with unittest.mock.patch("builtins.open") as mock_open:
+
+            def selective_mock(*args, **kwargs):
+                if "r" in args[1]:
+                    mock_file = unittest.mock.MagicMock()
+                    mock_file.__enter__.return_value.readlines.side_effect = IOError(
+                        "Błąd odczytu"
+                    )
+                    return mock_file
+
+                return open(*args, **kwargs)
+
+            mock_open.side_effect = selective_mock
+
+            loaded_tasks = self.file_manager.load_tasks()
+
+        self.assertIsInstance(loaded_tasks, list)
+        self.assertEqual(len(loaded_tasks), 0)
+
+    def test_task_file_creation_with_permissions(self):
+        """Test tworzenia pliku zadań z określonymi uprawnieniami."""
+
+        if os.path.exists(self.temp_file):
+            os.remove(self.temp_file)
+
+        with unittest.mock.patch("builtins.open") as mock_open:
+            mock_open.return_value.__enter__.return_value = unittest.mock.MagicMock()
+            self.file_manager.load_tasks()
+
+        mock_open.assert_any_call(self.temp_file, "w")
+
+    def test_file_manager_with_default_path(self):
+        """Test inicjalizacji FileManager z domyślną ścieżką pliku."""
+        default_manager = FileManager()
+
+        self.assertEqual(default_manager.file_path, "database_todo.txt")
+        self.assertIsNot(default_manager.file_path, self.temp_file)
+        self.assertIsInstance(default_manager.file_path, str)
+
+    def test_parametrized_test(self):
+        """Test zapisywania i wczytywania zadań z różnymi statusami."""
+        test_cases = [
+            ("pending", TaskStatus.PENDING),
+            ("done", TaskStatus.DONE),
+            ("unfinished", TaskStatus.UNFINISHED),
+        ]
+
+        for status_name, status_enum in test_cases:
+            with self.subTest(status=status_name):
+
+                temp_file = tempfile.NamedTemporaryFile(delete=False).name
+                try:
+
+                    file_manager = FileManager(temp_file)
+
+                    task = Task("Zadanie testowe", "Opis zadania", status_enum)
+
+                    result = file_manager.save_tasks([task])
+                    self.assertTrue(result)
+
+                    loaded_tasks = file_manager.load_tasks()
+
+                    self.assertEqual(len(loaded_tasks), 1)
+                    self.assertEqual(loaded_tasks[0].title, "Zadanie testowe")
+                    self.assertEqual(loaded_tasks[0].description, "Opis zadania")
+                    self.assertEqual(loaded_tasks[0].status, status_enum)
+                    self.assertEqual(loaded_tasks[0].status.value, status_name)
+                finally:
+
+                    if os.path.exists(temp_file):
+                        os.remove(temp_file)
+
+    def test_journal_apply_changes_appends_records(self):
+        """Test dopisywania zmian do dziennika bez przepisywania migawki."""
+        file_manager = FileManager(self.temp_file, journal=True)
+        self.task1.task_id = 1
+        file_manager.save_tasks(self.tasks)
+
+        with mock.patch.object(file_manager, "save_tasks") as mock_save:
+            result = file_manager.apply_changes(self.tasks, [("update", self.task1)])
+
+        self.assertTrue(result)
+        mock_save.assert_not_called()
+        with open(file_manager.journal_path, "r") as file:
+            self.assertEqual(file.read(), f"U|{self.task1.to_string()}\n")
+
+        os.remove(file_manager.journal_path)
+
+    def test_journal_load_replays_records(self):
+        """Test odtworzenia dziennika na migawce podczas wczytywania."""
+        file_manager = FileManager(self.temp_file, journal=True)
+        self.task1.task_id = 1
+        self.task2.task_id = 2
+        file_manager.save_tasks(self.tasks)
+
+        task3 = Task("Zadanie 3", "Opis 3", task_id=3)
+        self.tasks.append(task3)
+        self.task2.change_status(TaskStatus.UNFINISHED)
+        file_manager.apply_changes(self.tasks, [("add", task3)])
+        file_manager.apply_changes(self.tasks, [("update", self.task2)])
+        file_manager.apply_changes(self.tasks, [("delete", self.task1)])
+
+        loaded_tasks = FileManager(self.temp_file, journal=True).load_tasks()
+
+        self.assertEqual([task.title for task in loaded_tasks], ["Zadanie 2", "Zadanie 3"])
+        self.assertEqual(loaded_tasks[0].status, TaskStatus.UNFINISHED)
+        self.assertEqual([task.task_id for task in loaded_tasks], [2, 3])
+
+        os.remove(file_manager.journal_path)
+
+    def test_journal_compaction_writes_snapshot(self):
+        """Test kompaktowania dziennika po przekroczeniu progu."""
+        file_manager = FileManager(self.temp_file, journal=True, compact_threshold=2)
+        self.task1.task_id = 1
+        self.task2.task_id = 2
+        file_manager.save_tasks(self.tasks)
+
+        file_manager.apply_changes(self.tasks, [("update", self.task1)])
+        file_manager.apply_changes(self.tasks, [("update", self.task2)])
+        file_manager.apply_changes(self.tasks, [("update", self.task1)])
+
+        self.assertEqual(os.path.getsize(file_manager.journal_path), 0)
+        self.assertEqual(len(FileManager(self.temp_file).load_tasks()), 2)
+
+        os.remove(file_manager.journal_path)
+
+    def test_journal_is_used_without_journal_mode(self):
+        """Test nakładania i czyszczenia dziennika przez FileManager bez trybu dziennika."""
+        journal_manager = FileManager(self.temp_file, journal=True)
+        self.task1.task_id = 1
+        self.task2.task_id = 2
+        journal_manager.save_tasks(self.tasks)
+        journal_manager.apply_changes(self.tasks[1:], [("delete", self.task1)])
+
+        loaded_tasks = self.file_manager.load_tasks()
+        self.assertEqual([task.task_id for task in loaded_tasks], [2])
+        self.assertEqual([task.task_id for task in self.file_manager.load_tasks_lazy()], [2])
+        self.file_manager.close()
+
+        task3 = Task("Zadanie 3", task_id=3)
+        self.assertTrue(self.file_manager.save_tasks(loaded_tasks + [task3]))
+        self.assertEqual(os.path.getsize(journal_manager.journal_path), 0)
+
+        reloaded = FileManager(self.temp_file, journal=True).load_tasks()
+        self.assertEqual([(task.title, task.task_id) for task in reloaded],
+                         [("Zadanie 2", 2), ("Zadanie 3", 3)])
+
+    def test_journal_skips_invalid_records(self):
+        """Test pomijania nieprawidłowych rekordów dziennika."""
+        file_manager = FileManager(self.temp_file, journal=True)
+        self.task1.task_id = 1
+        self.task2.task_id = 2
+        file_manager.save_tasks(self.tasks)
+        with open(file_manager.journal_path, "w") as file:
+            file.write("X|nieznany\n")
+            file.write("D|7\n")
+            file.write("U|Bez identyfikatora||done\n")
+            file.write("D|1\n")
+
+        loaded_tasks = file_manager.load_tasks()
+
+        self.assertEqual(len(loaded_tasks), 1)
+        self.assertEqual(loaded_tasks[0].title, "Zadanie 2")
+
+        os.remove(file_manager.journal_path)
+
+    def test_load_tasks_lazy(self):
+        """Test leniwego wczytania zadań - obiekty powstają przy dostępie."""
+        self.task1.task_id = 7
+        self.file_manager.save_tasks(self.tasks)
+
+        loaded_tasks = self.file_manager.load_tasks_lazy()
+
+        self.assertEqual(len(loaded_tasks), 2)
+        self.assertEqual(loaded_tasks.loaded_count, 0)
+        self.assertEqual(loaded_tasks[1].title, self.task2.title)
+        self.assertEqual(loaded_tasks.loaded_count, 1)
+        self.assertEqual([task.to_string() for task in loaded_tasks],
+                         [task.to_string() for task in self.tasks])
+        self.file_manager.close()
+
+    def test_load_tasks_lazy_skips_invalid_lines(self):
+        """Test pomijania nieprawidłowych linii przy leniwym wczytaniu."""
+        with open(self.temp_file, "wb") as file:
+            file.write(b"Zadanie 1|Opis 1|pending\r\n")
+            file.write(b"Nieprawidlowe_dane\n")
+            file.write(b"\n")
+            file.write(b"Zadanie 3|Opis 3|invalid_status\n")
+            file.write(b"Zadanie 4|Opis 4|done|4\n")
+            file.write(b"Zadanie|bez|statusu|x\n")
+            file.write(b"Zadanie 5|Opis 5|unfinished")
+
+        with mock.patch("builtins.print") as mock_print:
+            loaded_tasks = self.file_manager.load_tasks_lazy()
+
+        self.assertEqual([task.title for task in loaded_tasks],
+                         ["Zadanie 1", "Zadanie 4", "Zadanie 5"])
+        self.assertEqual(loaded_tasks[1].task_id, 4)
+        self.assertEqual(mock_print.call_args_list, [
+            mock.call("Pominięto nieprawidłowe zadanie: Nieprawidłowy format zadania (linia 2)"),
+            mock.call("Pominięto nieprawidłowe zadanie: Nieprawidłowy status zadania (linia 4)"),
+            mock.call("Pominięto nieprawidłowe zadanie: Nieprawidłowy status zadania (linia 6)"),
+        ])
+        self.file_manager.close()
+
+    def test_load_tasks_lazy_empty_and_missing_file(self):
+        """Test leniwego wczytania pustego i nieistniejącego pliku."""
+        self.assertEqual(self.file_manager.load_tasks_lazy(), [])
+        os.remove(self.temp_file)
+        self.assertEqual(self.file_manager.load_tasks_lazy(), [])
+        self.assertTrue(os.path.exists(self.temp_file))
+
+    def test_save_tasks_over_lazily_loaded_file(self):
+        """Test nadpisania pliku, z którego wczytano leniwą listę zadań."""
+        self.file_manager.save_tasks(self.tasks)
+        loaded_tasks = self.file_manager.load_tasks_lazy()
+
+        self.assertTrue(self.file_manager.save_tasks(loaded_tasks[1:]))
+
+        self.assertEqual(loaded_tasks[0].title, self.task1.title)
+        self.assertEqual(len(self.file_manager.load_tasks()), 1)
+
+    def test_iter_tasks_streams_tasks(self):
+        """Test strumieniowego odczytu zadań generatorem."""
+        self.file_manager.save_tasks(self.tasks)
+
+        iterator = self.file_manager.iter_tasks()
+
+        self.assertNotIsInstance(iterator, list)
+        self.assertEqual(next(iterator).title, self.task1.title)
+        self.assertEqual([task.title for task in iterator], [self.task2.title])
+
+    def test_iter_tasks_skips_invalid_lines_with_report(self):
+        """Test pomijania nieprawidłowych linii z komunikatem przy odczycie strumieniowym."""
+        with open(self.temp_file, "w") as file:
+            file.write("Zadanie 1|Opis 1|pending\n")
+            file.write("Nieprawidłowe_dane\n")
+            file.write("Zadanie 2|Opis 2|done\n")
+
+        with mock.patch("builtins.print") as mock_print:
+            titles = [task.title for task in self.file_manager.iter_tasks()]
+
+        self.assertEqual(titles, ["Zadanie 1", "Zadanie 2"])
+        mock_print.assert_called_once()
+        self.assertIn("Pominięto nieprawidłowe zadanie", mock_print.call_args[0][0])
+
+    def test_iter_tasks_nonexistent_file(self):
+        """Test odczytu strumieniowego nieistniejącego pliku."""
+        os.remove(self.temp_file)
+        self.assertEqual(list(self.file_manager.iter_tasks()), [])
+        self.assertTrue(os.path.exists(self.temp_file))
+
+    def test_save_tasks_from_generator_over_same_file(self):
+        """Test filtrowania zadań i zapisu strumieniowego do tego samego pliku."""
+        self.file_manager.save_tasks(self.tasks)
+
+        done_tasks = (task for task in self.file_manager.iter_tasks()
+                      if task.status == TaskStatus.DONE)
+        result = self.file_manager.save_tasks(done_tasks)
+
+        self.assertTrue(result)
+        loaded_tasks = self.file_manager.load_tasks()
+        self.assertEqual([task.title for task in loaded_tasks], [self.task2.title])
+        self.assertFalse(os.path.exists(self.temp_file + ".tmp"))
+
+    def test_save_tasks_from_failing_generator(self):
+        """Test przerwanego zapisu strumieniowego - plik docelowy bez zmian."""
+        self.file_manager.save_tasks(self.tasks)
+
+        def failing_tasks():
+            yield self.task1
+            raise OSError("Błąd źródła danych")
+
+        result = self.file_manager.save_tasks(failing_tasks())
+
+        self.assertFalse(result)
+        self.assertEqual(len(self.file_manager.load_tasks()), 2)
+        self.assertFalse(os.path.exists(self.temp_file + ".tmp"))
+
+    def test_iter_tasks_with_journal(self):
+        """Test strumieniowego odczytu z nałożonym dziennikiem."""
+        file_manager = FileManager(self.temp_file, journal=True)
+        self.task1.task_id = 1
+        self.task2.task_id = 2
+        file_manager.save_tasks(self.tasks)
+        task3 = Task("Zadanie 3", task_id=3)
+        file_manager.apply_changes(self.tasks, [("add", task3), ("delete", self.task1)])
+        file_manager.apply_changes(self.tasks, [("delete", self.task2), ("add", self.task2)])
+
+        titles = [task.title for task in file_manager.iter_tasks()]
+
+        self.assertEqual(titles, ["Zadanie 3", "Zadanie 2"])
+        os.remove(file_manager.journal_path)
+
+    def test_atomic_save_keeps_previous_content_on_error(self):
+        """Test zapisu atomowego - błąd w trakcie zapisu nie niszczy pliku."""
+        file_manager = FileManager(self.temp_file, atomic=True)
+        file_manager.save_tasks(self.tasks)
+        broken_task = Task("Zadanie", "Opis", "invalid_status")
+
+        result = file_manager.save_tasks([self.task1, broken_task])
+
+        self.assertFalse(result)
+        self.assertEqual(len(file_manager.load_tasks()), 2)
+        self.assertFalse(os.path.exists(self.temp_file + ".tmp"))
+
+    def test_atomic_save_replaces_file(self):
+        """Test zapisu atomowego przez plik tymczasowy i podmianę."""
+        file_manager = FileManager(self.temp_file, atomic=True)
+
+        with mock.patch("src.file_manager.os.replace", wraps=os.replace) as mock_replace:
+            result = file_manager.save_tasks(self.tasks)
+
+        self.assertTrue(result)
+        mock_replace.assert_called_once_with(self.temp_file + ".tmp", self.temp_file)
+        self.assertEqual(len(file_manager.load_tasks()), 2)
+
+    def test_durability_levels_fsync_calls(self):
+        """Test liczby wywołań fsync dla poszczególnych poziomów trwałości."""
+        test_cases = [("none", 0), ("batch", 1), ("always", 3)]
+
+        for durability, expected_calls in test_cases:
+            with self.subTest(durability=durability):
+                file_manager = FileManager(self.temp_file, durability=durability,
+                                           sync_interval=2)
+                with mock.patch("src.file_manager.os.fsync") as mock_fsync:
+                    for _ in range(3):
+                        file_manager.save_tasks(self.tasks)
+                self.assertEqual(mock_fsync.call_count, expected_calls)
+
+    def test_sync_flushes_pending_batch(self):
+        """Test wymuszenia odłożonego fsync w trybie "batch"."""
+        file_manager = FileManager(self.temp_file, durability="batch", sync_interval=10)
+        file_manager.save_tasks(self.tasks)
+
+        with mock.patch("src.file_manager.os.fsync") as mock_fsync:
+            file_manager.sync()
+            file_manager.sync()
+
+        mock_fsync.assert_called_once()
+
+    def test_invalid_durability_level(self):
+        """Test nieznanego poziomu trwałości."""
+        with self.assertRaises(ValueError):
+            FileManager(self.temp_file, durability="sometimes")
+
+    def test_shared_detects_external_changes(self):
+        """Test wykrywania zmian zapisanych przez inny obiekt (proces)."""
+        first = FileManager(self.temp_file, journal=True, shared=True)
+        second = FileManager(self.temp_file, journal=True, shared=True)
+        self.task1.task_id = 1
+        self.task2.task_id = 2
+        first.save_tasks(self.tasks)
+        second.load_tasks()
+        self.assertFalse(second.has_external_changes())
+
+        self.task1.update_details(description="Nowy opis")
+        first.apply_changes(self.tasks, [("update", self.task1), ("delete", self.task2)])
+
+        self.assertTrue(second.has_external_changes())
+        self.assertFalse(first.has_external_changes())
+        changes = second.read_external_changes()
+        self.assertEqual([(operation, getattr(payload, "description", payload))
+                          for operation, payload in changes],
+                         [("update", "Nowy opis"), ("delete", 2)])
+        self.assertFalse(second.has_external_changes())
+        self.assertEqual(second.read_external_changes(), [])
+
+    def test_shared_snapshot_requires_reload(self):
+        """Test, czy zapis nowej migawki wymaga ponownego wczytania pliku."""
+        first = FileManager(self.temp_file, journal=True, shared=True)
+        second = FileManager(self.temp_file, journal=True, shared=True)
+        second.load_tasks()
+
+        first.save_tasks(self.tasks)
+
+        self.assertIsNone(second.read_external_changes())
+        self.assertEqual(len(second.load_tasks()), 2)
+        self.assertFalse(second.has_external_changes())
+
+    def test_shared_lock_excludes_other_writers(self):
+        """Test wzajemnego wykluczania zapisów przez blokadę międzyprocesową."""
+        first = FileManager(self.temp_file, shared=True)
+        second = FileManager(self.temp_file, shared=True)
+        acquired = threading.Event()
+
+        def save():
+            with second.lock():
+                acquired.set()
+
+        with first.lock():
+            with first.lock():
+                thread = threading.Thread(target=save)
+                thread.start()
+                self.assertFalse(acquired.wait(0.05))
+        self.assertTrue(acquired.wait(5))
+        thread.join()
+
+    def test_shared_save_keeps_mapped_file(self):
+        """Test, czy zapis pliku współdzielonego nie zmienia pliku zmapowanego wcześniej."""
+        first = FileManager(self.temp_file, shared=True)
+        second = FileManager(self.temp_file, shared=True)
+        first.save_tasks([Task(f"Zadanie {i}", task_id=i + 1) for i in range(1000)])
+        lazy_tasks = first.load_tasks_lazy()
+        inode = os.stat(self.temp_file).st_ino
+
+        second.save_tasks([Task("Zadanie", task_id=1)])
+
+        self.assertNotEqual(os.stat(self.temp_file).st_ino, inode)
+        self.assertEqual(lazy_tasks[-1].title, "Zadanie 999")
+        self.assertEqual(len(first.load_tasks_lazy()), 1)
+        first.close()
+
+    @unittest.skipIf(file_manager_module.fcntl is None, "brak modułu fcntl")
+    def test_shared_lazy_load_takes_read_lock(self):
+        """Test blokady współdzielonej przy leniwym wczytaniu pliku współdzielonego."""
+        file_manager = FileManager(self.temp_file, shared=True)
+        file_manager.save_tasks(self.tasks)
+        fcntl = file_manager_module.fcntl
+
+        with mock.patch.object(fcntl, "flock", wraps=fcntl.flock) as mock_flock:
+            file_manager.load_tasks_lazy()
+        file_manager.close()
+
+        self.assertIn(mock.call(file_manager._lock_fd, fcntl.LOCK_SH), mock_flock.call_args_list)
+
+    def test_not_shared_has_no_lock_file(self):
+        """Test, czy plik niewspółdzielony nie tworzy pliku blokady."""
+        self.file_manager.save_tasks(self.tasks)
+        with self.file_manager.lock():
+            pass
+        self.assertFalse(os.path.exists(self.temp_file + ".lock"))
+        self.assertFalse(self.file_manager.has_external_changes())
+
+    def test_metrics_for_save_and_load(self):
+        """Test pomiarów zapisu i odczytu zadań."""
+        metrics = MetricsRecorder()
+        file_manager = FileManager(self.temp_file, journal=True, metrics=metrics)
+
+        file_manager.save_tasks(self.tasks)
+        file_manager.apply_changes(self.tasks, [("update", self.task1)])
+        file_manager.load_tasks()
+
+        self.assertEqual(metrics.histogram("file.save_tasks").count, 1)
+        self.assertEqual(metrics.histogram("file.apply_changes").count, 1)
+        self.assertEqual(metrics.histogram("file.load_tasks").count, 1)
+        written = os.path.getsize(self.temp_file) + os.path.getsize(self.temp_file + ".journal")
+        self.assertEqual(metrics.counter("file.bytes_written"), written)
+        self.assertEqual(metrics.counter("file.tasks_loaded"), 2)
+
+    def test_metrics_for_skipped_records(self):
+        """Test zdarzeń dla pominiętych nieprawidłowych linii."""
+        metrics = MetricsRecorder()
+        file_manager = FileManager(self.temp_file, metrics=metrics)
+        with open(self.temp_file, "w") as file:
+            file.write("Zadanie 1|Opis 1|pending\n")
+            file.write("Nieprawidłowe_dane\n")
+            file.write("Zadanie 3|Opis 3|invalid_status\n")
+
+        with mock.patch("builtins.print"):
+            file_manager.load_tasks()
+            file_manager.load_tasks_lazy()
+        file_manager.close()
+
+        self.assertEqual(metrics.counter("file.skipped_records"), 4)
+        events = metrics.events("file.skipped_record")
+        self.assertEqual([event["line"] for event in events], [2, 3, 2, 3])
+        self.assertEqual(events[0]["path"], self.temp_file)
+        self.assertEqual([event["error"] for event in events[2:]],
+                         [event["error"] for event in events[:2]])
+
+    def _write_damaged_file(self):
+        """Zapisuje plik z prawidłowymi i nieprawidłowymi liniami."""
+        with open(self.temp_file, "w") as file:
+            file.write("Zadanie 1|Opis 1|pending\n")
+            file.write("Nieprawidłowe_dane\n")
+            file.write("\n")
+            file.write("Zadanie 3|Opis 3|invalid_status\n")
+            file.write("Zadanie 4|Opis 4|done|x\n")
+            file.write("Zadanie 5|Opis 5|done\n")
+
+    def test_collect_errors_builds_report(self):
+        """Test zbierania błędów wczytywania do raportu zamiast komunikatów."""
+        self._write_damaged_file()
+        file_manager = FileManager(self.temp_file, collect_errors=True)
+
+        with mock.patch("builtins.print") as mock_print:
+            tasks = file_manager.load_tasks()
+
+        mock_print.assert_not_called()
+        self.assertEqual([task.title for task in tasks], ["Zadanie 1", "Zadanie 5"])
+        report = file_manager.load_report
+        self.assertEqual((report.loaded, report.skipped), (2, 3))
+        self.assertEqual(report.reasons, {
+            "Nieprawidłowy format zadania": 1,
+            "Nieprawidłowy status zadania": 1,
+            "Nieprawidłowy identyfikator zadania": 1,
+        })
+        self.assertEqual([sample[0] for sample in report.samples], [2, 4, 5])
+        self.assertEqual(report.samples[0][2], "Nieprawidłowe_dane")
+
+    def test_collect_errors_limits_samples(self):
+        """Test ograniczenia liczby przykładowych linii w raporcie."""
+        with open(self.temp_file, "w") as file:
+            for i in range(50):
+                file.write(f"zła linia {i}\n")
+        file_manager = FileManager(self.temp_file, collect_errors=True, max_error_samples=3)
+
+        self.assertEqual(file_manager.load_tasks(), [])
+        self.assertEqual(file_manager.load_report.skipped, 50)
+        self.assertEqual([sample[0] for sample in file_manager.load_report.samples], [1, 2, 3])
+
+    def test_collect_errors_lazy_load(self):
+        """Test raportu błędów przy leniwym wczytaniu."""
+        self._write_damaged_file()
+        metrics = MetricsRecorder()
+        file_manager = FileManager(self.temp_file, collect_errors=True, metrics=metrics)
+
+        with mock.patch("builtins.print") as mock_print:
+            tasks = file_manager.load_tasks_lazy()
+
+        mock_print.assert_not_called()
+        self.assertEqual([task.title for task in tasks], ["Zadanie 1", "Zadanie 5"])
+        report = file_manager.load_report
+        self.assertEqual((report.loaded, report.skipped), (2, 3))
+        self.assertEqual([sample[:2] for sample in report.samples], [
+            (2, "Nieprawidłowy format zadania"),
+            (4, "Nieprawidłowy status zadania"),
+            (5, "Nieprawidłowy identyfikator zadania"),
+        ])
+        self.assertEqual(metrics.counter("file.skipped_records"), 3)
+        events = metrics.events("file.skipped_record")
+        self.assertEqual([event["line"] for event in events], [2, 4, 5])
+        file_manager.close()
+
+    def test_collect_errors_clean_file(self):
+        """Test raportu dla pliku bez błędów."""
+        file_manager = FileManager(self.temp_file, collect_errors=True)
+        file_manager.save_tasks(self.tasks)
+
+        file_manager.load_tasks()
+
+        self.assertTrue(file_manager.load_report.ok)
+        self.assertEqual(file_manager.load_report.loaded, 2)
+
+    def _load_with_prints(self, file_manager):
+        """Wczytuje zadania i zwraca je wraz z wypisanymi komunikatami."""
+        with mock.patch("builtins.print") as mock_print:
+            tasks = file_manager.load_tasks()
+        fields = [
+            (task.title, task.description, task.status, task.task_id, task.to_string())
+            for task in tasks
+        ]
+        return fields, mock_print.call_args_list
+
+    def test_parallel_load_matches_sequential(self):
+        """Test, czy równoległe wczytanie daje te same zadania i komunikaty co sekwencyjne."""
+        with open(self.temp_file, "wb") as file:
+            for i in range(40):
+                file.write(f"Zadanie {i}|Opis {i}|done|{i + 1}\r\n".encode())
+                if i % 7 == 0:
+                    file.write(b"Nieprawidlowe_dane\n\n")
+                if i % 11 == 0:
+                    file.write(b"Zadanie|Opis|invalid_status\n")
+            file.write("Zażółć|Opis|pending".encode(locale.getpreferredencoding(False)))
+
+        expected = self._load_with_prints(FileManager(self.temp_file))
+        with mock.patch("src.file_manager.PARALLEL_MIN_BYTES", 0):
+            result = self._load_with_prints(FileManager(self.temp_file, workers=3))
+
+        self.assertEqual(result, expected)
+        self.assertEqual(len(expected[0]), 41)
+        self.assertEqual(len(expected[1]), 10)
+
+    def test_parallel_load_collect_errors_and_journal(self):
+        """Test równoległego wczytania z raportem błędów i dziennikiem."""
+        file_manager = FileManager(self.temp_file, journal=True)
+        tasks = [Task(f"Zadanie {i}", "Opis", task_id=i + 1) for i in range(30)]
+        file_manager.save_tasks(tasks)
+        with open(self.temp_file, "a") as file:
+            file.write("Nieprawidlowe_dane\n")
+        tasks[3].update_details(title="Zmienione")
+        file_manager.apply_changes(tasks, [("update", tasks[3]), ("delete", tasks[0])])
+
+        loader = FileManager(
+            self.temp_file, journal=True, collect_errors=True, max_error_samples=1, workers=2
+        )
+        with mock.patch("src.file_manager.PARALLEL_MIN_BYTES", 0):
+            loaded = loader.load_tasks()
+
+        self.assertEqual(
+            [task.title for task in loaded[:3]], ["Zadanie 1", "Zadanie 2", "Zmienione"]
+        )
+        self.assertEqual(len(loaded), 29)
+        self.assertEqual((loader.load_report.loaded, loader.load_report.skipped), (29, 1))
+        self.assertEqual(
+            loader.load_report.samples,
+            [(31, "Nieprawidłowy format zadania", "Nieprawidlowe_dane")],
+        )
+
+    def test_parallel_load_falls_back_to_sequential(self):
+        """Test wczytania sekwencyjnego, gdy puli procesów nie można utworzyć."""
+        self.file_manager.save_tasks(self.tasks)
+        file_manager = FileManager(self.temp_file, workers=4)
+
+        pool_error = OSError("brak zasobów")
+        with mock.patch("src.file_manager.PARALLEL_MIN_BYTES", 0), \
+                mock.patch("src.file_manager.ProcessPoolExecutor", side_effect=pool_error), \
+                mock.patch("builtins.print") as mock_print:
+            loaded = file_manager.load_tasks()
+
+        self.assertEqual([task.title for task in loaded], ["Zadanie 1", "Zadanie 2"])
+        self.assertIn("wczytywanie sekwencyjne", mock_print.call_args[0][0])
+
+    def test_chunk_bounds_end_at_line_boundaries(self):
+        """Test podziału pliku na fragmenty kończące się na końcu linii."""
+        with open(self.temp_file, "wb") as file:
+            file.write(b"a|b|done\n" * 5 + b"ostatnia")
+
+        bounds = _chunk_bounds(self.temp_file, 4)
+
+        self.assertEqual(bounds[0][0], 0)
+        self.assertEqual(bounds[-1][1], os.path.getsize(self.temp_file))
+        self.assertEqual([start for start, _ in bounds[1:]], [end for _, end in bounds[:-1]])
+        self.assertTrue(all(start % 9 == 0 for start, _ in bounds))
+        self.assertEqual(_chunk_bounds(self.temp_file, 100)[:2], [(0, 9), (9, 18)])
+
+    def test_compressed_save_and_load(self):
+        """Test zapisu i odczytu skompresowanej migawki w każdym formacie."""
+        tasks = [Task(f"Zadanie {i}", "Powtarzający się opis", task_id=i + 1) for i in range(500)]
+        plain_size = None
+        for compression in [None, *COMPRESSION_FORMATS]:
+            with self.subTest(compression=compression):
+                file_manager = FileManager(self.temp_file, compression=compression)
+                self.assertTrue(file_manager.save_tasks(tasks))
+                self.assertEqual(_detect_compression(self.temp_file), compression)
+                plain_size = plain_size or os.path.getsize(self.temp_file)
+                self.assertLessEqual(os.path.getsize(self.temp_file), plain_size)
+
+                loaded = FileManager(self.temp_file).load_tasks()
+
+                self.assertEqual(
+                    [task.to_string() for task in loaded], [task.to_string() for task in tasks]
+                )
+
+    def test_compressed_file_detected_on_load(self):
+        """Test rozpoznania skompresowanego pliku bez podawania formatu."""
+        with gzip.open(self.temp_file, "wt") as file:
+            file.write("Zadanie 1|Opis 1|pending|1\n")
+            file.write("Nieprawidłowe_dane\n")
+            file.write("Zadanie 2|Opis 2|done|2\n")
+        metrics = MetricsRecorder()
+        file_manager = FileManager(self.temp_file, collect_errors=True, metrics=metrics)
+
+        lazy_tasks = file_manager.load_tasks_lazy()
+        streamed = [task.title for task in file_manager.iter_tasks()]
+
+        self.assertEqual([task.title for task in lazy_tasks], ["Zadanie 1", "Zadanie 2"])
+        self.assertEqual(streamed, ["Zadanie 1", "Zadanie 2"])
+        self.assertEqual(
+            file_manager.load_report.samples,
+            [(2, "Nieprawidłowy format zadania", "Nieprawidłowe_dane")],
+        )
+        self.assertEqual(metrics.histogram("file.load_tasks").count, 1)
+
+    def test_compressed_snapshot_with_journal(self):
+        """Test dziennika nakładanego na skompresowaną migawkę."""
+        file_manager = FileManager(
+            self.temp_file, journal=True, compression="gzip", durability="always"
+        )
+        self.task1.task_id, self.task2.task_id = 1, 2
+        file_manager.save_tasks(self.tasks)
+        self.task2.change_status(TaskStatus.PENDING)
+        file_manager.apply_changes(self.tasks, [("update", self.task2)])
+
+        with open(self.temp_file + ".journal") as file:
+            self.assertIn("Zadanie 2", file.read())
+        loaded = FileManager(self.temp_file, journal=True).load_tasks()
+
+        self.assertEqual(_detect_compression(self.temp_file), "gzip")
+        self.assertEqual(
+            [task.status for task in loaded], [TaskStatus.PENDING, TaskStatus.PENDING]
+        )
+
+    def test_compressed_bytes_written_and_atomic_save(self):
+        """Test licznika zapisanych bajtów po kompresji i zapisu atomowego."""
+        metrics = MetricsRecorder()
+        file_manager = FileManager(self.temp_file, atomic=True, compression="xz", metrics=metrics)
+
+        file_manager.save_tasks(self.tasks)
+
+        self.assertEqual(metrics.counter("file.bytes_written"), os.path.getsize(self.temp_file))
+        self.assertFalse(os.path.exists(self.temp_file + ".tmp"))
+        self.assertEqual(len(file_manager.load_tasks()), 2)
+
+    def test_plain_file_resembling_compression_signature(self):
+        """Test, czy zwykły plik podobny do sygnatury bz2 nie jest uznawany za skompresowany."""
+        with open(self.temp_file, "w") as file:
+            file.write("BZh9|Opis|pending\n")
+
+        self.assertIsNone(_detect_compression(self.temp_file))
+        self.assertEqual(self.file_manager.load_tasks()[0].title, "BZh9")
+
+    def test_unknown_compression(self):
+        """Test nieznanego formatu kompresji."""
+        with self.assertRaises(ValueError):
+            FileManager(self.temp_file, compression="rar")
+
+    def test_journal_readded_task_keeps_id_order(self):
+        """Test, czy ponownie dodane zadanie wraca na miejsce według identyfikatora."""
+        file_manager = FileManager(self.temp_file, journal=True)
+        tasks = [Task(f"Zadanie {i}", task_id=i) for i in range(1, 5)]
+        file_manager.save_tasks(tasks)
+        file_manager.apply_changes(tasks, [("delete", tasks[1])])
+        readded = [("add", Task("Zadanie 9", task_id=9)), ("add", tasks[1])]
+        file_manager.apply_changes(tasks, readded)
+
+        self.assertEqual([task.task_id for task in file_manager.load_tasks()], [1, 2, 3, 4, 9])
+        lazy_tasks = file_manager.load_tasks_lazy()
+        self.assertEqual([task.task_id for task in lazy_tasks], [1, 2, 3, 4, 9])
+        file_manager.close()
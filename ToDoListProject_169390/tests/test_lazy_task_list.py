@@ -0,0 +1,73 @@
+import unittest
+import unittest.mock
+from src.lazy_task_list import LazyTaskList
+from src.task import Task
+
+
+class TestLazyTaskList(unittest.TestCase):
+    """Klasa testowa dla klasy LazyTaskList."""
+
+    def setUp(self):
+        """Przygotowanie danych przed każdym testem."""
+        self.loader = unittest.mock.MagicMock(side_effect=lambda key: Task(f"Zadanie {key}"))
+        self.tasks = LazyTaskList(range(5), self.loader)
+
+    def test_len_does_not_load_tasks(self):
+        """Test, czy długość listy nie wymaga tworzenia zadań."""
+        self.assertEqual(len(self.tasks), 5)
+        self.loader.assert_not_called()
+
+    def test_getitem_loads_single_task_once(self):
+        """Test leniwego tworzenia pojedynczego zadania."""
+        task = self.tasks[3]
+
+        self.assertEqual(task.title, "Zadanie 3")
+        self.assertIs(self.tasks[3], task)
+        self.assertIs(self.tasks[-2], task)
+        self.loader.assert_called_once_with(3)
+        self.assertEqual(self.tasks.loaded_count, 1)
+
+    def test_iteration_and_slices(self):
+        """Test iteracji i wycinków listy."""
+        self.assertEqual([task.title for task in self.tasks[1:3]], ["Zadanie 1", "Zadanie 2"])
+        self.assertEqual(len(list(self.tasks)), 5)
+        self.assertEqual(self.loader.call_count, 5)
+
+    def test_mutations(self):
+        """Test modyfikacji listy jak zwykłej listy."""
+        new_task = Task("Nowe zadanie")
+        self.tasks.append(new_task)
+        del self.tasks[0]
+        self.tasks[0] = Task("Podmienione")
+
+        self.assertEqual(len(self.tasks), 5)
+        self.assertEqual(self.tasks[0].title, "Podmienione")
+        self.assertIs(self.tasks[-1], new_task)
+        self.assertEqual(self.tasks.index(new_task), 4)
+        self.loader.assert_not_called()
+
+    def test_equality_with_list(self):
+        """Test porównania z listą zadań."""
+        tasks = list(self.tasks)
+        self.assertEqual(self.tasks, tasks)
+        self.assertNotEqual(self.tasks, tasks[:-1])
+
+    def test_materialize(self):
+        """Test wczytania wszystkich zadań i odłączenia źródła."""
+        self.tasks.materialize()
+
+        self.assertEqual(self.tasks.loaded_count, 5)
+        self.assertEqual(self.tasks[4].title, "Zadanie 4")
+        self.assertEqual(self.loader.call_count, 5)
+
+    def test_copy_shares_loaded_tasks(self):
+        """Test kopii listy bez wczytywania zadań."""
+        task = self.tasks[0]
+
+        duplicate = self.tasks.copy()
+        del duplicate[1]
+
+        self.assertEqual(len(self.tasks), 5)
+        self.assertEqual(len(duplicate), 4)
+        self.assertIs(duplicate[0], task)
+        self.assertEqual(self.loader.call_count, 1)
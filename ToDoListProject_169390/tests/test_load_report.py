@@ -0,0 +1,67 @@
+import json
+import unittest
+from src.load_report import LoadReport
+
+
+class TestLoadReport(unittest.TestCase):
+    """Klasa testowa dla klasy LoadReport."""
+
+    def setUp(self):
+        """Przygotowanie danych przed każdym testem."""
+        self.report = LoadReport(max_samples=2)
+
+    def test_empty_report(self):
+        """Test raportu bez błędów."""
+        self.assertTrue(self.report.ok)
+        self.assertEqual(self.report.skipped, 0)
+        self.assertEqual(self.report.summary(), "Wczytano zadania: 0, pominięto nieprawidłowe: 0")
+
+    def test_add_counts_reasons_and_bounds_samples(self):
+        """Test zliczania powodów i ograniczenia liczby przykładów."""
+        self.report.add(2, "Nieprawidłowy format zadania", "abc\n")
+        self.report.add(5, "Nieprawidłowy status zadania", "a|b|c\r\n")
+        self.report.add(9, "Nieprawidłowy format zadania", "def\n")
+
+        self.assertFalse(self.report.ok)
+        self.assertEqual(self.report.skipped, 3)
+        self.assertEqual(
+            self.report.reasons,
+            {"Nieprawidłowy format zadania": 2, "Nieprawidłowy status zadania": 1},
+        )
+        self.assertEqual(
+            self.report.samples,
+            [
+                (2, "Nieprawidłowy format zadania", "abc"),
+                (5, "Nieprawidłowy status zadania", "a|b|c"),
+            ],
+        )
+
+    def test_summary_and_to_dict(self):
+        """Test podsumowania i eksportu raportu."""
+        self.report.loaded = 10
+        self.report.add(3, "Nieprawidłowy format zadania", "abc")
+
+        self.assertEqual(
+            self.report.summary(),
+            "Wczytano zadania: 10, pominięto nieprawidłowe: 1 (Nieprawidłowy format zadania: 1)",
+        )
+        data = json.loads(json.dumps(self.report.to_dict()))
+        self.assertEqual(data["loaded"], 10)
+        self.assertEqual(
+            data["samples"], [{"line": 3, "reason": "Nieprawidłowy format zadania", "text": "abc"}]
+        )
+        self.assertEqual(repr(self.report), "LoadReport(loaded=10, skipped=1)")
+
+    def test_merge_offsets_line_numbers(self):
+        """Test łączenia raportów fragmentów pliku."""
+        chunk = LoadReport(max_samples=None)
+        chunk.loaded = 4
+        chunk.add(1, "Nieprawidłowy format zadania", "abc")
+        chunk.add(3, "Nieprawidłowy status zadania", "a|b|c")
+        self.report.add(2, "Nieprawidłowy format zadania", "def")
+
+        self.report.merge(chunk, line_offset=10)
+
+        self.assertEqual((self.report.loaded, self.report.skipped), (4, 3))
+        self.assertEqual(self.report.reasons["Nieprawidłowy format zadania"], 2)
+        self.assertEqual([sample[0] for sample in self.report.samples], [2, 11])
@@ -0,0 +1,98 @@
+import json
+import unittest
+from src.metrics import NULL_METRICS, Histogram, Metrics, MetricsRecorder, timed
+
+
+class _Timed:
+    """Klasa z metodą mierzoną dekoratorem timed."""
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+
+    @timed("test.operation")
+    def operation(self, value):
+        """Zwraca podaną wartość."""
+        return value
+
+
+class TestMetrics(unittest.TestCase):
+    """Klasa testowa dla modułu metrics."""
+
+    def setUp(self):
+        """Przygotowanie danych przed każdym testem."""
+        self.metrics = MetricsRecorder(max_events=2)
+
+    def test_null_metrics(self):
+        """Test, czy domyślny obiekt pomiarów niczego nie zapisuje."""
+        with NULL_METRICS.timer("test.operation"):
+            pass
+        NULL_METRICS.observe("test.operation", 1.0)
+        NULL_METRICS.increment("test.counter")
+        NULL_METRICS.event("test.event", value=1)
+        self.assertIsInstance(NULL_METRICS, Metrics)
+
+    def test_counters(self):
+        """Test zliczania."""
+        self.metrics.increment("test.counter")
+        self.metrics.increment("test.counter", 5)
+        self.assertEqual(self.metrics.counter("test.counter"), 6)
+        self.assertEqual(self.metrics.counter("test.other"), 0)
+
+    def test_timer(self):
+        """Test pomiaru czasu bloku."""
+        with self.metrics.timer("test.operation"):
+            pass
+        with self.assertRaises(RuntimeError):
+            with self.metrics.timer("test.operation"):
+                raise RuntimeError("Błąd")
+
+        histogram = self.metrics.histogram("test.operation")
+        self.assertEqual(histogram.count, 2)
+        self.assertGreaterEqual(histogram.minimum, 0)
+        self.assertIsNone(self.metrics.histogram("test.other"))
+
+    def test_events_are_bounded(self):
+        """Test przechowywania ograniczonej liczby ostatnich zdarzeń."""
+        for line in range(3):
+            self.metrics.event("test.skipped", line=line)
+        self.metrics.event("test.other")
+
+        self.assertEqual([event["line"] for event in self.metrics.events("test.skipped")], [2])
+        self.assertEqual(len(self.metrics.events()), 2)
+
+    def test_snapshot_and_reset(self):
+        """Test eksportu pomiarów i ich usunięcia."""
+        self.metrics.increment("test.counter")
+        self.metrics.observe("test.operation", 0.001)
+        self.metrics.event("test.event", path="plik.txt")
+
+        snapshot = json.loads(json.dumps(self.metrics.snapshot()))
+        self.assertEqual(snapshot["counters"], {"test.counter": 1})
+        self.assertEqual(snapshot["histograms"]["test.operation"]["count"], 1)
+        self.assertEqual(snapshot["events"][0]["path"], "plik.txt")
+
+        self.metrics.reset()
+        self.assertEqual(self.metrics.snapshot(), {"counters": {}, "histograms": {}, "events": []})
+
+    def test_histogram_percentiles(self):
+        """Test szacowania percentyli histogramu."""
+        histogram = Histogram()
+        self.assertIsNone(histogram.percentile(0.5))
+        for _ in range(98):
+            histogram.record(0.00001)
+        histogram.record(0.5)
+        histogram.record(1000.0)
+
+        self.assertLessEqual(histogram.percentile(0.5), 0.00002)
+        self.assertGreaterEqual(histogram.percentile(0.5), 0.00001)
+        self.assertGreaterEqual(histogram.percentile(0.99), 0.5)
+        self.assertEqual(histogram.percentile(1.0), 1000.0)
+        self.assertEqual(histogram.maximum, 1000.0)
+        self.assertIn("inf", histogram.to_dict()["buckets"])
+
+    def test_timed_decorator(self):
+        """Test dekoratora mierzącego czas metody."""
+        self.assertEqual(_Timed(self.metrics).operation(1), 1)
+        self.assertEqual(_Timed(NULL_METRICS).operation(2), 2)
+        self.assertEqual(self.metrics.histogram("test.operation").count, 1)
+        self.assertEqual(_Timed.operation.__doc__, "Zwraca podaną wartość.")
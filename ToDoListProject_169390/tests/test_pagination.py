@@ -0,0 +1,48 @@
+import unittest
+from src.pagination import TaskPage, decode_cursor, encode_cursor, sort_key
+from src.task import Task
+from src.todo_status import TaskStatus
+
+
+class TestPagination(unittest.TestCase):
+    """Klasa testowa dla modułu pagination."""
+
+    def test_cursor_round_trip(self):
+        """Test zakodowania i odczytania kursora."""
+        query = ["title", False, "done"]
+        cursor = encode_cursor(query, ("żółć", 7))
+        self.assertIsInstance(cursor, str)
+        self.assertEqual(decode_cursor(cursor, query), ("żółć", 7))
+
+    def test_cursor_from_other_query(self):
+        """Test odrzucenia kursora z innego zapytania."""
+        cursor = encode_cursor(["task_id", False, None], (7,))
+        with self.assertRaises(ValueError):
+            decode_cursor(cursor, ["task_id", True, None])
+
+    def test_invalid_cursor(self):
+        """Test odrzucenia nieprawidłowego kursora."""
+        for cursor in ("nie-kursor", "", "e30=", 123):
+            with self.assertRaises(ValueError):
+                decode_cursor(cursor, ["task_id", False, None])
+
+    def test_sort_key(self):
+        """Test kluczy sortowania zadań."""
+        task1 = Task("b", status=TaskStatus.DONE, task_id=1)
+        task2 = Task("A", task_id=2)
+        task3 = Task("a", task_id=3)
+        tasks = [task3, task1, task2]
+
+        self.assertEqual(sorted(tasks, key=sort_key("task_id")), [task1, task2, task3])
+        self.assertEqual(sorted(tasks, key=sort_key("title")), [task2, task3, task1])
+        self.assertEqual(sorted(tasks, key=sort_key("status")), [task1, task2, task3])
+        with self.assertRaises(ValueError):
+            sort_key("description")
+
+    def test_task_page(self):
+        """Test strony zadań."""
+        task = Task("Zadanie")
+        page = TaskPage([task], None, 1)
+        self.assertEqual(list(page), [task])
+        self.assertEqual(len(page), 1)
+        self.assertIn("total=1", repr(page))
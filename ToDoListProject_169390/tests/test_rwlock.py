@@ -0,0 +1,110 @@
+import threading
+import unittest
+from src.rwlock import ReadWriteLock
+
+
+class TestReadWriteLock(unittest.TestCase):
+    """Klasa testowa dla klasy ReadWriteLock."""
+
+    def setUp(self):
+        """Przygotowanie danych przed każdym testem."""
+        self.lock = ReadWriteLock()
+
+    def run_in_thread(self, target):
+        """Uruchamia funkcję w osobnym wątku i zwraca wątek."""
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        return thread
+
+    def test_readers_do_not_block_each_other(self):
+        """Test jednoczesnego trzymania blokady przez wielu czytelników."""
+        inside = threading.Barrier(3, timeout=5)
+
+        def read():
+            with self.lock.reader:
+                inside.wait()
+
+        threads = [self.run_in_thread(read) for _ in range(2)]
+        inside.wait()
+        for thread in threads:
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+
+    def test_writer_waits_for_readers(self):
+        """Test, czy pisarz czeka na zwolnienie blokady przez czytelnika."""
+        acquired = threading.Event()
+
+        def write():
+            with self.lock.writer:
+                acquired.set()
+
+        with self.lock.reader:
+            thread = self.run_in_thread(write)
+            self.assertFalse(acquired.wait(0.05))
+        self.assertTrue(acquired.wait(5))
+        thread.join(5)
+
+    def test_waiting_writer_blocks_new_readers(self):
+        """Test pierwszeństwa oczekującego pisarza przed nowymi czytelnikami."""
+        order = []
+        self.lock.acquire_read()
+
+        def write():
+            with self.lock.writer:
+                order.append("writer")
+
+        def read():
+            with self.lock.reader:
+                order.append("reader")
+
+        writer = self.run_in_thread(write)
+        while not self.lock._waiting_writers:
+            threading.Event().wait(0.001)
+        reader = self.run_in_thread(read)
+        self.assertFalse(threading.Event().wait(0.05))
+        self.assertEqual(order, [])
+        self.lock.release_read()
+        writer.join(5)
+        reader.join(5)
+
+        self.assertEqual(order, ["writer", "reader"])
+
+    def test_lock_is_reentrant(self):
+        """Test ponownego zajęcia blokady przez ten sam wątek."""
+        with self.lock.writer:
+            with self.lock.writer:
+                with self.lock.reader:
+                    pass
+            self.assertEqual(self.lock._writer, threading.get_ident())
+        with self.lock.reader:
+            with self.lock.reader:
+                pass
+        self.assertIsNone(self.lock._writer)
+        self.assertEqual(self.lock._readers, {})
+
+    def test_held(self):
+        """Test sprawdzania, czy bieżący wątek trzyma blokadę."""
+        self.assertFalse(self.lock.held())
+        with self.lock.reader:
+            self.assertTrue(self.lock.held())
+        with self.lock.writer:
+            self.assertTrue(self.lock.held())
+            thread_result = []
+            thread = threading.Thread(target=lambda: thread_result.append(self.lock.held()))
+            thread.start()
+            thread.join()
+            self.assertEqual(thread_result, [False])
+        self.assertFalse(self.lock.held())
+
+    def test_upgrade_is_not_allowed(self):
+        """Test zamiany blokady odczytu na blokadę zapisu."""
+        with self.lock.reader:
+            with self.assertRaises(RuntimeError):
+                self.lock.acquire_write()
+
+    def test_release_without_acquire(self):
+        """Test zwolnienia niezajętej blokady."""
+        with self.assertRaises(RuntimeError):
+            self.lock.release_read()
+        with self.assertRaises(RuntimeError):
+            self.lock.release_write()
@@ -0,0 +1,92 @@
+import unittest
+from src.search_index import SearchIndex, normalize_text, tokenize
+from src.task import Task
+from src.todo_status import TaskStatus
+
+
+class TestSearchIndex(unittest.TestCase):
+    """Klasa testowa dla klasy SearchIndex."""
+
+    def setUp(self):
+        """Przygotowanie danych przed każdym testem."""
+        self.task1 = Task("Zakupy", "Mleko i chleb", task_id=1)
+        self.task2 = Task("Raport kwartalny", "Wysłać do Łodzi", TaskStatus.DONE, task_id=2)
+        self.task3 = Task("Zakład pracy", "Żółć w raporcie", task_id=3)
+        self.index = SearchIndex([self.task3, self.task1, self.task2])
+
+    def test_normalize_text(self):
+        """Test normalizacji wielkości liter i polskich znaków."""
+        self.assertEqual(normalize_text("Zażółć GĘŚLĄ jaźń"), "zazolc gesla jazn")
+        self.assertEqual(normalize_text("Łódź"), "lodz")
+        self.assertEqual(normalize_text("Café"), "cafe")
+
+    def test_tokenize(self):
+        """Test podziału tekstu na słowa."""
+        self.assertEqual(tokenize("Mleko, chleb; Żółć!"), ["mleko", "chleb", "zolc"])
+        self.assertEqual(tokenize("  "), [])
+
+    def test_search_by_word(self):
+        """Test wyszukiwania po słowie z tytułu i opisu."""
+        self.assertEqual(self.index.search("mleko"), [self.task1])
+        self.assertEqual(self.index.search("RAPORT"), [self.task2])
+
+    def test_search_ignores_diacritics(self):
+        """Test wyszukiwania bez względu na znaki diakrytyczne."""
+        self.assertEqual(self.index.search("zolc"), [self.task3])
+        self.assertEqual(self.index.search("Łodzi"), [self.task2])
+        self.assertEqual(self.index.search("lodzi"), [self.task2])
+
+    def test_search_requires_all_words(self):
+        """Test wyszukiwania zadań zawierających wszystkie słowa zapytania."""
+        self.assertEqual(self.index.search("zakupy chleb"), [self.task1])
+        self.assertEqual(self.index.search("zakupy raport"), [])
+
+    def test_search_by_prefix(self):
+        """Test wyszukiwania po prefiksie słowa."""
+        self.assertEqual(self.index.search("zak", prefix=True), [self.task1, self.task3])
+        self.assertEqual(self.index.search("rap", prefix=True), [self.task2, self.task3])
+        self.assertEqual(self.index.search("zak"), [])
+
+    def test_search_with_status_filter(self):
+        """Test zawężenia wyników do podanych statusów."""
+        done = self.index.search("rap", statuses={TaskStatus.DONE}, prefix=True)
+        pending = self.index.search("rap", statuses={TaskStatus.PENDING}, prefix=True)
+        self.assertEqual(done, [self.task2])
+        self.assertEqual(pending, [self.task3])
+        self.assertEqual(self.index.search("rap", statuses=set(), prefix=True), [])
+
+    def test_search_with_limit(self):
+        """Test ograniczenia liczby wyników."""
+        self.assertEqual(self.index.search("zak", prefix=True, limit=1), [self.task1])
+
+    def test_search_empty_query(self):
+        """Test wyszukiwania pustym zapytaniem."""
+        self.assertEqual(self.index.search(""), [])
+        self.assertEqual(self.index.search("!?"), [])
+
+    def test_add_and_remove(self):
+        """Test dodawania i usuwania zadań z indeksu."""
+        task4 = Task("Mleko", task_id=4)
+        self.index.add(task4)
+        self.assertEqual(self.index.search("mleko"), [self.task1, task4])
+
+        self.index.remove(self.task1)
+        self.assertEqual(self.index.search("mleko"), [task4])
+        self.assertEqual(self.index.search("chleb"), [])
+        self.assertEqual(self.index.search("chl", prefix=True), [])
+
+    def test_update_after_edit(self):
+        """Test aktualizacji indeksu po zmianie tytułu zadania."""
+        old_title, old_description = self.task1.title, self.task1.description
+        self.task1.update_details(title="Spotkanie")
+        self.index.update(self.task1, old_title, old_description)
+
+        self.assertEqual(self.index.search("zakupy"), [])
+        self.assertEqual(self.index.search("spotkanie"), [self.task1])
+        self.assertEqual(self.index.search("mleko"), [self.task1])
+
+    def test_rebuild(self):
+        """Test przebudowy indeksu."""
+        self.index.rebuild([self.task1])
+        self.assertEqual(self.index.search("raport"), [])
+        self.assertEqual(self.index.search("zak", prefix=True), [self.task1])
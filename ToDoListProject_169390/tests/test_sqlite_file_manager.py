@@ -0,0 +1,144 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from src.sqlite_file_manager import SqliteFileManager
+from src.task import Task
+from src.todo_manager import TodoManager
+from src.todo_status import TaskStatus
+
+
+class TestSqliteFileManager(unittest.TestCase):
+    """Klasa testowa dla klasy SqliteFileManager."""
+
+    def setUp(self):
+        """Przygotowanie danych przed każdym testem."""
+
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False).name
+        self.file_manager = SqliteFileManager(self.temp_file)
+
+        self.task1 = Task("Zadanie 1", "Opis 1", task_id=1)
+        self.task2 = Task("Zadanie 2", "Opis | 2", TaskStatus.DONE, task_id=2)
+        self.tasks = [self.task1, self.task2]
+
+    def tearDown(self):
+        """Sprzątanie po testach."""
+
+        self.file_manager.close()
+        for path in (self.temp_file, self.temp_file + "-wal", self.temp_file + "-shm"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def assertTasksEqual(self, loaded, expected):
+        """Porównuje zadania pole po polu."""
+        self.assertEqual(
+            [(task.task_id, task.title, task.description, task.status) for task in loaded],
+            [(task.task_id, task.title, task.description, task.status) for task in expected],
+        )
+
+    def test_load_tasks_empty_database(self):
+        """Test wczytania zadań z nowej bazy."""
+        self.assertEqual(self.file_manager.load_tasks(), [])
+
+    def test_save_and_load_tasks(self):
+        """Test zapisania i wczytania zadań."""
+        self.assertTrue(self.file_manager.save_tasks(self.tasks))
+        self.assertTasksEqual(SqliteFileManager(self.temp_file).load_tasks(), self.tasks)
+
+    def test_save_tasks_replaces_content(self):
+        """Test, czy zapis całej listy zastępuje poprzednią zawartość."""
+        self.file_manager.save_tasks(self.tasks)
+        self.file_manager.save_tasks([self.task2])
+        self.assertTasksEqual(self.file_manager.load_tasks(), [self.task2])
+
+    def test_save_tasks_assigns_missing_ids(self):
+        """Test nadania identyfikatorów zadaniom bez identyfikatora."""
+        task = Task("Zadanie 3")
+        self.file_manager.save_tasks([self.task2, task])
+        self.assertEqual(task.task_id, 3)
+        self.assertTasksEqual(self.file_manager.load_tasks(), [self.task2, task])
+
+    def test_apply_changes(self):
+        """Test zapisu pojedynczych zmian."""
+        self.file_manager.save_tasks(self.tasks)
+        task3 = Task("Zadanie 3", task_id=3)
+        self.task1.change_status(TaskStatus.UNFINISHED)
+        changes = [("add", task3), ("update", self.task1), ("delete", self.task2)]
+
+        self.assertTrue(self.file_manager.apply_changes([self.task1, task3], changes))
+        self.assertTasksEqual(self.file_manager.load_tasks(), [self.task1, task3])
+
+    def test_apply_changes_is_atomic(self):
+        """Test wycofania wszystkich zmian, gdy jedna z nich się nie powiedzie."""
+        self.file_manager.save_tasks(self.tasks)
+        invalid = Task(None, task_id=3)
+        self.task1.update_details(title="Zmienione")
+
+        result = self.file_manager.apply_changes([], [("update", self.task1), ("add", invalid)])
+
+        self.assertFalse(result)
+        self.assertEqual(self.file_manager.load_tasks()[0].title, "Zadanie 1")
+
+    def test_tasks_by_status(self):
+        """Test wczytywania i zliczania zadań o podanym statusie."""
+        self.file_manager.save_tasks(self.tasks)
+        done_tasks = self.file_manager.load_tasks_by_status(TaskStatus.DONE)
+        self.assertTasksEqual(done_tasks, [self.task2])
+        self.assertEqual(self.file_manager.count_tasks_by_status(TaskStatus.PENDING), 1)
+        self.assertEqual(self.file_manager.count_tasks_by_status(TaskStatus.UNFINISHED), 0)
+
+    def test_status_query_uses_index(self):
+        """Test, czy zapytanie o status korzysta z indeksu."""
+        connection = sqlite3.connect(self.temp_file)
+        self.file_manager.load_tasks()
+        plan = connection.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM tasks WHERE status = ? ORDER BY id", ("done",)
+        ).fetchall()
+        connection.close()
+        self.assertIn("tasks_status", " ".join(str(row) for row in plan))
+
+    def test_wal_mode(self):
+        """Test, czy baza działa w trybie WAL."""
+        self.file_manager.load_tasks()
+        connection = sqlite3.connect(self.temp_file)
+        mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+        connection.close()
+        self.assertEqual(mode, "wal")
+
+    def test_invalid_status_is_skipped(self):
+        """Test pominięcia wiersza z nieznanym statusem."""
+        self.file_manager.save_tasks(self.tasks)
+        connection = sqlite3.connect(self.temp_file)
+        with connection:
+            connection.execute("UPDATE tasks SET status = 'nieznany' WHERE id = 1")
+        connection.close()
+
+        self.assertTasksEqual(self.file_manager.load_tasks(), [self.task2])
+
+    def test_reopen_after_close(self):
+        """Test użycia magazynu po zamknięciu połączenia."""
+        self.file_manager.save_tasks(self.tasks)
+        self.file_manager.sync()
+        self.file_manager.close()
+        self.assertTasksEqual(self.file_manager.load_tasks(), self.tasks)
+
+    def test_invalid_durability(self):
+        """Test odrzucenia nieznanego poziomu trwałości."""
+        with self.assertRaises(ValueError):
+            SqliteFileManager(self.temp_file, durability="czasami")
+
+    def test_todo_manager_with_sqlite(self):
+        """Test pracy TodoManager z magazynem SQLite."""
+        manager = TodoManager(file_manager=self.file_manager)
+        manager.add_task("Zadanie 1")
+        task = manager.add_task("Zadanie 2", "Opis")
+        manager.change_task_status_by_id(task.task_id, TaskStatus.DONE)
+        manager.edit_task(0, title="Zmienione")
+        manager.delete_task(0)
+        manager.add_task("Zadanie 3")
+
+        reloaded = TodoManager(file_manager=SqliteFileManager(self.temp_file))
+        self.assertEqual([task.title for task in reloaded.get_tasks()], ["Zadanie 2", "Zadanie 3"])
+        self.assertEqual(reloaded.get_tasks()[1].task_id, 3)
+        self.assertEqual(reloaded.count_tasks_by_status(TaskStatus.DONE), 1)
+        reloaded.close()
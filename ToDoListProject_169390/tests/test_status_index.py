@@ -0,0 +1,68 @@
+import unittest
+from src.status_index import StatusIndex
+from src.task import Task
+from src.todo_status import TaskStatus
+
+
+class TestStatusIndex(unittest.TestCase):
+    """Klasa testowa dla klasy StatusIndex."""
+
+    def setUp(self):
+        """Przygotowanie danych przed każdym testem."""
+        self.task1 = Task("Zadanie 1")
+        self.task2 = Task("Zadanie 2", status=TaskStatus.DONE)
+        self.task3 = Task("Zadanie 3")
+        self.index = StatusIndex([self.task1, self.task2, self.task3])
+
+    def test_get_returns_tasks_with_status(self):
+        """Test pobrania zadań o podanym statusie."""
+        self.assertEqual(self.index.get(TaskStatus.PENDING), [self.task1, self.task3])
+        self.assertEqual(self.index.get(TaskStatus.DONE), [self.task2])
+        self.assertEqual(self.index.get(TaskStatus.UNFINISHED), [])
+
+    def test_count(self):
+        """Test zliczania zadań o podanym statusie."""
+        self.assertEqual(self.index.count(TaskStatus.PENDING), 2)
+        self.assertEqual(self.index.count(TaskStatus.DONE), 1)
+        self.assertEqual(self.index.count(TaskStatus.UNFINISHED), 0)
+
+    def test_add_and_remove(self):
+        """Test dodawania i usuwania zadań z indeksu."""
+        task4 = Task("Zadanie 4", status=TaskStatus.UNFINISHED)
+        self.index.add(task4)
+        self.assertEqual(self.index.get(TaskStatus.UNFINISHED), [task4])
+
+        self.index.remove(self.task1)
+        self.assertEqual(self.index.get(TaskStatus.PENDING), [self.task3])
+
+    def test_move(self):
+        """Test przeniesienia zadania po zmianie statusu."""
+        self.task1.status = TaskStatus.DONE
+        self.index.move(self.task1, TaskStatus.PENDING)
+
+        self.assertEqual(self.index.get(TaskStatus.PENDING), [self.task3])
+        self.assertEqual(self.index.get(TaskStatus.DONE), [self.task2, self.task1])
+
+    def test_invalid_status_is_ignored(self):
+        """Test pomijania zadań o nieprawidłowym statusie."""
+        self.index.add(Task("Zadanie", status="invalid_status"))
+        self.assertEqual(self.index.get("invalid_status"), [])
+        self.assertEqual(self.index.count("invalid_status"), 0)
+
+    def test_rebuild(self):
+        """Test przebudowy indeksu."""
+        self.index.rebuild([self.task2])
+        self.assertEqual(self.index.count(TaskStatus.PENDING), 0)
+        self.assertEqual(self.index.get(TaskStatus.DONE), [self.task2])
+
+    def test_key_keeps_list_order(self):
+        """Test kolejności zadań według klucza po powrocie do poprzedniego statusu."""
+        tasks = [Task(f"Zadanie {i}", task_id=i) for i in range(1, 4)]
+        index = StatusIndex(tasks, key=lambda task: task.task_id)
+        for status in (TaskStatus.DONE, TaskStatus.PENDING):
+            old_status = tasks[0].status
+            tasks[0].status = status
+            index.move(tasks[0], old_status)
+
+        self.assertEqual(index.get(TaskStatus.PENDING), tasks)
+        self.assertEqual(index.get(TaskStatus.PENDING), tasks)
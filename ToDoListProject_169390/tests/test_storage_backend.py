@@ -0,0 +1,49 @@
+import unittest
+from src.file_manager import FileManager
+from src.storage_backend import StorageBackend
+from src.task import Task
+
+
+class _MemoryBackend(StorageBackend):
+    """Magazyn w pamięci implementujący tylko wymagane metody."""
+
+    def __init__(self):
+        self.saved = []
+
+    def load_tasks(self):
+        return list(self.saved)
+
+    def save_tasks(self, tasks):
+        self.saved = list(tasks)
+        return True
+
+
+class TestStorageBackend(unittest.TestCase):
+    """Klasa testowa dla klasy StorageBackend."""
+
+    def test_required_methods(self):
+        """Test, czy load_tasks i save_tasks wymagają implementacji."""
+        backend = StorageBackend()
+        with self.assertRaises(NotImplementedError):
+            backend.load_tasks()
+        with self.assertRaises(NotImplementedError):
+            backend.save_tasks([])
+
+    def test_default_methods(self):
+        """Test domyślnych implementacji pozostałych metod."""
+        backend = _MemoryBackend()
+        task = Task("Zadanie 1")
+
+        self.assertTrue(backend.apply_changes([task], [("add", task)]))
+        self.assertEqual(backend.saved, [task])
+        self.assertEqual(backend.load_tasks_lazy(), [task])
+        self.assertFalse(backend.shared)
+        self.assertFalse(backend.has_external_changes())
+        self.assertIsNone(backend.read_external_changes())
+        with backend.lock():
+            backend.sync()
+            backend.close()
+
+    def test_file_manager_is_backend(self):
+        """Test, czy FileManager jest magazynem zadań."""
+        self.assertTrue(issubclass(FileManager, StorageBackend))
@@ -1,218 +1,324 @@
-import unittest
-import unittest.mock
-from src.task import Task
-from src.todo_status import TaskStatus
-
-
-class TestTask(unittest.TestCase):
-    """Klasa testowa dla klasy Task."""
-
-    def setUp(self):
-        """Przygotowanie danych przed każdym testem."""
-        self.title = "Przykładowe zadanie"
-        self.description = "Opis przykładowego zadania"
-        self.task = Task(self.title, self.description)
-
-    def test_task_initialization(self):
-        """Test poprawnej inicjalizacji zadania."""
-        self.assertEqual(self.task.title, self.title)
-        self.assertEqual(self.task.description, self.description)
-        self.assertEqual(self.task.status, TaskStatus.PENDING)
-
-    def test_task_initialization_with_status(self):
-        """Test inicjalizacji zadania z określonym statusem."""
-        task = Task(self.title, self.description, TaskStatus.DONE)
-        self.assertEqual(task.status, TaskStatus.DONE)
-
-    def test_change_status_valid(self):
-        """Test zmiany statusu na prawidłowy."""
-        result = self.task.change_status(TaskStatus.DONE)
-        self.assertTrue(result)
-        self.assertEqual(self.task.status, TaskStatus.DONE)
-
-    def test_change_status_invalid(self):
-        """Test zmiany statusu na nieprawidłowy."""
-        initial_status = self.task.status
-        result = self.task.change_status("nieistniejący_status")
-        self.assertFalse(result)
-        self.assertEqual(self.task.status, initial_status)
-
-    def test_update_details_title_only(self):
-        """Test aktualizacji tylko tytułu zadania."""
-        new_title = "Nowy tytuł"
-        self.task.update_details(title=new_title)
-        self.assertEqual(self.task.title, new_title)
-        self.assertEqual(self.task.description, self.description)
-
-    def test_update_details_description_only(self):
-        """Test aktualizacji tylko opisu zadania."""
-        new_description = "Nowy opis"
-        self.task.update_details(description=new_description)
-        self.assertEqual(self.task.title, self.title)
-        self.assertEqual(self.task.description, new_description)
-
-    def test_update_details_both(self):
-        """Test aktualizacji zarówno tytułu jak i opisu zadania."""
-        new_title = "Nowy tytuł"
-        new_description = "Nowy opis"
-        self.task.update_details(new_title, new_description)
-        self.assertEqual(self.task.title, new_title)
-        self.assertEqual(self.task.description, new_description)
-
-    def test_to_string(self):
-        """Test konwersji zadania do formatu string."""
-        expected = f"{self.title}|{self.description}|pending"
-        self.assertEqual(self.task.to_string(), expected)
-
-    def test_from_string_valid(self):
-        """Test tworzenia zadania z prawidłowego formatu string."""
-        task_string = "Tytuł|Opis|done"
-        task = Task.from_string(task_string)
-        self.assertEqual(task.title, "Tytuł")
-        self.assertEqual(task.description, "Opis")
-        self.assertEqual(task.status, TaskStatus.DONE)
-
-    def test_from_string_invalid_format(self):
-        """Test tworzenia zadania z nieprawidłowego formatu string (za mało elementów)."""
-        task_string = "Tytuł|Opis"
-        with self.assertRaises(ValueError):
-            Task.from_string(task_string)
-
-    def test_from_string_invalid_format_too_many(self):
-        """Test tworzenia zadania z nieprawidłowego formatu string (za dużo elementów)."""
-        task_string = "Tytuł|Opis|done|extra"
-        with self.assertRaises(ValueError):
-            Task.from_string(task_string)
-
-    def test_from_string_invalid_status(self):
-        """Test tworzenia zadania z nieprawidłowym statusem."""
-        task_string = "Tytuł|Opis|nieprawidłowy_status"
-        with self.assertRaises(ValueError):
-            Task.from_string(task_string)
-
-    def test_from_string_empty(self):
-        """Test tworzenia zadania z pustego stringa."""
-        task_string = ""
-        with self.assertRaises(ValueError):
-            Task.from_string(task_string)
-
-    def test_empty_title_initialization(self):
-        """Test inicjalizacji zadania z pustym tytułem."""
-        task = Task("")
-        self.assertEqual(task.title, "")
-
-    def test_none_description_initialization(self):
-        """Test inicjalizacji zadania z None jako opis."""
-        task = Task("Tytuł", None)
-        self.assertEqual(task.description, None)
-
-    def test_update_details_none_values(self):
-        """Test aktualizacji z None jako wartości."""
-        self.task.update_details(title=None, description=None)
-        self.assertEqual(self.task.title, self.title)
-        self.assertEqual(self.task.description, self.description)
-
-    def test_to_string_with_special_chars(self):
-        """Test konwersji do stringa zadania ze znakami specjalnymi."""
-        task = Task("Tytuł | ze znakiem", "Opis | ze znakiem")
-        result = task.to_string()
-        self.assertEqual(result, "Tytuł | ze znakiem|Opis | ze znakiem|pending")
-
-    def test_from_string_with_empty_description(self):
-        """Test tworzenia zadania z pustym opisem."""
-        task_string = "Tytuł||done"
-        task = Task.from_string(task_string)
-        self.assertEqual(task.title, "Tytuł")
-        self.assertEqual(task.description, "")
-        self.assertEqual(task.status, TaskStatus.DONE)
-
-    def test_from_string_with_edge_cases(self):
-        """Test tworzenia zadania z tekstu zawierającego znaki specjalne."""
-        task_string = "Tytuł ze znakami !@#$%|Opis z&^*|pending"
-        task = Task.from_string(task_string)
-        self.assertEqual(task.title, "Tytuł ze znakami !@#$%")
-        self.assertEqual(task.description, "Opis z&^*")
-        self.assertEqual(task.status, TaskStatus.PENDING)
-
-    @unittest.mock.patch("src.task.get_default_status")
-    def test_task_initialization_default_status(self, mock_get_default):
-        """Test, czy zadanie używa funkcji get_default_status."""
-        mock_get_default.return_value = TaskStatus.UNFINISHED
-
-        task = Task("Testowe zadanie")
-
-        self.assertEqual(task.status, TaskStatus.UNFINISHED)
-
-    def test_task_string_representation(self):
-        """Test reprezentacji tekstowej zadania."""
-
-        task_str = str(self.task)
-        self.assertIsInstance(task_str, str)
-        self.assertGreater(len(task_str), 0)
-
-    def test_task_equality(self):
-        """Test porównania dwóch zadań o tych samych parametrach."""
-        task1 = Task("Zadanie", "Opis", TaskStatus.PENDING)
-        task2 = Task("Zadanie", "Opis", TaskStatus.PENDING)
-
-        self.assertIsNot(task1, task2)
-
-        self.assertEqual(task1.title, task2.title)
-        self.assertEqual(task1.description, task2.description)
-        self.assertEqual(task1.status, task2.status)
-
-    def test_change_status_same_status(self):
-        """Test zmiany statusu na ten sam co obecnie."""
-        initial_status = self.task.status
-        result = self.task.change_status(initial_status)
-        self.assertTrue(result)
-        self.assertEqual(self.task.status, initial_status)
-
-    def test_update_details_empty_title(self):
-        """Test aktualizacji tytułu na pusty string."""
-        task = Task("Przykładowe zadanie", "Opis")
-
-        task.update_details(title="")
-
-        self.assertEqual(task.title, "Przykładowe zadanie")
-        self.assertEqual(task.description, "Opis")
-
-    def test_to_string_with_complex_values(self):
-        """Test konwersji zadania z złożonymi wartościami do formatu string."""
-        title_with_chars = "Zadanie | ze znakiem |"
-        desc_with_chars = "Opis | ze znakiem |"
-        task = Task(title_with_chars, desc_with_chars)
-
-        expected = f"{title_with_chars}|{desc_with_chars}|pending"
-        self.assertEqual(task.to_string(), expected)
-
-        with self.assertRaises(ValueError):
-
-            Task.from_string(task.to_string())
-
-    def test_from_string_with_malformed_input(self):
-        """Test tworzenia zadania z niepoprawnego wejścia."""
-        with self.assertRaises(ValueError):
-            Task.from_string(None)
-
-    def test_from_string_with_exception_in_status_creation(self):
-        """Test obsługi wyjątku przy tworzeniu statusu."""
-        with unittest.mock.patch("src.task.TaskStatus") as mock_status:
-            mock_status.side_effect = Exception("Testowy wyjątek")
-            with self.assertRaises(ValueError) as context:
-                Task.from_string("Tytuł|Opis|pending")
-            self.assertIn("Nie można utworzyć zadania", str(context.exception))
-
-    def test_task_initialization_with_invalid_status(self):
-        """Test inicjalizacji zadania z nieprawidłowym typem statusu."""
-
-        task = Task("Tytuł", "Opis", "invalid_status")
-
-        self.assertEqual(task.status, "invalid_status")
-
-    def test_change_status_with_none(self):
-        """Test zmiany statusu na None."""
-        initial_status = self.task.status
-        result = self.task.change_status(None)
-        self.assertFalse(result)
-        self.assertEqual(self.task.status, initial_status)
+import os
+import tempfile
+import unittest
+import unittest.mock
+from src.file_manager import FileManager
+from src.task import Task
+from src.todo_status import TaskStatus
+
+
+class TestTask(unittest.TestCase):
+    """Klasa testowa dla klasy Task."""
+
+    def setUp(self):
+        """Przygotowanie danych przed każdym testem."""
+        self.title = "Przykładowe zadanie"
+        self.description = "Opis przykładowego zadania"
+        self.task = Task(self.title, self.description)
+
+    def test_task_initialization(self):
+        """Test poprawnej inicjalizacji zadania."""
+        self.assertEqual(self.task.title, self.title)
+        self.assertEqual(self.task.description, self.description)
+        self.assertEqual(self.task.status, TaskStatus.PENDING)
+
+    def test_task_initialization_with_status(self):
+        """Test inicjalizacji zadania z określonym statusem."""
+        task = Task(self.title, self.description, TaskStatus.DONE)
+        self.assertEqual(task.status, TaskStatus.DONE)
+
+    def test_change_status_valid(self):
+        """Test zmiany statusu na prawidłowy."""
+        result = self.task.change_status(TaskStatus.DONE)
+        self.assertTrue(result)
+        self.assertEqual(self.task.status, TaskStatus.DONE)
+
+    def test_change_status_invalid(self):
+        """Test zmiany statusu na nieprawidłowy."""
+        initial_status = self.task.status
+        result = self.task.change_status("nieistniejący_status")
+        self.assertFalse(result)
+        self.assertEqual(self.task.status, initial_status)
+
+    def test_update_details_title_only(self):
+        """Test aktualizacji tylko tytułu zadania."""
+        new_title = "Nowy tytuł"
+        self.task.update_details(title=new_title)
+        self.assertEqual(self.task.title, new_title)
+        self.assertEqual(self.task.description, self.description)
+
+    def test_update_details_description_only(self):
+        """Test aktualizacji tylko opisu zadania."""
+        new_description = "Nowy opis"
+        self.task.update_details(description=new_description)
+        self.assertEqual(self.task.title, self.title)
+        self.assertEqual(self.task.description, new_description)
+
+    def test_update_details_both(self):
+        """Test aktualizacji zarówno tytułu jak i opisu zadania."""
+        new_title = "Nowy tytuł"
+        new_description = "Nowy opis"
+        self.task.update_details(new_title, new_description)
+        self.assertEqual(self.task.title, new_title)
+        self.assertEqual(self.task.description, new_description)
+
+    def test_to_string(self):
+        """Test konwersji zadania do formatu string."""
+        expected = f"{self.title}|{self.description}|pending"
+        self.assertEqual(self.task.to_string(), expected)
+
+    def test_from_string_valid(self):
+        """Test tworzenia zadania z prawidłowego formatu string."""
+        task_string = "Tytuł|Opis|done"
+        task = Task.from_string(task_string)
+        self.assertEqual(task.title, "Tytuł")
+        self.assertEqual(task.description, "Opis")
+        self.assertEqual(task.status, TaskStatus.DONE)
+
+    def test_from_string_invalid_format(self):
+        """Test tworzenia zadania z nieprawidłowego formatu string (za mało elementów)."""
+        task_string = "Tytuł|Opis"
+        with self.assertRaises(ValueError):
+            Task.from_string(task_string)
+
+    def test_from_string_invalid_format_too_many(self):
+        """Test tworzenia zadania z nieprawidłowego formatu string (za dużo elementów)."""
+        task_string = "Tytuł|Opis|done|extra"
+        with self.assertRaises(ValueError):
+            Task.from_string(task_string)
+
+    def test_from_string_invalid_status(self):
+        """Test tworzenia zadania z nieprawidłowym statusem."""
+        task_string = "Tytuł|Opis|nieprawidłowy_status"
+        with self.assertRaises(ValueError):
+            Task.from_string(task_string)
+
+    def test_from_string_empty(self):
+        """Test tworzenia zadania z pustego stringa."""
+        task_string = ""
+        with self.assertRaises(ValueError):
+            Task.from_string(task_string)
+
+    def test_empty_title_initialization(self):
+        """Test inicjalizacji zadania z pustym tytułem."""
+        task = Task("")
+        self.assertEqual(task.title, "")
+
+    def test_none_description_initialization(self):
+        """Test inicjalizacji zadania z None jako opis."""
+        task = Task("Tytuł", None)
+        self.assertEqual(task.description, None)
+
+    def test_update_details_none_values(self):
+        """Test aktualizacji z None jako wartości."""
+        self.task.update_details(title=None, description=None)
+        self.assertEqual(self.task.title, self.title)
+        self.assertEqual(self.task.description, self.description)
+
+    def test_to_string_with_special_chars(self):
+        """Test konwersji do stringa zadania ze znakami specjalnymi."""
+        task = Task("Tytuł | ze znakiem", "Opis | ze znakiem")
+        result = task.to_string()
+        self.assertEqual(result, "Tytuł | ze znakiem|Opis | ze znakiem|pending")
+
+    def test_from_string_with_empty_description(self):
+        """Test tworzenia zadania z pustym opisem."""
+        task_string = "Tytuł||done"
+        task = Task.from_string(task_string)
+        self.assertEqual(task.title, "Tytuł")
+        self.assertEqual(task.description, "")
+        self.assertEqual(task.status, TaskStatus.DONE)
+
+    def test_from_string_with_edge_cases(self):
+        """Test tworzenia zadania z tekstu zawierającego znaki specjalne."""
+        task_string = "Tytuł ze znakami !@#$%|Opis z&^*|pending"
+        task = Task.from_string(task_string)
+        self.assertEqual(task.title, "Tytuł ze znakami !@#$%")
+        self.assertEqual(task.description, "Opis z&^*")
+        self.assertEqual(task.status, TaskStatus.PENDING)
+
+    @unittest.mock.patch("src.task.get_default_status")
+    def test_task_initialization_default_status(self, mock_get_default):
+        """Test, czy zadanie używa funkcji get_default_status."""
+        mock_get_default.return_value = TaskStatus.UNFINISHED
+
+        task = Task("Testowe zadanie")
+
+        self.assertEqual(task.status, TaskStatus.UNFINISHED)
+
+    def test_task_string_representation(self):
+        """Test reprezentacji tekstowej zadania."""
+
+        task_str = str(self.task)
+        self.assertIsInstance(task_str, str)
+        self.assertGreater(len(task_str), 0)
+
+    def test_task_equality(self):
+        """Test porównania dwóch zadań o tych samych parametrach."""
+        task1 = Task("Zadanie", "Opis", TaskStatus.PENDING)
+        task2 = Task("Zadanie", "Opis", TaskStatus.PENDING)
+
+        self.assertIsNot(task1, task2)
+
+        self.assertEqual(task1.title, task2.title)
+        self.assertEqual(task1.description, task2.description)
+        self.assertEqual(task1.status, task2.status)
+
+    def test_change_status_same_status(self):
+        """Test zmiany statusu na ten sam co obecnie."""
+        initial_status = self.task.status
+        result = self.task.change_status(initial_status)
+        self.assertTrue(result)
+        self.assertEqual(self.task.status, initial_status)
+
+    def test_update_details_empty_title(self):
+        """Test aktualizacji tytułu na pusty string."""
+        task = Task("Przykładowe zadanie", "Opis")
+
+        task.update_details(title="")
+
+        self.assertEqual(task.title, "Przykładowe zadanie")
+        self.assertEqual(task.description, "Opis")
+
+    def test_to_string_with_complex_values(self):
+        """Test konwersji zadania z złożonymi wartościami do formatu string."""
+        title_with_chars = "Zadanie | ze znakiem |"
+        desc_with_chars = "Opis | ze znakiem |"
+        task = Task(title_with_chars, desc_with_chars)
+
+        expected = f"{title_with_chars}|{desc_with_chars}|pending"
+        self.assertEqual(task.to_string(), expected)
+
+        with self.assertRaises(ValueError):
+
+            Task.from_string(task.to_string())
+
+    def test_from_string_with_malformed_input(self):
+        """Test tworzenia zadania z niepoprawnego wejścia."""
+        with self.assertRaises(ValueError):
+            Task.from_string(None)
+
+    def test_from_string_with_exception_in_status_creation(self):
+        """Test obsługi nieznanego statusu przy tworzeniu zadania."""
+        with unittest.mock.patch.dict("src.task._STATUS_BY_VALUE", clear=True):
+            with self.assertRaises(ValueError) as context:
+                Task.from_string("Tytuł|Opis|pending")
+            self.assertIn("Nie można utworzyć zadania", str(context.exception))
+            self.assertIn("Nieprawidłowy status zadania", str(context.exception))
+
+    def test_task_initialization_with_invalid_status(self):
+        """Test inicjalizacji zadania z nieprawidłowym typem statusu."""
+
+        task = Task("Tytuł", "Opis", "invalid_status")
+
+        self.assertEqual(task.status, "invalid_status")
+
+    def test_change_status_with_none(self):
+        """Test zmiany statusu na None."""
+        initial_status = self.task.status
+        result = self.task.change_status(None)
+        self.assertFalse(result)
+        self.assertEqual(self.task.status, initial_status)
+
+    def test_to_string_with_task_id(self):
+        """Test konwersji do stringa zadania z identyfikatorem."""
+        task = Task("Tytuł", "Opis", TaskStatus.DONE, task_id=42)
+        self.assertEqual(task.to_string(), "Tytuł|Opis|done|42")
+
+    def test_from_string_with_task_id(self):
+        """Test tworzenia zadania z identyfikatorem."""
+        task = Task.from_string("Tytuł|Opis|done|42\n")
+        self.assertEqual(task.task_id, 42)
+        self.assertEqual(task.status, TaskStatus.DONE)
+        self.assertEqual(Task.from_string(task.to_string()).task_id, 42)
+
+    def test_from_string_without_task_id(self):
+        """Test tworzenia zadania w starym formacie bez identyfikatora."""
+        task = Task.from_string("Tytuł|Opis|done")
+        self.assertIsNone(task.task_id)
+
+    def test_from_string_invalid_task_id(self):
+        """Test tworzenia zadania z nieprawidłowym identyfikatorem."""
+        for task_string in (
+            "Tytuł|Opis|done|-1", "Tytuł|Opis|done|", "Tytuł|Opis|done|1.5", "Tytuł|Opis|done|²"
+        ):
+            with self.subTest(task_string=task_string):
+                with self.assertRaises(ValueError):
+                    Task.from_string(task_string)
+
+    def test_task_uses_slots(self):
+        """Test, czy zadanie nie ma słownika instancji (__slots__)."""
+        self.assertFalse(hasattr(self.task, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.task.nieistniejacy_atrybut = 1
+
+    def test_from_string_reuses_status_instances(self):
+        """Test, czy wczytane zadania współdzielą obiekty statusu."""
+        task1 = Task.from_string("Tytuł 1|Opis|done")
+        task2 = Task.from_string("Tytuł 2|Opis|done")
+        self.assertIs(task1.status, task2.status)
+        self.assertIs(task1.status, TaskStatus.DONE)
+
+    def test_to_string_is_cached_until_change(self):
+        """Test zapamiętywania linii tekstu i oznaczania zadania jako zmienionego."""
+        self.assertTrue(self.task.dirty)
+        line = self.task.to_string()
+        self.assertFalse(self.task.dirty)
+        self.assertIs(self.task.to_string(), line)
+
+        self.task.update_details(description="Nowy opis")
+        self.assertTrue(self.task.dirty)
+        self.assertEqual(self.task.to_string(), f"{self.title}|Nowy opis|pending")
+
+        self.task.change_status(TaskStatus.DONE)
+        self.assertEqual(self.task.to_string(), f"{self.title}|Nowy opis|done")
+
+        self.task.task_id = 5
+        self.assertEqual(self.task.to_string(), f"{self.title}|Nowy opis|done|5")
+
+        self.task.mark_dirty()
+        self.assertTrue(self.task.dirty)
+
+    def test_attribute_assignment_invalidates_line(self):
+        """Test unieważnienia linii tekstu po bezpośrednim przypisaniu atrybutów i zapisie."""
+        task = Task.from_string("Tytuł|Opis|pending|1")
+        task.title = "Nowy tytuł"
+        task.description = "Nowy opis"
+        task.status = TaskStatus.DONE
+
+        temp_file = tempfile.NamedTemporaryFile(delete=False).name
+        try:
+            FileManager(temp_file).save_tasks([task])
+            loaded = FileManager(temp_file).load_tasks()
+        finally:
+            os.remove(temp_file)
+        self.assertEqual(loaded[0].to_string(), "Nowy tytuł|Nowy opis|done|1")
+
+    def test_from_string_keeps_canonical_line(self):
+        """Test, czy zadanie wczytane z tekstu nie wymaga ponownej serializacji."""
+        task = Task.from_string("  Tytuł|Opis|done|3\n")
+        self.assertFalse(task.dirty)
+        self.assertEqual(task.to_string(), "Tytuł|Opis|done|3")
+
+        task = Task.from_string("Tytuł|Opis|done|007")
+        self.assertTrue(task.dirty)
+        self.assertEqual(task.to_string(), "Tytuł|Opis|done|7")
+
+    def test_parse_valid_line(self):
+        """Test parsowania prawidłowej linii bez zgłaszania wyjątku."""
+        task, error = Task.parse("Tytuł|Opis|done|3\n")
+        self.assertIsNone(error)
+        self.assertEqual(
+            (task.title, task.description, task.status, task.task_id),
+            ("Tytuł", "Opis", TaskStatus.DONE, 3),
+        )
+        self.assertFalse(task.dirty)
+
+    def test_parse_invalid_lines_returns_reason(self):
+        """Test zwracania powodu błędu dla nieprawidłowych linii."""
+        self.assertEqual(Task.parse("bez separatorów"), (None, "Nieprawidłowy format zadania"))
+        self.assertEqual(Task.parse("a|b|c|d|e"), (None, "Nieprawidłowy format zadania"))
+        self.assertEqual(Task.parse("Tytuł|Opis|zły"), (None, "Nieprawidłowy status zadania"))
+        invalid_id = (None, "Nieprawidłowy identyfikator zadania")
+        self.assertEqual(Task.parse("Tytuł|Opis|done|x1"), invalid_id)
+        self.assertEqual(Task.parse("Tytuł|Opis|done|²"), invalid_id)
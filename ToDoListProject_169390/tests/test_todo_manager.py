@@ -1,275 +1,1180 @@
-import unittest
-import os
-import tempfile
-import unittest.mock
-from src.todo_manager import TodoManager, get_tasks_by_status
-from src.todo_status import TaskStatus
-
-
-class TestTodoManager(unittest.TestCase):
-    def setUp(self):
-        """Przygotowanie danych przed każdym testem."""
-
-        self.temp_file = tempfile.NamedTemporaryFile(delete=False).name
-        self.todo_manager = TodoManager(self.temp_file)
-
-    def tearDown(self):
-        """Sprzątanie po testach."""
-
-        if os.path.exists(self.temp_file):
-            os.remove(self.temp_file)
-
-    def test_add_task(self):
-        """Test dodawania zadania."""
-        task = self.todo_manager.add_task("Nowe zadanie", "Opis zadania")
-        self.assertIsNotNone(task)
-        self.assertEqual(task.title, "Nowe zadanie")
-        self.assertEqual(task.description, "Opis zadania")
-        self.assertEqual(task.status, TaskStatus.PENDING)
-        self.assertEqual(len(self.todo_manager.get_tasks()), 1)
-
-    def test_add_task_empty_title(self):
-        """Test dodawania zadania z pustym tytułem."""
-        with self.assertRaises(ValueError):
-            self.todo_manager.add_task("")
-
-    def test_add_task_without_description(self):
-        """Test dodawania zadania bez opisu."""
-        task = self.todo_manager.add_task("Tylko tytuł")
-        self.assertEqual(task.description, "")
-
-    def test_delete_task_valid_index(self):
-        """Test usuwania zadania o prawidłowym indeksie."""
-        self.todo_manager.add_task("Zadanie 1")
-        self.todo_manager.add_task("Zadanie 2")
-        result = self.todo_manager.delete_task(0)
-        self.assertTrue(result)
-        self.assertEqual(len(self.todo_manager.get_tasks()), 1)
-        self.assertEqual(self.todo_manager.get_tasks()[0].title, "Zadanie 2")
-
-    def test_delete_task_invalid_index(self):
-        """Test usuwania zadania o nieprawidłowym indeksie."""
-        self.todo_manager.add_task("Zadanie 1")
-        result = self.todo_manager.delete_task(5)
-        self.assertFalse(result)
-        self.assertEqual(len(self.todo_manager.get_tasks()), 1)
-
-    def test_delete_task_negative_index(self):
-        """Test usuwania zadania o ujemnym indeksie."""
-        self.todo_manager.add_task("Zadanie 1")
-        result = self.todo_manager.delete_task(-1)
-        self.assertFalse(result)
-        self.assertEqual(len(self.todo_manager.get_tasks()), 1)
-
-    def test_edit_task_valid_index(self):
-        """Test edycji zadania o prawidłowym indeksie."""
-        self.todo_manager.add_task("Stary tytuł", "Stary opis")
-        result = self.todo_manager.edit_task(0, "Nowy tytuł", "Nowy opis")
-        self.assertTrue(result)
-        task = self.todo_manager.get_tasks()[0]
-        self.assertEqual(task.title, "Nowy tytuł")
-        self.assertEqual(task.description, "Nowy opis")
-
-    def test_edit_task_only_title(self):
-        """Test edycji tylko tytułu zadania."""
-        self.todo_manager.add_task("Stary tytuł", "Opis")
-        result = self.todo_manager.edit_task(0, "Nowy tytuł")
-        self.assertTrue(result)
-        task = self.todo_manager.get_tasks()[0]
-        self.assertEqual(task.title, "Nowy tytuł")
-        self.assertEqual(task.description, "Opis")
-
-    def test_edit_task_only_description(self):
-        """Test edycji tylko opisu zadania."""
-        self.todo_manager.add_task("Tytuł", "Stary opis")
-        result = self.todo_manager.edit_task(0, None, "Nowy opis")
-        self.assertTrue(result)
-        task = self.todo_manager.get_tasks()[0]
-        self.assertEqual(task.title, "Tytuł")
-        self.assertEqual(task.description, "Nowy opis")
-
-    def test_edit_task_invalid_index(self):
-        """Test edycji zadania o nieprawidłowym indeksie."""
-        self.todo_manager.add_task("Zadanie")
-        result = self.todo_manager.edit_task(5, "Nowy tytuł")
-        self.assertFalse(result)
-
-    def test_change_task_status_valid_index_enum(self):
-        """Test zmiany statusu zadania używając enum TaskStatus."""
-        self.todo_manager.add_task("Zadanie")
-        result = self.todo_manager.change_task_status(0, TaskStatus.DONE)
-        self.assertTrue(result)
-        self.assertEqual(self.todo_manager.get_tasks()[0].status, TaskStatus.DONE)
-
-    def test_change_task_status_valid_index_string(self):
-        """Test zmiany statusu zadania używając stringa."""
-        self.todo_manager.add_task("Zadanie")
-        result = self.todo_manager.change_task_status(0, "done")
-        self.assertTrue(result)
-        self.assertEqual(self.todo_manager.get_tasks()[0].status, TaskStatus.DONE)
-
-    def test_change_task_status_invalid_string(self):
-        """Test zmiany statusu zadania na nieprawidłowy string."""
-        self.todo_manager.add_task("Zadanie")
-        result = self.todo_manager.change_task_status(0, "nieistniejący_status")
-        self.assertFalse(result)
-        self.assertEqual(self.todo_manager.get_tasks()[0].status, TaskStatus.PENDING)
-
-    def test_change_task_status_same_status(self):
-        """Test zmiany statusu zadania na ten sam co obecny."""
-        self.todo_manager.add_task("Zadanie")
-        result = self.todo_manager.change_task_status(0, TaskStatus.PENDING)
-        self.assertFalse(result)
-
-    def test_change_task_status_invalid_index(self):
-        """Test zmiany statusu zadania o nieprawidłowym indeksie."""
-        self.todo_manager.add_task("Zadanie")
-        result = self.todo_manager.change_task_status(5, TaskStatus.DONE)
-        self.assertFalse(result)
-
-    def test_get_tasks_empty(self):
-        """Test pobrania pustej listy zadań."""
-        tasks = self.todo_manager.get_tasks()
-        self.assertEqual(len(tasks), 0)
-
-    def test_get_tasks_multiple(self):
-        """Test pobrania listy z wieloma zadaniami."""
-        self.todo_manager.add_task("Zadanie 1")
-        self.todo_manager.add_task("Zadanie 2")
-        self.todo_manager.add_task("Zadanie 3")
-        tasks = self.todo_manager.get_tasks()
-        self.assertEqual(len(tasks), 3)
-        self.assertEqual(tasks[0].title, "Zadanie 1")
-        self.assertEqual(tasks[1].title, "Zadanie 2")
-        self.assertEqual(tasks[2].title, "Zadanie 3")
-
-    def test_get_tasks_by_status_enum(self):
-        """Test pobrania zadań o określonym statusie używając enum."""
-
-        self.todo_manager.add_task("Zadanie 1")
-        self.todo_manager.add_task("Zadanie 2")
-        self.todo_manager.change_task_status(0, TaskStatus.DONE)
-
-        done_tasks = get_tasks_by_status(self.todo_manager, TaskStatus.DONE)
-        self.assertEqual(len(done_tasks), 1)
-        self.assertEqual(done_tasks[0].title, "Zadanie 1")
-
-        pending_tasks = get_tasks_by_status(self.todo_manager, TaskStatus.PENDING)
-        self.assertEqual(len(pending_tasks), 1)
-        self.assertEqual(pending_tasks[0].title, "Zadanie 2")
-
-    def test_get_tasks_by_status_string(self):
-        """Test pobrania zadań o określonym statusie używając stringa."""
-
-        self.todo_manager.add_task("Zadanie 1")
-        self.todo_manager.add_task("Zadanie 2")
-        self.todo_manager.change_task_status(0, "done")
-
-        done_tasks = get_tasks_by_status(self.todo_manager, "done")
-        self.assertEqual(len(done_tasks), 1)
-        self.assertEqual(done_tasks[0].title, "Zadanie 1")
-
-    def test_get_tasks_by_status_invalid_string(self):
-        """Test pobrania zadań o nieprawidłowym statusie."""
-        self.todo_manager.add_task("Zadanie 1")
-        tasks = get_tasks_by_status(self.todo_manager, "nieistniejący_status")
-        self.assertEqual(len(tasks), 0)
-
-    def test_persistence_between_instances(self):
-        """Test sprawdzający czy dane są zachowywane między instancjami."""
-
-        self.todo_manager.add_task("Zadanie do zapisania")
-
-        new_manager = TodoManager(self.temp_file)
-
-        tasks = new_manager.get_tasks()
-        self.assertEqual(len(tasks), 1)
-        self.assertEqual(tasks[0].title, "Zadanie do zapisania")
-
-    def test_get_tasks_by_status_with_empty_manager(self):
-        """Test funkcji get_tasks_by_status na pustym menedżerze zadań."""
-
-        tasks = get_tasks_by_status(self.todo_manager, TaskStatus.PENDING)
-        self.assertListEqual(tasks, [])
-
-        tasks = get_tasks_by_status(self.todo_manager, "done")
-        self.assertListEqual(tasks, [])
-
-    @unittest.mock.patch("src.todo_manager.is_valid_status")
-    def test_change_task_status_invalid_status_validation(self, mock_is_valid):
-        """Test zmiany statusu zadania gdy walidacja zwraca False."""
-
-        self.todo_manager.add_task("Zadanie testowe")
-
-        mock_is_valid.return_value = False
-
-        result = self.todo_manager.change_task_status(0, "nieprawidłowy")
-
-        self.assertFalse(result)
-        self.assertEqual(self.todo_manager.get_tasks()[0].status, TaskStatus.PENDING)
-        mock_is_valid.assert_called_once_with("nieprawidłowy")
-
-    @unittest.mock.patch("src.todo_manager.FileManager")
-    def test_todo_manager_file_error_handling(self, mock_file_manager_class):
-        """Test obsługi błędów przy inicjalizacji TodoManager z problematycznym FileManager."""
-
-        mock_file_manager = unittest.mock.MagicMock()
-        mock_file_manager.load_tasks.return_value = []
-        mock_file_manager_class.return_value = mock_file_manager
-
-        manager = TodoManager("błędna_ścieżka.txt")
-
-        self.assertIsInstance(manager, TodoManager)
-        self.assertIsInstance(manager.tasks, list)
-        self.assertEqual(len(manager.tasks), 0)
-
-        mock_file_manager_class.assert_called_once_with("błędna_ścieżka.txt")
-
-    def test_change_task_status_unexpected_exception(self):
-        """Test obsługi nieoczekiwanego wyjątku przy zmianie statusu zadania."""
-
-        self.todo_manager.add_task("Zadanie testowe")
-
-        original_task = self.todo_manager.tasks[0]
-        mock_task = unittest.mock.MagicMock()
-        mock_task.status = TaskStatus.PENDING
-        mock_task.change_status.side_effect = Exception("Nieoczekiwany błąd")
-        self.todo_manager.tasks[0] = mock_task
-
-        result = self.todo_manager.change_task_status(0, TaskStatus.DONE)
-
-        self.assertFalse(result)
-        mock_task.change_status.assert_called_once_with(TaskStatus.DONE)
-
-        self.todo_manager.tasks[0] = original_task
-
-    def test_add_task_persistence(self):
-        """Test czy dodane zadanie jest rzeczywiście zapisywane do pliku."""
-
-        task = self.todo_manager.add_task("Zadanie testowe")
-
-        new_manager = TodoManager(self.temp_file)
-
-        self.assertEqual(len(new_manager.get_tasks()), 1)
-        self.assertEqual(new_manager.get_tasks()[0].title, "Zadanie testowe")
-        self.assertIsNot(new_manager.get_tasks()[0], task)
-
-    @unittest.mock.patch("src.todo_manager.FileManager.save_tasks")
-    def test_save_changes_error_handling(self, mock_save_tasks):
-        """Test obsługi błędów przy zapisywaniu zmian."""
-
-        mock_save_tasks.return_value = False
-
-        self.todo_manager.add_task("Zadanie testowe")
-
-        self.assertEqual(len(self.todo_manager.get_tasks()), 1)
-        mock_save_tasks.assert_called_once()
-
-    def test_get_tasks_by_status_with_none_argument(self):
-        """Test funkcji get_tasks_by_status z argumentem None."""
-
-        self.todo_manager.add_task("Zadanie 1")
-        self.todo_manager.add_task("Zadanie 2")
-
-        with self.assertRaises(AttributeError):
-            get_tasks_by_status(self.todo_manager, None)
+import unittest
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import unittest.mock
+from src.todo_manager import TodoManager, get_tasks_by_status
+from src.change_events import ADDED, DELETED, EDITED, RESET, STATUS_CHANGED, TaskEvent
+from src.file_manager import FileManager
+from src.metrics import MetricsRecorder
+from src.todo_status import TaskStatus
+from src.version_store import VersionStore
+
+
+def _add_shared_tasks(file_path, worker, count):
+    """Dodaje zadania do współdzielonego pliku (funkcja procesu potomnego)."""
+    manager = TodoManager(file_manager=FileManager(file_path, journal=True, shared=True))
+    for i in range(count):
+        task = manager.add_task(f"Zadanie {worker}-{i}")
+        if i % 2:
+            manager.change_task_status_by_id(task.task_id, TaskStatus.DONE)
+
+
+class TestTodoManager(unittest.TestCase):
+    def setUp(self):
+        """Przygotowanie danych przed każdym testem."""
+
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False).name
+        self.todo_manager = TodoManager(self.temp_file)
+
+    def tearDown(self):
+        """Sprzątanie po testach."""
+
+        for path in (self.temp_file, self.temp_file + ".journal", self.temp_file + ".lock"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_add_task(self):
+        """Test dodawania zadania."""
+        task = self.todo_manager.add_task("Nowe zadanie", "Opis zadania")
+        self.assertIsNotNone(task)
+        self.assertEqual(task.title, "Nowe zadanie")
+        self.assertEqual(task.description, "Opis zadania")
+        self.assertEqual(task.status, TaskStatus.PENDING)
+        self.assertEqual(len(self.todo_manager.get_tasks()), 1)
+
+    def test_add_task_empty_title(self):
+        """Test dodawania zadania z pustym tytułem."""
+        with self.assertRaises(ValueError):
+            self.todo_manager.add_task("")
+
+    def test_add_task_without_description(self):
+        """Test dodawania zadania bez opisu."""
+        task = self.todo_manager.add_task("Tylko tytuł")
+        self.assertEqual(task.description, "")
+
+    def test_delete_task_valid_index(self):
+        """Test usuwania zadania o prawidłowym indeksie."""
+        self.todo_manager.add_task("Zadanie 1")
+        self.todo_manager.add_task("Zadanie 2")
+        result = self.todo_manager.delete_task(0)
+        self.assertTrue(result)
+        self.assertEqual(len(self.todo_manager.get_tasks()), 1)
+        self.assertEqual(self.todo_manager.get_tasks()[0].title, "Zadanie 2")
+
+    def test_delete_task_invalid_index(self):
+        """Test usuwania zadania o nieprawidłowym indeksie."""
+        self.todo_manager.add_task("Zadanie 1")
+        result = self.todo_manager.delete_task(5)
+        self.assertFalse(result)
+        self.assertEqual(len(self.todo_manager.get_tasks()), 1)
+
+    def test_delete_task_negative_index(self):
+        """Test usuwania zadania o ujemnym indeksie."""
+        self.todo_manager.add_task("Zadanie 1")
+        result = self.todo_manager.delete_task(-1)
+        self.assertFalse(result)
+        self.assertEqual(len(self.todo_manager.get_tasks()), 1)
+
+    def test_edit_task_valid_index(self):
+        """Test edycji zadania o prawidłowym indeksie."""
+        self.todo_manager.add_task("Stary tytuł", "Stary opis")
+        result = self.todo_manager.edit_task(0, "Nowy tytuł", "Nowy opis")
+        self.assertTrue(result)
+        task = self.todo_manager.get_tasks()[0]
+        self.assertEqual(task.title, "Nowy tytuł")
+        self.assertEqual(task.description, "Nowy opis")
+
+    def test_edit_task_only_title(self):
+        """Test edycji tylko tytułu zadania."""
+        self.todo_manager.add_task("Stary tytuł", "Opis")
+        result = self.todo_manager.edit_task(0, "Nowy tytuł")
+        self.assertTrue(result)
+        task = self.todo_manager.get_tasks()[0]
+        self.assertEqual(task.title, "Nowy tytuł")
+        self.assertEqual(task.description, "Opis")
+
+    def test_edit_task_only_description(self):
+        """Test edycji tylko opisu zadania."""
+        self.todo_manager.add_task("Tytuł", "Stary opis")
+        result = self.todo_manager.edit_task(0, None, "Nowy opis")
+        self.assertTrue(result)
+        task = self.todo_manager.get_tasks()[0]
+        self.assertEqual(task.title, "Tytuł")
+        self.assertEqual(task.description, "Nowy opis")
+
+    def test_edit_task_invalid_index(self):
+        """Test edycji zadania o nieprawidłowym indeksie."""
+        self.todo_manager.add_task("Zadanie")
+        result = self.todo_manager.edit_task(5, "Nowy tytuł")
+        self.assertFalse(result)
+
+    def test_change_task_status_valid_index_enum(self):
+        """Test zmiany statusu zadania używając enum TaskStatus."""
+        self.todo_manager.add_task("Zadanie")
+        result = self.todo_manager.change_task_status(0, TaskStatus.DONE)
+        self.assertTrue(result)
+        self.assertEqual(self.todo_manager.get_tasks()[0].status, TaskStatus.DONE)
+
+    def test_change_task_status_valid_index_string(self):
+        """Test zmiany statusu zadania używając stringa."""
+        self.todo_manager.add_task("Zadanie")
+        result = self.todo_manager.change_task_status(0, "done")
+        self.assertTrue(result)
+        self.assertEqual(self.todo_manager.get_tasks()[0].status, TaskStatus.DONE)
+
+    def test_change_task_status_invalid_string(self):
+        """Test zmiany statusu zadania na nieprawidłowy string."""
+        self.todo_manager.add_task("Zadanie")
+        result = self.todo_manager.change_task_status(0, "nieistniejący_status")
+        self.assertFalse(result)
+        self.assertEqual(self.todo_manager.get_tasks()[0].status, TaskStatus.PENDING)
+
+    def test_change_task_status_same_status(self):
+        """Test zmiany statusu zadania na ten sam co obecny."""
+        self.todo_manager.add_task("Zadanie")
+        result = self.todo_manager.change_task_status(0, TaskStatus.PENDING)
+        self.assertFalse(result)
+
+    def test_change_task_status_invalid_index(self):
+        """Test zmiany statusu zadania o nieprawidłowym indeksie."""
+        self.todo_manager.add_task("Zadanie")
+        result = self.todo_manager.change_task_status(5, TaskStatus.DONE)
+        self.assertFalse(result)
+
+    def test_get_tasks_empty(self):
+        """Test pobrania pustej listy zadań."""
+        tasks = self.todo_manager.get_tasks()
+        self.assertEqual(len(tasks), 0)
+
+    def test_get_tasks_multiple(self):
+        """Test pobrania listy z wieloma zadaniami."""
+        self.todo_manager.add_task("Zadanie 1")
+        self.todo_manager.add_task("Zadanie 2")
+        self.todo_manager.add_task("Zadanie 3")
+        tasks = self.todo_manager.get_tasks()
+        self.assertEqual(len(tasks), 3)
+        self.assertEqual(tasks[0].title, "Zadanie 1")
+        self.assertEqual(tasks[1].title, "Zadanie 2")
+        self.assertEqual(tasks[2].title, "Zadanie 3")
+
+    def test_get_tasks_by_status_enum(self):
+        """Test pobrania zadań o określonym statusie używając enum."""
+
+        self.todo_manager.add_task("Zadanie 1")
+        self.todo_manager.add_task("Zadanie 2")
+        self.todo_manager.change_task_status(0, TaskStatus.DONE)
+
+        done_tasks = get_tasks_by_status(self.todo_manager, TaskStatus.DONE)
+        self.assertEqual(len(done_tasks), 1)
+        self.assertEqual(done_tasks[0].title, "Zadanie 1")
+
+        pending_tasks = get_tasks_by_status(self.todo_manager, TaskStatus.PENDING)
+        self.assertEqual(len(pending_tasks), 1)
+        self.assertEqual(pending_tasks[0].title, "Zadanie 2")
+
+    def test_get_tasks_by_status_string(self):
+        """Test pobrania zadań o określonym statusie używając stringa."""
+
+        self.todo_manager.add_task("Zadanie 1")
+        self.todo_manager.add_task("Zadanie 2")
+        self.todo_manager.change_task_status(0, "done")
+
+        done_tasks = get_tasks_by_status(self.todo_manager, "done")
+        self.assertEqual(len(done_tasks), 1)
+        self.assertEqual(done_tasks[0].title, "Zadanie 1")
+
+    def test_get_tasks_by_status_invalid_string(self):
+        """Test pobrania zadań o nieprawidłowym statusie."""
+        self.todo_manager.add_task("Zadanie 1")
+        tasks = get_tasks_by_status(self.todo_manager, "nieistniejący_status")
+        self.assertEqual(len(tasks), 0)
+
+    def test_persistence_between_instances(self):
+        """Test sprawdzający czy dane są zachowywane między instancjami."""
+
+        self.todo_manager.add_task("Zadanie do zapisania")
+
+        new_manager = TodoManager(self.temp_file)
+
+        tasks = new_manager.get_tasks()
+        self.assertEqual(len(tasks), 1)
+        self.assertEqual(tasks[0].title, "Zadanie do zapisania")
+
+    def test_get_tasks_by_status_with_empty_manager(self):
+        """Test funkcji get_tasks_by_status na pustym menedżerze zadań."""
+
+        tasks = get_tasks_by_status(self.todo_manager, TaskStatus.PENDING)
+        self.assertListEqual(tasks, [])
+
+        tasks = get_tasks_by_status(self.todo_manager, "done")
+        self.assertListEqual(tasks, [])
+
+    @unittest.mock.patch("src.todo_manager.is_valid_status")
+    def test_change_task_status_invalid_status_validation(self, mock_is_valid):
+        """Test zmiany statusu zadania gdy walidacja zwraca False."""
+
+        self.todo_manager.add_task("Zadanie testowe")
+
+        mock_is_valid.return_value = False
+
+        result = self.todo_manager.change_task_status(0, "nieprawidłowy")
+
+        self.assertFalse(result)
+        self.assertEqual(self.todo_manager.get_tasks()[0].status, TaskStatus.PENDING)
+        mock_is_valid.assert_called_once_with("nieprawidłowy")
+
+    @unittest.mock.patch("src.todo_manager.FileManager")
+    def test_todo_manager_file_error_handling(self, mock_file_manager_class):
+        """Test obsługi błędów przy inicjalizacji TodoManager z problematycznym FileManager."""
+
+        mock_file_manager = unittest.mock.MagicMock()
+        mock_file_manager.load_tasks.return_value = []
+        mock_file_manager_class.return_value = mock_file_manager
+
+        manager = TodoManager("błędna_ścieżka.txt")
+
+        self.assertIsInstance(manager, TodoManager)
+        self.assertIsInstance(manager.tasks, list)
+        self.assertEqual(len(manager.tasks), 0)
+
+        mock_file_manager_class.assert_called_once_with("błędna_ścieżka.txt")
+
+    def test_change_task_status_unexpected_exception(self):
+        """Test obsługi nieoczekiwanego wyjątku przy zmianie statusu zadania."""
+
+        self.todo_manager.add_task("Zadanie testowe")
+
+        original_task = self.todo_manager.tasks[0]
+        mock_task = unittest.mock.MagicMock()
+        mock_task.status = TaskStatus.PENDING
+        mock_task.change_status.side_effect = Exception("Nieoczekiwany błąd")
+        self.todo_manager.tasks[0] = mock_task
+
+        result = self.todo_manager.change_task_status(0, TaskStatus.DONE)
+
+        self.assertFalse(result)
+        mock_task.change_status.assert_called_once_with(TaskStatus.DONE)
+
+        self.todo_manager.tasks[0] = original_task
+
+    def test_add_task_persistence(self):
+        """Test czy dodane zadanie jest rzeczywiście zapisywane do pliku."""
+
+        task = self.todo_manager.add_task("Zadanie testowe")
+
+        new_manager = TodoManager(self.temp_file)
+
+        self.assertEqual(len(new_manager.get_tasks()), 1)
+        self.assertEqual(new_manager.get_tasks()[0].title, "Zadanie testowe")
+        self.assertIsNot(new_manager.get_tasks()[0], task)
+
+    @unittest.mock.patch("src.todo_manager.FileManager.save_tasks")
+    def test_save_changes_error_handling(self, mock_save_tasks):
+        """Test obsługi błędów przy zapisywaniu zmian."""
+
+        mock_save_tasks.return_value = False
+
+        self.todo_manager.add_task("Zadanie testowe")
+
+        self.assertEqual(len(self.todo_manager.get_tasks()), 1)
+        mock_save_tasks.assert_called_once()
+
+    def test_get_tasks_by_status_with_none_argument(self):
+        """Test funkcji get_tasks_by_status z argumentem None."""
+
+        self.todo_manager.add_task("Zadanie 1")
+        self.todo_manager.add_task("Zadanie 2")
+
+        with self.assertRaises(AttributeError):
+            get_tasks_by_status(self.todo_manager, None)
+
+    def test_journal_mode_does_not_rewrite_snapshot(self):
+        """Test trybu dziennika - pojedyncza zmiana nie przepisuje całego pliku."""
+        file_manager = FileManager(self.temp_file, journal=True)
+        manager = TodoManager(file_manager=file_manager)
+        manager.add_task("Zadanie 1")
+        manager.add_task("Zadanie 2")
+
+        with unittest.mock.patch.object(file_manager, "save_tasks") as mock_save:
+            manager.change_task_status(1, TaskStatus.DONE)
+            manager.delete_task(0)
+        mock_save.assert_not_called()
+
+        reloaded = TodoManager(file_manager=FileManager(self.temp_file, journal=True))
+        self.assertEqual(len(reloaded.get_tasks()), 1)
+        self.assertEqual(reloaded.get_tasks()[0].title, "Zadanie 2")
+        self.assertEqual(reloaded.get_tasks()[0].status, TaskStatus.DONE)
+
+        os.remove(file_manager.journal_path)
+
+    @unittest.mock.patch("src.todo_manager.FileManager.save_tasks")
+    def test_batch_saves_once(self, mock_save_tasks):
+        """Test zapisu wielu operacji w transakcji jednym zapisem."""
+        with self.todo_manager.batch():
+            for i in range(100):
+                self.todo_manager.add_task(f"Zadanie {i}")
+            self.todo_manager.edit_task(0, "Zmienione")
+            self.todo_manager.change_task_status(1, TaskStatus.DONE)
+            self.todo_manager.delete_task(2)
+            mock_save_tasks.assert_not_called()
+
+        mock_save_tasks.assert_called_once()
+        self.assertEqual(len(self.todo_manager.get_tasks()), 99)
+
+    def test_batch_rollback_on_exception(self):
+        """Test wycofania zmian transakcji po wyjątku."""
+        self.todo_manager.add_task("Zadanie 1", "Opis 1")
+        self.todo_manager.add_task("Zadanie 2", "Opis 2")
+
+        with self.assertRaises(ValueError):
+            with self.todo_manager.batch():
+                self.todo_manager.edit_task(0, "Zmienione", "Zmieniony opis")
+                self.todo_manager.change_task_status(1, TaskStatus.DONE)
+                self.todo_manager.delete_task(0)
+                self.todo_manager.add_task("Zadanie 3")
+                self.todo_manager.add_task("")
+
+        tasks = self.todo_manager.get_tasks()
+        self.assertEqual([task.title for task in tasks], ["Zadanie 1", "Zadanie 2"])
+        self.assertEqual(tasks[0].description, "Opis 1")
+        self.assertEqual(tasks[1].status, TaskStatus.PENDING)
+
+        reloaded = TodoManager(self.temp_file)
+        self.assertEqual([task.title for task in reloaded.get_tasks()], ["Zadanie 1", "Zadanie 2"])
+
+    def test_batch_rollback_restores_deleted_tasks_in_id_order(self):
+        """Test przywrócenia usuniętych zadań na miejsca według identyfikatora."""
+        for i in range(5):
+            self.todo_manager.add_task(f"Zadanie {i}")
+
+        with self.assertRaises(ValueError):
+            with self.todo_manager.batch():
+                self.todo_manager.delete_task_by_id(4)
+                self.todo_manager.delete_task_by_id(2)
+                task = self.todo_manager.add_task("Nowe")
+                self.todo_manager.edit_task_by_id(task.task_id, title="Zmienione")
+                raise ValueError("Przerwanie transakcji")
+
+        self.assertEqual([task.task_id for task in self.todo_manager.get_tasks()], [1, 2, 3, 4, 5])
+        self.assertIsNone(self.todo_manager.get_task(task.task_id))
+        self.assertEqual(self.todo_manager.get_task(4).title, "Zadanie 3")
+        reloaded = TodoManager(self.temp_file)
+        self.assertEqual([task.task_id for task in reloaded.get_tasks()], [1, 2, 3, 4, 5])
+
+        self.assertTrue(self.todo_manager.undo())
+        self.assertEqual([task.task_id for task in self.todo_manager.get_tasks()], [1, 2, 3, 4])
+
+    def test_nested_batch_flushes_on_outer_exit(self):
+        """Test zagnieżdżonych transakcji - zapis dopiero po bloku zewnętrznym."""
+        with unittest.mock.patch.object(self.todo_manager.file_manager, "save_tasks") as mock_save:
+            with self.todo_manager.batch():
+                with self.todo_manager.batch():
+                    self.todo_manager.add_task("Zadanie 1")
+                mock_save.assert_not_called()
+                self.todo_manager.add_task("Zadanie 2")
+
+        mock_save.assert_called_once()
+
+    def test_count_tasks_by_status(self):
+        """Test zliczania zadań według statusu."""
+        self.todo_manager.add_task("Zadanie 1")
+        self.todo_manager.add_task("Zadanie 2")
+        self.todo_manager.add_task("Zadanie 3")
+        self.todo_manager.change_task_status(0, TaskStatus.DONE)
+        self.todo_manager.delete_task(1)
+
+        self.assertEqual(self.todo_manager.count_tasks_by_status(TaskStatus.DONE), 1)
+        self.assertEqual(self.todo_manager.count_tasks_by_status("pending"), 1)
+        self.assertEqual(self.todo_manager.count_tasks_by_status("nieistniejący_status"), 0)
+
+    def test_status_index_follows_task_change_status(self):
+        """Test aktualizacji indeksu statusów przy Task.change_status."""
+        task = self.todo_manager.add_task("Zadanie 1")
+
+        task.change_status(TaskStatus.UNFINISHED)
+
+        self.assertEqual(get_tasks_by_status(self.todo_manager, TaskStatus.UNFINISHED), [task])
+        self.assertEqual(get_tasks_by_status(self.todo_manager, TaskStatus.PENDING), [])
+
+    def test_status_index_after_batch_rollback(self):
+        """Test odtworzenia indeksu statusów po wycofaniu transakcji."""
+        self.todo_manager.add_task("Zadanie 1")
+
+        with self.assertRaises(ValueError):
+            with self.todo_manager.batch():
+                self.todo_manager.change_task_status(0, TaskStatus.DONE)
+                self.todo_manager.add_task("Zadanie 2")
+                raise ValueError("Przerwanie transakcji")
+
+        self.assertEqual(self.todo_manager.count_tasks_by_status(TaskStatus.DONE), 0)
+        self.assertEqual(self.todo_manager.count_tasks_by_status(TaskStatus.PENDING), 1)
+
+    def test_status_index_built_on_load(self):
+        """Test budowy indeksu statusów przy wczytywaniu zadań z pliku."""
+        self.todo_manager.add_task("Zadanie 1")
+        self.todo_manager.add_task("Zadanie 2")
+        self.todo_manager.change_task_status(1, TaskStatus.DONE)
+
+        new_manager = TodoManager(self.temp_file)
+
+        done_tasks = get_tasks_by_status(new_manager, TaskStatus.DONE)
+        self.assertEqual([task.title for task in done_tasks], ["Zadanie 2"])
+
+    def test_add_task_assigns_unique_ids(self):
+        """Test nadawania unikalnych identyfikatorów nowym zadaniom."""
+        task1 = self.todo_manager.add_task("Zadanie 1")
+        task2 = self.todo_manager.add_task("Zadanie 2")
+
+        self.assertIsNotNone(task1.task_id)
+        self.assertNotEqual(task1.task_id, task2.task_id)
+        self.assertIs(self.todo_manager.get_task(task2.task_id), task2)
+        self.assertIsNone(self.todo_manager.get_task(999))
+
+    def test_ids_persist_between_instances(self):
+        """Test zachowania identyfikatorów między instancjami."""
+        task = self.todo_manager.add_task("Zadanie 1")
+        self.todo_manager.add_task("Zadanie 2")
+        self.todo_manager.delete_task(0)
+
+        new_manager = TodoManager(self.temp_file)
+        new_task = new_manager.add_task("Zadanie 3")
+
+        self.assertEqual(new_manager.get_tasks()[0].task_id, task.task_id + 1)
+        self.assertNotIn(new_task.task_id, (task.task_id, task.task_id + 1))
+
+    def test_operations_by_id(self):
+        """Test edycji, zmiany statusu i usuwania zadania po identyfikatorze."""
+        task1 = self.todo_manager.add_task("Zadanie 1")
+        task2 = self.todo_manager.add_task("Zadanie 2")
+        task3 = self.todo_manager.add_task("Zadanie 3")
+
+        self.assertTrue(self.todo_manager.delete_task_by_id(task1.task_id))
+        self.assertTrue(self.todo_manager.edit_task_by_id(task3.task_id, "Nowy tytuł"))
+        self.assertTrue(self.todo_manager.change_task_status_by_id(task3.task_id, "done"))
+
+        self.assertEqual(self.todo_manager.get_tasks(), [task2, task3])
+        self.assertEqual(task3.title, "Nowy tytuł")
+        self.assertEqual(task3.status, TaskStatus.DONE)
+        self.assertIsNone(self.todo_manager.get_task(task1.task_id))
+
+    def test_operations_by_unknown_id(self):
+        """Test operacji na nieistniejącym identyfikatorze."""
+        self.todo_manager.add_task("Zadanie 1")
+
+        self.assertFalse(self.todo_manager.delete_task_by_id(999))
+        self.assertFalse(self.todo_manager.edit_task_by_id(999, "Tytuł"))
+        self.assertFalse(self.todo_manager.change_task_status_by_id(999, TaskStatus.DONE))
+        self.assertEqual(len(self.todo_manager.get_tasks()), 1)
+
+    def test_legacy_file_gets_ids_on_load(self):
+        """Test nadania identyfikatorów zadaniom z pliku w starym formacie."""
+        with open(self.temp_file, "w") as file:
+            file.write("Zadanie 1|Opis 1|pending\n")
+            file.write("Zadanie 2|Opis 2|done|1\n")
+
+        manager = TodoManager(self.temp_file)
+        tasks = [(task.task_id, task.title) for task in manager.get_tasks()]
+
+        self.assertEqual(tasks, [(1, "Zadanie 2"), (2, "Zadanie 1")])
+        reloaded = TodoManager(self.temp_file)
+        self.assertEqual([(task.task_id, task.title) for task in reloaded.get_tasks()], tasks)
+        self.assertTrue(reloaded.delete_task_by_id(2))
+        self.assertEqual(reloaded.get_tasks()[0].title, "Zadanie 2")
+
+    def test_get_tasks_by_status_keeps_list_order(self):
+        """Test kolejności zadań o danym statusie po powrocie do poprzedniego statusu."""
+        for title in ("A", "B", "C"):
+            self.todo_manager.add_task(title)
+        self.todo_manager.change_task_status(0, TaskStatus.DONE)
+        self.todo_manager.change_task_status(0, TaskStatus.PENDING)
+
+        tasks = self.todo_manager.get_tasks_by_status(TaskStatus.PENDING)
+        self.assertEqual([task.title for task in tasks], ["A", "B", "C"])
+
+    def test_tasks_are_ordered_by_id(self):
+        """Test porządkowania zadań z pliku według identyfikatorów."""
+        with open(self.temp_file, "w") as file:
+            file.write("Zadanie 3|Opis|pending|3\n")
+            file.write("Zadanie 1|Opis|pending|1\n")
+            file.write("Powtórzone|Opis|pending|3\n")
+            file.write("Zadanie 2|Opis|done|2\n")
+
+        manager = TodoManager(self.temp_file)
+
+        expected = [(1, "Zadanie 1"), (2, "Zadanie 2"), (3, "Zadanie 3"), (4, "Powtórzone")]
+        self.assertEqual([(task.task_id, task.title) for task in manager.get_tasks()], expected)
+        with open(self.temp_file) as file:
+            self.assertEqual([line.rsplit("|", 1)[1] for line in file],
+                             ["1\n", "2\n", "3\n", "4\n"])
+        self.assertTrue(manager.delete_task_by_id(2))
+        self.assertEqual(manager.add_task("Nowe").task_id, 5)
+        lazy = TodoManager(self.temp_file, lazy=True)
+        self.assertEqual([task.task_id for task in lazy.list_tasks().tasks], [1, 3, 4, 5])
+
+    def test_lazy_mode_defers_parsing(self):
+        """Test trybu leniwego - zadania tworzone dopiero przy dostępie."""
+        for i in range(5):
+            self.todo_manager.add_task(f"Zadanie {i}")
+        self.todo_manager.change_task_status(3, TaskStatus.DONE)
+
+        manager = TodoManager(self.temp_file, lazy=True)
+
+        self.assertEqual(len(manager.get_tasks()), 5)
+        self.assertEqual(manager.tasks.loaded_count, 0)
+        self.assertEqual(manager.get_tasks()[2].title, "Zadanie 2")
+        self.assertEqual(manager.tasks.loaded_count, 1)
+        self.assertEqual([task.title for task in get_tasks_by_status(manager, "done")],
+                         ["Zadanie 3"])
+        manager.file_manager.close()
+
+    def test_lazy_mode_mutations_persist(self):
+        """Test modyfikacji zadań w trybie leniwym."""
+        self.todo_manager.add_task("Zadanie 1")
+        self.todo_manager.add_task("Zadanie 2")
+
+        manager = TodoManager(self.temp_file, lazy=True)
+        manager.delete_task(0)
+        manager.change_task_status(0, TaskStatus.DONE)
+        new_task = manager.add_task("Zadanie 3")
+
+        self.assertEqual(manager.get_task(new_task.task_id), new_task)
+        self.assertEqual(manager.count_tasks_by_status(TaskStatus.DONE), 1)
+        reloaded = TodoManager(self.temp_file)
+        self.assertEqual([task.title for task in reloaded.get_tasks()], ["Zadanie 2", "Zadanie 3"])
+        self.assertEqual(reloaded.get_tasks()[0].status, TaskStatus.DONE)
+
+    def test_lazy_mode_positional_changes_of_legacy_file_in_journal(self):
+        """Test zmian według indeksu w trybie leniwym dla pliku w starym formacie z dziennikiem."""
+        with open(self.temp_file, "w") as file:
+            file.write("Zadanie 1|Opis|pending\n")
+            file.write("Zadanie 2|Opis|pending\n")
+            file.write("Zadanie 3|Opis|pending\n")
+
+        manager = TodoManager(file_manager=FileManager(self.temp_file, journal=True), lazy=True)
+        self.assertTrue(manager.change_task_status(0, TaskStatus.DONE))
+        self.assertTrue(manager.edit_task(1, title="Zmienione"))
+        self.assertTrue(manager.delete_task(2))
+        manager.file_manager.close()
+
+        reloaded = TodoManager(file_manager=FileManager(self.temp_file, journal=True))
+        self.assertEqual(
+            [(task.task_id, task.title, task.status) for task in reloaded.get_tasks()],
+            [(1, "Zadanie 1", TaskStatus.DONE), (2, "Zmienione", TaskStatus.PENDING)],
+        )
+
+    def test_write_behind_defers_saving(self):
+        """Test trybu zapisu w tle - operacje nie czekają na zapis."""
+        manager = TodoManager(self.temp_file, write_behind=True, flush_interval=60)
+        with unittest.mock.patch.object(manager.file_manager, "apply_changes",
+                                        wraps=manager.file_manager.apply_changes) as mock_apply:
+            manager.add_task("Zadanie 1")
+            manager.add_task("Zadanie 2")
+            manager.change_task_status(0, TaskStatus.DONE)
+            mock_apply.assert_not_called()
+
+            self.assertTrue(manager.flush())
+            mock_apply.assert_called_once()
+
+        reloaded = TodoManager(self.temp_file)
+        self.assertEqual([task.title for task in reloaded.get_tasks()], ["Zadanie 1", "Zadanie 2"])
+        self.assertEqual(reloaded.get_tasks()[0].status, TaskStatus.DONE)
+        manager.close()
+
+    def test_write_behind_close_saves_pending_changes(self):
+        """Test zapisu odłożonych zmian przy zamknięciu menedżera."""
+        manager = TodoManager(self.temp_file, write_behind=True, flush_interval=60)
+        manager.add_task("Zadanie 1")
+        manager.delete_task(0)
+        manager.add_task("Zadanie 2")
+
+        self.assertTrue(manager.close())
+        manager.add_task("Zadanie 3")
+
+        reloaded = TodoManager(self.temp_file)
+        self.assertEqual([task.title for task in reloaded.get_tasks()], ["Zadanie 2", "Zadanie 3"])
+
+    def test_write_behind_flush_inside_batch(self):
+        """Test wywołania flush() i close() wewnątrz batch() w trybie zapisu w tle."""
+        manager = TodoManager(self.temp_file, write_behind=True, flush_interval=60)
+        manager.add_task("Zadanie 1")
+
+        with manager.batch():
+            manager.add_task("Zadanie 2")
+            with self.assertRaises(RuntimeError):
+                manager.flush()
+            with self.assertRaises(RuntimeError):
+                manager.close()
+
+        self.assertTrue(manager.close())
+        reloaded = TodoManager(self.temp_file)
+        self.assertEqual([task.title for task in reloaded.get_tasks()], ["Zadanie 1", "Zadanie 2"])
+
+    def test_write_behind_with_journal(self):
+        """Test zapisu w tle w trybie dziennika."""
+        manager = TodoManager(
+            file_manager=FileManager(self.temp_file, journal=True), write_behind=True
+        )
+        with manager.batch():
+            for i in range(10):
+                manager.add_task(f"Zadanie {i}")
+        manager.edit_task(4, description="Opis")
+        manager.close()
+
+        reloaded = TodoManager(file_manager=FileManager(self.temp_file, journal=True))
+        self.assertEqual(len(reloaded.get_tasks()), 10)
+        self.assertEqual(reloaded.get_tasks()[4].description, "Opis")
+        os.remove(self.temp_file + ".journal")
+
+    def test_concurrent_mutations_from_threads(self):
+        """Test jednoczesnych modyfikacji i odczytów z wielu wątków."""
+        errors = []
+
+        def work(thread_number):
+            try:
+                for i in range(50):
+                    task = self.todo_manager.add_task(f"Zadanie {thread_number}-{i}")
+                    self.todo_manager.change_task_status_by_id(task.task_id, TaskStatus.DONE)
+                    self.todo_manager.get_tasks_by_status(TaskStatus.DONE)
+                    len(self.todo_manager.get_tasks())
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(self.todo_manager.count_tasks_by_status(TaskStatus.DONE), 200)
+        ids = [task.task_id for task in self.todo_manager.get_tasks()]
+        self.assertEqual(len(set(ids)), 200)
+        reloaded = TodoManager(self.temp_file)
+        self.assertEqual(len(reloaded.get_tasks()), 200)
+        self.assertEqual(reloaded.count_tasks_by_status(TaskStatus.DONE), 200)
+
+    def test_get_tasks_returns_copy(self):
+        """Test, czy get_tasks zwraca kopię listy zadań."""
+        self.todo_manager.add_task("Zadanie 1")
+
+        tasks = self.todo_manager.get_tasks()
+        tasks.clear()
+
+        self.assertEqual(len(self.todo_manager.get_tasks()), 1)
+
+    def test_search(self):
+        """Test wyszukiwania zadań po słowach z tytułu i opisu."""
+        task1 = self.todo_manager.add_task("Zakupy", "Mleko i chleb")
+        task2 = self.todo_manager.add_task("Wyjazd do Łodzi", "Zarezerwować hotel")
+        task3 = self.todo_manager.add_task("Zakład pracy")
+
+        self.assertEqual(self.todo_manager.search("chleb"), [task1])
+        self.assertEqual(self.todo_manager.search("lodzi"), [task2])
+        self.assertEqual(self.todo_manager.search("zak", prefix=True), [task1, task3])
+        self.assertEqual(self.todo_manager.search("zak", prefix=True, limit=1), [task1])
+        self.assertEqual(self.todo_manager.search("nieistniejące"), [])
+
+    def test_search_with_status_filter(self):
+        """Test wyszukiwania zawężonego do statusów."""
+        task1 = self.todo_manager.add_task("Raport roczny")
+        task2 = self.todo_manager.add_task("Raport kwartalny")
+        self.todo_manager.change_task_status(1, TaskStatus.DONE)
+
+        self.assertEqual(self.todo_manager.search("raport", status=TaskStatus.DONE), [task2])
+        self.assertEqual(self.todo_manager.search("raport", status="pending"), [task1])
+        self.assertEqual(
+            self.todo_manager.search("raport", status=[TaskStatus.DONE, TaskStatus.PENDING]),
+            [task1, task2],
+        )
+
+    def test_search_index_follows_changes(self):
+        """Test aktualizacji indeksu wyszukiwania po dodaniu, edycji i usunięciu zadań."""
+        task1 = self.todo_manager.add_task("Zakupy")
+        self.assertEqual(self.todo_manager.search("zakupy"), [task1])
+
+        task2 = self.todo_manager.add_task("Zakupy świąteczne")
+        self.todo_manager.edit_task(0, title="Spotkanie")
+        self.assertEqual(self.todo_manager.search("zakupy"), [task2])
+        self.assertEqual(self.todo_manager.search("spotkanie"), [task1])
+
+        self.todo_manager.delete_task(1)
+        self.assertEqual(self.todo_manager.search("zakupy"), [])
+        self.assertEqual(self.todo_manager.search("swiateczne"), [])
+
+    def test_search_after_batch_rollback(self):
+        """Test wyszukiwania po wycofaniu transakcji."""
+        task = self.todo_manager.add_task("Zakupy")
+        self.todo_manager.search("zakupy")
+
+        with self.assertRaises(RuntimeError):
+            with self.todo_manager.batch():
+                self.todo_manager.edit_task(0, title="Spotkanie")
+                self.todo_manager.add_task("Zakupy online")
+                raise RuntimeError("Błąd")
+
+        self.assertEqual(self.todo_manager.search("zakupy"), [task])
+        self.assertEqual(self.todo_manager.search("spotkanie"), [])
+
+    def test_list_tasks_offset(self):
+        """Test stronicowania listy zadań przesunięciem."""
+        with self.todo_manager.batch():
+            tasks = [self.todo_manager.add_task(f"Zadanie {i}") for i in range(10)]
+
+        page = self.todo_manager.list_tasks(limit=4, offset=4)
+        self.assertEqual(page.tasks, tasks[4:8])
+        self.assertEqual(page.total, 10)
+        self.assertIsNotNone(page.next_cursor)
+        self.assertEqual(self.todo_manager.list_tasks(limit=4, offset=8).tasks, tasks[8:])
+        self.assertEqual(self.todo_manager.list_tasks(limit=4, offset=20).tasks, [])
+
+    def test_list_tasks_cursor(self):
+        """Test stronicowania listy zadań kursorem."""
+        with self.todo_manager.batch():
+            tasks = [self.todo_manager.add_task(f"Zadanie {i}") for i in range(7)]
+
+        first = self.todo_manager.list_tasks(limit=3)
+        self.todo_manager.delete_task(0)
+        second = self.todo_manager.list_tasks(limit=3, cursor=first.next_cursor)
+        third = self.todo_manager.list_tasks(limit=3, cursor=second.next_cursor)
+
+        self.assertEqual(first.tasks, tasks[:3])
+        self.assertEqual(second.tasks, tasks[3:6])
+        self.assertEqual(third.tasks, tasks[6:])
+        self.assertIsNone(third.next_cursor)
+
+    def test_list_tasks_cursor_with_unordered_file(self):
+        """Test stronicowania kursorem zadań z pliku o identyfikatorach w innej kolejności."""
+        with open(self.temp_file, "w") as file:
+            for task_id in (3, 1, 5, 2, 4):
+                status = "done" if task_id % 2 else "pending"
+                file.write(f"Zadanie {task_id}|Opis|{status}|{task_id}\n")
+
+        for lazy in (False, True):
+            for status in (None, TaskStatus.DONE):
+                with self.subTest(lazy=lazy, status=status):
+                    manager = TodoManager(self.temp_file, lazy=lazy)
+                    ids, cursor = [], None
+                    for _ in range(5):
+                        page = manager.list_tasks(limit=2, cursor=cursor, status=status)
+                        ids += [task.task_id for task in page]
+                        cursor = page.next_cursor
+                        if cursor is None:
+                            break
+                    self.assertIsNone(cursor)
+                    self.assertEqual(ids, [1, 2, 3, 4, 5] if status is None else [1, 3, 5])
+
+    def test_list_tasks_with_status_and_sort(self):
+        """Test stronicowania z filtrem statusu i sortowaniem."""
+        with self.todo_manager.batch():
+            for title in ("Gamma", "alfa", "Beta", "delta", "Epsilon"):
+                self.todo_manager.add_task(title)
+            self.todo_manager.change_task_status(3, TaskStatus.DONE)
+
+        pending = self.todo_manager.list_tasks(limit=2, status=TaskStatus.PENDING, sort_by="title")
+        self.assertEqual([task.title for task in pending], ["alfa", "Beta"])
+        self.assertEqual(pending.total, 4)
+        rest = self.todo_manager.list_tasks(
+            limit=2, status="pending", sort_by="title", cursor=pending.next_cursor
+        )
+        self.assertEqual([task.title for task in rest], ["Epsilon", "Gamma"])
+        self.assertIsNone(rest.next_cursor)
+
+        newest = self.todo_manager.list_tasks(limit=2, reverse=True)
+        self.assertEqual([task.title for task in newest], ["Epsilon", "delta"])
+        done = self.todo_manager.list_tasks(status=TaskStatus.DONE)
+        self.assertEqual([task.title for task in done], ["delta"])
+
+    def test_list_tasks_invalid_arguments(self):
+        """Test stronicowania z nieprawidłowymi argumentami."""
+        self.todo_manager.add_task("Zadanie 1")
+        self.todo_manager.add_task("Zadanie 2")
+        cursor = self.todo_manager.list_tasks(limit=1).next_cursor
+
+        with self.assertRaises(ValueError):
+            self.todo_manager.list_tasks(limit=0)
+        with self.assertRaises(ValueError):
+            self.todo_manager.list_tasks(offset=-1)
+        with self.assertRaises(ValueError):
+            self.todo_manager.list_tasks(sort_by="opis")
+        with self.assertRaises(ValueError):
+            self.todo_manager.list_tasks(cursor="nieprawidłowy")
+        with self.assertRaises(ValueError):
+            self.todo_manager.list_tasks(cursor=cursor, sort_by="title")
+        self.assertEqual(self.todo_manager.list_tasks(status="nieznany").tasks, [])
+
+    def test_metrics(self):
+        """Test pomiarów operacji menedżera i zapisu zmian."""
+        metrics = MetricsRecorder()
+        manager = TodoManager(self.temp_file, metrics=metrics)
+
+        manager.add_task("Zadanie 1")
+        manager.add_task("Zadanie 2")
+        manager.change_task_status(0, TaskStatus.DONE)
+        manager.delete_task(1)
+
+        self.assertIs(manager.file_manager.metrics, metrics)
+        self.assertEqual(metrics.histogram("todo.load").count, 1)
+        self.assertEqual(metrics.histogram("todo.add_task").count, 2)
+        self.assertEqual(metrics.histogram("todo.change_task_status").count, 1)
+        self.assertEqual(metrics.histogram("todo.delete_task").count, 1)
+        self.assertEqual(metrics.histogram("todo.save_changes").count, 4)
+        self.assertEqual(metrics.counter("todo.changes"), 4)
+        self.assertEqual(metrics.histogram("file.save_tasks").count, 4)
+        self.assertGreater(metrics.counter("file.bytes_written"), 0)
+
+    def test_metrics_from_file_manager(self):
+        """Test użycia obiektu pomiarów przekazanego do FileManager."""
+        metrics = MetricsRecorder()
+        manager = TodoManager(file_manager=FileManager(self.temp_file, metrics=metrics))
+        manager.add_task("Zadanie 1")
+
+        self.assertIs(manager.metrics, metrics)
+        self.assertEqual(metrics.histogram("todo.add_task").count, 1)
+
+    def test_shared_file_applies_external_changes(self):
+        """Test nanoszenia zmian zapisanych przez inny menedżer tego samego pliku."""
+        first = TodoManager(file_manager=FileManager(self.temp_file, journal=True, shared=True))
+        second = TodoManager(file_manager=FileManager(self.temp_file, journal=True, shared=True))
+
+        task = first.add_task("Zadanie 1")
+        first.add_task("Zadanie 2")
+        self.assertEqual([t.title for t in second.get_tasks()], ["Zadanie 1", "Zadanie 2"])
+
+        first.change_task_status_by_id(task.task_id, TaskStatus.DONE)
+        first.delete_task(1)
+        self.assertEqual(second.count_tasks_by_status(TaskStatus.DONE), 1)
+        self.assertEqual(len(second.get_tasks()), 1)
+
+        new_task = second.add_task("Zadanie 3")
+        self.assertEqual(new_task.task_id, 3)
+        self.assertEqual(first.get_task(3).title, "Zadanie 3")
+
+    def test_shared_file_reload_after_snapshot(self):
+        """Test ponownego wczytania pliku po zapisie migawki przez inny menedżer."""
+        first = TodoManager(file_manager=FileManager(self.temp_file, shared=True))
+        second = TodoManager(file_manager=FileManager(self.temp_file, shared=True))
+
+        first.add_task("Zadanie 1")
+        second.add_task("Zadanie 2")
+
+        self.assertTrue(first.refresh())
+        self.assertEqual([t.title for t in first.get_tasks()], ["Zadanie 1", "Zadanie 2"])
+        self.assertEqual([t.task_id for t in first.get_tasks()], [1, 2])
+        self.assertFalse(first.refresh())
+
+    def test_shared_file_with_multiple_processes(self):
+        """Test jednoczesnych zmian z wielu procesów bez utraty zadań."""
+        context = multiprocessing.get_context("fork" if os.name == "posix" else "spawn")
+        TodoManager(file_manager=FileManager(self.temp_file, journal=True, shared=True))
+        processes = [
+            context.Process(target=_add_shared_tasks, args=(self.temp_file, worker, 20))
+            for worker in range(3)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(30)
+            self.assertEqual(process.exitcode, 0)
+
+        manager = TodoManager(file_manager=FileManager(self.temp_file, journal=True))
+        ids = [task.task_id for task in manager.get_tasks()]
+        self.assertEqual(sorted(ids), list(range(1, 61)))
+        self.assertEqual(manager.count_tasks_by_status(TaskStatus.DONE), 30)
+
+    def test_write_behind_with_shared_file(self):
+        """Test odrzucenia trybu zapisu w tle dla pliku współdzielonego."""
+        with self.assertRaises(ValueError):
+            TodoManager(file_manager=FileManager(self.temp_file, shared=True), write_behind=True)
+
+    def _versioned_manager(self, **kwargs):
+        """Tworzy menedżer z historią wersji w pliku tymczasowym."""
+        versions_path = self.temp_file + ".versions"
+        self.addCleanup(lambda: os.path.exists(versions_path) and os.remove(versions_path))
+        return TodoManager(self.temp_file, version_store=VersionStore(versions_path), **kwargs)
+
+    def test_versions_list_and_diff(self):
+        """Test tworzenia, listowania i porównywania wersji."""
+        manager = self._versioned_manager()
+        for i in range(5):
+            manager.add_task(f"Zadanie {i}")
+        first = manager.create_version("przed edycją")
+        manager.edit_task(0, title="Zmienione")
+        manager.delete_task(4)
+        manager.add_task("Nowe")
+        second = manager.create_version("po edycji")
+        manager.change_task_status(1, TaskStatus.DONE)
+
+        self.assertEqual([(v.number, v.label) for v in manager.list_versions()],
+                         [(1, "przed edycją"), (2, "po edycji")])
+        self.assertEqual((second.changed, second.deleted), (2, 1))
+        diff = manager.diff_versions(first.number, second.number)
+        self.assertEqual([task.title for task in diff.added], ["Nowe"])
+        self.assertEqual([task.title for task in diff.deleted], ["Zadanie 4"])
+        self.assertEqual(
+            [(old.title, new.title) for old, new in diff.changed], [("Zadanie 0", "Zmienione")]
+        )
+        current = manager.diff_versions(second.number)
+        self.assertEqual([new.status for _, new in current.changed], [TaskStatus.DONE])
+
+    def test_restore_version(self):
+        """Test przywrócenia wersji po błędnej zbiorczej edycji."""
+        manager = self._versioned_manager()
+        for i in range(5):
+            manager.add_task(f"Zadanie {i}")
+        version = manager.create_version()
+        with manager.batch():
+            for task in manager.get_tasks():
+                manager.edit_task_by_id(task.task_id, description="Przypadkowa zmiana")
+            manager.delete_task(0)
+
+        backup = manager.restore_version(version.number)
+        added = manager.add_task("Po przywróceniu")
+
+        self.assertEqual(backup.label, f"Przed przywróceniem wersji {version.number}")
+        self.assertEqual([task.description for task in manager.get_tasks()[:5]], [""] * 5)
+        self.assertEqual(manager.get_task(1).title, "Zadanie 0")
+        self.assertEqual(added.task_id, 6)
+        self.assertEqual(len(manager.get_tasks_by_status(TaskStatus.PENDING)), 6)
+        reloaded = TodoManager(self.temp_file)
+        self.assertEqual([task.title for task in reloaded.get_tasks()],
+                         [f"Zadanie {i}" for i in range(5)] + ["Po przywróceniu"])
+        self.assertEqual(len(manager.diff_versions(backup.number)), 6)
+
+    def test_restore_version_errors(self):
+        """Test błędów przywracania i porównywania wersji."""
+        manager = self._versioned_manager()
+        manager.add_task("Zadanie")
+        version = manager.create_version()
+
+        with self.assertRaises(LookupError):
+            manager.restore_version(99)
+        with self.assertRaises(RuntimeError):
+            with manager.batch():
+                manager.restore_version(version.number)
+        with self.assertRaises(ValueError):
+            self.todo_manager.create_version()
+        self.assertEqual(len(manager.list_versions()), 1)
+
+    def test_batches_in_two_threads(self):
+        """Test transakcji dwóch wątków - druga czeka na zakończenie pierwszej."""
+        inside = threading.Event()
+        release = threading.Event()
+
+        def first():
+            with self.todo_manager.batch():
+                self.todo_manager.add_task("A")
+                inside.set()
+                release.wait(5)
+                self.todo_manager.add_task("B")
+
+        def second():
+            inside.wait(5)
+            with self.todo_manager.batch():
+                self.todo_manager.add_task("C")
+
+        threads = [threading.Thread(target=first), threading.Thread(target=second)]
+        for thread in threads:
+            thread.start()
+        inside.wait(5)
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.todo_manager._batch_depth, 0)
+        self.assertEqual([task.title for task in self.todo_manager.get_tasks()], ["A", "B", "C"])
+        self.assertEqual([task.title for task in TodoManager(self.temp_file).get_tasks()],
+                         ["A", "B", "C"])
+
+    def test_undo_redo_single_operations(self):
+        """Test cofania i ponawiania pojedynczych operacji."""
+        manager = self.todo_manager
+        for i in range(3):
+            manager.add_task(f"Zadanie {i}", f"Opis {i}")
+        manager.edit_task(0, title="Zmienione")
+        manager.change_task_status_by_id(2, TaskStatus.DONE)
+        manager.delete_task_by_id(2)
+
+        self.assertTrue(manager.undo())
+        self.assertEqual([task.task_id for task in manager.get_tasks()], [1, 2, 3])
+        self.assertTrue(manager.undo())
+        self.assertEqual(manager.get_task(2).status, TaskStatus.PENDING)
+        self.assertTrue(manager.undo())
+        self.assertEqual(manager.get_task(1).title, "Zadanie 0")
+        self.assertEqual(manager.get_tasks_by_status(TaskStatus.DONE), [])
+
+        self.assertTrue(manager.redo())
+        self.assertTrue(manager.redo())
+        self.assertTrue(manager.redo())
+        self.assertFalse(manager.redo())
+        self.assertEqual([task.title for task in manager.get_tasks()], ["Zmienione", "Zadanie 2"])
+        self.assertEqual(manager.search("Zmienione")[0].task_id, 1)
+
+        reloaded = TodoManager(self.temp_file)
+        self.assertEqual([(task.task_id, task.title) for task in reloaded.get_tasks()],
+                         [(1, "Zmienione"), (3, "Zadanie 2")])
+
+    def test_undo_batch_and_new_operation_clears_redo(self):
+        """Test cofania całej transakcji i czyszczenia historii ponowień."""
+        manager = self.todo_manager
+        for i in range(4):
+            manager.add_task(f"Zadanie {i}")
+        with manager.batch():
+            for task in manager.get_tasks():
+                manager.change_task_status_by_id(task.task_id, TaskStatus.DONE)
+            manager.delete_task(0)
+
+        self.assertTrue(manager.undo())
+        self.assertEqual(manager.count_tasks_by_status(TaskStatus.PENDING), 4)
+        self.assertEqual(len(manager.get_tasks()), 4)
+
+        manager.add_task("Nowe")
+        self.assertFalse(manager.redo())
+        self.assertTrue(manager.undo())
+        self.assertEqual(len(manager.get_tasks()), 4)
+
+    def test_undo_after_edit_without_changes(self):
+        """Test, czy edycja, która niczego nie zmienia, nie zajmuje kroku historii."""
+        manager = TodoManager(self.temp_file)
+        task = manager.add_task("Zadanie", "Opis")
+        manager = TodoManager(self.temp_file)
+
+        self.assertTrue(manager.edit_task_by_id(task.task_id))
+        self.assertTrue(manager.edit_task_by_id(task.task_id, title="Zadanie", description="Opis"))
+        self.assertFalse(manager.undo())
+
+    def test_undo_depth_is_bounded(self):
+        """Test ograniczenia głębokości historii operacji."""
+        manager = TodoManager(self.temp_file, undo_depth=2)
+        for i in range(5):
+            manager.add_task(f"Zadanie {i}")
+
+        self.assertTrue(manager.undo())
+        self.assertTrue(manager.undo())
+        self.assertFalse(manager.undo())
+        self.assertEqual(len(manager.get_tasks()), 3)
+        self.assertFalse(TodoManager(self.temp_file, undo_depth=0).undo())
+
+    def test_undo_delete_with_journal_keeps_id_order(self):
+        """Test zapisu cofniętego usunięcia jednym rekordem dziennika i kolejności po wczytaniu."""
+        manager = TodoManager(file_manager=FileManager(self.temp_file, journal=True))
+        with manager.batch():
+            for i in range(5):
+                manager.add_task(f"Zadanie {i}")
+        manager.file_manager.save_tasks(manager.tasks)
+        manager.delete_task_by_id(3)
+
+        manager.undo()
+
+        with open(self.temp_file + ".journal") as file:
+            self.assertEqual(len(file.readlines()), 2)
+        reloaded = TodoManager(file_manager=FileManager(self.temp_file, journal=True))
+        self.assertEqual([task.task_id for task in reloaded.get_tasks()], [1, 2, 3, 4, 5])
+        self.assertEqual(reloaded.list_tasks(limit=2, offset=2).tasks[0].task_id, 3)
+
+    def test_undo_inside_batch(self):
+        """Test odrzucenia cofania wewnątrz transakcji."""
+        self.todo_manager.add_task("Zadanie")
+        with self.assertRaises(RuntimeError):
+            with self.todo_manager.batch():
+                self.todo_manager.undo()
+        self.assertEqual(len(self.todo_manager.get_tasks()), 1)
+
+    def test_subscribe_receives_change_events(self):
+        """Test zdarzeń zmian przekazywanych subskrybentowi."""
+        manager = self.todo_manager
+        manager.add_task("Zadanie 1")
+        subscription = manager.subscribe()
+
+        task = manager.add_task("Zadanie 2", "Opis")
+        manager.edit_task_by_id(1, title="Zmienione")
+        manager.change_task_status_by_id(1, TaskStatus.DONE)
+        manager.delete_task_by_id(1)
+        self.assertFalse(manager.change_task_status_by_id(task.task_id, TaskStatus.PENDING))
+
+        fields = {"title": "Zadanie 2", "description": "Opis", "status": TaskStatus.PENDING}
+        self.assertEqual(subscription.poll(), [
+            TaskEvent(ADDED, task.task_id, None, fields),
+            TaskEvent(
+                DELETED,
+                1,
+                {"title": "Zadanie 1", "description": "", "status": TaskStatus.PENDING},
+                None,
+            ),
+        ])
+
+        manager.undo()
+        self.assertEqual([event.kind for event in subscription.poll()], [ADDED])
+        subscription.close()
+        manager.delete_task_by_id(1)
+        self.assertEqual(subscription.poll(), [])
+
+    def test_subscribe_skips_edit_without_changes(self):
+        """Test braku zdarzenia EDITED dla edycji, która niczego nie zmienia."""
+        manager = self.todo_manager
+        task = manager.add_task("Zadanie", "Opis")
+        subscription = manager.subscribe()
+
+        manager.edit_task_by_id(task.task_id)
+        self.assertEqual(subscription.poll(), [])
+        manager.edit_task_by_id(task.task_id, title="Zadanie", description="Opis")
+        self.assertEqual(subscription.poll(), [])
+
+        manager.edit_task_by_id(task.task_id, description="Nowy opis")
+        self.assertEqual(subscription.poll(), [TaskEvent(
+            EDITED,
+            task.task_id,
+            {"title": "Zadanie", "description": "Opis"},
+            {"title": "Zadanie", "description": "Nowy opis"},
+        )])
+        subscription.close()
+
+    def test_subscribe_batch_events(self):
+        """Test zdarzeń transakcji przekazywanych po zakończeniu i odrzucanych przy wycofaniu."""
+        manager = self.todo_manager
+        for i in range(3):
+            manager.add_task(f"Zadanie {i}")
+        subscription = manager.subscribe(kinds=[STATUS_CHANGED])
+
+        with self.assertRaises(RuntimeError):
+            with manager.batch():
+                manager.change_task_status(0, TaskStatus.DONE)
+                raise RuntimeError("błąd")
+        self.assertEqual(subscription.poll(), [])
+
+        with manager.batch():
+            for task in manager.get_tasks():
+                manager.change_task_status_by_id(task.task_id, TaskStatus.DONE)
+            self.assertEqual(subscription.pending_count, 0)
+        events = subscription.poll()
+        self.assertEqual([event.task_id for event in events], [1, 2, 3])
+        self.assertEqual(events[0].new, {"status": TaskStatus.DONE})
+
+    def test_subscribe_external_changes_and_reset(self):
+        """Test zdarzeń dla zmian innych procesów i przywrócenia wersji."""
+        first = TodoManager(file_manager=FileManager(self.temp_file, journal=True, shared=True))
+        second = self._versioned_manager(
+            file_manager=FileManager(self.temp_file, journal=True, shared=True)
+        )
+        subscription = second.subscribe()
+        task = first.add_task("Zadanie")
+        first.edit_task_by_id(task.task_id, description="Opis")
+        first.change_task_status_by_id(task.task_id, TaskStatus.DONE)
+
+        second.refresh()
+        fields = {"title": "Zadanie", "description": "Opis", "status": TaskStatus.DONE}
+        self.assertEqual(subscription.poll(), [TaskEvent(ADDED, task.task_id, None, fields)])
+
+        first.edit_task_by_id(task.task_id, title="Zmienione")
+        second.refresh()
+        self.assertEqual(subscription.poll(), [TaskEvent(
+            EDITED, task.task_id, {"title": "Zadanie", "description": "Opis"},
+            {"title": "Zmienione", "description": "Opis"},
+        )])
+
+        version = second.create_version()
+        second.restore_version(version.number)
+        self.assertEqual(subscription.poll(), [TaskEvent(RESET)])
@@ -0,0 +1,111 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from src.task import Task
+from src.todo_status import TaskStatus
+from src.version_store import VersionStore, diff_states
+
+
+class TestVersionStore(unittest.TestCase):
+    """Klasa testowa dla klasy VersionStore."""
+
+    def setUp(self):
+        """Przygotowanie danych przed każdym testem."""
+
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False).name
+        os.remove(self.temp_file)
+        self.store = VersionStore(self.temp_file)
+        self.tasks = [Task(f"Zadanie {i}", f"Opis {i}", task_id=i) for i in range(1, 101)]
+
+    def tearDown(self):
+        """Sprzątanie po testach."""
+
+        if os.path.exists(self.temp_file):
+            os.remove(self.temp_file)
+
+    def test_commit_stores_only_changes(self):
+        """Test zapisu w nowej wersji tylko zmienionych zadań."""
+        first = self.store.commit(self.tasks, "początek")
+        size = os.path.getsize(self.temp_file)
+        self.tasks[5].change_status(TaskStatus.DONE)
+        del self.tasks[7]
+        second = self.store.commit(self.tasks, "zmiana\nstatusu")
+
+        self.assertEqual((first.number, first.changed, first.deleted), (1, 100, 0))
+        self.assertEqual((second.number, second.changed, second.deleted), (2, 1, 1))
+        self.assertEqual(second.label, "zmiana statusu")
+        self.assertLess(os.path.getsize(self.temp_file) - size, 100)
+
+    def test_hundreds_of_versions_cost_changes(self):
+        """Test, czy setki wersji zajmują miejsce proporcjonalne do zmian."""
+        self.store.commit(self.tasks)
+        size = os.path.getsize(self.temp_file)
+        for i in range(300):
+            self.tasks[i % 100].update_details(description=f"Wersja {i}")
+            self.store.commit(self.tasks)
+
+        self.assertLess(os.path.getsize(self.temp_file), size * 10)
+        self.assertEqual(len(self.store.versions()), 301)
+
+    def test_state_and_tasks_of_old_version(self):
+        """Test odtworzenia stanu starszej wersji."""
+        self.store.commit(self.tasks)
+        self.tasks[0].update_details(title="Zmieniony")
+        self.tasks.append(Task("Nowe", task_id=200))
+        self.store.commit(self.tasks)
+
+        old_tasks = self.store.tasks(1)
+
+        self.assertEqual(len(old_tasks), 100)
+        self.assertEqual(old_tasks[0].title, "Zadanie 1")
+        self.assertEqual(self.store.state(2)[1], "Zmieniony|Opis 1|pending|1")
+        with self.assertRaises(LookupError):
+            self.store.state(3)
+
+    def test_history_read_by_new_store(self):
+        """Test wczytania historii zapisanej przez inny obiekt (np. inny proces)."""
+        self.store.commit(self.tasks, "pierwsza")
+        del self.tasks[0]
+        self.store.commit(self.tasks, "druga")
+
+        other = VersionStore(self.temp_file)
+        versions = other.versions()
+        self.tasks[0].change_status(TaskStatus.DONE)
+        third = other.commit(self.tasks)
+
+        self.assertEqual([(v.number, v.label, v.changed, v.deleted) for v in versions],
+                         [(1, "pierwsza", 100, 0), (2, "druga", 0, 1)])
+        self.assertEqual((third.number, third.changed), (3, 1))
+        self.assertEqual(len(self.store.versions()), 3)
+
+    def test_interrupted_write_is_skipped(self):
+        """Test pominięcia niedokończonego zapisu wersji."""
+        self.store.commit(self.tasks[:2])
+        with open(self.temp_file, "ab") as file:
+            file.write(b"U|Niedoko")
+
+        store = VersionStore(self.temp_file)
+        with mock.patch("builtins.print") as mock_print:
+            version = store.commit(self.tasks[:3])
+            reloaded = VersionStore(self.temp_file).versions()
+
+        self.assertEqual(version.number, 2)
+        self.assertEqual([v.changed for v in reloaded], [2, 1])
+        mock_print.assert_called_once()
+        self.assertEqual(len(store.tasks(2)), 3)
+
+    def test_diff_states(self):
+        """Test porównania dwóch stanów listy zadań."""
+        old = {1: "A|a|pending|1", 2: "B|b|pending|2", 3: "C|c|done|3"}
+        new = {1: "A|a|done|1", 3: "C|c|done|3", 4: "D|d|pending|4"}
+
+        diff = diff_states(old, new)
+
+        self.assertEqual([task.title for task in diff.added], ["D"])
+        self.assertEqual([task.title for task in diff.deleted], ["B"])
+        self.assertEqual(
+            [(a.status, b.status) for a, b in diff.changed],
+            [(TaskStatus.PENDING, TaskStatus.DONE)],
+        )
+        self.assertEqual(len(diff), 3)
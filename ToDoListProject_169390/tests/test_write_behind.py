@@ -0,0 +1,118 @@
+import threading
+import unittest
+import unittest.mock
+from src.task import Task
+from src.write_behind import WriteBehindWriter
+
+
+class TestWriteBehindWriter(unittest.TestCase):
+    """Klasa testowa dla klasy WriteBehindWriter."""
+
+    def setUp(self):
+        """Przygotowanie danych przed każdym testem."""
+        self.file_manager = unittest.mock.Mock()
+        self.file_manager.apply_changes.return_value = True
+        self.file_manager.save_tasks.return_value = True
+        self.tasks = [Task("Zadanie 1", task_id=1), Task("Zadanie 2", task_id=2)]
+        self.writer = WriteBehindWriter(
+            self.file_manager, threading.RLock(), interval=60, threshold=100
+        )
+
+    def tearDown(self):
+        """Sprzątanie po testach."""
+        self.writer.close()
+
+    def test_changes_are_coalesced_until_flush(self):
+        """Test łączenia zmian w jeden zapis wykonywany przy flush()."""
+        self.writer.submit(self.tasks, [("add", self.tasks[0])])
+        self.writer.submit(self.tasks, [("add", self.tasks[1])])
+        self.assertEqual(self.writer.pending_count, 2)
+
+        self.assertTrue(self.writer.flush())
+
+        self.file_manager.apply_changes.assert_called_once_with(
+            self.tasks, [("add", self.tasks[0]), ("add", self.tasks[1])]
+        )
+        self.assertEqual(self.writer.pending_count, 0)
+
+    def test_threshold_triggers_write(self):
+        """Test zapisu po osiągnięciu progu liczby zmian."""
+        written = threading.Event()
+        self.file_manager.apply_changes.side_effect = lambda tasks, changes: written.set() or True
+        self.writer.threshold = 2
+
+        self.writer.submit(self.tasks, [("update", self.tasks[0]), ("update", self.tasks[1])])
+
+        self.assertTrue(written.wait(5))
+
+    def test_interval_triggers_write(self):
+        """Test zapisu po upływie interwału."""
+        written = threading.Event()
+        self.file_manager.apply_changes.side_effect = lambda tasks, changes: written.set() or True
+        self.writer.close()
+        self.writer = WriteBehindWriter(self.file_manager, threading.RLock(), interval=0.01)
+
+        self.writer.submit(self.tasks, [("update", self.tasks[0])])
+
+        self.assertTrue(written.wait(5))
+
+    def test_writes_copy_of_task_list(self):
+        """Test, czy zapisywana jest kopia listy z chwili zapisu."""
+        self.writer.submit(self.tasks, [("delete", self.tasks[1])])
+        self.writer.flush()
+
+        written_tasks = self.file_manager.apply_changes.call_args[0][0]
+        self.assertEqual(written_tasks, self.tasks)
+        self.assertIsNot(written_tasks, self.tasks)
+
+    def test_snapshot_request_saves_all_tasks(self):
+        """Test zapisu całej listy na żądanie."""
+        self.writer.submit(self.tasks, [("update", self.tasks[0])], snapshot=True)
+        self.writer.flush()
+
+        self.file_manager.save_tasks.assert_called_once_with(self.tasks)
+        self.file_manager.apply_changes.assert_not_called()
+
+    def test_failed_write_is_reported(self):
+        """Test zgłoszenia nieudanego zapisu przez flush()."""
+        self.file_manager.apply_changes.side_effect = OSError("Disk full")
+        self.writer.submit(self.tasks, [("update", self.tasks[0])])
+
+        with unittest.mock.patch("builtins.print") as mock_print:
+            self.assertFalse(self.writer.flush())
+            mock_print.assert_called_with("Błąd podczas zapisu w tle: Disk full")
+
+    def test_failed_write_is_retried(self):
+        """Test ponownego zapisu zmian po nieudanym zapisie."""
+        self.file_manager.apply_changes.side_effect = [OSError("Disk full"), True]
+        self.writer.submit(self.tasks, [("update", self.tasks[0])])
+
+        with unittest.mock.patch("builtins.print"):
+            self.assertFalse(self.writer.flush())
+        self.writer.submit(self.tasks, [("update", self.tasks[1])])
+        self.assertTrue(self.writer.flush())
+
+        self.assertEqual(self.file_manager.apply_changes.call_count, 2)
+        self.file_manager.apply_changes.assert_called_with(
+            self.tasks, [("update", self.tasks[0]), ("update", self.tasks[1])]
+        )
+        self.assertEqual(self.writer.pending_count, 0)
+
+    def test_close_keeps_changes_after_failed_write(self):
+        """Test zgłoszenia przez close() zmian, których nie udało się zapisać."""
+        self.file_manager.apply_changes.return_value = False
+        self.writer.submit(self.tasks, [("update", self.tasks[0])])
+
+        self.assertFalse(self.writer.close())
+        self.assertEqual(self.writer.pending_count, 1)
+
+    def test_close_writes_pending_changes(self):
+        """Test zapisu odłożonych zmian przy zamknięciu."""
+        self.writer.submit(self.tasks, [("update", self.tasks[0])])
+
+        self.assertTrue(self.writer.close())
+
+        self.file_manager.apply_changes.assert_called_once()
+        with self.assertRaises(RuntimeError):
+            self.writer.submit(self.tasks, [])
+        self.assertTrue(self.writer.flush())